@@ -8,8 +8,9 @@ prior behavior; only the place that produces it has moved.
 """
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import HTTPException as FastAPIHTTPException
@@ -85,6 +86,7 @@ from libs.domain.errors.episode_bgm__error import (
     NotEpisodeBgmPathError,
     SubtitledEpisodeMissingError,
 )
+from libs.domain.errors.job__error import JobCancelledError, JobNotFoundError
 from libs.domain.errors.prompt__error import (
     InvalidSuggestionRequestError,
     SuggestionGenerationFailedError,
@@ -132,7 +134,9 @@ from libs.domain.errors.media__error import (
     NotMediaError,
     NotUnderAiVideosError,
     NotUnderDeletedError,
+    ThumbnailFailedError,
 )
+from libs.domain.errors.tree__error import TreeNodeNotFoundError
 from libs.domain.errors.voice__error import (
     InvalidVoiceAttributeError,
     InvalidVoiceIdError,
@@ -236,6 +240,11 @@ _PLAIN: tuple[tuple[type[Exception], int, str, bool], ...] = (
     (NoCardForShotError, 404, "no_card_for_shot", True),
     (IntroCardImageMissingError, 404, "intro_card_image_missing", True),
     (IntroCardBurnFailedError, 500, "intro_card_burn_failed", True),
+    # background jobs
+    (JobNotFoundError, 404, "job_not_found", False),
+    (JobCancelledError, 409, "job_cancelled", False),
+    # tree views
+    (TreeNodeNotFoundError, 404, "tree_node_not_found", False),
     # media
     (InvalidMediaPathError, 400, "invalid_path", False),
     (NotMediaError, 400, "extension_not_allowed", False),
@@ -246,6 +255,7 @@ _PLAIN: tuple[tuple[type[Exception], int, str, bool], ...] = (
     (NotUnderDeletedError, 400, "not_in_deleted", False),
     (MediaNotFoundError, 404, "not_found", False),
     (MediaMoveFailedError, 500, "move_failed", True),
+    (ThumbnailFailedError, 500, "thumbnail_failed", True),
     # voice (follow-up 115)
     (InvalidVoiceAttributeError, 400, "invalid_attribute", True),
     (InvalidVoiceIdError, 400, "invalid_voice_id", True),
@@ -286,6 +296,15 @@ def _make_plain_handler(status: int, kind: str, include_message: bool):
     return handler
 
 
+def describe_error(exc: Exception) -> dict[str, Any]:
+    """The `detail` body a synchronous route would have answered for `exc` —
+    what a failed background job reports as its `error`."""
+    for exc_cls, _status, kind, include_message in _PLAIN:
+        if isinstance(exc, exc_cls):
+            return {"kind": kind, "message": str(exc)} if include_message else {"kind": kind}
+    return {"kind": "job_failed", "message": str(exc) or type(exc).__name__}
+
+
 def _register_exception_handlers(app: FastAPI) -> None:
     for exc_cls, status, kind, include_message in _PLAIN:
         app.add_exception_handler(exc_cls, _make_plain_handler(status, kind, include_message))
@@ -342,7 +361,22 @@ def _register_exception_handlers(app: FastAPI) -> None:
 
 
 def create_app(container: Container, serve_static: bool = True) -> FastAPI:
-    app = FastAPI(title="ai_video_management", openapi_url=None, docs_url=None, redoc_url=None)
+    # Failed background jobs report the same `{kind, …}` their route would have;
+    # queued / running jobs are cancelled (ffmpeg killed) when the server stops,
+    # and the tree watcher thread is released.
+    jobs = container.job_manager()
+    jobs.bind_error_describer(describe_error)
+
+    @asynccontextmanager
+    async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        yield
+        jobs.shutdown()
+        container.tree_watcher().stop()
+
+    app = FastAPI(
+        title="ai_video_management", openapi_url=None, docs_url=None, redoc_url=None,
+        lifespan=_lifespan,
+    )
 
     # Eager-create the actor pool folder (follow-up 015). If this fails the
     # actor feature is unusable — let the traceback surface at startup
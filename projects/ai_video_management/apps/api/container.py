@@ -17,6 +17,7 @@ from pathlib import Path
 
 from dependency_injector import containers, providers
 
+from apps.api.jobs import JobManager
 from libs.application.commands.actor__command import ActorCommand
 from libs.application.commands.bgm__command import BgmCommand
 from libs.application.commands.casting__command import CastingCommand
@@ -56,11 +57,15 @@ from libs.application.queries.prompt__query import PromptQuery
 from libs.application.queries.tree__query import TreeQuery
 from libs.application.queries.voice__query import VoiceQuery
 from libs.common.exposed_tree import ExposedTree
+from libs.common.build_manifest import BuildManifest
+from libs.common.fs_watcher import FsWatcher
 from libs.common.origin import BoundOrigin
 from libs.common.safe_resolve import SafeResolver
 from libs.infrastructure.clients.anthropic__client import AnthropicClient
 from libs.infrastructure.readers.bgm_reference__reader import BgmReferenceReader
 from libs.infrastructure.readers.file__reader import FileReader
+from libs.infrastructure.readers.media_probe__reader import MediaProbeReader
+from libs.infrastructure.readers.thumbnail__reader import ThumbnailReader
 from libs.infrastructure.readers.perf_check__reader import PerfCheckPromptReader
 from libs.infrastructure.readers.performance_library__reader import PerformanceLibraryReader
 from libs.infrastructure.readers.shot_regen__reader import ShotRegenPromptReader
@@ -109,14 +114,43 @@ class Container(containers.DeclarativeContainer):
         SafeResolver, root=repo_root_path
     )
 
+    # One probe cache for every ffmpeg writer (+ its on-disk per-drama index).
+    media_probe: providers.Singleton[MediaProbeReader] = providers.Singleton(
+        MediaProbeReader
+    )
+
+    # Gallery thumbs / poster frames (per-drama `.cache/thumbs/` on disk).
+    thumbnails: providers.Singleton[ThumbnailReader] = providers.Singleton(
+        ThumbnailReader, probe=media_probe
+    )
+
+    # Skip-if-up-to-date record for every derived artifact (per-drama on disk).
+    build_manifest: providers.Singleton[BuildManifest] = providers.Singleton(
+        BuildManifest
+    )
+
+    # Bounded background queue for the long ffmpeg operations (concat, whole
+    # burns, BGM mux, view extraction) + the post-concat seam scoring.
+    job_manager: providers.Singleton[JobManager] = providers.Singleton(
+        JobManager, max_workers=2
+    )
+
     file_reader: providers.Singleton[FileReader] = providers.Singleton(
         FileReader, exposed=exposed_tree, resolver=safe_resolver
     )
     file_writer: providers.Singleton[FileWriter] = providers.Singleton(
         FileWriter, exposed=exposed_tree, resolver=safe_resolver
     )
+    # Change feed for the cached sidebar tree, the actor / voice / BGM
+    # library catalogs and the casting / BGM-cue reference indexes (inotify;
+    # polling fallback).
+    tree_watcher: providers.Singleton[FsWatcher] = providers.Singleton(
+        FsWatcher,
+        roots=providers.Callable(lambda tree: tree.top_level_dirs(), exposed_tree),
+        excluded=providers.Callable(lambda tree: tree.excluded_dirs(), exposed_tree),
+    )
     tree_reader: providers.Singleton[TreeReader] = providers.Singleton(
-        TreeReader, exposed=exposed_tree
+        TreeReader, exposed=exposed_tree, watcher=tree_watcher
     )
     media_renamer: providers.Singleton[MediaRenamer] = providers.Singleton(
         MediaRenamer, exposed=exposed_tree, resolver=safe_resolver
@@ -131,10 +165,11 @@ class Container(containers.DeclarativeContainer):
         ScenePlateExtractor, exposed=exposed_tree, resolver=safe_resolver
     )
     subtitle_burner: providers.Singleton[SubtitleBurner] = providers.Singleton(
-        SubtitleBurner, exposed=exposed_tree, resolver=safe_resolver
+        SubtitleBurner, exposed=exposed_tree, resolver=safe_resolver,
+        manifest=build_manifest,
     )
     intro_card_burner: providers.Singleton[IntroCardBurner] = providers.Singleton(
-        IntroCardBurner, exposed=exposed_tree, resolver=safe_resolver
+        IntroCardBurner, exposed=exposed_tree, resolver=safe_resolver, probe=media_probe
     )
     subtitle_batch_burner: providers.Singleton[SubtitleBatchBurner] = providers.Singleton(
         SubtitleBatchBurner,
@@ -146,7 +181,8 @@ class Container(containers.DeclarativeContainer):
         PerfScorer, exposed=exposed_tree, resolver=safe_resolver
     )
     production_exporter: providers.Singleton[ProductionExporter] = providers.Singleton(
-        ProductionExporter, exposed=exposed_tree, resolver=safe_resolver
+        ProductionExporter, exposed=exposed_tree, resolver=safe_resolver,
+        manifest=build_manifest,
     )
     shot_regen_reader: providers.Singleton[ShotRegenPromptReader] = providers.Singleton(
         ShotRegenPromptReader, exposed=exposed_tree, resolver=safe_resolver
@@ -170,16 +206,17 @@ class Container(containers.DeclarativeContainer):
         renamer=media_renamer,
     )
     actor_pool: providers.Singleton[ActorPool] = providers.Singleton(
-        ActorPool, exposed=exposed_tree, resolver=safe_resolver
+        ActorPool, exposed=exposed_tree, resolver=safe_resolver, watcher=tree_watcher
     )
     voice_pool: providers.Singleton[VoicePool] = providers.Singleton(
-        VoicePool, exposed=exposed_tree, resolver=safe_resolver
+        VoicePool, exposed=exposed_tree, resolver=safe_resolver, watcher=tree_watcher
     )
     bgm_pool: providers.Singleton[BgmPool] = providers.Singleton(
-        BgmPool, exposed=exposed_tree, resolver=safe_resolver
+        BgmPool, exposed=exposed_tree, resolver=safe_resolver, watcher=tree_watcher
     )
     bgm_reference_reader: providers.Singleton[BgmReferenceReader] = providers.Singleton(
-        BgmReferenceReader, exposed=exposed_tree, resolver=safe_resolver
+        BgmReferenceReader, exposed=exposed_tree, resolver=safe_resolver,
+        watcher=tree_watcher,
     )
     casting: providers.Singleton[Casting] = providers.Singleton(
         Casting,
@@ -188,12 +225,13 @@ class Container(containers.DeclarativeContainer):
         renamer=media_renamer,
         actor_pool=actor_pool,
         voice_pool=voice_pool,
+        watcher=tree_watcher,
     )
     character_video_truncator: providers.Singleton[CharacterVideoTruncator] = providers.Singleton(
         CharacterVideoTruncator, exposed=exposed_tree, resolver=safe_resolver
     )
     shot_concat_builder: providers.Singleton[ShotConcatBuilder] = providers.Singleton(
-        ShotConcatBuilder, exposed=exposed_tree, resolver=safe_resolver
+        ShotConcatBuilder, exposed=exposed_tree, resolver=safe_resolver, probe=media_probe
     )
     character_view_extractor: providers.Singleton[CharacterViewExtractor] = providers.Singleton(
         CharacterViewExtractor, exposed=exposed_tree, resolver=safe_resolver
@@ -202,10 +240,16 @@ class Container(containers.DeclarativeContainer):
         CharacterReader, exposed=exposed_tree, resolver=safe_resolver
     )
     episode_concat_builder: providers.Singleton[EpisodeConcatBuilder] = providers.Singleton(
-        EpisodeConcatBuilder, exposed=exposed_tree, resolver=safe_resolver
+        EpisodeConcatBuilder,
+        exposed=exposed_tree,
+        resolver=safe_resolver,
+        probe=media_probe,
+        jobs=job_manager,
+        manifest=build_manifest,
     )
     episode_takes_selector: providers.Singleton[EpisodeTakesSelector] = providers.Singleton(
-        EpisodeTakesSelector, exposed=exposed_tree, resolver=safe_resolver
+        EpisodeTakesSelector, exposed=exposed_tree, resolver=safe_resolver,
+        manifest=build_manifest,
     )
     drama_takes_selector: providers.Singleton[DramaTakesSelector] = providers.Singleton(
         DramaTakesSelector,
@@ -221,12 +265,16 @@ class Container(containers.DeclarativeContainer):
         exposed=exposed_tree,
         resolver=safe_resolver,
         burner=subtitle_burner,
+        manifest=build_manifest,
     )
     episode_bgm_manager: providers.Singleton[EpisodeBgmManager] = providers.Singleton(
         EpisodeBgmManager,
         exposed=exposed_tree,
         resolver=safe_resolver,
         bgm_pool=bgm_pool,
+        probe=media_probe,
+        manifest=build_manifest,
+        references=bgm_reference_reader,
     )
     downloaded_novels_root: providers.Singleton[Path] = providers.Singleton(
         lambda root: root / "downloaded_novels", repo_root_path
@@ -347,7 +395,7 @@ class Container(containers.DeclarativeContainer):
         CastingQuery, casting=casting
     )
     media_query: providers.Factory[MediaQuery] = providers.Factory(
-        MediaQuery, exposed=exposed_tree, resolver=safe_resolver
+        MediaQuery, exposed=exposed_tree, resolver=safe_resolver, thumbnails=thumbnails
     )
     file_query: providers.Factory[FileQuery] = providers.Factory(
         FileQuery, reader=file_reader
@@ -0,0 +1,196 @@
+"""Background job queue for the long ffmpeg operations.
+
+Concat / whole-episode subtitle burn / BGM mux / drama-wide burn / character
+view extraction can each run for minutes. Run synchronously they pin a uvicorn
+threadpool thread for the whole encode and trip HTTP client timeouts, so the
+routes for those operations accept `background: true` and hand the work to
+this queue instead:
+
+* a bounded `ThreadPoolExecutor` (`max_workers` renders at once; the rest wait
+  `queued`), so several editors can queue renders without oversubscribing the
+  CPU or starving the request threads;
+* every job has an id, a `kind`, the `target` path it works on, a state
+  (`queued` → `running` → `succeeded` | `failed` | `cancelled`), a 0..1
+  `progress` fed from ffmpeg's `-progress` output (`libs/common/job_progress`)
+  and, when finished, the operation's payload or `{kind, message}` error;
+* `cancel` drops a queued job outright, or flags a running one — the ffmpeg
+  child is killed at the next poll and the job ends `cancelled`;
+* `version` bumps on every change; the SSE endpoint polls it (on the event
+  loop — a watcher never holds a thread) and emits only when it moved.
+
+Finished jobs are kept (most recent `keep_finished`) so a reconnecting client
+can still read the outcome.
+"""
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from libs.common.job_progress import TERMINAL_STATES, job_scope
+from libs.domain.errors.job__error import JobCancelledError, JobNotFoundError
+
+# Progress events are coalesced: a change smaller than this doesn't bump
+# `version` (ffmpeg reports ~2×/s per encode; the bar does not need more).
+_PROGRESS_STEP: float = 0.005
+
+
+def _default_describe(exc: Exception) -> dict[str, Any]:
+    return {"kind": "job_failed", "message": str(exc) or type(exc).__name__}
+
+
+class Job:
+    """One queued operation. Implements `JobReporter` for its own worker."""
+
+    def __init__(self, job_id: str, kind: str, target: str) -> None:
+        self.id = job_id
+        self.kind = kind
+        self.target = target
+        self.state = "queued"
+        self.progress = 0.0
+        self.stage: str | None = None
+        self.result: Any = None
+        self.error: dict[str, Any] | None = None
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.version = 0
+        self.future: Future[None] | None = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    # JobReporter ----------------------------------------------------------
+    def report(self, fraction: float | None, stage: str | None = None) -> None:
+        with self._lock:
+            changed = False
+            if fraction is not None:
+                fraction = min(max(fraction, 0.0), 1.0)
+                if abs(fraction - self.progress) >= _PROGRESS_STEP or fraction == 1.0:
+                    changed = fraction != self.progress
+                    self.progress = fraction
+            if stage is not None and stage != self.stage:
+                self.stage = stage
+                changed = True
+            if changed:
+                self.version += 1
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    # state transitions -----------------------------------------------------
+    def request_cancel(self) -> None:
+        self._cancel.set()
+
+    def transition(self, state: str, **fields: Any) -> None:
+        with self._lock:
+            self.state = state
+            for k, v in fields.items():
+                setattr(self, k, v)
+            self.version += 1
+
+    @property
+    def finished(self) -> bool:
+        return self.state in TERMINAL_STATES
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "target": self.target,
+                "state": self.state,
+                "progress": round(self.progress, 4),
+                "stage": self.stage,
+                "cancel_requested": self._cancel.is_set(),
+                "result": self.result,
+                "error": self.error,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "version": self.version,
+            }
+
+
+class JobManager:
+    def __init__(self, max_workers: int = 2, keep_finished: int = 200) -> None:
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="job"
+        )
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._keep_finished = keep_finished
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._describe: Callable[[Exception], dict[str, Any]] = _default_describe
+
+    def bind_error_describer(self, describe: Callable[[Exception], dict[str, Any]]) -> None:
+        """Map a failed job's exception to the same `{kind, message}` the
+        synchronous route would have answered (set by app_factory)."""
+        self._describe = describe
+
+    def submit(self, kind: str, target: str, fn: Callable[[], Any]) -> dict[str, Any]:
+        """Queue `fn` and return the new job's snapshot. `fn`'s return value is
+        stored via its `to_payload()` when it has one."""
+        with self._lock:
+            job_id = f"{int(time.time() * 1000):x}-{next(self._ids)}"
+            job = Job(job_id, kind, target)
+            self._jobs[job_id] = job
+            self._evict_locked()
+        job.future = self._pool.submit(self._run, job, fn)
+        return job.snapshot()
+
+    def get(self, job_id: str) -> dict[str, Any]:
+        return self._job(job_id).snapshot()
+
+    def snapshots(self) -> list[dict[str, Any]]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [j.snapshot() for j in reversed(jobs)]
+
+    def cancel(self, job_id: str) -> dict[str, Any]:
+        job = self._job(job_id)
+        if job.finished:
+            return job.snapshot()
+        job.request_cancel()
+        if job.future is not None and job.future.cancel():
+            # never started — the worker will not run, so close it out here
+            job.transition("cancelled", finished_at=time.time())
+        else:
+            job.transition(job.state)  # surface cancel_requested to watchers
+        return job.snapshot()
+
+    def shutdown(self) -> None:
+        for job in list(self._jobs.values()):
+            job.request_cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job: Job, fn: Callable[[], Any]) -> None:
+        if job.is_cancelled():
+            job.transition("cancelled", finished_at=time.time())
+            return
+        job.transition("running", started_at=time.time())
+        try:
+            with job_scope(job):
+                value = fn()
+        except JobCancelledError:
+            job.transition("cancelled", finished_at=time.time())
+        except Exception as exc:
+            job.transition("failed", error=self._describe(exc), finished_at=time.time())
+        else:
+            payload = value.to_payload() if hasattr(value, "to_payload") else value
+            job.report(1.0)
+            job.transition("succeeded", result=payload, finished_at=time.time())
+
+    def _job(self, job_id: str) -> Job:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return job
+
+    def _evict_locked(self) -> None:
+        finished = [k for k, j in self._jobs.items() if j.finished]
+        for k in finished[: max(0, len(finished) - self._keep_finished)]:
+            del self._jobs[k]
@@ -22,6 +22,7 @@ from apps.api.routes.episode_bgm__route import router as _episode_bgm_router
 from apps.api.routes.file__route import router as _file_router
 from apps.api.routes.frame__route import router as _frame_router
 from apps.api.routes.intro_card__route import router as _intro_card_router
+from apps.api.routes.job__route import router as _job_router
 from apps.api.routes.scene_plate__route import router as _scene_plate_router
 from apps.api.routes.media__route import router as _media_router
 from apps.api.routes.novel__route import router as _novel_router
@@ -60,3 +61,4 @@ router.include_router(_subtitle_router)
 router.include_router(_intro_card_router)
 router.include_router(_production_router)
 router.include_router(_drama_router)
+router.include_router(_job_router)
@@ -1,6 +1,20 @@
 """Shared route helpers (cross-cutting across aggregate route files)."""
 from __future__ import annotations
 
+import re
+from typing import Any, Iterator
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from libs.application.dtos.media__dto import MediaFileQdto
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_STREAM_CHUNK: int = 256 * 1024
+# a versioned URL (`?v=` changes whenever the bytes do) is cached for a year
+_IMMUTABLE_CACHE: str = "private, max-age=31536000, immutable"
+_REVALIDATE_CACHE: str = "no-cache"
+
 
 def file_security_headers(filename: str) -> dict[str, str]:
     safe = "".join(c for c in filename if 32 <= ord(c) < 127 and c not in '"\\')
@@ -10,3 +24,90 @@ def file_security_headers(filename: str) -> dict[str, str]:
         "X-Content-Type-Options": "nosniff",
         "Content-Disposition": f'attachment; filename="{safe}"',
     }
+
+
+def job_accepted(snapshot: dict[str, Any]) -> JSONResponse:
+    """202 for an operation handed to the background job queue (`background:
+    true`): the body is the queued job; poll `/api/jobs/{id}` or stream
+    `/api/jobs/{id}/events` for progress and the final payload."""
+    return JSONResponse(status_code=202, content={"job": snapshot})
+
+
+def media_file_response(request: Request, qdto: MediaFileQdto, *, versioned: bool) -> Response:
+    """Serve a media file with HTTP caching + byte ranges: a strong ETag and
+    Last-Modified, `If-None-Match` -> empty 304, a single `Range: bytes=…`
+    -> 206 (unsatisfiable -> 416; honoured only while `If-Range` still
+    matches), else the whole file — streamed in chunks either way. Multi-range
+    requests get the whole file (allowed by RFC 9110)."""
+    size = qdto.size_bytes
+    headers = {
+        **file_security_headers(qdto.filename),
+        "ETag": qdto.etag,
+        "Last-Modified": qdto.mtime_http,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": _IMMUTABLE_CACHE if versioned else _REVALIDATE_CACHE,
+    }
+    if _etag_matches(request.headers.get("if-none-match"), qdto.etag):
+        return Response(status_code=304, headers=headers)
+    span = _requested_span(request, qdto)
+    if span == "unsatisfiable":
+        return Response(
+            status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"}
+        )
+    start, end = span if span is not None else (0, size - 1)
+    status = 200
+    if span is not None:
+        status = 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        _read_span(qdto, start, end),
+        status_code=status,
+        media_type=qdto.media_type,
+        headers=headers,
+    )
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header or not etag:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _requested_span(request: Request, qdto: MediaFileQdto) -> tuple[int, int] | str | None:
+    """(start, end) inclusive, "unsatisfiable", or None for the whole file."""
+    raw = request.headers.get("range")
+    if not raw:
+        return None
+    if_range = request.headers.get("if-range")
+    if if_range and if_range not in (qdto.etag, qdto.mtime_http):
+        return None
+    m = _RANGE_RE.match(raw.strip())
+    if m is None:
+        return None  # malformed or multi-range: ignore, send it all
+    first, last = m.groups()
+    size = qdto.size_bytes
+    if first == "":
+        if last == "" or int(last) == 0:
+            return "unsatisfiable"
+        return max(0, size - int(last)), size - 1
+    start = int(first)
+    if start >= size:
+        return "unsatisfiable"
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if end < start:
+        return None
+    return start, end
+
+
+def _read_span(qdto: MediaFileQdto, start: int, end: int) -> Iterator[bytes]:
+    remaining = end - start + 1
+    with open(qdto.resolved_path, "rb") as f:
+        f.seek(start)
+        while remaining > 0:
+            chunk = f.read(min(_STREAM_CHUNK, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
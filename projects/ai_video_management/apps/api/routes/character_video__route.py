@@ -7,6 +7,8 @@ from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from apps.api.container import Container
+from apps.api.jobs import JobManager
+from apps.api.routes._helpers import job_accepted
 from libs.application.commands.character_video__command import CharacterVideoCommand
 
 router = APIRouter()
@@ -26,6 +28,7 @@ class ExtractCharacterViewsBody(BaseModel):
 
 class ExtractAllCharacterViewsBody(BaseModel):
     path: str
+    background: bool = False  # queue as a job → 202 {job}; see /api/jobs
 
 
 @router.post("/api/truncate-character-video")
@@ -60,7 +63,12 @@ def extract_character_views(
 def extract_all_character_views(
     body: ExtractAllCharacterViewsBody,
     command: CharacterVideoCommand = Depends(Provide[Container.character_video_command]),
+    jobs: JobManager = Depends(Provide[Container.job_manager]),
 ) -> Response:
+    if body.background:
+        return job_accepted(jobs.submit(
+            "extract-all-character-views", body.path, lambda: command.extract_all_views(body.path)
+        ))
     return JSONResponse(
         status_code=200, content=command.extract_all_views(body.path).to_payload()
     )
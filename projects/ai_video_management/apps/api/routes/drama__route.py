@@ -18,6 +18,10 @@ class DramaScopeBody(BaseModel):
     path: str  # any file or folder under ai_videos/{drama}/
 
 
+class SelectDramaTakesBody(DramaScopeBody):
+    force: bool = False  # re-copy even the shots already locked to their newest take
+
+
 @router.post("/api/list-drama-episodes")
 @inject
 def list_drama_episodes(
@@ -30,9 +34,9 @@ def list_drama_episodes(
 @router.post("/api/select-drama-takes")
 @inject
 def select_drama_takes(
-    body: DramaScopeBody,
+    body: SelectDramaTakesBody,
     command: DramaTakesCommand = Depends(Provide[Container.drama_takes_command]),
 ) -> Response:
     return JSONResponse(
-        status_code=200, content=command.select_all(body.path).to_payload()
+        status_code=200, content=command.select_all(body.path, body.force).to_payload()
     )
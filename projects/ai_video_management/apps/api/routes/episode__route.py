@@ -7,6 +7,8 @@ from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, ConfigDict, Field
 
 from apps.api.container import Container
+from apps.api.jobs import JobManager
+from apps.api.routes._helpers import job_accepted
 from libs.application.commands.episode__command import EpisodeCommand
 from libs.application.commands.episode_takes__command import EpisodeTakesCommand
 from libs.application.queries.episode__query import EpisodeQuery
@@ -16,6 +18,7 @@ router = APIRouter()
 
 class EpisodeTakesBody(BaseModel):
     path: str
+    force: bool = False  # re-copy even the shots already locked to their newest take
 
 
 class SeamPlanEntry(BaseModel):
@@ -33,6 +36,9 @@ class ConcatEpisodeBody(BaseModel):
     lang: str = "original"  # "original" | "zh" | "en" | "both"
     rife: bool = False       # RIFE motion-bridge the 承接 seams (slower, needs GPU exe)
     plan: list[SeamPlanEntry] | None = None  # explicit per-seam plan (overrides auto gate)
+    incremental: bool = False  # reuse cached per-shot segments; re-encode only changed shots
+    background: bool = False   # queue as a job → 202 {job}; progress via /api/jobs/{id}/events
+    force: bool = False        # re-stitch even when ep{NN}.mp4 is up to date
 
 
 class EpisodeSeamsBody(BaseModel):
@@ -51,14 +57,24 @@ class EpisodeSeamMetricsBody(BaseModel):
 def concat_episode(
     body: ConcatEpisodeBody,
     command: EpisodeCommand = Depends(Provide[Container.episode_command]),
+    jobs: JobManager = Depends(Provide[Container.job_manager]),
 ) -> Response:
     plan = (
         [e.model_dump(by_alias=True) for e in body.plan]
         if body.plan is not None else None
     )
+    if body.background:
+        return job_accepted(jobs.submit(
+            "concat-episode", body.path,
+            lambda: command.concat(
+                body.path, body.lang, body.rife, plan, body.incremental, body.force
+            ),
+        ))
     return JSONResponse(
         status_code=200,
-        content=command.concat(body.path, body.lang, body.rife, plan).to_payload(),
+        content=command.concat(
+            body.path, body.lang, body.rife, plan, body.incremental, body.force
+        ).to_payload(),
     )
 
 
@@ -68,7 +84,7 @@ def select_episode_takes(
     body: EpisodeTakesBody,
     command: EpisodeTakesCommand = Depends(Provide[Container.episode_takes_command]),
 ) -> Response:
-    return JSONResponse(status_code=200, content=command.select(body.path).to_payload())
+    return JSONResponse(status_code=200, content=command.select(body.path, body.force).to_payload())
 
 
 @router.post("/api/episode-seams")
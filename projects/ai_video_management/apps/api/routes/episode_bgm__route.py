@@ -12,6 +12,8 @@ from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from apps.api.container import Container
+from apps.api.jobs import JobManager
+from apps.api.routes._helpers import job_accepted
 from libs.application.commands.episode_bgm__command import EpisodeBgmCommand
 from libs.application.queries.episode_bgm__query import EpisodeBgmQuery
 
@@ -33,6 +35,8 @@ class UnassignBgmCueBody(BaseModel):
 
 class BurnEpisodeBgmBody(BaseModel):
     path: str
+    background: bool = False  # queue as a job → 202 {job}; see /api/jobs
+    force: bool = False       # re-mix even when the output is up to date
 
 
 @router.get("/api/episode-bgm")
@@ -69,6 +73,11 @@ def episode_bgm_unassign(
 def episode_bgm_burn(
     body: BurnEpisodeBgmBody,
     command: EpisodeBgmCommand = Depends(Provide[Container.episode_bgm_command]),
+    jobs: JobManager = Depends(Provide[Container.job_manager]),
 ) -> Response:
-    cdto = command.burn(body.path)
+    if body.background:
+        return job_accepted(jobs.submit(
+            "episode-bgm-burn", body.path, lambda: command.burn(body.path, body.force)
+        ))
+    cdto = command.burn(body.path, body.force)
     return JSONResponse(status_code=200, content=cdto.to_payload())
@@ -0,0 +1,85 @@
+"""Background-job routes: list / status / cancel + an SSE progress stream.
+
+Jobs are created by the long ffmpeg routes when called with `background: true`
+(see `apps/api/jobs.py`). The event stream polls the job on the event loop —
+a watcher never holds a threadpool thread — and sends one `job` event per
+state/progress change, ending after the terminal state.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+from apps.api.container import Container
+from apps.api.jobs import JobManager
+from libs.common.job_progress import TERMINAL_STATES
+
+router = APIRouter()
+
+_POLL_S: float = 0.25
+_HEARTBEAT_S: float = 15.0
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.get("/api/jobs")
+@inject
+def list_jobs(jobs: JobManager = Depends(Provide[Container.job_manager])) -> Response:
+    return JSONResponse(status_code=200, content={"jobs": jobs.snapshots()})
+
+
+@router.get("/api/jobs/{job_id}")
+@inject
+def get_job(
+    job_id: str, jobs: JobManager = Depends(Provide[Container.job_manager])
+) -> Response:
+    return JSONResponse(status_code=200, content=jobs.get(job_id))
+
+
+@router.post("/api/jobs/{job_id}/cancel")
+@inject
+def cancel_job(
+    job_id: str, jobs: JobManager = Depends(Provide[Container.job_manager])
+) -> Response:
+    return JSONResponse(status_code=200, content=jobs.cancel(job_id))
+
+
+@router.get("/api/jobs/{job_id}/events")
+@inject
+async def job_events(
+    job_id: str,
+    request: Request,
+    jobs: JobManager = Depends(Provide[Container.job_manager]),
+) -> Response:
+    first = jobs.get(job_id)  # 404 before the stream opens, not inside it
+
+    async def _stream() -> AsyncIterator[str]:
+        snap = first
+        yield _sse("job", snap)
+        last_sent = asyncio.get_running_loop().time()
+        while snap["state"] not in TERMINAL_STATES:
+            await asyncio.sleep(_POLL_S)
+            if await request.is_disconnected():
+                return
+            cur = jobs.get(job_id)
+            now = asyncio.get_running_loop().time()
+            if cur["version"] != snap["version"]:
+                snap = cur
+                last_sent = now
+                yield _sse("job", snap)
+            elif now - last_sent >= _HEARTBEAT_S:
+                last_sent = now
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,13 +1,20 @@
-"""Media-aggregate routes: serve / archive / unarchive / delete / hard_delete / purge_deleted / rename."""
+"""Media-aggregate routes: serve / thumbnail / archive / unarchive / delete / hard_delete / purge_deleted / rename.
+
+`GET /api/media` streams with byte ranges (video scrubbing fetches only what it
+plays) and a strong ETag; a URL carrying `v` (the UI's mtime / cache buster) is
+marked immutable, an unversioned one is revalidated (304) on every use.
+`GET /api/thumbnail` serves the same way a small cached WebP/JPEG of an image,
+or a poster frame of a video, for galleries.
+"""
 from __future__ import annotations
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from apps.api.container import Container
-from apps.api.routes._helpers import file_security_headers
+from apps.api.routes._helpers import media_file_response
 from libs.application.commands.media__command import MediaCommand
 from libs.application.queries.media__query import MediaQuery
 
@@ -25,15 +32,24 @@ class ArchiveMediaBody(BaseModel):
 @router.get("/api/media")
 @inject
 def get_media(
+    request: Request,
     path: str = Query(...),
+    v: str | None = Query(None),
     query: MediaQuery = Depends(Provide[Container.media_query]),
 ) -> Response:
-    qdto = query.serve(path)
-    return FileResponse(
-        str(qdto.resolved_path),
-        media_type=qdto.media_type,
-        headers=file_security_headers(qdto.filename),
-    )
+    return media_file_response(request, query.serve(path), versioned=bool(v))
+
+
+@router.get("/api/thumbnail")
+@inject
+def get_thumbnail(
+    request: Request,
+    path: str = Query(...),
+    w: int | None = Query(None, ge=1, le=4096),
+    v: str | None = Query(None),
+    query: MediaQuery = Depends(Provide[Container.media_query]),
+) -> Response:
+    return media_file_response(request, query.thumbnail(path, w), versioned=bool(v))
 
 
 @router.post("/api/rename-media")
@@ -14,6 +14,7 @@ router = APIRouter()
 
 class ExportProductionBody(BaseModel):
     path: str
+    force: bool = False  # re-copy even the production files that are up to date
 
 
 @router.post("/api/export-production")
@@ -23,5 +24,5 @@ def export_production(
     command: ProductionCommand = Depends(Provide[Container.production_command]),
 ) -> Response:
     return JSONResponse(
-        status_code=200, content=command.export(body.path).to_payload()
+        status_code=200, content=command.export(body.path, body.force).to_payload()
     )
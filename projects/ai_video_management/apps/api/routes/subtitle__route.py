@@ -5,12 +5,18 @@ from __future__ import annotations
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends
 from fastapi.responses import JSONResponse, Response
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from apps.api.container import Container
+from apps.api.jobs import JobManager
+from apps.api.routes._helpers import job_accepted
 from libs.application.commands.subtitle__command import SubtitleCommand
 from libs.application.commands.subtitle_batch__command import SubtitleBatchCommand
 from libs.application.commands.episode_subtitle__command import EpisodeSubtitleCommand
+from libs.application.dtos.subtitle__dto import (
+    EpisodeWholeBurnLangsResultCdto,
+    EpisodeWholeBurnResultCdto,
+)
 
 router = APIRouter()
 
@@ -22,16 +28,46 @@ class SubtitlePathBody(BaseModel):
 class BurnSubtitlesBody(BaseModel):
     path: str
     lang: str = "zh"  # "zh" | "en" | "both"
+    force: bool = False  # re-burn even the masters that are up to date
+
+
+class BatchBurnSubtitlesBody(BurnSubtitlesBody):
+    # concurrent ffmpegs; None → cores ÷ threads-per-ffmpeg, 1 → one at a time
+    workers: int | None = Field(default=None, ge=1)
+
+
+class MultiLangBurnSubtitlesBody(BurnSubtitlesBody):
+    # several masters from ONE decode (e.g. ["zh", "en", "both"]); overrides
+    # `lang` and answers {"results": [...]}, one entry per language
+    langs: list[str] | None = None
+
+
+class BackgroundBody(BaseModel):
+    background: bool = False  # queue as a job → 202 {job}; see /api/jobs
+
+
+class BackgroundMultiLangBurnSubtitlesBody(MultiLangBurnSubtitlesBody, BackgroundBody):
+    pass
+
+
+class BackgroundBatchBurnSubtitlesBody(BatchBurnSubtitlesBody, BackgroundBody):
+    pass
 
 
 @router.post("/api/burn-subtitles")
 @inject
 def burn_subtitles(
-    body: BurnSubtitlesBody,
+    body: MultiLangBurnSubtitlesBody,
     command: SubtitleCommand = Depends(Provide[Container.subtitle_command]),
 ) -> Response:
+    if body.langs is not None:
+        return JSONResponse(
+            status_code=200,
+            content=command.burn_langs(body.path, body.langs, body.force).to_payload(),
+        )
     return JSONResponse(
-        status_code=200, content=command.burn(body.path, body.lang).to_payload()
+        status_code=200,
+        content=command.burn(body.path, body.lang, body.force).to_payload(),
     )
 
 
@@ -58,31 +94,51 @@ def scaffold_episode_subtitles(
 @router.post("/api/burn-episode-subtitles")
 @inject
 def burn_episode_subtitles(
-    body: BurnSubtitlesBody,
+    body: BatchBurnSubtitlesBody,
     command: SubtitleBatchCommand = Depends(Provide[Container.subtitle_batch_command]),
 ) -> Response:
     return JSONResponse(
-        status_code=200, content=command.burn_episode(body.path, body.lang).to_payload()
+        status_code=200,
+        content=command.burn_episode(
+            body.path, body.lang, body.workers, body.force
+        ).to_payload(),
     )
 
 
 @router.post("/api/burn-episode-subtitles-whole")
 @inject
 def burn_episode_subtitles_whole(
-    body: BurnSubtitlesBody,
+    body: BackgroundMultiLangBurnSubtitlesBody,
     command: EpisodeSubtitleCommand = Depends(Provide[Container.episode_subtitle_command]),
+    jobs: JobManager = Depends(Provide[Container.job_manager]),
 ) -> Response:
-    return JSONResponse(
-        status_code=200, content=command.burn_whole(body.path, body.lang).to_payload()
-    )
+    langs = body.langs
+
+    def _run() -> EpisodeWholeBurnResultCdto | EpisodeWholeBurnLangsResultCdto:
+        if langs is not None:
+            return command.burn_whole_langs(body.path, langs, body.force)
+        return command.burn_whole(body.path, body.lang, body.force)
+
+    if body.background:
+        return job_accepted(jobs.submit("burn-episode-subtitles-whole", body.path, _run))
+    return JSONResponse(status_code=200, content=_run().to_payload())
 
 
 @router.post("/api/burn-drama-subtitles")
 @inject
 def burn_drama_subtitles(
-    body: BurnSubtitlesBody,
+    body: BackgroundBatchBurnSubtitlesBody,
     command: SubtitleBatchCommand = Depends(Provide[Container.subtitle_batch_command]),
+    jobs: JobManager = Depends(Provide[Container.job_manager]),
 ) -> Response:
+    if body.background:
+        return job_accepted(jobs.submit(
+            "burn-drama-subtitles", body.path,
+            lambda: command.burn_drama(body.path, body.lang, body.workers, body.force),
+        ))
     return JSONResponse(
-        status_code=200, content=command.burn_drama(body.path, body.lang).to_payload()
+        status_code=200,
+        content=command.burn_drama(
+            body.path, body.lang, body.workers, body.force
+        ).to_payload(),
     )
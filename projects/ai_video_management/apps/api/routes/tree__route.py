@@ -1,18 +1,43 @@
-"""Tree-aggregate routes: GET /api/tree."""
-from __future__ import annotations
+"""Tree-aggregate routes: GET /api/tree.
+
+The tree is served from the watcher-backed cached model with a content ETag;
+a matching `If-None-Match` gets an empty 304 (the UI revalidates on every
+refresh, so an unchanged tree costs neither a walk nor a payload).
 
-from typing import Any
+Lazy loading: `depth` (levels of children kept), `path` (subtree of one
+section / directory) and `offset` + `limit` (window over a huge folder's
+children) return only that slice. Without any of them the full tree is
+returned, as before.
+"""
+from __future__ import annotations
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import JSONResponse, Response
 
 from apps.api.container import Container
 from libs.application.queries.tree__query import TreeQuery
 
 router = APIRouter()
 
+_MAX_LIMIT: int = 5000
+
 
 @router.get("/api/tree")
 @inject
-def get_tree(query: TreeQuery = Depends(Provide[Container.tree_query])) -> dict[str, Any]:
-    return query.build().to_payload()
+def get_tree(
+    request: Request,
+    path: str = Query(""),
+    depth: int | None = Query(None, ge=0),
+    offset: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1, le=_MAX_LIMIT),
+    query: TreeQuery = Depends(Provide[Container.tree_query]),
+) -> Response:
+    if path or depth is not None or offset or limit is not None:
+        qdto = query.view(path=path, depth=depth, offset=offset, limit=limit)
+    else:
+        qdto = query.build()
+    headers = {"ETag": qdto.etag, "Cache-Control": "no-cache"}
+    if qdto.etag and request.headers.get("if-none-match") == qdto.etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(status_code=200, content=qdto.to_payload(), headers=headers)
@@ -21,13 +21,15 @@ async function readJson<T>(response: Response): Promise<T> {
 }
 
 export async function fetchTree(): Promise<TreeNode> {
-  // `no-store`: after a delete/rename the left-nav tree must reflect the
-  // current filesystem. Without it the browser can serve a cached /api/tree
-  // and the deleted actor keeps showing in the sidebar.
+  // `no-cache`: after a delete/rename the left-nav tree must reflect the
+  // current filesystem, so every call revalidates — but with the server's
+  // ETag, so an unchanged tree comes back as an empty 304 and the browser
+  // reuses its copy (a stale cached /api/tree once kept a deleted actor
+  // showing in the sidebar; revalidation rules that out).
   const response = await fetch("/api/tree", {
     method: "GET",
     headers: { Accept: "application/json" },
-    cache: "no-store",
+    cache: "no-cache",
   });
   return readJson<TreeNode>(response);
 }
@@ -220,20 +222,39 @@ export interface BurnSubtitlesResult {
   out: string;
   cues: number;
   lang: SubtitleLang;
+  /** The master was already built from this render + subtitles.md; not re-burned. */
+  up_to_date: boolean;
 }
 
+/** Burn one language master. Skipped (`up_to_date`) when nothing it depends on
+ * changed since the last burn, unless `force`. */
 export async function burnSubtitles(
   path: string,
   lang: SubtitleLang = "zh",
+  force: boolean = false,
 ): Promise<BurnSubtitlesResult> {
   const response = await fetch("/api/burn-subtitles", {
     method: "POST",
     headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path, lang }),
+    body: JSON.stringify({ path, lang, force }),
   });
   return readJson<BurnSubtitlesResult>(response);
 }
 
+/** Burn several language masters of one render (e.g. zh + en + zhen) from a
+ * single decode — one ffmpeg process instead of one per language. */
+export async function burnSubtitlesLangs(
+  path: string,
+  langs: SubtitleLang[],
+): Promise<{ results: BurnSubtitlesResult[] }> {
+  const response = await fetch("/api/burn-subtitles", {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Accept: "application/json" },
+    body: JSON.stringify({ path, langs }),
+  });
+  return readJson<{ results: BurnSubtitlesResult[] }>(response);
+}
+
 export interface ScaffoldSubtitlesResult {
   path: string;
   cues: number;
@@ -256,6 +277,7 @@ export interface BatchShotOutcome {
   out: string | null;
   cues: number | null;
   reason: string | null;
+  up_to_date: boolean;
 }
 
 export interface ScaffoldEpisodeSubtitlesResult {
@@ -284,15 +306,16 @@ export interface BurnEpisodeSubtitlesResult {
 
 /** Burn the {lang} subtitle master for every shot in ONE episode (each shot's
  * newest render + its subtitles.md). `path` may be any file under the episode
- * folder. */
+ * folder. `workers` caps concurrent ffmpegs (default: cores ÷ threads each). */
 export async function burnEpisodeSubtitles(
   path: string,
   lang: SubtitleLang = "zh",
+  workers?: number,
 ): Promise<BurnEpisodeSubtitlesResult> {
   const response = await fetch("/api/burn-episode-subtitles", {
     method: "POST",
     headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path, lang }),
+    body: JSON.stringify({ path, lang, workers }),
   });
   return readJson<BurnEpisodeSubtitlesResult>(response);
 }
@@ -305,17 +328,13 @@ export interface BurnDramaSubtitlesResult {
 
 /** Burn the {lang} subtitle master for every shot across ALL episodes of a
  * drama (each shot's newest render + its subtitles.md). `path` may be any file
- * under the drama folder. */
+ * under the drama folder. `workers` as in burnEpisodeSubtitles. */
 export async function burnDramaSubtitles(
   path: string,
   lang: SubtitleLang = "zh",
+  workers?: number,
 ): Promise<BurnDramaSubtitlesResult> {
-  const response = await fetch("/api/burn-drama-subtitles", {
-    method: "POST",
-    headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path, lang }),
-  });
-  return readJson<BurnDramaSubtitlesResult>(response);
+  return runJob<BurnDramaSubtitlesResult>("/api/burn-drama-subtitles", { path, lang, workers });
 }
 
 export interface ExportedEpisode {
@@ -324,6 +343,7 @@ export interface ExportedEpisode {
   episode: string;  // ep01
   src: string;
   out: string;
+  up_to_date: boolean;  // production copy already current; not re-copied
 }
 
 export interface ExportProductionResult {
@@ -339,11 +359,14 @@ export interface ExportProductionResult {
  * (language implied by the sub-folder, so the suffix is stripped). Overwrites;
  * nothing-to-export is a valid empty result. `path` may be any file under the
  * drama folder. */
-export async function exportProduction(path: string): Promise<ExportProductionResult> {
+export async function exportProduction(
+  path: string,
+  force: boolean = false,
+): Promise<ExportProductionResult> {
   const response = await fetch("/api/export-production", {
     method: "POST",
     headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path }),
+    body: JSON.stringify({ path, force }),
   });
   return readJson<ExportProductionResult>(response);
 }
@@ -889,11 +912,6 @@ export async function suggestRefinements(
   return readJson<SuggestRefinementsResult>(response);
 }
 
-/** Build a same-origin URL for image preview, with mtime cache-buster. */
-export function imageUrl(path: string, mtime: number): string {
-  return `/api/file?path=${encodeURIComponent(path)}&mtime=${encodeURIComponent(String(mtime))}`;
-}
-
 /** Build a same-origin URL for raw media (image / video / audio) via /api/media.
  * Bypasses /api/file's base64 + 1 MB limit. Per follow-up 005.
  *
@@ -901,6 +919,9 @@ export function imageUrl(path: string, mtime: number): string {
  * Otherwise we append a module-level buster bumped on every tree refresh by
  * `bumpMediaCacheBuster()` — this evicts stale browser cache after a regen
  * (e.g. character views) where the URL path is unchanged but the bytes are not.
+ * A versioned URL is served `immutable`, so until the version moves the browser
+ * re-uses its copy without asking; the server also answers byte ranges (video
+ * seeking) and `If-None-Match` revalidation.
  */
 let _mediaCacheBuster: number = Date.now();
 export function bumpMediaCacheBuster(): void {
@@ -911,6 +932,14 @@ export function mediaUrl(path: string, mtime?: number): string {
   return `/api/media?path=${encodeURIComponent(path)}&v=${encodeURIComponent(String(v))}`;
 }
 
+/** Same-origin URL of a gallery-sized still via /api/thumbnail: a cached
+ * WebP/JPEG of an image, or a poster frame of a video. `width` snaps up to
+ * 128 / 256 / 512 server-side. Versioned like `mediaUrl`. */
+export function thumbUrl(path: string, mtime?: number, width: number = 256): string {
+  const v = mtime !== undefined ? mtime : _mediaCacheBuster;
+  return `/api/thumbnail?path=${encodeURIComponent(path)}&w=${width}&v=${encodeURIComponent(String(v))}`;
+}
+
 export interface TruncateCharacterVideoResult {
   src: string;
   out: string;
@@ -1026,12 +1055,7 @@ export interface ExtractAllCharacterViewsResult {
 export async function extractAllCharacterViews(
   path: string,
 ): Promise<ExtractAllCharacterViewsResult> {
-  const response = await fetch("/api/extract-all-character-views", {
-    method: "POST",
-    headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path }),
-  });
-  return readJson<ExtractAllCharacterViewsResult>(response);
+  return runJob<ExtractAllCharacterViewsResult>("/api/extract-all-character-views", { path });
 }
 
 export interface EpisodeShotUsed {
@@ -1061,6 +1085,10 @@ export interface ConcatEpisodeResult {
   /** Sidecar ep{NN}.segments.json (each shot's final-timeline [start,end)); the
    * whole-episode subtitle burn reads it to place cues. null if unknown. */
   segments: string | null;
+  /** Incremental build: cached per-shot segments reused without re-encoding. */
+  reused_segments: number;
+  /** Nothing changed since the last stitch: the existing reel was kept. */
+  up_to_date: boolean;
 }
 
 /** One shot→shot junction in the seam planner. */
@@ -1116,25 +1144,26 @@ export async function analyzeEpisodeSeams(
  * the old per-shot burned masters for back-compat. `path` may be any file under
  * the episode folder. When `rife` is true the 承接 seams are bridged with
  * RIFE-synthesised motion instead of butt-joined (slower; needs the
- * rife-ncnn-vulkan exe on the server). */
+ * rife-ncnn-vulkan exe on the server). When `incremental` is true each shot's
+ * normalised segment is cached server-side and only changed shots re-encode
+ * (RIFE seams still go through the full stitch). An up-to-date reel is not
+ * re-stitched unless `force`. */
 export async function concatEpisode(
   path: string,
   lang: EpisodeLang = "original",
   rife: boolean = false,
   plan: SeamPlanEntry[] | null = null,
+  incremental: boolean = false,
+  force: boolean = false,
 ): Promise<ConcatEpisodeResult> {
-  const response = await fetch("/api/concat-episode", {
-    method: "POST",
-    headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path, lang, rife, plan }),
-  });
-  return readJson<ConcatEpisodeResult>(response);
+  return runJob<ConcatEpisodeResult>("/api/concat-episode", { path, lang, rife, plan, incremental, force });
 }
 
 export interface SelectTake {
   shot: string;
   src: string;   // the newest renders/ take that was copied
   out: string;   // the locked shot{NN}.mp4
+  up_to_date: boolean;  // already locked to this take; not re-copied
 }
 
 export interface SelectEpisodeTakesResult {
@@ -1149,11 +1178,12 @@ export interface SelectEpisodeTakesResult {
  * under the episode folder. */
 export async function selectEpisodeTakes(
   path: string,
+  force: boolean = false,
 ): Promise<SelectEpisodeTakesResult> {
   const response = await fetch("/api/select-episode-takes", {
     method: "POST",
     headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path }),
+    body: JSON.stringify({ path, force }),
   });
   return readJson<SelectEpisodeTakesResult>(response);
 }
@@ -1164,6 +1194,7 @@ export interface BurnEpisodeWholeResult {
   lang: SubtitleLang;
   cues: number;
   shots: number;
+  up_to_date: boolean;
 }
 
 /** Step ③ of the concat-first flow: burn ONE subtitle track onto the clean
@@ -1176,12 +1207,16 @@ export async function burnEpisodeSubtitlesWhole(
   path: string,
   lang: SubtitleLang = "zh",
 ): Promise<BurnEpisodeWholeResult> {
-  const response = await fetch("/api/burn-episode-subtitles-whole", {
-    method: "POST",
-    headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path, lang }),
-  });
-  return readJson<BurnEpisodeWholeResult>(response);
+  return runJob<BurnEpisodeWholeResult>("/api/burn-episode-subtitles-whole", { path, lang });
+}
+
+/** `burnEpisodeSubtitlesWhole` for several languages at once: the reel is
+ * decoded once and every ep{NN}_{lang}.mp4 is encoded from that one pass. */
+export async function burnEpisodeSubtitlesWholeLangs(
+  path: string,
+  langs: SubtitleLang[],
+): Promise<{ results: BurnEpisodeWholeResult[] }> {
+  return runJob<{ results: BurnEpisodeWholeResult[] }>("/api/burn-episode-subtitles-whole", { path, langs });
 }
 
 // ============================================================================
@@ -1774,6 +1809,7 @@ export interface BurnEpisodeBgmResult {
   out: string;
   used: Array<{ window: string; bgm_id: string; duck: boolean }>;
   skipped: Array<{ window: string; reason: string }>;
+  up_to_date: boolean;
 }
 
 export async function readEpisodeBgm(path: string): Promise<EpisodeBgmRead> {
@@ -1807,13 +1843,11 @@ export async function unassignBgmCue(
   return readJson<EpisodeBgmRead>(response);
 }
 
-export async function burnEpisodeBgm(path: string): Promise<BurnEpisodeBgmResult> {
-  const response = await fetch("/api/episode-bgm/burn", {
-    method: "POST",
-    headers: { "Content-Type": "application/json", Accept: "application/json" },
-    body: JSON.stringify({ path }),
-  });
-  return readJson<BurnEpisodeBgmResult>(response);
+export async function burnEpisodeBgm(
+  path: string,
+  force: boolean = false,
+): Promise<BurnEpisodeBgmResult> {
+  return runJob<BurnEpisodeBgmResult>("/api/episode-bgm/burn", { path, force });
 }
 
 /** One scored metric within a seam method's result (M1–M4). */
@@ -1912,3 +1946,92 @@ export async function scoreEpisodeSeams(
   });
   return readJson<SeamMetricsResult>(response);
 }
+
+// ============================================================================
+// Background jobs — the long ffmpeg routes (concat-episode, burn-episode-
+// subtitles-whole, burn-drama-subtitles, episode-bgm/burn, extract-all-
+// character-views) accept `background: true` and answer 202 {job}. Their
+// wrappers above all go through `runJob`, so no request holds a server thread
+// (or a proxy timeout) for the length of an encode.
+// ============================================================================
+
+export type JobState = "queued" | "running" | "succeeded" | "failed" | "cancelled";
+
+export interface Job<R = unknown> {
+  id: string;
+  kind: string;            // "concat-episode" | "seam-scores" | …
+  target: string;          // the path the operation works on
+  state: JobState;
+  progress: number;        // 0..1, from ffmpeg's -progress output
+  stage: string | null;    // current unit of a batch ("ep02/shot05", …)
+  cancel_requested: boolean;
+  result: R | null;        // the sync route's payload once succeeded
+  error: ApiErrorDetail | null;
+  created_at: number;
+  started_at: number | null;
+  finished_at: number | null;
+  version: number;
+}
+
+/** Queue one of the long operations as a background job; `body` is the same
+ * JSON the synchronous call takes. */
+export async function submitJob<R>(
+  url: string,
+  body: Record<string, unknown>,
+): Promise<Job<R>> {
+  const response = await fetch(url, {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Accept: "application/json" },
+    body: JSON.stringify({ ...body, background: true }),
+  });
+  return (await readJson<{ job: Job<R> }>(response)).job;
+}
+
+export async function getJob<R>(id: string): Promise<Job<R>> {
+  const response = await fetch(`/api/jobs/${encodeURIComponent(id)}`, {
+    method: "GET",
+    headers: { Accept: "application/json" },
+    cache: "no-store",
+  });
+  return readJson<Job<R>>(response);
+}
+
+/** Run one long operation as a background job and resolve with its payload —
+ * what the synchronous call answers. A failed job throws its `error` as an
+ * ApiError, as the synchronous route would have. */
+async function runJob<R>(url: string, body: Record<string, unknown>): Promise<R> {
+  let job = await submitJob<R>(url, body);
+  // a dropped stream settles with the latest snapshot — follow it to the end
+  while (job.state === "queued" || job.state === "running") {
+    job = await watchJob<R>(job.id, () => {});
+  }
+  if (job.state === "succeeded") return job.result as R;
+  const detail = job.state === "cancelled" ? { kind: "job_cancelled" } : job.error;
+  throw new ApiError(job.state === "cancelled" ? 409 : 500, `job ${job.state}`, detail);
+}
+
+/** Follow a job over SSE: `onUpdate` fires per state/progress change; the
+ * promise settles with the terminal snapshot. Abort `signal` to stop watching. */
+export function watchJob<R>(
+  id: string,
+  onUpdate: (job: Job<R>) => void,
+  signal?: AbortSignal,
+): Promise<Job<R>> {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(`/api/jobs/${encodeURIComponent(id)}/events`);
+    signal?.addEventListener("abort", () => source.close());
+    source.addEventListener("job", (ev) => {
+      const job = JSON.parse((ev as MessageEvent<string>).data) as Job<R>;
+      onUpdate(job);
+      if (job.state === "succeeded" || job.state === "failed" || job.state === "cancelled") {
+        source.close();
+        resolve(job);
+      }
+    });
+    source.onerror = () => {
+      source.close();
+      // the stream closes after the terminal event; fall back to one read
+      getJob<R>(id).then(resolve, reject);
+    };
+  });
+}
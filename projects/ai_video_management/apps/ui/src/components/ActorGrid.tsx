@@ -9,7 +9,7 @@
  */
 import { useCallback, useEffect, useMemo, useState } from "react";
 import { useNavigate } from "react-router-dom";
-import { ATTR_OPTIONS, castingAssign, deleteActor, importFromDownloads, listActors, mediaUrl, type ActorInfo } from "../api";
+import { ATTR_OPTIONS, castingAssign, deleteActor, importFromDownloads, listActors, mediaUrl, thumbUrl, type ActorInfo } from "../api";
 import { extractDramas, type DramaChoice } from "../lib/dramas";
 import { announceToast } from "../lib/announce";
 import { ApiError, type TreeNode } from "../types";
@@ -361,7 +361,7 @@ export function ActorGrid({ tree, onChange }: ActorGridProps): JSX.Element {
                   <>
                     <img
                       className="actor-tile-image"
-                      src={mediaUrl(actor.image_path, actor.mtime)}
+                      src={thumbUrl(actor.image_path, actor.mtime, 512)}
                       alt={actor.id}
                       loading="lazy"
                     />
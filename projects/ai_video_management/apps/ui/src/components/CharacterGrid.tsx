@@ -15,6 +15,7 @@ import {
   extractCharacterViews,
   listCharacterVideos,
   mediaUrl,
+  thumbUrl,
 } from "../api";
 import { extractDramas, findAssetDir, type DramaChoice } from "../lib/dramas";
 import { announceToast } from "../lib/announce";
@@ -227,12 +228,13 @@ export function CharacterGrid({ tree, onChange }: CharacterGridProps): JSX.Eleme
                   {latestVideo ? (
                     <video
                       src={mediaUrl(latestVideo)}
+                      poster={thumbUrl(latestVideo)}
                       controls
-                      preload="metadata"
+                      preload="none"
                       playsInline
                     />
                   ) : t.thumbPath ? (
-                    <img src={mediaUrl(t.thumbPath)} alt={t.folder} loading="lazy" />
+                    <img src={thumbUrl(t.thumbPath)} alt={t.folder} loading="lazy" />
                   ) : (
                     <div className="actor-tile-noimg">无立绘</div>
                   )}
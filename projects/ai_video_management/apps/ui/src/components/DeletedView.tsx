@@ -6,7 +6,7 @@
  */
 import { useCallback, useMemo, useState } from "react";
 import { useNavigate } from "react-router-dom";
-import { hardDeleteMedia, mediaUrl, purgeDeleted } from "../api";
+import { hardDeleteMedia, mediaUrl, purgeDeleted, thumbUrl } from "../api";
 import { announceToast } from "../lib/announce";
 import { ApiError, type TreeNode } from "../types";
 
@@ -216,11 +216,11 @@ export function DeletedView({ tree, onChange }: DeletedViewProps): JSX.Element {
               ) : null}
               <div className="deleted-tile-thumb">
                 {entry.kind === "video" ? (
-                  <video src={mediaUrl(entry.path)} preload="metadata" muted playsInline />
+                  <video src={mediaUrl(entry.path)} poster={thumbUrl(entry.path)} preload="none" muted playsInline />
                 ) : entry.kind === "audio" ? (
                   <audio src={mediaUrl(entry.path)} preload="metadata" controls />
                 ) : (
-                  <img src={mediaUrl(entry.path)} alt={entry.name} loading="lazy" />
+                  <img src={thumbUrl(entry.path)} alt={entry.name} loading="lazy" />
                 )}
               </div>
               <div className="deleted-tile-meta">
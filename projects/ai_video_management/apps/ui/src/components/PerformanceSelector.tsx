@@ -5,7 +5,8 @@
  * read-only with a 📋 复制 button — it never triggers a render directly.
  *
  * Filter UX mirrors CastingView (filter state + useMemo + toast). The regen
- * display + copy mirrors ShotRegenButton. mp4 previews reuse `mediaUrl`. */
+ * display + copy mirrors ShotRegenButton. mp4 previews reuse `mediaUrl`, with a
+ * `thumbUrl` poster until played. */
 import { useCallback, useEffect, useMemo, useState } from "react";
 import {
   type PerformanceCandidate,
@@ -13,6 +14,7 @@ import {
   performanceCandidates,
   regenShotPrompt,
   setShotPerformanceRefs,
+  thumbUrl,
 } from "../api";
 import { ApiError } from "../types";
 
@@ -259,7 +261,8 @@ export function PerformanceSelector({ shotPath, mtime, content }: PerformanceSel
                 {c.mp4_rel_path ? (
                   <video
                     controls
-                    preload="metadata"
+                    preload="none"
+                    poster={thumbUrl(c.mp4_rel_path)}
                     src={mediaUrl(c.mp4_rel_path)}
                     style={{ width: 120, borderRadius: 4, flexShrink: 0 }}
                   />
@@ -27,6 +27,7 @@ import {
   archiveMedia,
   burnEpisodeSubtitles,
   burnEpisodeSubtitlesWhole,
+  burnEpisodeSubtitlesWholeLangs,
   concatShotCharacters,
   selectEpisodeTakes,
   deleteMedia,
@@ -285,10 +286,18 @@ export function Reader({ tree, knownPaths, onSaved }: ReaderProps): JSX.Element
 
   // Step ③ 整集字幕: burn ONE subtitle track onto the clean ep{NN}.mp4, cues
   // placed at their true final-timeline offset (segments.json) → no seam drift.
-  const onBurnEpisodeWholeClick = useCallback(async (lang: SubtitleLang) => {
+  // "all" burns zh / en / 中英 from ONE decode of the reel.
+  const onBurnEpisodeWholeClick = useCallback(async (lang: SubtitleLang | "all") => {
     if (!path) return;
     setBurnWholeBusy(true);
     try {
+      if (lang === "all") {
+        const { results } = await burnEpisodeSubtitlesWholeLangs(path, ["zh", "en", "both"]);
+        const built = results.filter((r) => !r.up_to_date).map((r) => r.out.split("/").pop() ?? r.out);
+        announceToast(built.length > 0 ? `已对成片烧入三版字幕 → ${built.join("、")}` : "三版整集字幕均已是最新，未重烧");
+        onSaved();
+        return;
+      }
       const result = await burnEpisodeSubtitlesWhole(path, lang);
       const langLabel = lang === "both" ? "中英" : lang === "en" ? "英文" : "中文";
       const out = result.out.split("/").pop() ?? result.out;
@@ -537,7 +546,8 @@ export function Reader({ tree, knownPaths, onSaved }: ReaderProps): JSX.Element
                 ["zh", "③ 💬 中文", "对 ep{NN}.mp4 按 segments 烧中文字幕 → ep{NN}_zh.mp4"],
                 ["en", "💬 EN", "对 ep{NN}.mp4 烧英文字幕 → ep{NN}_en.mp4"],
                 ["both", "💬 中英", "对 ep{NN}.mp4 烧中英字幕 → ep{NN}_zhen.mp4"],
-              ] as [SubtitleLang, string, string][]).map(([lang, label, title]) => (
+                ["all", "💬 全部", "一次解码烧出三版 → ep{NN}_zh / _en / _zhen.mp4（未变化的语言跳过）"],
+              ] as [SubtitleLang | "all", string, string][]).map(([lang, label, title]) => (
                 <button key={lang} type="button" className="reader-episode-concat-btn"
                   onClick={() => onBurnEpisodeWholeClick(lang)} disabled={burnWholeBusy}
                   aria-label={`Step 3: burn ${lang} subtitles onto the clean episode reel`}
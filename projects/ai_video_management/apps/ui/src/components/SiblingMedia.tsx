@@ -19,12 +19,14 @@ import {
   archiveMedia,
   burnIntroCards,
   burnSubtitles,
+  burnSubtitlesLangs,
   extractCharacterViews,
   extractFrames,
   extractLastFrame,
   extractScenePlates,
   mediaUrl,
   scaffoldSubtitles,
+  thumbUrl,
   unarchiveMedia,
 } from "../api";
 import type { SubtitleLang } from "../api";
@@ -161,15 +163,18 @@ interface MediaTileProps {
   onExtractLastFrame: (path: string) => void;
   onExtractScenePlates: (path: string) => void;
   onExtractCharacterViews: (path: string) => void;
-  onBurnSubtitles: (path: string, lang: SubtitleLang) => void;
+  onBurnSubtitles: (path: string, lang: SubtitleLang | "all") => void;
   onScaffoldSubtitles: (path: string) => void;
   onBurnIntroCards: (path: string) => void;
 }
 
-const SUBTITLE_LANG_BUTTONS: { lang: SubtitleLang; label: string; title: string }[] = [
+const SUBTITLE_LANGS: SubtitleLang[] = ["zh", "en", "both"];
+
+const SUBTITLE_LANG_BUTTONS: { lang: SubtitleLang | "all"; label: string; title: string }[] = [
   { lang: "zh", label: "💬中文", title: "烧中文字幕 → shot{NN}_zh.mp4 (原视频保留)" },
   { lang: "en", label: "💬EN", title: "Burn English subtitles → shot{NN}_en.mp4 (original kept)" },
   { lang: "both", label: "💬中英", title: "烧中英双语字幕(中上英下) → shot{NN}_zhen.mp4 (原视频保留)" },
+  { lang: "all", label: "💬全部", title: "一次解码烧出三版字幕 → shot{NN}_zh / _en / _zhen.mp4 (未变化的语言跳过，原视频保留)" },
 ];
 
 function MediaTile({
@@ -227,12 +232,14 @@ function MediaTile({
         onClick={(e) => e.stopPropagation()}
         aria-label={`Select ${filename}`}
       />
+      {/* rows list every take of an episode: tiles load a cached poster / thumb,
+          the full file only when a video is played */}
       {isVideo ? (
-        <video controls preload="metadata" src={url} />
+        <video controls preload="none" poster={thumbUrl(path, undefined, 512)} src={url} />
       ) : isAudio ? (
         <audio controls preload="metadata" src={url} />
       ) : (
-        <img src={url} alt={filename} loading="lazy" />
+        <img src={thumbUrl(path, undefined, 512)} alt={filename} loading="lazy" />
       )}
       <figcaption>
         {archived ? "📦 " : ""}
@@ -554,11 +561,17 @@ export function SiblingMedia({ currentPath, knownPaths, onChange }: SiblingMedia
     }
   };
 
-  const handleBurnSubtitles = async (path: string, lang: SubtitleLang): Promise<void> => {
+  const handleBurnSubtitles = async (path: string, lang: SubtitleLang | "all"): Promise<void> => {
     setBurningPath(path);
     try {
-      const result = await burnSubtitles(path, lang);
-      announce(`已生成 ${basename(result.out)} (${result.cues} 句字幕)`);
+      if (lang === "all") {
+        const { results } = await burnSubtitlesLangs(path, SUBTITLE_LANGS);
+        const built = results.filter((r) => !r.up_to_date).map((r) => basename(r.out));
+        announce(built.length > 0 ? `已生成 ${built.join("、")}` : "三版字幕均已是最新，未重烧");
+      } else {
+        const result = await burnSubtitles(path, lang);
+        announce(`已生成 ${basename(result.out)} (${result.cues} 句字幕)`);
+      }
       onChange?.();
     } catch (err) {
       const kind = errorKind(err);
@@ -11,5 +11,5 @@ class DramaTakesCommand:
     def __init__(self, selector: DramaTakesSelector) -> None:
         self._selector = selector
 
-    def select_all(self, rel_path: str) -> DramaTakesResultCdto:
-        return DramaTakesMapper.to_cdto(self._selector.select_all(rel_path))
+    def select_all(self, rel_path: str, force: bool = False) -> DramaTakesResultCdto:
+        return DramaTakesMapper.to_cdto(self._selector.select_all(rel_path, force))
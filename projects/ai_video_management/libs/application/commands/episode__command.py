@@ -18,8 +18,9 @@ class EpisodeCommand:
 
     def concat(
         self, rel_path: str, lang: str = "original", rife: bool = False,
-        plan: list[dict] | None = None,
+        plan: list[dict] | None = None, incremental: bool = False,
+        force: bool = False,
     ) -> ConcatEpisodeResultCdto:
         return EpisodeMapper.concat_to_cdto(
-            self._builder.build(rel_path, lang, rife, plan)
+            self._builder.build(rel_path, lang, rife, plan, incremental, force)
         )
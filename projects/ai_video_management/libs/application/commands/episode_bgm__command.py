@@ -26,5 +26,7 @@ class EpisodeBgmCommand:
             self._manager.unassign(rel, start, end)  # type: ignore[arg-type]
         )
 
-    def burn(self, rel: str) -> BurnEpisodeBgmResultCdto:
-        return EpisodeBgmMapper.burn_to_cdto(self._manager.burn(rel))  # type: ignore[arg-type]
+    def burn(self, rel: str, force: bool = False) -> BurnEpisodeBgmResultCdto:
+        return EpisodeBgmMapper.burn_to_cdto(
+            self._manager.burn(rel, force)  # type: ignore[arg-type]
+        )
@@ -3,7 +3,10 @@ stitched ep{NN}.mp4 (whole-episode pass, follow-up 147). Thin seam over
 EpisodeSubtitleBurner."""
 from __future__ import annotations
 
-from libs.application.dtos.subtitle__dto import EpisodeWholeBurnResultCdto
+from libs.application.dtos.subtitle__dto import (
+    EpisodeWholeBurnLangsResultCdto,
+    EpisodeWholeBurnResultCdto,
+)
 from libs.application.mappers.episode_subtitle__mapper import EpisodeSubtitleMapper
 from libs.infrastructure.writers.episode_subtitle__writer import EpisodeSubtitleBurner
 
@@ -12,5 +15,17 @@ class EpisodeSubtitleCommand:
     def __init__(self, burner: EpisodeSubtitleBurner) -> None:
         self._burner = burner
 
-    def burn_whole(self, rel_path: str, lang: str = "zh") -> EpisodeWholeBurnResultCdto:
-        return EpisodeSubtitleMapper.to_cdto(self._burner.burn_whole(rel_path, lang))
+    def burn_whole(
+        self, rel_path: str, lang: str = "zh", force: bool = False
+    ) -> EpisodeWholeBurnResultCdto:
+        return EpisodeSubtitleMapper.to_cdto(self._burner.burn_whole(rel_path, lang, force))
+
+    def burn_whole_langs(
+        self, rel_path: str, langs: list[str], force: bool = False
+    ) -> EpisodeWholeBurnLangsResultCdto:
+        return EpisodeWholeBurnLangsResultCdto(
+            results=tuple(
+                EpisodeSubtitleMapper.to_cdto(r)
+                for r in self._burner.burn_whole_langs(rel_path, langs, force)
+            )
+        )
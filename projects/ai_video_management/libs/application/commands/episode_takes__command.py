@@ -11,5 +11,5 @@ class EpisodeTakesCommand:
     def __init__(self, selector: EpisodeTakesSelector) -> None:
         self._selector = selector
 
-    def select(self, rel_path: str) -> SelectTakesResultCdto:
-        return EpisodeTakesMapper.to_cdto(self._selector.select(rel_path))
+    def select(self, rel_path: str, force: bool = False) -> SelectTakesResultCdto:
+        return EpisodeTakesMapper.to_cdto(self._selector.select(rel_path, force))
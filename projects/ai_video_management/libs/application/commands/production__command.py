@@ -11,5 +11,5 @@ class ProductionCommand:
     def __init__(self, exporter: ProductionExporter) -> None:
         self._exporter = exporter
 
-    def export(self, rel_path: str) -> ExportProductionResultCdto:
-        return ProductionMapper.to_cdto(self._exporter.export(rel_path))
+    def export(self, rel_path: str, force: bool = False) -> ExportProductionResultCdto:
+        return ProductionMapper.to_cdto(self._exporter.export(rel_path, force))
@@ -8,6 +8,7 @@ and file I/O live in infrastructure (SubtitleBurner).
 from __future__ import annotations
 
 from libs.application.dtos.subtitle__dto import (
+    BurnSubtitlesLangsResultCdto,
     BurnSubtitlesResultCdto,
     ScaffoldSubtitlesResultCdto,
 )
@@ -19,8 +20,20 @@ class SubtitleCommand:
     def __init__(self, burner: SubtitleBurner) -> None:
         self._burner = burner
 
-    def burn(self, rel_path: str, lang: str = "zh") -> BurnSubtitlesResultCdto:
-        return SubtitleMapper.to_burn_cdto(self._burner.burn(rel_path, lang))
+    def burn(
+        self, rel_path: str, lang: str = "zh", force: bool = False
+    ) -> BurnSubtitlesResultCdto:
+        return SubtitleMapper.to_burn_cdto(self._burner.burn(rel_path, lang, force=force))
+
+    def burn_langs(
+        self, rel_path: str, langs: list[str], force: bool = False
+    ) -> BurnSubtitlesLangsResultCdto:
+        return BurnSubtitlesLangsResultCdto(
+            results=tuple(
+                SubtitleMapper.to_burn_cdto(r)
+                for r in self._burner.burn_langs(rel_path, langs, force=force)
+            )
+        )
 
     def scaffold(self, rel_path: str) -> ScaffoldSubtitlesResultCdto:
         return SubtitleMapper.to_scaffold_cdto(self._burner.scaffold(rel_path))
@@ -24,12 +24,18 @@ class SubtitleBatchCommand:
             self._batch.scaffold_episode(rel_path)
         )
 
-    def burn_episode(self, rel_path: str, lang: str = "zh") -> BurnEpisodeSubtitlesResultCdto:
+    def burn_episode(
+        self, rel_path: str, lang: str = "zh", workers: int | None = None,
+        force: bool = False,
+    ) -> BurnEpisodeSubtitlesResultCdto:
         return SubtitleBatchMapper.to_burn_episode_cdto(
-            self._batch.burn_episode(rel_path, lang)
+            self._batch.burn_episode(rel_path, lang, workers, force)
         )
 
-    def burn_drama(self, rel_path: str, lang: str = "zh") -> BurnDramaSubtitlesResultCdto:
+    def burn_drama(
+        self, rel_path: str, lang: str = "zh", workers: int | None = None,
+        force: bool = False,
+    ) -> BurnDramaSubtitlesResultCdto:
         return SubtitleBatchMapper.to_burn_drama_cdto(
-            self._batch.burn_drama(rel_path, lang)
+            self._batch.burn_drama(rel_path, lang, workers, force)
         )
@@ -73,6 +73,8 @@ class ConcatEpisodeResultCdto:
     rife_used: bool = False
     rife_bridges: int = 0
     segments_rel: str | None = None
+    reused_segments: int = 0
+    up_to_date: bool = False
 
     def to_payload(self) -> dict[str, Any]:
         return {
@@ -84,4 +86,6 @@ class ConcatEpisodeResultCdto:
             "rife_used": self.rife_used,
             "rife_bridges": self.rife_bridges,
             "segments": self.segments_rel,
+            "reused_segments": self.reused_segments,
+            "up_to_date": self.up_to_date,
         }
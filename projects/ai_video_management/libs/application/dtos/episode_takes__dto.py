@@ -11,9 +11,13 @@ class TakeSelectionCdto:
     shot: str
     src_rel: str
     out_rel: str
+    up_to_date: bool = False
 
     def to_payload(self) -> dict[str, Any]:
-        return {"shot": self.shot, "src": self.src_rel, "out": self.out_rel}
+        return {
+            "shot": self.shot, "src": self.src_rel, "out": self.out_rel,
+            "up_to_date": self.up_to_date,
+        }
 
 
 @dataclass(frozen=True)
@@ -13,11 +13,16 @@ class MediaFileQdto:
     """For serve-media: returns the resolved on-disk Path + the content-type
     so the route handler can build a FileResponse. The Path lives in this
     DTO (not domain) because it's a transport artefact — the route handler
-    needs it to construct FastAPI's FileResponse."""
+    needs it to construct FastAPI's FileResponse. `size_bytes` / `etag` /
+    `mtime_http` are the stat the validators (`If-None-Match`, `If-Range`)
+    and `Content-Range` are computed from."""
 
     resolved_path: Path
     media_type: str
     filename: str
+    size_bytes: int = 0
+    etag: str = ""
+    mtime_http: str = ""
 
 
 @dataclass(frozen=True)
@@ -13,6 +13,7 @@ class ExportedEpisodeCdto:
     episode: str
     src_rel: str
     out_rel: str
+    up_to_date: bool = False
 
     def to_payload(self) -> dict[str, Any]:
         return {
@@ -21,6 +22,7 @@ class ExportedEpisodeCdto:
             "episode": self.episode,
             "src": self.src_rel,
             "out": self.out_rel,
+            "up_to_date": self.up_to_date,
         }
 
 
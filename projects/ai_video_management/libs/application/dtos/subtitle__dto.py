@@ -11,6 +11,7 @@ class BurnSubtitlesResultCdto:
     out_rel: str
     cue_count: int
     lang: str
+    up_to_date: bool = False
 
     def to_payload(self) -> dict[str, Any]:
         return {
@@ -18,9 +19,20 @@ class BurnSubtitlesResultCdto:
             "out": self.out_rel,
             "cues": self.cue_count,
             "lang": self.lang,
+            "up_to_date": self.up_to_date,
         }
 
 
+@dataclass(frozen=True)
+class BurnSubtitlesLangsResultCdto:
+    """Several language masters burned from one decode (`langs` request)."""
+
+    results: tuple[BurnSubtitlesResultCdto, ...]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {"results": [r.to_payload() for r in self.results]}
+
+
 @dataclass(frozen=True)
 class ScaffoldSubtitlesResultCdto:
     md_rel: str
@@ -43,6 +55,7 @@ class BatchShotOutcomeCdto:
     out_rel: str | None
     cue_count: int | None
     reason: str | None
+    up_to_date: bool = False
 
     def to_payload(self) -> dict[str, Any]:
         return {
@@ -52,6 +65,7 @@ class BatchShotOutcomeCdto:
             "out": self.out_rel,
             "cues": self.cue_count,
             "reason": self.reason,
+            "up_to_date": self.up_to_date,
         }
 
 
@@ -88,6 +102,7 @@ class EpisodeWholeBurnResultCdto:
     lang: str
     cue_count: int
     shot_count: int
+    up_to_date: bool = False
 
     def to_payload(self) -> dict[str, Any]:
         return {
@@ -96,9 +111,18 @@ class EpisodeWholeBurnResultCdto:
             "lang": self.lang,
             "cues": self.cue_count,
             "shots": self.shot_count,
+            "up_to_date": self.up_to_date,
         }
 
 
+@dataclass(frozen=True)
+class EpisodeWholeBurnLangsResultCdto:
+    results: tuple[EpisodeWholeBurnResultCdto, ...]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {"results": [r.to_payload() for r in self.results]}
+
+
 @dataclass(frozen=True)
 class BurnDramaSubtitlesResultCdto:
     drama_rel: str
@@ -9,6 +9,7 @@ from typing import Any
 @dataclass(frozen=True)
 class TreeQdto:
     root: dict[str, Any]
+    etag: str = ""  # content hash of `root`; `/api/tree` answers 304 on a match
 
     def to_payload(self) -> dict[str, Any]:
         return self.root
@@ -33,6 +33,8 @@ class EpisodeMapper:
             rife_used=r.rife_used,
             rife_bridges=r.rife_bridges,
             segments_rel=r.segments_rel,
+            reused_segments=r.reused_segments,
+            up_to_date=r.up_to_date,
         )
 
     @staticmethod
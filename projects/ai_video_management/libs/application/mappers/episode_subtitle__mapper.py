@@ -14,4 +14,5 @@ class EpisodeSubtitleMapper:
             lang=r.lang,
             cue_count=r.cue_count,
             shot_count=r.shot_count,
+            up_to_date=r.up_to_date,
         )
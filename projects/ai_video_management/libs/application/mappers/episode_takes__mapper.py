@@ -15,7 +15,7 @@ class EpisodeTakesMapper:
         return SelectTakesResultCdto(
             episode_rel=r.episode_rel,
             selected=tuple(
-                TakeSelectionCdto(s.shot, s.src_rel, s.out_rel) for s in r.selected
+                TakeSelectionCdto(s.shot, s.src_rel, s.out_rel, s.up_to_date) for s in r.selected
             ),
             skipped=tuple(TakeSkipCdto(s.shot, s.reason) for s in r.skipped),
         )
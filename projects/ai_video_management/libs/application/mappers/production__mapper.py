@@ -15,7 +15,9 @@ class ProductionMapper:
             drama_rel=r.drama_rel,
             production_rel=r.production_rel,
             exported=tuple(
-                ExportedEpisodeCdto(e.lang, e.folder, e.episode, e.src_rel, e.out_rel)
+                ExportedEpisodeCdto(
+                    e.lang, e.folder, e.episode, e.src_rel, e.out_rel, e.up_to_date
+                )
                 for e in r.exported
             ),
             by_lang=r.by_lang(),
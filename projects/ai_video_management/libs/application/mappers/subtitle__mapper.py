@@ -12,7 +12,8 @@ class SubtitleMapper:
     @staticmethod
     def to_burn_cdto(r: BurnResult) -> BurnSubtitlesResultCdto:
         return BurnSubtitlesResultCdto(
-            src_rel=r.src_rel, out_rel=r.out_rel, cue_count=r.cue_count, lang=r.lang
+            src_rel=r.src_rel, out_rel=r.out_rel, cue_count=r.cue_count, lang=r.lang,
+            up_to_date=r.up_to_date,
         )
 
     @staticmethod
@@ -50,4 +50,5 @@ class SubtitleBatchMapper:
             out_rel=o.out_rel,
             cue_count=o.cue_count,
             reason=o.reason,
+            up_to_date=o.up_to_date,
         )
@@ -1,6 +1,14 @@
-"""Media-aggregate queries: serve a media file by sandbox-relative path."""
+"""Media-aggregate queries: serve a media file (or its cached gallery
+thumbnail / poster frame) by sandbox-relative path.
+
+The strong ETag digests (path, size, mtime_ns): every writer here replaces or
+rewrites a file with a new mtime, so a changed file always gets a new tag.
+"""
 from __future__ import annotations
 
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
 from pathlib import Path
 
 from libs.application.dtos.media__dto import MediaFileQdto
@@ -10,6 +18,7 @@ from libs.domain.errors.file__error import (
     FileNotInSandboxError,
     UnsupportedFileExtensionError,
 )
+from libs.infrastructure.readers.thumbnail__reader import ThumbnailReader
 
 _MEDIA_MIME_MAP: dict[str, str] = {
     ".png": "image/png",
@@ -34,11 +43,28 @@ _MEDIA_MIME_MAP: dict[str, str] = {
 
 
 class MediaQuery:
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver,
+        thumbnails: ThumbnailReader | None = None,
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._thumbnails = thumbnails or ThumbnailReader()
 
     def serve(self, rel_path: str) -> MediaFileQdto:
+        resolved = self._resolve_media(rel_path)
+        return self._file_qdto(
+            resolved, _MEDIA_MIME_MAP.get(resolved.suffix.lower(), "application/octet-stream")
+        )
+
+    def thumbnail(self, rel_path: str, width: int | None = None) -> MediaFileQdto:
+        """The cached thumb (image) / poster frame (video) of a media file."""
+        thumb = self._thumbnails.thumbnail(self._resolve_media(rel_path), width)
+        return self._file_qdto(
+            thumb, _MEDIA_MIME_MAP.get(thumb.suffix.lower(), "application/octet-stream")
+        )
+
+    def _resolve_media(self, rel_path: str) -> Path:
         ext = Path(rel_path).suffix.lower() if isinstance(rel_path, str) else ""
         if ext not in MEDIA_EXTENSIONS:
             raise UnsupportedFileExtensionError(ext)
@@ -47,8 +73,21 @@ class MediaQuery:
         resolved = self._resolver.resolve(rel_path)
         if resolved is None or not resolved.is_file():
             raise FileNotInSandboxError(rel_path)
+        return resolved
+
+    @staticmethod
+    def _file_qdto(resolved: Path, media_type: str) -> MediaFileQdto:
+        try:
+            st = resolved.stat()
+        except OSError as e:
+            raise FileNotInSandboxError(resolved.name) from e
+        stamp = f"{resolved.as_posix()}|{st.st_size}|{st.st_mtime_ns}"
+        mtime_dt = datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
         return MediaFileQdto(
             resolved_path=resolved,
-            media_type=_MEDIA_MIME_MAP.get(ext, "application/octet-stream"),
+            media_type=media_type,
             filename=resolved.name,
+            size_bytes=st.st_size,
+            etag=f'"{hashlib.sha1(stamp.encode("utf-8")).hexdigest()[:20]}"',
+            mtime_http=format_datetime(mtime_dt, usegmt=True),
         )
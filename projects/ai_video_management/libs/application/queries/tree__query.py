@@ -12,4 +12,15 @@ class TreeQuery:
         self._reader = reader
 
     def build(self) -> TreeQdto:
-        return TreeQdto(root=self._reader.build())
+        root, etag = self._reader.snapshot()
+        return TreeQdto(root=root, etag=etag)
+
+    def view(
+        self,
+        path: str = "",
+        depth: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> TreeQdto:
+        node, etag = self._reader.view(path=path, depth=depth, offset=offset, limit=limit)
+        return TreeQdto(root=node, etag=etag)
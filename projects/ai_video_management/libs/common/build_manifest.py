@@ -0,0 +1,112 @@
+"""Skip-if-up-to-date bookkeeping for derived artifacts.
+
+Every writer that derives a file from other files (language masters, locked
+takes, `ep{NN}.mp4` + `.segments.json`, whole-episode burns, the BGM mix,
+`production/` copies) asks this manifest before doing the work:
+
+    key = build_key(inputs, {"lang": lang, "ffmpeg": ffmpeg_version()})
+    if not force and manifest.lookup(out, key) is not None:
+        ...  # up to date — report it, skip the encode
+    ...build out...
+    manifest.record(out, key)
+
+A key digests each input's (path, size, mtime_ns) — a missing input counts as
+`None`, so creating it later changes the key — plus the writer's parameters
+(language, trims, recipe version, ffmpeg version …). An entry is only honoured
+while the output itself still has the size/mtime it had when recorded, so an
+output deleted, replaced or hand-edited since is rebuilt. `record` can attach
+a small `meta` dict that `lookup` hands back, for writers whose result carries
+facts only the build computed.
+
+Entries for outputs under `ai_videos/{drama}/` persist in
+`ai_videos/{drama}/.cache/build_manifest.json` (drama-relative keys), kept by
+the same `drama_layout.DramaIndex` store as the media probe index: `record`
+only updates memory, a drama's manifest is written once per burst, and entries
+whose output is gone are pruned when it is loaded. Outputs anywhere else are
+never considered up to date.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+from libs.common.drama_layout import DramaIndex
+
+MANIFEST_FILE_NAME: str = "build_manifest.json"
+_MANIFEST_VERSION: int = 1
+
+
+def build_key(inputs: Iterable[Path], params: dict[str, Any]) -> str:
+    """Digest of the inputs' (path, size, mtime_ns) stamps + `params`."""
+    stamps: list[tuple[str, int | None, int | None]] = []
+    for p in inputs:
+        try:
+            st = p.stat()
+            stamps.append((str(p), st.st_size, st.st_mtime_ns))
+        except OSError:
+            stamps.append((str(p), None, None))
+    payload = json.dumps(
+        {"inputs": stamps, "params": params},
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def ffmpeg_version() -> str:
+    """The bundled ffmpeg's version — part of every encode's key, so an
+    imageio-ffmpeg upgrade rebuilds. "" when it cannot be determined."""
+    try:
+        import imageio_ffmpeg
+
+        return str(imageio_ffmpeg.get_ffmpeg_version())
+    except Exception:  # imageio_ffmpeg raises various on failure
+        return ""
+
+
+class BuildManifest:
+    def __init__(self) -> None:
+        self._index = DramaIndex(MANIFEST_FILE_NAME, _MANIFEST_VERSION)
+
+    def lookup(self, out: Path, key: str) -> dict[str, Any] | None:
+        """The meta recorded for `out` when it was built from `key` and is
+        unchanged since; None when it must be (re)built."""
+        located = self._index.slot(out)
+        if located is None:
+            return None
+        try:
+            st = out.stat()
+        except OSError:
+            return None
+        entry = self._index.get(*located)
+        if (
+            not entry
+            or entry.get("key") != key
+            or (entry.get("size"), entry.get("mtime_ns")) != (st.st_size, st.st_mtime_ns)
+        ):
+            return None
+        meta = entry.get("meta")
+        return dict(meta) if isinstance(meta, dict) else {}
+
+    def record(self, out: Path, key: str, meta: dict[str, Any] | None = None) -> None:
+        """Remember that `out` (as it is on disk now) was built from `key`."""
+        located = self._index.slot(out)
+        if located is None:
+            return
+        try:
+            st = out.stat()
+        except OSError:
+            return
+        entry: dict[str, Any] = {"key": key, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        if meta:
+            entry["meta"] = meta
+        self._index.put(*located, entry)
+
+    def flush(self) -> None:
+        """Write every drama manifest holding changes not yet on disk. Runs by
+        itself shortly after a burst of records and at exit; call it to persist
+        now (e.g. before another process reads the manifest)."""
+        self._index.flush()
@@ -14,14 +14,45 @@ Every consumer (casting assign, downloads import, sub-type lookup, bgm-cue
 scan, …) must work for both. These helpers take the drama root dir and return
 the *actual* location — preferring whichever exists, falling back to the flat
 root so first-time `create` still lands somewhere sane.
+
+Derived machine state lives in the drama's `.cache/` (`cache_dir`). The JSON
+files there share one discipline — versioned, written via tmp + `os.replace`
+(`write_json_atomic`) — and the per-file indexes (media probes, the build
+manifest) share one store, `DramaIndex`.
+
+Stdlib-only: the repo tools load `media_probe__reader.py` by path, and it loads
+this file the same way.
 """
 from __future__ import annotations
 
+import atexit
+import json
+import os
+import threading
+import weakref
 from pathlib import Path
+from typing import Any
 
+AI_VIDEOS_DIR: str = "ai_videos"
 WORLD_STAGE: str = "2_世界观人设"
 SCRIPT_STAGE: str = "4_剧本"
 SHOTS_STAGE: str = "5_6_分镜与prompt"
+# Per-drama derived-data cache (probe index, …). Hidden from the tree and the
+# sandbox — machine state, not an artifact.
+CACHE_DIR: str = ".cache"
+
+
+def cache_dir(drama_dir: Path) -> Path:
+    """`ai_videos/{drama}/.cache/` — not created here; writers mkdir on demand."""
+    return drama_dir / CACHE_DIR
+
+
+def drama_dir_of(path: Path) -> Path | None:
+    """The `ai_videos/{drama}` folder `path` lives under, or None."""
+    for anc in path.parents:
+        if anc.parent.name == AI_VIDEOS_DIR:
+            return anc
+    return None
 
 
 def _first_existing_dir(*candidates: Path) -> Path:
@@ -69,3 +100,126 @@ def episodes_dir(drama_dir: Path) -> Path:
         drama_dir / SHOTS_STAGE / "episodes",
         drama_dir / SCRIPT_STAGE / "episodes",
     )
+
+
+# --- .cache/ persistence ---------------------------------------------------------
+
+# Pending `DramaIndex` entries are written this long after the first one of a burst.
+INDEX_FLUSH_DELAY_S: float = 2.0
+
+
+def read_json_versioned(path: Path, version: int, field: str) -> dict[str, Any]:
+    """The `field` mapping of a `{"version": …, field: {…}}` cache file; empty
+    when the file is missing, unreadable or from another version."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version:
+        return {}
+    found = data.get(field)
+    return dict(found) if isinstance(found, dict) else {}
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Write `payload` to a private tmp file beside `path`, then `os.replace`
+    it in, so a reader never sees half a file. Best-effort: an unwritable cache
+    only costs recomputing next time."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+# Every live index, so pending entries are written before exit.
+_INDEXES: "weakref.WeakSet[DramaIndex]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    for index in list(_INDEXES):
+        index.flush()
+
+
+class DramaIndex:
+    """Entries keyed by drama-relative path, one `.cache/{file_name}` per drama.
+
+    A drama's file is read on first use, dropping entries whose file is gone
+    (and scheduling that write-back). `put` only updates memory: a drama is
+    written once per burst (`INDEX_FLUSH_DELAY_S` after the first put, on
+    `flush()`, and at interpreter exit), merged with whatever another process
+    wrote meanwhile — ours win on conflict, minus what we pruned — with no stat
+    per entry."""
+
+    def __init__(self, file_name: str, version: int) -> None:
+        self._file_name = file_name
+        self._version = version
+        self._lock = threading.Lock()
+        self._entries: dict[Path, dict[str, dict]] = {}  # drama dir -> entries
+        self._pruned: dict[Path, set[str]] = {}  # drama dir -> rels dropped on load
+        self._dirty: set[Path] = set()  # dramas with changes not yet written
+        self._timer: threading.Timer | None = None
+        _INDEXES.add(self)
+
+    @staticmethod
+    def slot(path: Path) -> tuple[Path, str] | None:
+        """(drama dir, drama-relative key) for `path`; None outside a drama or
+        inside its `.cache/`."""
+        resolved = path.resolve()
+        drama = drama_dir_of(resolved)
+        if drama is None:
+            return None
+        rel = resolved.relative_to(drama).as_posix()
+        if rel.split("/", 1)[0] == CACHE_DIR:
+            return None
+        return drama, rel
+
+    def get(self, drama: Path, rel: str) -> dict | None:
+        with self._lock:
+            return self._load(drama).get(rel)
+
+    def put(self, drama: Path, rel: str, entry: dict) -> None:
+        with self._lock:
+            self._load(drama)[rel] = entry
+            self._pruned.get(drama, set()).discard(rel)
+            self._mark_dirty(drama)
+
+    def flush(self) -> None:
+        """Write every drama holding changes not yet on disk."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            dirty, self._dirty = self._dirty, set()
+            pending = {
+                drama: (dict(self._entries.get(drama, {})), set(self._pruned.get(drama, ())))
+                for drama in dirty
+            }
+        for drama, (entries, pruned) in pending.items():
+            path = cache_dir(drama) / self._file_name
+            disk = read_json_versioned(path, self._version, "entries")
+            live = {rel: e for rel, e in disk.items() if rel not in pruned}
+            write_json_atomic(path, {"version": self._version, "entries": {**live, **entries}})
+
+    def _load(self, drama: Path) -> dict[str, dict]:
+        """Caller holds the lock."""
+        entries = self._entries.get(drama)
+        if entries is None:
+            loaded = read_json_versioned(cache_dir(drama) / self._file_name, self._version, "entries")
+            entries = {rel: e for rel, e in loaded.items() if (drama / rel).is_file()}
+            self._entries[drama] = entries
+            self._pruned[drama] = set(loaded) - set(entries)
+            if self._pruned[drama]:
+                self._mark_dirty(drama)
+        return entries
+
+    def _mark_dirty(self, drama: Path) -> None:
+        """Caller holds the lock."""
+        self._dirty.add(drama)
+        if self._timer is None:
+            self._timer = threading.Timer(INDEX_FLUSH_DELAY_S, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
@@ -17,7 +17,8 @@ TREE_VISIBLE_EXTENSIONS: frozenset[str] = ALLOWED_EXTENSIONS | MEDIA_EXTENSIONS
 MAX_FILE_BYTES: int = 1_048_576
 
 _EXCLUDED_DIRS: frozenset[str] = frozenset(
-    {"node_modules", ".git", ".audit", "__pycache__", ".pytest_cache", "dist", "build", ".vite"}
+    {"node_modules", ".git", ".audit", "__pycache__", ".pytest_cache", "dist", "build", ".vite",
+     ".cache"}
 )
 
 
@@ -85,3 +86,8 @@ class ExposedTree:
 
     def excluded_dirs(self) -> frozenset[str]:
         return _EXCLUDED_DIRS
+
+    def top_level_dirs(self) -> list[Path]:
+        """The exposed roots (`ai_videos/`, `downloaded_novels/`, `my_novel/`),
+        whether or not they exist yet."""
+        return [self._root / name for name in sorted(_ALLOWED_TOP_LEVEL)]
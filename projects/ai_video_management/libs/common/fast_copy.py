@@ -0,0 +1,98 @@
+"""Place a copy of a large media file without duplicating its bytes when the
+filesystem allows it (locked takes, `production/` exports).
+
+`place_copy(src, dst)` tries, in order:
+
+* **reflink** — `FICLONE` (Linux btrfs / XFS / bcachefs …): a copy-on-write
+  clone, instant, shares extents until either side is written;
+* **hardlink** — `os.link`: instant, zero extra bytes, but `dst` IS `src`
+  (same inode) — so the writers that produce these sources always replace
+  their outputs (temp + `os.replace`), never rewrite them in place;
+* **copy** — `shutil.copy2`, the old behaviour (other volume, FAT, SMB …).
+
+`mode="reflink"` skips the hardlink step (a real, independent file or a clone) —
+what take locking uses, since `shot{NN}.mp4` is itself edited afterwards;
+`mode="copy"` always copies. Every strategy materialises into a temp sibling and
+`os.replace`s it over `dst`, so an existing `dst` — possibly itself a hardlink
+to something else — is swapped out, never written through, and a crash leaves
+the old `dst` intact.
+
+A `dst` that is already `src` (same inode) or already matches its size + mtime
+(what `copy2` / a clone + `copystat` leave behind) is left alone and reported
+`"unchanged"` unless `overwrite=True`.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Literal
+
+try:  # POSIX only; Windows falls through to hardlink / copy
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+CopyMode = Literal["auto", "reflink", "copy"]
+CopyMethod = Literal["unchanged", "reflink", "hardlink", "copy"]
+
+COPY_MODES: frozenset[str] = frozenset({"auto", "reflink", "copy"})
+_FICLONE: int = 0x40049409  # _IOW(0x94, 9, int), linux/fs.h
+
+
+def place_copy(
+    src: Path, dst: Path, *, mode: CopyMode = "auto", overwrite: bool = False
+) -> CopyMethod:
+    """Make `dst` a copy of `src`; returns how (see module docstring)."""
+    if mode not in COPY_MODES:
+        raise ValueError(f"unknown copy mode: {mode!r}")
+    if not overwrite and _matches(src, dst):
+        return "unchanged"
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.{threading.get_ident()}.part")
+    tmp.unlink(missing_ok=True)
+    try:
+        method = _materialise(src, tmp, mode)
+        os.replace(tmp, dst)
+        # rename() between two links of one inode is a no-op that keeps `tmp`
+        tmp.unlink(missing_ok=True)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return method
+
+
+def _matches(src: Path, dst: Path) -> bool:
+    try:
+        s, d = src.stat(), dst.stat()
+    except OSError:
+        return False
+    if (s.st_dev, s.st_ino) == (d.st_dev, d.st_ino):
+        return True
+    return (s.st_size, s.st_mtime_ns) == (d.st_size, d.st_mtime_ns)
+
+
+def _materialise(src: Path, tmp: Path, mode: CopyMode) -> CopyMethod:
+    if mode != "copy" and _reflink(src, tmp):
+        shutil.copystat(src, tmp)
+        return "reflink"
+    if mode == "auto":
+        try:
+            os.link(src, tmp)
+            return "hardlink"
+        except OSError:  # EXDEV, EPERM, FAT, unsupported share …
+            tmp.unlink(missing_ok=True)
+    shutil.copy2(src, tmp)
+    return "copy"
+
+
+def _reflink(src: Path, tmp: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:  # EOPNOTSUPP, EXDEV, EINVAL … — not clonable here
+        tmp.unlink(missing_ok=True)
+        return False
@@ -0,0 +1,225 @@
+"""Filesystem change feed for the derived-state caches (the `/api/tree` model).
+
+`FsWatcher` watches the exposed roots on a daemon thread and hands every batch
+of changed paths to its subscribers:
+
+* **inotify** (via `watchfiles`, which `uvicorn[standard]` already installs for
+  `--reload`) — events arrive ~20 ms after the write, cost is O(changes);
+* **polling** fallback when `watchfiles` is missing, or its native watcher
+  fails (inotify watch limit, network mount): watchfiles' own poller first,
+  else a stdlib stat-walk every `poll_interval_s`.
+
+`sync()` is a read-your-writes fence: it touches a file in a private temp dir
+that is watched by the SAME watcher and waits until that event comes back, so
+every change made before the call has been delivered to the subscribers. A
+subscriber can therefore trust its cache right after `sync()` returns True —
+and must fall back to recomputing when it returns False (watcher down/stalled).
+
+Roots that do not exist when the watcher starts are not watched.
+"""
+from __future__ import annotations
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+from weakref import WeakSet
+
+_FENCE_NAME: str = "fence"
+_STEP_MS: int = 20
+_DEBOUNCE_MS: int = 400
+_START_TIMEOUT_S: float = 5.0
+_FENCE_RETRY_S: float = 0.25
+_STOP_JOIN_S: float = 2.0
+
+# Live watchers, stopped at interpreter exit: a daemon thread torn down while
+# inside the native watcher aborts the process ("exception not rethrown").
+_LIVE: WeakSet[FsWatcher] = WeakSet()
+
+
+def _stop_all() -> None:
+    for watcher in list(_LIVE):
+        watcher.stop()
+
+
+atexit.register(_stop_all)
+
+
+class FsWatcher:
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        excluded: frozenset[str] = frozenset(),
+        poll_interval_s: float = 1.0,
+    ) -> None:
+        self._roots = [Path(r) for r in roots]
+        self._excluded = excluded
+        self._poll_interval_s = poll_interval_s
+        self._subscribers: list[Callable[[set[Path]], None]] = []
+        self._lock = threading.Lock()
+        self._fenced = threading.Condition(self._lock)
+        self._sync_lock = threading.Lock()
+        self._fences = 0
+        self._fence_dir: Path | None = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._alive = False
+        self.mode: str | None = None  # "inotify" | "polling" once running
+
+    def subscribe(self, callback: Callable[[set[Path]], None]) -> None:
+        self._subscribers.append(callback)
+
+    @property
+    def running(self) -> bool:
+        return self._alive
+
+    def start(self) -> bool:
+        """Start watching (idempotent). True once the watcher is live — the
+        first fence round-trip proves the native watches are in place."""
+        with self._lock:
+            if self._thread is not None:
+                return self._alive
+            roots = [r for r in self._roots if r.is_dir()]
+            if not roots:
+                return False
+            self._fence_dir = Path(tempfile.mkdtemp(prefix="fswatch-")).resolve()
+            self._alive = True
+            self._thread = threading.Thread(
+                target=self._run, args=(roots,), name="fs-watch", daemon=True
+            )
+            self._thread.start()
+            _LIVE.add(self)
+        return self.sync(_START_TIMEOUT_S)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._alive = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(_STOP_JOIN_S)
+        if self._fence_dir is not None:
+            shutil.rmtree(self._fence_dir, ignore_errors=True)
+        _LIVE.discard(self)
+
+    def sync(self, timeout: float = 2.0) -> bool:
+        """Block until every change made before this call has been dispatched.
+        False when the watcher is not running or did not answer in time."""
+        if not self._alive or self._fence_dir is None:
+            return False
+        deadline = time.monotonic() + timeout
+        with self._sync_lock:  # one fence in flight; concurrent callers queue
+            with self._lock:
+                before = self._fences
+            # Re-touch until acknowledged: right after start() the native
+            # watches may not be armed yet, and a first touch can go unseen.
+            attempt = 0
+            while True:
+                try:
+                    (self._fence_dir / _FENCE_NAME).write_text(
+                        f"{before}.{attempt}", encoding="utf-8"
+                    )
+                except OSError:
+                    return False
+                attempt += 1
+                with self._fenced:
+                    left = deadline - time.monotonic()
+                    self._fenced.wait_for(
+                        lambda: self._fences > before or not self._alive,
+                        max(0.0, min(left, _FENCE_RETRY_S)),
+                    )
+                    if self._fences > before or not self._alive:
+                        return self._alive
+                if time.monotonic() >= deadline:
+                    return False
+
+    # ------------------------------------------------------------------ thread
+    def _run(self, roots: list[Path]) -> None:
+        assert self._fence_dir is not None
+        try:
+            import watchfiles
+        except ImportError:
+            watchfiles = None  # type: ignore[assignment]
+        try:
+            if watchfiles is not None:
+                for force_polling in (False, True):
+                    try:
+                        self.mode = "polling" if force_polling else "inotify"
+                        self._run_watchfiles(watchfiles, roots, force_polling)
+                        return
+                    except Exception:  # native watcher unavailable → its poller
+                        if self._stop.is_set():
+                            return
+            self.mode = "polling"
+            self._run_polling(roots)
+        except Exception:
+            pass
+        finally:
+            with self._fenced:
+                self._alive = False
+                self._fenced.notify_all()
+
+    def _run_watchfiles(self, watchfiles, roots: list[Path], force_polling: bool) -> None:  # type: ignore[no-untyped-def]
+        for batch in watchfiles.watch(
+            *roots, self._fence_dir,
+            watch_filter=None, debounce=_DEBOUNCE_MS, step=_STEP_MS,
+            stop_event=self._stop, raise_interrupt=False,
+            force_polling=force_polling, poll_delay_ms=int(self._poll_interval_s * 1000),
+        ):
+            self._dispatch({Path(p) for _change, p in batch})
+
+    def _run_polling(self, roots: list[Path]) -> None:
+        prev = self._scan(roots)
+        while not self._stop.wait(self._poll_interval_s):
+            cur = self._scan(roots)
+            changed = {p for p in prev.keys() | cur.keys() if prev.get(p) != cur.get(p)}
+            prev = cur
+            if changed:
+                self._dispatch(changed)
+
+    def _scan(self, roots: list[Path]) -> dict[Path, tuple[int, int]]:
+        assert self._fence_dir is not None
+        seen: dict[Path, tuple[int, int]] = {}
+        for root in [*roots, self._fence_dir]:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if d not in self._excluded]
+                for name in [".", *filenames]:
+                    p = Path(dirpath) if name == "." else Path(dirpath, name)
+                    try:
+                        st = p.stat()
+                    except OSError:
+                        continue
+                    seen[p] = (st.st_mtime_ns, st.st_size)
+        return seen
+
+    def _is_excluded(self, p: Path) -> bool:
+        """True when a path segment BELOW its watched root is an excluded dir
+        name (`.cache`, `node_modules`, …) — the root's own ancestors don't count."""
+        for root in self._roots:
+            try:
+                rel = p.relative_to(root)
+            except ValueError:
+                continue
+            return not self._excluded.isdisjoint(rel.parts)
+        return False
+
+    def _dispatch(self, paths: set[Path]) -> None:
+        fence_hit = False
+        changed: set[Path] = set()
+        for p in paths:
+            if p.parent == self._fence_dir or p == self._fence_dir:
+                fence_hit = True
+            elif not self._is_excluded(p):
+                changed.add(p)
+        if changed:
+            for callback in list(self._subscribers):
+                try:
+                    callback(changed)
+                except Exception:
+                    continue
+        if fence_hit:
+            with self._fenced:
+                self._fences += 1
+                self._fenced.notify_all()
@@ -0,0 +1,235 @@
+"""Progress + cancellation plumbing between a background job and its ffmpeg.
+
+The job queue (`apps/api/jobs.py`) runs a long render on a worker thread and
+binds the job to that thread's context via `job_scope`. Writers stay unaware
+of the queue: they call `run_ffmpeg` where they used to call `subprocess.run`,
+and mark the units of a batch with `job_step`.
+
+* With NO job bound (direct HTTP call, CLI, tests) `run_ffmpeg` is exactly
+  `subprocess.run(cmd, capture_output=True, timeout=…, check=False)`.
+* Under a job it adds `-progress pipe:1`, turns each `out_time_us=` line into a
+  fraction of `duration_s`, polls the job's cancel flag and kills ffmpeg when it
+  is set (→ `JobCancelledError`).
+
+`job_step(i, n, stage)` narrows the reported range to the i-th of n equal
+slices, so a drama-wide burn advances smoothly instead of every shot's ffmpeg
+jumping the bar from 0 to 1.
+
+`parallel_steps(items, fn, workers=…)` is the concurrent counterpart: units run
+on a bounded thread pool (each ffmpeg is its own process, so threads suffice),
+the job stays bound in every worker (cancel still kills each running ffmpeg),
+and progress advances one unit at a time as units COMPLETE — the individual
+encodes' `-progress` fractions are muted, since several overlapping encodes
+would fight over the bar. `default_workers(ffmpeg_threads)` sizes the pool.
+"""
+from __future__ import annotations
+
+import contextvars
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO, Any, Callable, Iterator, Protocol, Sequence, TypeVar
+
+from libs.domain.errors.job__error import JobCancelledError
+
+_POLL_S: float = 0.25
+# The states a job never leaves (the queue's and the SSE route's shared notion of "done").
+TERMINAL_STATES: frozenset[str] = frozenset({"succeeded", "failed", "cancelled"})
+
+
+class JobReporter(Protocol):
+    def report(self, fraction: float | None, stage: str | None = None) -> None: ...
+
+    def is_cancelled(self) -> bool: ...
+
+
+class JobSubmitter(Protocol):
+    def submit(self, kind: str, target: str, fn: Callable[[], Any]) -> dict[str, Any]: ...
+
+
+_CURRENT: ContextVar[JobReporter | None] = ContextVar("job_reporter", default=None)
+# (lo, hi) slice of the whole job the current unit of work maps onto.
+_SPAN: ContextVar[tuple[float, float]] = ContextVar("job_span", default=(0.0, 1.0))
+# False inside `parallel_steps` workers: run_ffmpeg still polls cancel but does
+# not report its own fraction (the batch reports per completed unit instead).
+_FFMPEG_REPORTS: ContextVar[bool] = ContextVar("job_ffmpeg_reports", default=True)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def current_job() -> JobReporter | None:
+    return _CURRENT.get()
+
+
+@contextmanager
+def job_scope(job: JobReporter) -> Iterator[None]:
+    """Bind `job` to the running context for the duration of the block."""
+    token = _CURRENT.set(job)
+    span = _SPAN.set((0.0, 1.0))
+    try:
+        yield
+    finally:
+        _SPAN.reset(span)
+        _CURRENT.reset(token)
+
+
+def check_cancelled() -> None:
+    job = _CURRENT.get()
+    if job is not None and job.is_cancelled():
+        raise JobCancelledError("cancelled")
+
+
+@contextmanager
+def job_step(index: int, total: int, stage: str | None = None) -> Iterator[None]:
+    """Scope the i-th of `total` equal slices of the current span. No-op
+    outside a job; raises `JobCancelledError` at the boundary when cancelled."""
+    job = _CURRENT.get()
+    if job is None or total <= 0:
+        yield
+        return
+    check_cancelled()
+    lo, hi = _SPAN.get()
+    width = (hi - lo) / total
+    step_lo = lo + width * index
+    token = _SPAN.set((step_lo, step_lo + width))
+    job.report(step_lo, stage)
+    try:
+        yield
+    finally:
+        _SPAN.reset(token)
+
+
+def parallel_steps(
+    items: Sequence[T],
+    fn: Callable[[T], R],
+    *,
+    workers: int,
+    stage: Callable[[T], str] | None = None,
+) -> list[R]:
+    """`[fn(item) for item in items]` on `workers` threads, results in input
+    order. Under a job: the job is bound in each worker, progress moves by one
+    unit of the current span per completed item (`stage` names it), and a
+    cancel — or any exception — stops queued items and re-raises once the
+    running ones have returned (`JobCancelledError` for a cancel)."""
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    job = _CURRENT.get()
+    lo, hi = _SPAN.get()
+    total = len(items)
+    done = 0
+    lock = threading.Lock()
+
+    def _unit(item: T) -> R:
+        check_cancelled()
+        _FFMPEG_REPORTS.set(False)
+        result = fn(item)
+        nonlocal done
+        with lock:
+            done += 1
+            if job is not None:
+                job.report(lo + (hi - lo) * done / total, stage(item) if stage else None)
+        return result
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool:
+        # each unit runs in a copy of the caller's context: job + span bound
+        futures = [
+            pool.submit(contextvars.copy_context().run, _unit, item) for item in items
+        ]
+        finished, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        if any(f.exception() is not None for f in finished):
+            for f in futures:
+                f.cancel()
+    # the pool has joined: every future is done or was cancelled unstarted
+    for f in futures:
+        if not f.cancelled() and f.exception() is not None:
+            raise f.exception()  # type: ignore[misc]
+    return [f.result() for f in futures]
+
+
+def default_workers(ffmpeg_threads: int) -> int:
+    """`parallel_steps` width that fills the machine without oversubscribing
+    it: cores ÷ the threads each unit's ffmpeg is capped at."""
+    return max(1, (os.cpu_count() or 1) // max(1, ffmpeg_threads))
+
+
+def parse_progress_line(line: str, duration_s: float | None) -> float | None:
+    """Fraction done from one `-progress` line, or None when it carries none.
+    `out_time_ms` is (despite the name) microseconds, same as `out_time_us`."""
+    key, _, value = line.strip().partition("=")
+    if key == "progress" and value == "end":
+        return 1.0
+    if key not in ("out_time_us", "out_time_ms") or not duration_s or duration_s <= 0:
+        return None
+    try:
+        return int(value) / 1_000_000 / duration_s
+    except ValueError:
+        return None  # "N/A" before the first frame is muxed
+
+
+def run_ffmpeg(
+    cmd: list[str],
+    *,
+    timeout: float,
+    duration_s: float | None = None,
+    cwd: str | Path | None = None,
+) -> subprocess.CompletedProcess[bytes]:
+    """`subprocess.run`-compatible ffmpeg call that reports to the bound job.
+
+    Raises `subprocess.TimeoutExpired` past `timeout` (as `subprocess.run`
+    would) and `JobCancelledError` when the job is cancelled mid-encode."""
+    job = _CURRENT.get()
+    if job is None:
+        return subprocess.run(
+            cmd, cwd=cwd, capture_output=True, timeout=timeout, check=False
+        )
+    check_cancelled()
+    argv = [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+    proc = subprocess.Popen(
+        argv, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    err_chunks: list[bytes] = []
+    # the reader threads do not inherit this context — capture the span here
+    lo, hi = _SPAN.get()
+    reports = _FFMPEG_REPORTS.get()
+
+    def _drain_err(stream: IO[bytes]) -> None:
+        err_chunks.append(stream.read())
+
+    def _follow(stream: IO[bytes]) -> None:
+        for raw in stream:
+            frac = parse_progress_line(raw.decode("ascii", errors="replace"), duration_s)
+            if frac is not None and reports:
+                job.report(lo + (hi - lo) * min(max(frac, 0.0), 1.0))
+
+    readers = [
+        threading.Thread(target=_drain_err, args=(proc.stderr,), daemon=True),
+        threading.Thread(target=_follow, args=(proc.stdout,), daemon=True),
+    ]
+    for t in readers:
+        t.start()
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                proc.wait(timeout=_POLL_S)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            if job.is_cancelled():
+                raise JobCancelledError("cancelled")
+            if time.monotonic() > deadline:
+                raise subprocess.TimeoutExpired(argv, timeout)
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for t in readers:
+            t.join(timeout=5)
+    return subprocess.CompletedProcess(argv, proc.returncode, b"", b"".join(err_chunks))
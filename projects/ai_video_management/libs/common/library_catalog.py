@@ -0,0 +1,176 @@
+"""In-memory catalog of a library folder (`_actors/`, `_voices/`, `_bgm/{cat}/`).
+
+The pools used to iterate every entry folder and re-parse every sidecar on each
+list, and rescan the whole library to allocate the next id. A catalog parses
+each entry once and keeps, per entry folder:
+
+* the pool's parsed value (`load(folder)`; None = folder present but not a
+  listable entry — no/invalid sidecar — which still occupies its id number);
+* its id number, in a sorted list, so `max_number()` is O(1) and an add /
+  remove is O(log n) (without a watcher it is a bare listing, as before).
+
+Freshness follows the tree cache: with a live `FsWatcher`, `sync()` fences
+every change made before the call (the pool's own writes included) and only
+the entry folders named by change events are re-loaded — O(changes). Without a
+watcher (unit tests, watcher down / fence timed out) each call revalidates
+every entry by a stat stamp of its folder's files and re-loads only the ones
+that moved: still a directory walk, but no sidecar is re-read unless edited.
+"""
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+from libs.common.fs_watcher import FsWatcher
+
+T = TypeVar("T")
+
+_Stamp = tuple[tuple[str, int, int], ...]
+
+
+class LibraryCatalog(Generic[T]):
+    def __init__(
+        self,
+        root: Callable[[], Path],
+        *,
+        number: Callable[[Path], int | None],
+        load: Callable[[Path], T | None],
+        depth: int = 1,
+        shelf: Callable[[Path], bool] | None = None,
+        watcher: FsWatcher | None = None,
+    ) -> None:
+        """`number(folder)` is the entry's id number, None when the folder is
+        not an entry at all. `depth=2` catalogs `root/{shelf}/{entry}` (BGM
+        categories; `shelf(dir)` picks the valid shelves)."""
+        self._root = root
+        self._number = number
+        self._load = load
+        self._depth = depth
+        self._shelf = shelf or (lambda _p: True)
+        self._watcher = watcher
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[_Stamp | None, int, T | None]] = {}
+        self._numbers: list[int] = []
+        self._ordered: list[tuple[Path, T]] | None = None
+        self._dirty: set[Path] = set()
+        self._trusted = False  # memo valid under a live watcher since last full scan
+        if watcher is not None:
+            watcher.subscribe(self._on_change)
+
+    def entries(self) -> list[tuple[Path, T]]:
+        """(folder, value) for every loadable entry, ordered by folder path."""
+        self._refresh(self._live())
+        with self._lock:
+            if self._ordered is None:
+                self._ordered = [
+                    (folder, value)
+                    for folder, (_s, _n, value) in sorted(self._entries.items())
+                    if value is not None
+                ]
+            return list(self._ordered)
+
+    def max_number(self) -> int:
+        """Highest id number of any entry folder (loadable or not); 0 if none."""
+        live = self._live()
+        if not live:  # a bare listing is all an allocation needs
+            return max(self._scan().values(), default=0)
+        self._refresh(live)
+        with self._lock:
+            return self._numbers[-1] if self._numbers else 0
+
+    # ------------------------------------------------------------------ refresh
+    def _live(self) -> bool:
+        return self._watcher is not None and self._watcher.start() and self._watcher.sync()
+
+    def _refresh(self, live: bool) -> None:
+        with self._lock:
+            if live and self._trusted:
+                dirty, self._dirty = self._dirty, set()
+                for folder in dirty:
+                    self._reload(folder, None)
+                return
+            self._dirty.clear()
+            self._trusted = live
+            found = self._scan()
+            for gone in self._entries.keys() - found.keys():
+                self._drop(gone)
+            for folder, number in found.items():
+                stamp = self._stamp(folder)
+                held = self._entries.get(folder)
+                if held is None or held[0] is None or held[0] != stamp:
+                    self._reload(folder, stamp, number)
+
+    def _scan(self) -> dict[Path, int]:
+        shelves = [self._root()]
+        for _ in range(self._depth - 1):
+            shelves = [
+                d for s in shelves for d in _subdirs(s) if self._shelf(d)
+            ]
+        found: dict[Path, int] = {}
+        for shelf in shelves:
+            for folder in _subdirs(shelf):
+                number = self._number(folder)
+                if number is not None:
+                    found[folder] = number
+        return found
+
+    def _reload(self, folder: Path, stamp: _Stamp | None, number: int | None = None) -> None:
+        """Caller holds the lock."""
+        if number is None:
+            number = self._number(folder)
+        self._drop(folder)
+        if number is None or not folder.is_dir() or folder.is_symlink():
+            return
+        if self._depth > 1 and not self._shelf(folder.parent):
+            return
+        try:
+            value = self._load(folder)
+        except OSError:
+            value = None
+        self._entries[folder] = (stamp, number, value)
+        bisect.insort(self._numbers, number)
+        self._ordered = None
+
+    def _drop(self, folder: Path) -> None:
+        """Caller holds the lock."""
+        held = self._entries.pop(folder, None)
+        if held is None:
+            return
+        i = bisect.bisect_left(self._numbers, held[1])
+        if i < len(self._numbers) and self._numbers[i] == held[1]:
+            del self._numbers[i]
+        self._ordered = None
+
+    @staticmethod
+    def _stamp(folder: Path) -> _Stamp | None:
+        try:
+            with os.scandir(folder) as it:
+                stats = [(e.name, e.stat(follow_symlinks=False)) for e in it]
+        except OSError:
+            return None
+        return tuple(sorted((name, st.st_mtime_ns, st.st_size) for name, st in stats))
+
+    # ------------------------------------------------------------------ events
+    def _on_change(self, paths: set[Path]) -> None:
+        root = self._root()
+        with self._lock:
+            for p in paths:
+                try:
+                    rel = p.relative_to(root)
+                except ValueError:
+                    continue
+                if len(rel.parts) < self._depth:
+                    # the library root / a shelf itself moved: rescan it all
+                    self._trusted = False
+                    continue
+                self._dirty.add(root.joinpath(*rel.parts[: self._depth]))
+
+
+def _subdirs(parent: Path) -> list[Path]:
+    try:
+        return [c for c in parent.iterdir() if c.is_dir() and not c.is_symlink()]
+    except OSError:
+        return []
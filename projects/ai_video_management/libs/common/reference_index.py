@@ -0,0 +1,205 @@
+"""Reverse-reference index: library id -> where in the dramas it is used.
+
+"Is this actor / voice / BGM track in use, and where?" used to re-read every
+drama's `casting.md` (or every episode's `bgm/bgm.md`) per request — the
+library pages ask it for every tile badge, delete / archive ask it before
+moving anything. A `ReferenceIndex` keeps, per drama, the rows extracted from
+each of its source files:
+
+* `sources(drama_dir)` lists the files to index (e.g. the drama's casting.md);
+* `extract(drama_dir, path)` turns one file into `(ref_id, row)` pairs, `row`
+  a small JSON-able dict (role / notes, cue location / window …).
+
+`refs(ref_id)` and `ids()` answer from an id -> rows map that is only rebuilt
+after something changed, so a lookup costs the same whatever the drama count.
+
+Freshness follows the library catalog: with a live `FsWatcher`, `sync()`
+fences every earlier change and only the dramas named by change events are
+revalidated; without one, each call revalidates every drama. Revalidating a
+drama stats its source files and re-parses only the ones whose (size,
+mtime_ns) moved. The writers that edit a source call `note_written(path)` so
+their own change is indexed before they return.
+
+Each drama's entries persist in `ai_videos/{drama}/.cache/references_{kind}.json`
+(`drama_layout.write_json_atomic`), so a fresh process re-parses only what changed while it
+was down. The file is a snapshot checked stamp-by-stamp on load — never trusted
+blindly — so a concurrent writer's snapshot is as good as ours and the last
+replace simply wins.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from libs.common.drama_layout import cache_dir, read_json_versioned, write_json_atomic
+from libs.common.fs_watcher import FsWatcher
+
+_INDEX_VERSION: int = 1
+
+Row = dict[str, Any]
+# drama-relative source path -> (size, mtime_ns, [(ref_id, row), ...])
+_Entries = dict[str, tuple[int, int, list[tuple[str, Row]]]]
+
+
+class ReferenceIndex:
+    def __init__(
+        self,
+        ai_videos: Callable[[], Path],
+        *,
+        kind: str,
+        sources: Callable[[Path], list[Path]],
+        extract: Callable[[Path, Path], list[tuple[str, Row]]],
+        watcher: FsWatcher | None = None,
+    ) -> None:
+        """`kind` names the persisted file (`references_{kind}.json`)."""
+        self._ai_videos = ai_videos
+        self._kind = kind
+        self._sources = sources
+        self._extract = extract
+        self._watcher = watcher
+        self._lock = threading.Lock()
+        self._dramas: dict[str, _Entries] = {}
+        self._by_id: dict[str, list[Row]] | None = None
+        self._dirty: set[str] = set()
+        self._trusted = False  # memo valid under a live watcher since last full scan
+        if watcher is not None:
+            watcher.subscribe(self._on_change)
+
+    def refs(self, ref_id: str) -> list[Row]:
+        """Every row naming `ref_id`, each with its `drama` and drama-relative
+        `source`, ordered by (drama, source, file order)."""
+        return [dict(r) for r in self._index().get(ref_id, [])]
+
+    def ids(self) -> set[str]:
+        """Every id referenced anywhere."""
+        return set(self._index())
+
+    def note_written(self, path: Path) -> None:
+        """Re-index the drama holding `path` now (called by the writers)."""
+        drama = self._drama_of(path)
+        if drama is None:
+            return
+        with self._lock:
+            self._dirty.discard(drama)
+            self._refresh_drama(drama)
+
+    # ------------------------------------------------------------------ refresh
+    def _index(self) -> dict[str, list[Row]]:
+        live = self._watcher is not None and self._watcher.start() and self._watcher.sync()
+        with self._lock:
+            if live and self._trusted:
+                dirty, self._dirty = self._dirty, set()
+                for drama in dirty:
+                    self._refresh_drama(drama)
+            else:
+                self._dirty.clear()
+                self._trusted = live
+                present = set(self._drama_names())
+                for gone in self._dramas.keys() - present:
+                    del self._dramas[gone]
+                    self._by_id = None
+                for drama in present:
+                    self._refresh_drama(drama)
+            if self._by_id is None:
+                self._by_id = self._aggregate()
+            return self._by_id
+
+    def _drama_names(self) -> list[str]:
+        try:
+            children = list(self._ai_videos().iterdir())
+        except OSError:
+            return []
+        return [c.name for c in children if _is_drama(c)]
+
+    def _refresh_drama(self, name: str) -> None:
+        """Caller holds the lock."""
+        drama_dir = self._ai_videos() / name
+        if not _is_drama(drama_dir):
+            if self._dramas.pop(name, None) is not None:
+                self._by_id = None
+            return
+        held = self._dramas.get(name)
+        if held is None:
+            held = self._read(drama_dir)
+        fresh: _Entries = {}
+        for path in self._sources(drama_dir):
+            try:
+                st = path.stat()
+                rel = path.relative_to(drama_dir).as_posix()
+            except (OSError, ValueError):
+                continue
+            prev = held.get(rel)
+            if prev is not None and prev[:2] == (st.st_size, st.st_mtime_ns):
+                fresh[rel] = prev
+                continue
+            try:
+                rows = self._extract(drama_dir, path)
+            except OSError:
+                continue
+            fresh[rel] = (st.st_size, st.st_mtime_ns, rows)
+        changed = fresh != held
+        if changed or name not in self._dramas:
+            self._by_id = None
+        self._dramas[name] = fresh
+        if changed:
+            self._save(drama_dir, fresh)
+
+    def _aggregate(self) -> dict[str, list[Row]]:
+        by_id: dict[str, list[Row]] = {}
+        for drama in sorted(self._dramas):
+            entries = self._dramas[drama]
+            for rel in sorted(entries):
+                for ref_id, row in entries[rel][2]:
+                    by_id.setdefault(ref_id, []).append(
+                        {**row, "drama": drama, "source": rel}
+                    )
+        return by_id
+
+    def _drama_of(self, path: Path) -> str | None:
+        try:
+            rel = path.resolve().relative_to(self._ai_videos().resolve())
+        except (OSError, ValueError):
+            return None
+        return rel.parts[0] if rel.parts else None
+
+    # ------------------------------------------------------------------ persistence
+    def _path(self, drama_dir: Path) -> Path:
+        return cache_dir(drama_dir) / f"references_{self._kind}.json"
+
+    def _read(self, drama_dir: Path) -> _Entries:
+        out: _Entries = {}
+        for rel, e in read_json_versioned(self._path(drama_dir), _INDEX_VERSION, "files").items():
+            try:
+                rows = [(str(ref_id), dict(row)) for ref_id, row in e["rows"]]
+                out[rel] = (int(e["size"]), int(e["mtime_ns"]), rows)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return out
+
+    def _save(self, drama_dir: Path, entries: _Entries) -> None:
+        """Best-effort: an unwritable cache only costs a re-parse next start."""
+        files = {
+            rel: {"size": size, "mtime_ns": mtime_ns, "rows": [[i, r] for i, r in rows]}
+            for rel, (size, mtime_ns, rows) in entries.items()
+        }
+        write_json_atomic(self._path(drama_dir), {"version": _INDEX_VERSION, "files": files})
+
+    # ------------------------------------------------------------------ events
+    def _on_change(self, paths: set[Path]) -> None:
+        root = self._ai_videos()
+        with self._lock:
+            for p in paths:
+                try:
+                    rel = p.relative_to(root)
+                except ValueError:
+                    continue
+                if not rel.parts:
+                    self._trusted = False  # ai_videos/ itself moved: rescan it all
+                    continue
+                self._dirty.add(rel.parts[0])
+
+
+def _is_drama(p: Path) -> bool:
+    """A live drama folder — `_actors/`, `_bgm/`, `_deleted/` … are not."""
+    return not p.name.startswith("_") and p.is_dir() and not p.is_symlink()
@@ -9,7 +9,8 @@ _WIN_RESERVED = re.compile(
 )
 _SHORT_NAME = re.compile(r"~\d")
 _EXCLUDED_TOP_LEVEL: frozenset[str] = frozenset(
-    {"node_modules", ".git", ".audit", "__pycache__", ".pytest_cache", "dist", "build", ".vite"}
+    {"node_modules", ".git", ".audit", "__pycache__", ".pytest_cache", "dist", "build", ".vite",
+     ".cache"}
 )
 # Allowed top-level directories: `ai_videos/`, `downloaded_novels/`, and `my_novel/`.
 # Anything else is outside the sandbox.
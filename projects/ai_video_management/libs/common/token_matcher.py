@@ -0,0 +1,72 @@
+"""Compiled multi-pattern substring matcher (Aho–Corasick).
+
+`TokenMatcher(tokens).present(text)` answers "which of these tokens occur as
+substrings of `text`" in ONE pass over `text`, independent of the number of
+tokens — the same answer as `{t for t in tokens if t in text}`, without the
+tokens × text rescans. Built once per token set and reused across texts.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+class TokenMatcher:
+    def __init__(self, tokens: Iterable[str]) -> None:
+        # trie as parallel arrays: goto edges, failure link, and the token ids
+        # ending at each state (own + inherited along the failure chain)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._tokens: list[str] = []
+        seen: set[str] = set()
+        for token in tokens:
+            if not token or token in seen:
+                continue
+            seen.add(token)
+            self._insert(token, len(self._tokens))
+            self._tokens.append(token)
+        self._link()
+
+    @property
+    def tokens(self) -> tuple[str, ...]:
+        return tuple(self._tokens)
+
+    def present(self, text: str) -> set[str]:
+        """The tokens occurring anywhere in `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: set[int] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                hits.update(out[state])
+        return {self._tokens[i] for i in hits}
+
+    def _insert(self, token: str, token_id: int) -> None:
+        state = 0
+        for ch in token:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = (*self._out[state], token_id)
+
+    def _link(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = (*self._out[nxt], *self._out[self._fail[nxt]])
@@ -0,0 +1,14 @@
+"""Named domain errors for the background job queue."""
+from __future__ import annotations
+
+
+class JobDomainError(Exception):
+    """Base for background-job errors."""
+
+
+class JobNotFoundError(JobDomainError):
+    """No job with that id (never submitted, or already evicted)."""
+
+
+class JobCancelledError(JobDomainError):
+    """The running job was cancelled; its ffmpeg child has been killed."""
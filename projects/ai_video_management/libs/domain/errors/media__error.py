@@ -1,4 +1,4 @@
-"""Named domain errors for media-file operations (archive / delete / rename / hard-delete)."""
+"""Named domain errors for media-file operations (archive / delete / rename / hard-delete / thumbnail)."""
 from __future__ import annotations
 
 
@@ -44,3 +44,7 @@ class MediaTargetExistsError(MediaDomainError):
 
 class MediaMoveFailedError(MediaDomainError):
     """OS-level failure while moving / renaming a media file."""
+
+
+class ThumbnailFailedError(MediaDomainError):
+    """The source could not be decoded (or the thumb cache written)."""
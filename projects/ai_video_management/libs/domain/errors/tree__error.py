@@ -0,0 +1,10 @@
+"""Named domain errors for the sidebar tree (subtree / paginated views)."""
+from __future__ import annotations
+
+
+class TreeDomainError(Exception):
+    """Base for tree-view errors."""
+
+
+class TreeNodeNotFoundError(TreeDomainError):
+    """`path=` names no directory or section node in the current tree."""
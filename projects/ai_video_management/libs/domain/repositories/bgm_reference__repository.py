@@ -15,9 +15,10 @@ class BgmReferenceRepository(Protocol):
 
     def find_references_for_bgm(self, bgm_id: str) -> list[dict[str, object]]:
         """Every drama/location whose bgm.md references this track id, as
-        `[{drama, location, cue_lines}, ...]` sorted by (drama, location)."""
+        `[{drama, location, cue_file, cue_lines, cue_windows}, ...]` sorted
+        by (drama, location)."""
         ...
 
     def referenced_bgm_ids(self) -> set[str]:
-        """Single-pass union of every `bgm_NNNN` token across all bgm.md."""
+        """Union of every `bgm_NNNN` token across all bgm.md."""
         ...
@@ -15,4 +15,4 @@ class EpisodeBgmRepository(Protocol):
 
     def unassign(self, rel: str, start: float, end: float) -> object: ...
 
-    def burn(self, rel: str) -> object: ...
+    def burn(self, rel: str, force: bool = False) -> object: ...
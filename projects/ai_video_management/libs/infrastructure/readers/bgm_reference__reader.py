@@ -7,20 +7,25 @@ BGM cues live in per-episode `episodes/epNN/bgm.md` (novel) or a project-root
 
     起-止(秒) bgm_NNNN | vol= | duck=on/off | fade=in/out
 
-This reader only needs the token, so it greps `bgm_\d{4,}` per line —
-matching the cue grammar without parsing the full line. Mirrors the shape of
-`Casting.find_assignments_for_actor` / `assigned_actor_ids` (iterate dramas,
-skip `_`-prefixed dirs, parse) but over bgm.md instead of casting.md.
+This reader only needs the token (plus the cue window when the line parses),
+so it greps `bgm_\d{4,}` per line rather than validating the full grammar.
+Answers come from a `ReferenceIndex` over every live drama's cue files
+(bgm id -> drama, location, cue line, window): a file is re-read only after it
+changed, and `EpisodeBgmManager` reports its own rewrites via `note_written`.
 """
 from __future__ import annotations
 
 import re
-from libs.common import drama_layout
 from pathlib import Path
 
+from libs.common import drama_layout
 from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.reference_index import ReferenceIndex, Row
 from libs.common.safe_resolve import SafeResolver
+from libs.domain.errors.episode_bgm__error import InvalidBgmCueError
 from libs.domain.value_objects.bgm__valueobject import validate_bgm_id
+from libs.domain.value_objects.episode_bgm__valueobject import parse_cue_line
 
 BGM_CUE_FILE_NAME: str = "bgm.md"
 BGM_CUE_DIR_NAME: str = "bgm"
@@ -30,9 +35,18 @@ _BGM_TOKEN_RE = re.compile(r"\bbgm_\d{4,}\b")
 class BgmReferenceReader:
     """Implements `BgmReferenceRepository`."""
 
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver, watcher: FsWatcher | None = None
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._index = ReferenceIndex(
+            lambda: self._exposed.root / "ai_videos",
+            kind="bgm",
+            sources=_cue_files,
+            extract=_cue_rows,
+            watcher=watcher,
+        )
 
     def _rel(self, p: Path) -> str:
         try:
@@ -40,71 +54,76 @@ class BgmReferenceReader:
         except (OSError, ValueError):
             return p.as_posix()
 
-    def _iter_cue_files(self) -> list[tuple[str, str, Path]]:
-        """Every `bgm.md` under a live drama, as (drama, location, path).
-
-        location = "(root)" for a short's project-root bgm.md, or the
-        episode folder name (e.g. "episodes/ep01") for a novel.
-        """
-        ai_videos = self._exposed.root / "ai_videos"
-        if not ai_videos.is_dir():
-            return []
-        out: list[tuple[str, str, Path]] = []
-        for drama_dir in sorted(ai_videos.iterdir(), key=lambda p: p.name):
-            if not drama_dir.is_dir() or drama_dir.is_symlink():
-                continue
-            if drama_dir.name.startswith("_"):
-                continue
-            root_cue = drama_dir / BGM_CUE_FILE_NAME
-            if root_cue.is_file():
-                out.append((drama_dir.name, "(root)", root_cue))
-            episodes = drama_layout.episodes_dir(drama_dir)
-            if episodes.is_dir():
-                for ep_dir in sorted(episodes.iterdir(), key=lambda p: p.name):
-                    if not ep_dir.is_dir() or ep_dir.is_symlink():
-                        continue
-                    # Episode BGM cue timeline: the canonical location is the
-                    # per-episode `bgm/bgm.md` folder; a flat `episodes/epNN/
-                    # bgm.md` is still honoured for older layouts.
-                    ep_cue = ep_dir / BGM_CUE_DIR_NAME / BGM_CUE_FILE_NAME
-                    if not ep_cue.is_file():
-                        ep_cue = ep_dir / BGM_CUE_FILE_NAME
-                    if ep_cue.is_file():
-                        out.append((drama_dir.name, f"episodes/{ep_dir.name}", ep_cue))
-        return out
-
     def find_references_for_bgm(self, bgm_id: str) -> list[dict[str, object]]:
         validate_bgm_id(bgm_id)
-        out: list[dict[str, object]] = []
-        for drama, location, path in self._iter_cue_files():
-            try:
-                text = path.read_text(encoding="utf-8")
-            except OSError:
-                continue
-            cue_lines = [
-                line.strip()
-                for line in text.splitlines()
-                if bgm_id in _BGM_TOKEN_RE.findall(line)
-            ]
-            if cue_lines:
-                out.append(
-                    {
-                        "drama": drama,
-                        "location": location,
-                        "cue_file": self._rel(path),
-                        "cue_lines": cue_lines,
-                    }
-                )
+        ai_videos = self._exposed.root / "ai_videos"
+        grouped: dict[tuple[str, str], dict[str, object]] = {}
+        for ref in self._index.refs(bgm_id):
+            drama, source = str(ref["drama"]), str(ref["source"])
+            row = grouped.setdefault(
+                (drama, source),
+                {
+                    "drama": drama,
+                    "location": ref["location"],
+                    "cue_file": self._rel(ai_videos / drama / source),
+                    "cue_lines": [],
+                    "cue_windows": [],
+                },
+            )
+            row["cue_lines"].append(ref["line"])  # type: ignore[union-attr]
+            if ref.get("window") is not None:
+                row["cue_windows"].append(ref["window"])  # type: ignore[union-attr]
+        out = list(grouped.values())
         out.sort(key=lambda r: (str(r["drama"]), str(r["location"])))
         return out
 
     def referenced_bgm_ids(self) -> set[str]:
-        ids: set[str] = set()
-        for _drama, _location, path in self._iter_cue_files():
-            try:
-                text = path.read_text(encoding="utf-8")
-            except OSError:
+        return self._index.ids()
+
+    def note_written(self, cue_file: Path) -> None:
+        """Called by the cue-file writers right after they rewrite `cue_file`."""
+        self._index.note_written(cue_file)
+
+
+def _cue_files(drama_dir: Path) -> list[Path]:
+    """Every `bgm.md` of one drama: a short's project-root bgm.md, then each
+    episode's (the canonical per-episode `bgm/bgm.md` folder; a flat
+    `episodes/epNN/bgm.md` is still honoured for older layouts)."""
+    out: list[Path] = []
+    root_cue = drama_dir / BGM_CUE_FILE_NAME
+    if root_cue.is_file():
+        out.append(root_cue)
+    episodes = drama_layout.episodes_dir(drama_dir)
+    if episodes.is_dir():
+        for ep_dir in sorted(episodes.iterdir(), key=lambda p: p.name):
+            if not ep_dir.is_dir() or ep_dir.is_symlink():
                 continue
-            for token in _BGM_TOKEN_RE.findall(text):
-                ids.add(token)
-        return ids
+            ep_cue = ep_dir / BGM_CUE_DIR_NAME / BGM_CUE_FILE_NAME
+            if not ep_cue.is_file():
+                ep_cue = ep_dir / BGM_CUE_FILE_NAME
+            if ep_cue.is_file():
+                out.append(ep_cue)
+    return out
+
+
+def _cue_rows(drama_dir: Path, path: Path) -> list[tuple[str, Row]]:
+    """Index rows of one cue file: each referenced bgm id -> its location
+    ("(root)" or "episodes/epNN"), the cue line and its [start, end] window."""
+    if path.parent == drama_dir:
+        location = "(root)"
+    else:
+        ep_dir = path.parent.parent if path.parent.name == BGM_CUE_DIR_NAME else path.parent
+        location = f"episodes/{ep_dir.name}"
+    rows: list[tuple[str, Row]] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        ids = dict.fromkeys(_BGM_TOKEN_RE.findall(line))
+        if not ids:
+            continue
+        try:
+            cue = parse_cue_line(line)
+        except InvalidBgmCueError:
+            cue = None
+        window = [cue.start, cue.end] if cue is not None else None
+        for bgm_id in ids:
+            rows.append((bgm_id, {"location": location, "line": line.strip(), "window": window}))
+    return rows
@@ -0,0 +1,291 @@
+"""Shared media-metadata probe with a persistent per-drama index.
+
+Every ffmpeg-driven writer used to spawn its own `ffmpeg -i` (and often a
+second `-map 0:v:0 -c copy -f null -` demux pass) per clip per call just to
+learn a clip's duration / fps / size / audio presence — ~120 process spawns
+before the first frame of a 40-shot episode was encoded. This reader answers
+all of those from ONE demux pass per file version and remembers the answer.
+
+One probe = `ffmpeg -i SRC -map 0:v:0? -c copy -f null -`: the input header
+(stream lines → fps, WxH, video codec, Audio: presence, container Duration) is
+printed before the copy starts, and the final progress `time=` is the VIDEO
+stream's true length (the container Duration can be the longer audio track —
+see EpisodeConcatBuilder's xfade history). The audio-stream length needs its
+own demux pass, so it is probed lazily (`audio_duration`) and cached alongside.
+
+Results are keyed by (path, size, mtime_ns) — any rewrite of the file changes
+the key, so a stale entry is never served. Entries for files under
+`ai_videos/{drama}/` persist in `ai_videos/{drama}/.cache/media_index.json`
+(drama-relative keys, so the index survives a repo move); anything else
+(temp files, seam-candidate joins) is cached in memory only. The index is a
+`drama_layout.DramaIndex`: new entries are held in memory and written once per
+burst of probes, so a batch costs one write per drama instead of one per clip;
+concurrent writers merge before an atomic replace, and entries whose file is
+gone are pruned when an index is loaded.
+
+Deliberately stdlib-only apart from the (stdlib-only) `drama_layout`: the repo
+tools (`tools/seam_concat.py`, `tools/seam_metrics.py`, `tools/seam_tune.py`)
+load this file by path, and it then loads `drama_layout` by path too, so the
+CLIs and the webapp share one probe + one index.
+"""
+from __future__ import annotations
+
+import re
+import subprocess
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+# `cache_dir` / `drama_dir_of` are re-exported: the tools reach them through here.
+try:
+    from libs.common.drama_layout import DramaIndex, cache_dir, drama_dir_of
+except ImportError:  # loaded by path from tools/: no `libs` package to import from
+    import importlib.util
+    import sys
+
+    _spec = importlib.util.spec_from_file_location(
+        "drama_layout", Path(__file__).resolve().parents[2] / "common" / "drama_layout.py"
+    )
+    assert _spec is not None and _spec.loader is not None
+    _drama_layout = importlib.util.module_from_spec(_spec)
+    sys.modules[_spec.name] = _drama_layout
+    _spec.loader.exec_module(_drama_layout)
+    DramaIndex, cache_dir, drama_dir_of = (
+        _drama_layout.DramaIndex, _drama_layout.cache_dir, _drama_layout.drama_dir_of
+    )
+
+MEDIA_INDEX_FILE_NAME: str = "media_index.json"
+_INDEX_VERSION: int = 1
+_PROBE_TIMEOUT_S: int = 30
+
+_PROGRESS_TIME_RE = re.compile(r"time=\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+_FPS_RE = re.compile(r"(\d+(?:\.\d+)?)\s*fps")
+_SIZE_RE = re.compile(r"[\s,](\d{2,5})x(\d{2,5})[\s,\]]")
+_VCODEC_RE = re.compile(r"Video:\s*([\w-]+)")
+# The input header ends where ffmpeg starts describing the output side.
+_HEADER_END_RE = re.compile(r"^(Stream mapping:|Output #)", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """What a single probe pass learns about one media file. Fields are None
+    when ffmpeg could not report them; callers apply their own fallbacks."""
+
+    duration: float | None            # video-stream length (s); container Duration fallback
+    container_duration: float | None  # `Duration:` header (may be the longer audio track)
+    fps: float | None
+    width: int | None
+    height: int | None
+    has_audio: bool
+    vcodec: str | None
+    audio_duration: float | None = None  # audio-stream length; probed lazily
+
+    def to_payload(self) -> dict[str, object]:
+        return asdict(self)
+
+    @classmethod
+    def from_payload(cls, data: dict) -> "MediaInfo":
+        return cls(
+            duration=data.get("duration"),
+            container_duration=data.get("container_duration"),
+            fps=data.get("fps"),
+            width=data.get("width"),
+            height=data.get("height"),
+            has_audio=bool(data.get("has_audio", False)),
+            vcodec=data.get("vcodec"),
+            audio_duration=data.get("audio_duration"),
+        )
+
+
+def default_ffmpeg() -> str:
+    """The bundled imageio_ffmpeg binary when present, else `ffmpeg` on PATH."""
+    try:
+        import imageio_ffmpeg
+
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return "ffmpeg"
+
+
+def parse_probe_output(err: str) -> MediaInfo:
+    """Build a MediaInfo from the stderr of one `-map 0:v:0? -c copy -f null`
+    probe pass. Pure — exercised directly by the unit tests."""
+    m = _HEADER_END_RE.search(err)
+    header = err[: m.start()] if m else err
+    fps: float | None = None
+    width: int | None = None
+    height: int | None = None
+    vcodec: str | None = None
+    has_audio = False
+    for line in header.splitlines():
+        stripped = line.strip()
+        if not stripped.startswith("Stream #"):
+            continue
+        if "Audio:" in stripped:
+            has_audio = True
+        if "Video:" in stripped and vcodec is None:
+            cm = _VCODEC_RE.search(stripped)
+            vcodec = cm.group(1) if cm else None
+            sm = _SIZE_RE.search(stripped)
+            if sm:
+                width, height = int(sm.group(1)), int(sm.group(2))
+            fm = _FPS_RE.search(stripped)
+            if fm:
+                try:
+                    fps = float(fm.group(1))
+                except ValueError:
+                    fps = None
+    container = _hms(_DURATION_RE.search(header))
+    times = _PROGRESS_TIME_RE.findall(err[m.start():] if m else "")
+    video = _hms_tuple(times[-1]) if times else None
+    if video is not None and video <= 0.0:
+        video = None
+    return MediaInfo(
+        duration=video if video is not None else container,
+        container_duration=container,
+        fps=fps,
+        width=width,
+        height=height,
+        has_audio=has_audio,
+        vcodec=vcodec,
+    )
+
+
+def _hms(m: re.Match[str] | None) -> float | None:
+    if m is None:
+        return None
+    return _hms_tuple(m.groups())
+
+
+def _hms_tuple(t: tuple[str, ...]) -> float | None:
+    try:
+        return int(t[0]) * 3600 + int(t[1]) * 60 + float(t[2])
+    except (ValueError, IndexError):
+        return None
+
+
+class MediaProbeReader:
+    """Process-wide probe cache. One instance is shared by every writer (DI
+    singleton); the repo tools build their own and meet it in the on-disk
+    index."""
+
+    def __init__(self, ffmpeg: str | None = None) -> None:
+        self._ffmpeg = ffmpeg
+        self._lock = threading.Lock()
+        # resolved path → (size, mtime_ns, MediaInfo)
+        self._memo: dict[str, tuple[int, int, MediaInfo]] = {}
+        self._index = DramaIndex(MEDIA_INDEX_FILE_NAME, _INDEX_VERSION)
+
+    def probe(self, src: Path, ffmpeg: str | None = None) -> MediaInfo:
+        """Metadata for `src`, from cache when (size, mtime) still match.
+        A missing/unreadable file yields an all-None MediaInfo (not cached)."""
+        src = Path(src)
+        stamp = self._stamp(src)
+        if stamp is None:
+            return MediaInfo(None, None, None, None, None, False, None)
+        hit = self._lookup(src, stamp)
+        if hit is not None:
+            return hit
+        info = self._run_probe(ffmpeg or self._ffmpeg_exe(), src)
+        if info is None:  # timeout — don't pin a transient failure
+            return MediaInfo(None, None, None, None, None, False, None)
+        self._store(src, stamp, info)
+        return info
+
+    def audio_duration(self, src: Path, ffmpeg: str | None = None) -> float:
+        """Audio-stream length in seconds (0.0 when the source is mute). Costs
+        one extra demux pass the first time per file version, then cached."""
+        src = Path(src)
+        info = self.probe(src, ffmpeg)
+        if not info.has_audio:
+            return 0.0
+        if info.audio_duration is not None:
+            return info.audio_duration
+        stamp = self._stamp(src)
+        if stamp is None:
+            return 0.0
+        try:
+            result = subprocess.run(
+                [ffmpeg or self._ffmpeg_exe(), "-hide_banner", "-i", str(src),
+                 "-map", "0:a:0", "-c", "copy", "-f", "null", "-"],
+                capture_output=True, timeout=_PROBE_TIMEOUT_S, check=False,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return 0.0
+        times = _PROGRESS_TIME_RE.findall(result.stderr.decode("utf-8", "replace"))
+        dur = (_hms_tuple(times[-1]) or 0.0) if times else 0.0
+        self._store(src, stamp, MediaInfo(**{**asdict(info), "audio_duration": dur}))
+        return dur
+
+    def flush(self) -> None:
+        """Write every drama index holding entries not yet on disk. Runs by
+        itself shortly after a burst of probes and at exit; call it to persist
+        now (e.g. before handing the tree to another process)."""
+        self._index.flush()
+
+    def forget(self, src: Path) -> None:
+        """Drop `src` from the in-memory cache (the index entry self-invalidates
+        on the next size/mtime mismatch)."""
+        with self._lock:
+            self._memo.pop(str(Path(src).resolve()), None)
+
+    # --- internals ----------------------------------------------------------
+
+    def _ffmpeg_exe(self) -> str:
+        if self._ffmpeg is None:
+            self._ffmpeg = default_ffmpeg()
+        return self._ffmpeg
+
+    @staticmethod
+    def _stamp(src: Path) -> tuple[int, int] | None:
+        try:
+            st = src.stat()
+        except OSError:
+            return None
+        if not src.is_file():
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    @staticmethod
+    def _run_probe(ffmpeg: str, src: Path) -> MediaInfo | None:
+        try:
+            result = subprocess.run(
+                [ffmpeg, "-hide_banner", "-i", str(src),
+                 "-map", "0:v:0?", "-c", "copy", "-f", "null", "-"],
+                capture_output=True, timeout=_PROBE_TIMEOUT_S, check=False,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        except OSError:
+            return MediaInfo(None, None, None, None, None, False, None)
+        return parse_probe_output(result.stderr.decode("utf-8", errors="replace"))
+
+    def _lookup(self, src: Path, stamp: tuple[int, int]) -> MediaInfo | None:
+        key = str(src.resolve())
+        with self._lock:
+            memo = self._memo.get(key)
+        if memo is not None and memo[:2] == stamp:
+            return memo[2]
+        located = self._index.slot(src)
+        if located is None:
+            return None
+        entry = self._index.get(*located)
+        if not entry or (entry.get("size"), entry.get("mtime_ns")) != stamp:
+            return None
+        try:
+            info = MediaInfo.from_payload(entry.get("info") or {})
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            self._memo[key] = (stamp[0], stamp[1], info)
+        return info
+
+    def _store(self, src: Path, stamp: tuple[int, int], info: MediaInfo) -> None:
+        with self._lock:
+            self._memo[str(src.resolve())] = (stamp[0], stamp[1], info)
+        located = self._index.slot(src)
+        if located is not None:
+            self._index.put(
+                *located, {"size": stamp[0], "mtime_ns": stamp[1], "info": info.to_payload()}
+            )
@@ -0,0 +1,179 @@
+"""Sized gallery thumbnails + video poster frames, cached on disk.
+
+Galleries (actor pool, character tiles, the recycle bin, shot rows) used to
+load the ORIGINAL image or let every `<video>` fetch its own metadata — megabytes
+per tile. `thumbnail(src, width)` returns a small still instead:
+
+* images — Pillow, EXIF-rotated, shrunk (never enlarged) to `width`;
+* videos — one ffmpeg frame (`-ss` a quarter in, at most 1 s — past a fade-in,
+  cheap to seek), scaled by ffmpeg so only a thumb-sized frame is piped back.
+
+Encoded as WebP (JPEG when Pillow lacks WebP). Widths snap up to one of
+`THUMB_WIDTHS` so the cache holds a bounded set of variants per source.
+
+Cache: `ai_videos/{drama}/.cache/thumbs/` for sources under a drama (or
+`_actors` / `_voices` / … — any `ai_videos/` child), the system temp dir
+otherwise. The file name carries the source's (size, mtime_ns), so an edited
+source simply misses and the superseded variant is pruned when its successor
+is written; thumbs are written temp + rename, so a reader never sees a partial
+file. Concurrent requests for the same thumb wait for one encode.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+from PIL import Image, ImageOps, features
+
+from libs.common.drama_layout import cache_dir, drama_dir_of
+from libs.domain.errors.media__error import NotMediaError, ThumbnailFailedError
+from libs.infrastructure.readers.media_probe__reader import MediaProbeReader, default_ffmpeg
+
+THUMB_WIDTHS: tuple[int, ...] = (128, 256, 512)
+DEFAULT_THUMB_WIDTH: int = 256
+IMAGE_EXTENSIONS: frozenset[str] = frozenset(
+    {".png", ".jpg", ".jpeg", ".webp", ".gif", ".bmp"}
+)
+VIDEO_EXTENSIONS: frozenset[str] = frozenset(
+    {".mp4", ".mov", ".webm", ".mkv", ".avi", ".m4v"}
+)
+_THUMBS_DIR_NAME: str = "thumbs"
+_TEMP_CACHE_DIR_NAME: str = "ai_video_thumbs"
+_RECIPE_VERSION: int = 1  # bump when the encode changes, to orphan old thumbs
+_POSTER_MAX_SEEK_S: float = 1.0
+_FFMPEG_TIMEOUT_S: int = 30
+_WEBP_QUALITY: int = 80
+_JPEG_QUALITY: int = 82
+
+
+def snap_width(width: int | None) -> int:
+    """The smallest cached width >= `width` (the largest when beyond them)."""
+    if width is None:
+        return DEFAULT_THUMB_WIDTH
+    return next((w for w in THUMB_WIDTHS if w >= width), THUMB_WIDTHS[-1])
+
+
+class ThumbnailReader:
+    def __init__(self, probe: MediaProbeReader | None = None, ffmpeg: str | None = None) -> None:
+        self._probe = probe or MediaProbeReader()
+        self._ffmpeg = ffmpeg
+        self._ext = ".webp" if features.check("webp") else ".jpg"
+        self._lock = threading.Lock()
+        self._inflight: dict[Path, threading.Lock] = {}
+
+    @property
+    def extension(self) -> str:
+        return self._ext
+
+    def thumbnail(self, src: Path, width: int | None = None) -> Path:
+        """Path of the cached thumb of `src` at (snapped) `width`, encoding it
+        first when missing. Raises NotMediaError / ThumbnailFailedError."""
+        ext = src.suffix.lower()
+        if ext not in IMAGE_EXTENSIONS and ext not in VIDEO_EXTENSIONS:
+            raise NotMediaError(ext)
+        w = snap_width(width)
+        try:
+            st = src.stat()
+        except OSError as e:
+            raise ThumbnailFailedError(f"unreadable source: {src.name}") from e
+        stem = self._source_id(src, w)
+        version = hashlib.sha1(
+            f"{st.st_size}|{st.st_mtime_ns}|{_RECIPE_VERSION}".encode("ascii")
+        ).hexdigest()[:10]
+        out = self._cache_root(src) / f"{stem}_{version}{self._ext}"
+        if out.is_file():
+            return out
+        with self._key_lock(out):
+            if not out.is_file():
+                image = self._poster(src, w) if ext in VIDEO_EXTENSIONS else self._still(src, w)
+                self._write(image, out)
+                self._prune(out, stem)
+        with self._lock:
+            self._inflight.pop(out, None)
+        return out
+
+    # --- internals ----------------------------------------------------------
+
+    def _key_lock(self, out: Path) -> threading.Lock:
+        with self._lock:
+            return self._inflight.setdefault(out, threading.Lock())
+
+    @staticmethod
+    def _source_id(src: Path, width: int) -> str:
+        digest = hashlib.sha1(src.resolve().as_posix().encode("utf-8")).hexdigest()[:16]
+        return f"{digest}_{width}"
+
+    @staticmethod
+    def _cache_root(src: Path) -> Path:
+        drama = drama_dir_of(src.resolve())
+        if drama is not None:
+            return cache_dir(drama) / _THUMBS_DIR_NAME
+        return Path(tempfile.gettempdir()) / _TEMP_CACHE_DIR_NAME
+
+    @staticmethod
+    def _still(src: Path, width: int) -> Image.Image:
+        try:
+            with Image.open(src) as im:
+                im.seek(0)
+                image = ImageOps.exif_transpose(im)
+                image.thumbnail((width, width * 4), Image.Resampling.LANCZOS)
+                image.load()
+                return image
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            raise ThumbnailFailedError(f"cannot decode image: {src.name}") from e
+
+    def _poster(self, src: Path, width: int) -> Image.Image:
+        duration = self._probe.probe(src).duration or 0.0
+        seek = min(_POSTER_MAX_SEEK_S, duration / 4)
+        for at in dict.fromkeys((seek, 0.0)):  # retry from 0 if the seek overshot
+            frame = self._grab_frame(src, at, width)
+            if frame:
+                try:
+                    with Image.open(io.BytesIO(frame)) as im:
+                        im.load()
+                        return im.copy()
+                except OSError:
+                    continue
+        raise ThumbnailFailedError(f"no frame decoded: {src.name}")
+
+    def _grab_frame(self, src: Path, at: float, width: int) -> bytes:
+        cmd = [
+            self._ffmpeg or default_ffmpeg(), "-hide_banner", "-loglevel", "error",
+            "-ss", f"{at:.3f}", "-i", str(src),
+            "-frames:v", "1", "-vf", f"scale='min({width},iw)':-2",
+            "-f", "image2pipe", "-vcodec", "png", "-",
+        ]
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=_FFMPEG_TIMEOUT_S, check=False)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            raise ThumbnailFailedError(f"ffmpeg failed: {src.name}") from e
+        return result.stdout if result.returncode == 0 else b""
+
+    def _write(self, image: Image.Image, out: Path) -> None:
+        buf = io.BytesIO()
+        if self._ext == ".webp":
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+            image.save(buf, format="WEBP", quality=_WEBP_QUALITY, method=4)
+        else:
+            image.convert("RGB").save(buf, format="JPEG", quality=_JPEG_QUALITY, optimize=True)
+        tmp = out.with_name(f".{out.name}.{os.getpid()}.{threading.get_ident()}.part")
+        try:
+            out.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(buf.getvalue())
+            os.replace(tmp, out)
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
+            raise ThumbnailFailedError(f"cache unwritable: {out.parent}") from e
+
+    @staticmethod
+    def _prune(keep: Path, stem: str) -> None:
+        """Drop this source's superseded variants at the same width."""
+        for old in keep.parent.glob(f"{stem}_*"):
+            if old != keep:
+                old.unlink(missing_ok=True)
@@ -1,12 +1,34 @@
+"""Sidebar tree model.
+
+Per the tree-cache follow-up: with an `FsWatcher` wired in, every walked
+directory's subtree (and each drama's project meta / title, each novel's
+completeness flag) is memoized and the whole payload is kept with a content
+ETag. A batch of filesystem events drops only the memo entries on the changed
+paths' ancestor chain (plus anything under a removed dir), so a refresh after
+an edit re-walks O(changes) instead of the whole corpus — and an unchanged
+tree is answered from the snapshot (`/api/tree` → 304 on a matching ETag).
+
+Without a watcher (unit tests, or the watcher is down / did not answer its
+fence) every build is a fresh full walk — never a stale answer.
+
+Lazy views (`view()`): a depth-limited root, a `path=` subtree and an
+offset/limit window over a huge folder's children are projections of that
+same snapshot — only the requested slice is copied and serialized, so the
+payload tracks what the sidebar shows rather than the size of the corpus.
+"""
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from libs.common.exposed_tree import ExposedTree, TREE_VISIBLE_EXTENSIONS
+from libs.common.fs_watcher import FsWatcher
 from libs.common.sub_type_lookup import lookup as sub_type_lookup
+from libs.domain.errors.tree__error import TreeNodeNotFoundError
 from libs.domain.value_objects.bgm__valueobject import CATEGORY_LABELS_ZH as BGM_CATEGORY_LABELS_ZH
 from libs.domain.value_objects.novel__valueobject import CANONICAL_NOVELS, categories as novel_categories
 
@@ -22,6 +44,12 @@ _SYSTEM_FOLDER_LABELS_ZH: dict[str, str] = {
     "_actors": "演员库",
     "_bgm": "背景音乐库",
 }
+# `path=` of a section node (sections themselves carry `path: ""`).
+_SECTION_PATHS: dict[str, str] = {
+    "AI Videos": "ai_videos",
+    "Downloaded Novels": "downloaded_novels",
+    "My Novel": "my_novel",
+}
 
 
 class TreeReader:
@@ -30,11 +58,143 @@ class TreeReader:
     Single section: "AI Videos".
     """
 
-    def __init__(self, exposed: ExposedTree) -> None:
+    def __init__(self, exposed: ExposedTree, watcher: FsWatcher | None = None) -> None:
         self._exposed = exposed
         self._root = exposed.root
+        self._watcher = watcher
+        self._lock = threading.RLock()
+        # (kind, dir) → memoized value; None = memo off (no live watcher).
+        self._memo: dict[tuple[str, Path], Any] | None = None
+        self._snapshot: tuple[dict[str, Any], str] | None = None
+        # (tree, path → node) for the tree the last view() projected from.
+        self._index: tuple[dict[str, Any], dict[str, dict[str, Any]]] | None = None
+        if watcher is not None:
+            watcher.subscribe(self._invalidate)
 
     def build(self) -> dict[str, Any]:
+        return self.snapshot()[0]
+
+    def snapshot(self) -> tuple[dict[str, Any], str]:
+        """(tree, etag). Served from the cached model when the watcher is live
+        and has delivered every change made before this call; else a full walk.
+        The returned tree is shared — callers must not mutate it."""
+        live = self._watcher is not None and self._watcher.start() and self._watcher.sync()
+        with self._lock:
+            if not live:
+                self._memo = None
+                self._snapshot = None
+                tree = self._build_tree()
+                return tree, self._etag(tree)
+            if self._memo is None:
+                self._memo = {}
+            if self._snapshot is None:
+                tree = self._build_tree()
+                self._snapshot = (tree, self._etag(tree))
+            return self._snapshot
+
+    def view(
+        self,
+        path: str = "",
+        depth: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> tuple[dict[str, Any], str]:
+        """(node, etag) for a slice of the tree.
+
+        `path` selects a section (`ai_videos` / `downloaded_novels` /
+        `my_novel`) or directory node; "" is the root. `depth` keeps that many
+        levels of children below it (None = all). `offset`/`limit` window the
+        selected node's children; `limit` also caps every deeper child list.
+        A node whose children were cut carries `child_count` and
+        `truncated: true` (plus `offset` on the selected node) — the client
+        fetches the rest with `path=<that node>`.
+        """
+        tree, _ = self.snapshot()
+        node = tree if not path else self._indexed(tree).get(path.strip("/"))
+        if node is None:
+            raise TreeNodeNotFoundError(path)
+        projected = self._project(node, depth, offset, limit)
+        return projected, self._etag(projected)
+
+    def _indexed(self, tree: dict[str, Any]) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            if self._index is not None and self._index[0] is tree:
+                return self._index[1]
+        index: dict[str, dict[str, Any]] = {}
+        for section in tree["children"]:
+            index[_SECTION_PATHS.get(section["name"], section["name"])] = section
+            stack = list(section.get("children", []))
+            while stack:
+                node = stack.pop()
+                if node.get("type") == "directory":
+                    index[node["path"]] = node
+                    stack.extend(node.get("children", []))
+        with self._lock:
+            self._index = (tree, index)
+        return index
+
+    @classmethod
+    def _project(
+        cls,
+        node: dict[str, Any],
+        depth: int | None,
+        offset: int,
+        limit: int | None,
+    ) -> dict[str, Any]:
+        out = {k: v for k, v in node.items() if k != "children"}
+        children = node.get("children")
+        if children is None:
+            return out
+        total = len(children)
+        if depth is not None and depth <= 0:
+            out["children"] = []
+            if total:
+                out["child_count"] = total
+                out["truncated"] = True
+            return out
+        end = total if limit is None else offset + limit
+        window = children[offset:end]
+        below = None if depth is None else depth - 1
+        out["children"] = [cls._project(c, below, 0, limit) for c in window]
+        if offset or len(window) < total:
+            out["child_count"] = total
+            out["offset"] = offset
+            out["truncated"] = True
+        return out
+
+    def _invalidate(self, changed: set[Path]) -> None:
+        """Drop the memo entries a batch of changed paths can affect: each
+        path's ancestor chain (their child lists / labels / meta embed it) and
+        every entry under a changed path (a removed or renamed dir)."""
+        affected: set[Path] = set()
+        for p in changed:
+            affected.add(p)
+            affected.update(p.parents)
+        with self._lock:
+            self._snapshot = None
+            if not self._memo:
+                return
+            for key in [
+                k for k in self._memo
+                if k[1] in affected or not changed.isdisjoint(k[1].parents)
+            ]:
+                del self._memo[key]
+
+    def _memoized(self, kind: str, directory: Path, compute: Callable[[], Any]) -> Any:
+        memo = self._memo
+        if memo is None:
+            return compute()
+        key = (kind, directory)
+        if key not in memo:
+            memo[key] = compute()
+        return memo[key]
+
+    @staticmethod
+    def _etag(tree: dict[str, Any]) -> str:
+        body = json.dumps(tree, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+    def _build_tree(self) -> dict[str, Any]:
         return {
             "type": "section",
             "name": "root",
@@ -174,6 +334,10 @@ class TreeReader:
         `_meta.json.complete == True`. In-progress downloads stay on disk
         (resume checkpoint preserved) but are filtered out of the sidebar.
         """
+        return self._memoized("complete", novel_dir, lambda: self._read_complete(novel_dir))
+
+    @staticmethod
+    def _read_complete(novel_dir: Path) -> bool:
         meta_path = novel_dir / "_meta.json"
         if not meta_path.is_file():
             return False
@@ -184,6 +348,11 @@ class TreeReader:
         return bool(data.get("complete", False))
 
     def _walk_project(self, project_dir: Path) -> dict[str, Any] | None:
+        return self._memoized(
+            "project", project_dir, lambda: self._walk_project_uncached(project_dir)
+        )
+
+    def _walk_project_uncached(self, project_dir: Path) -> dict[str, Any] | None:
         sub = self._walk_filtered(project_dir, self._is_allowed_leaf)
         meta = sub_type_lookup(self._root, project_dir.name)
         project_meta_payload: dict[str, Any] | None = None
@@ -213,6 +382,9 @@ class TreeReader:
         `1_立项/concept.md`'s H1, shape `# 立项策划单 · 武神觉醒` → 武神觉醒.
         Also reused by `my_novel/{name}/README.md`.
         """
+        return self._memoized("title", project_dir, lambda: self._read_zh_title(project_dir))
+
+    def _read_zh_title(self, project_dir: Path) -> str | None:
         title = self._h1_zh(project_dir / "README.md")
         if title:
             return title
@@ -284,6 +456,14 @@ class TreeReader:
         return None
 
     def _walk_filtered(self, directory: Path, leaf_predicate: Any) -> list[dict[str, Any]]:
+        # every caller passes `_is_allowed_leaf`, so the dir alone keys the memo
+        return self._memoized(
+            "walk", directory, lambda: self._walk_filtered_uncached(directory, leaf_predicate)
+        )
+
+    def _walk_filtered_uncached(
+        self, directory: Path, leaf_predicate: Any
+    ) -> list[dict[str, Any]]:
         children: list[dict[str, Any]] = []
         excluded = self._exposed.excluded_dirs()
         try:
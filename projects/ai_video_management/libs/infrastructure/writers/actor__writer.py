@@ -33,8 +33,10 @@ import os
 import random
 import re
 import socket
+import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from io import BytesIO
 from pathlib import Path
@@ -44,6 +46,9 @@ import httpx
 from PIL import Image
 
 from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.job_progress import parallel_steps
+from libs.common.library_catalog import LibraryCatalog
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.actor__error import (
     ActorAlreadyDeletedError,
@@ -158,6 +163,11 @@ def _shared_negative_prompt() -> str:
     return build_negatives()
 
 
+def _actor_number(folder: Path) -> int | None:
+    m = _ACTOR_DIR_RE.match(folder.name)
+    return int(m.group(1)) if m else None
+
+
 def _find_actor_jpg(actor_folder: Path) -> Path | None:
     """Return the actor's face jpg file path, preferring the follow-up 033
     descriptive naming over the legacy `{actor_id}.jpg`. Per follow-up 052:
@@ -1115,6 +1125,19 @@ KLING_DEFAULT_MODEL: str = "kling-v2-1"
 # prompt-following behaviour users typically expect from the web UI.
 KLING_DEFAULT_CFG_SCALE: float = 0.7
 KLING_JWT_EXP_SECONDS: int = 1800
+# A cached JWT is re-signed this long before `exp`, so a request in flight
+# never carries a token that expires mid-call.
+KLING_JWT_REFRESH_MARGIN_SECONDS: int = 300
+# Generations one provider keeps in flight (submit → wait → download): a
+# 9-actor batch's face + body shots all go out at once. Further calls queue.
+KLING_MAX_CONCURRENCY: int = 18
+# Connection-pool cap of the provider's shared httpx.Client (one per in-flight
+# generation + the single poller + headroom).
+KLING_MAX_CONNECTIONS: int = 20
+# Token bucket in front of every Kling API call (submits + the tracker's list
+# poll; CDN downloads are not metered): sustained calls/second and burst.
+KLING_RATE_PER_SECOND: float = 4.0
+KLING_RATE_BURST: int = 8
 KLING_POLL_INTERVAL_SECONDS: float = 2.0
 KLING_MAX_WAIT_SECONDS: float = 120.0
 
@@ -1141,7 +1164,47 @@ def _kling_retry_sleep_seconds(attempt: int, retry_after_header: str | None) ->
     return min(max(ra, base), _KLING_RETRY_AFTER_CAP)
 
 
-def _kling_call_with_retry(fn: Callable[[], httpx.Response]) -> httpx.Response:
+class _KlingRateLimiter:
+    """Token bucket shared by every Kling API call of one provider.
+
+    `acquire()` blocks until a call may go out: `rate` per second sustained,
+    up to `burst` back to back. A 429 seen by any caller `hold()`s the whole
+    bucket for that call's backoff, so concurrent slots stop submitting into
+    the account's QPS cap instead of each burning its own retries on it;
+    after the hold the bucket restarts empty and refills at `rate`.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._stamp = time.monotonic()  # refill accrues from here
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._stamp:
+                    self._tokens = min(self._burst, self._tokens + (now - self._stamp) * self._rate)
+                    self._stamp = now
+                    if self._tokens >= 1.0:
+                        self._tokens -= 1.0
+                        return
+                    delay = (1.0 - self._tokens) / self._rate
+                else:  # held after a 429
+                    delay = self._stamp - now
+            time.sleep(delay)
+
+    def hold(self, seconds: float) -> None:
+        with self._lock:
+            self._tokens = 0.0
+            self._stamp = max(self._stamp, time.monotonic() + seconds)
+
+
+def _kling_call_with_retry(
+    fn: Callable[[], httpx.Response], limiter: _KlingRateLimiter | None = None
+) -> httpx.Response:
     """Retry an httpx call on transient Kling failures.
 
     Retries on HTTP 429 (Retry-After-honored, cap `_KLING_RETRY_AFTER_CAP`)
@@ -1150,16 +1213,23 @@ def _kling_call_with_retry(fn: Callable[[], httpx.Response]) -> httpx.Response:
     backoff [3s, 6s, 12s]; after exhaustion the final exception is
     re-raised so the caller (`generate_batch`) records its existing
     `http_failed: {exc}` slot error and continues with the next slot.
+    With a `limiter`, every attempt first takes a token and a 429 holds the
+    limiter for the same backoff, pausing the provider's other callers too.
     """
     last_exc: BaseException | None = None
     for attempt in range(len(_KLING_RETRY_BACKOFFS) + 1):
+        if limiter is not None:
+            limiter.acquire()
         try:
             return fn()
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code != 429 or attempt >= len(_KLING_RETRY_BACKOFFS):
                 raise
             retry_after = exc.response.headers.get("retry-after")
-            time.sleep(_kling_retry_sleep_seconds(attempt, retry_after))
+            delay = _kling_retry_sleep_seconds(attempt, retry_after)
+            if limiter is not None:
+                limiter.hold(delay)
+            time.sleep(delay)
             last_exc = exc
         except (
             httpx.ReadTimeout,
@@ -1243,14 +1313,123 @@ def _is_safe_download_host(url: str) -> bool:
     return True
 
 
+@dataclass
+class _KlingTaskWaiter:
+    done: threading.Event = field(default_factory=threading.Event)
+    url: str | None = None
+    error: Exception | None = None
+
+
+class _KlingTaskTracker:
+    """Shared poller for every in-flight Kling task of one provider.
+
+    Kling has no per-task status endpoint we use; each poll lists the latest
+    page of tasks. With N parallel `count=1` generate calls (the frontend's
+    worker pool) polling separately, every tick downloaded the same page N
+    times and tripped the per-account QPS cap (429). Waiters now register
+    their task id here; ONE daemon thread fetches the page once per
+    `poll_interval` for all of them and hands each waiter its result. The
+    thread exits when the last waiter is gone and restarts on the next.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[], list[dict[str, object]]],
+        poll_interval: float,
+    ) -> None:
+        self._fetch_page = fetch_page
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._waiters: dict[str, _KlingTaskWaiter] = {}
+        self._running = False
+
+    def wait(self, task_id: str, max_wait: float) -> str:
+        waiter = _KlingTaskWaiter()
+        with self._lock:
+            self._waiters[task_id] = waiter
+            if not self._running:
+                self._running = True
+                threading.Thread(target=self._run, name="kling-poll", daemon=True).start()
+        if not waiter.done.wait(max_wait):
+            with self._lock:
+                self._waiters.pop(task_id, None)
+            raise TimeoutError(f"kling: task {task_id} not done in {max_wait:.0f}s")
+        if waiter.error is not None:
+            raise waiter.error
+        assert waiter.url is not None
+        return waiter.url
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._running = False
+                    return
+            try:
+                tasks = self._fetch_page()
+            except Exception as exc:
+                # the list call itself failed (after its retries): every
+                # waiter would have seen this same failure on its own poll
+                self._finish_all(exc)
+                continue
+            with self._lock:
+                for task in tasks:
+                    task_id = str(task.get("task_id"))
+                    waiter = self._waiters.get(task_id)
+                    if waiter is None:
+                        continue
+                    waiter.url, waiter.error = _kling_task_outcome(task)
+                    if waiter.url is None and waiter.error is None:
+                        continue
+                    del self._waiters[task_id]
+                    waiter.done.set()
+                idle = not self._waiters
+            if not idle:
+                time.sleep(self._poll_interval)
+
+    def _finish_all(self, exc: Exception) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, {}
+        for waiter in waiters.values():
+            waiter.error = exc
+            waiter.done.set()
+
+
+def _kling_task_outcome(task: dict[str, object]) -> tuple[str | None, Exception | None]:
+    """(image url, None) when `task` succeeded, (None, error) when it failed
+    or succeeded without a usable image, (None, None) while still running."""
+    task_id = task.get("task_id")
+    status = task.get("task_status")
+    if status == "succeed":
+        images = (task.get("task_result") or {}).get("images") or []  # type: ignore[union-attr]
+        if not images:
+            return None, RuntimeError(f"kling: task {task_id} succeeded with no images")
+        url = images[0].get("url")
+        if not isinstance(url, str) or not url:
+            return None, RuntimeError(f"kling: task {task_id} missing image url")
+        return url, None
+    if status == "failed":
+        msg = task.get("task_status_msg") or task
+        return None, RuntimeError(f"kling: task {task_id} failed: {msg!r}")
+    return None, None
+
+
 class KlingProvider:
     """Async POST→poll→download against api.klingai.com text-to-image.
 
     Flow:
       1. POST /images/generations  →  {code: 0, data: {task_id: <uuid>}}
-      2. Poll GET /images/generations?pageSize=500 every 2s; find our task
-         by task_id; wait for task_status="succeed" (or "failed" → raise).
+      2. Wait on the shared `_KlingTaskTracker`, which lists
+         GET /images/generations?pageSize=500 once every 2s for ALL in-flight
+         tasks and resolves ours on task_status="succeed" (or "failed" → raise).
       3. task_result.images[0].url → SSRF-vet → download bytes.
+
+    All calls share one pooled `httpx.Client` (keep-alive; redirects are
+    followed only for the CDN download) and a JWT reused until shortly
+    before it expires. At most `max_concurrency` generations are in flight
+    (the rest queue), and the API calls pass a token bucket that a 429
+    pauses for its backoff — so a whole batch can be submitted at once and
+    finishes in about one generation latency.
     """
 
     name: str = "kling"
@@ -1264,6 +1443,9 @@ class KlingProvider:
         poll_interval: float = KLING_POLL_INTERVAL_SECONDS,
         max_wait: float = KLING_MAX_WAIT_SECONDS,
         cfg_scale: float = KLING_DEFAULT_CFG_SCALE,
+        http_client: httpx.Client | None = None,
+        max_concurrency: int = KLING_MAX_CONCURRENCY,
+        rate_per_second: float = KLING_RATE_PER_SECOND,
     ) -> None:
         if not access_key or not secret_key:
             raise ValueError("KlingProvider requires both access_key and secret_key")
@@ -1274,6 +1456,16 @@ class KlingProvider:
         self._poll_interval = poll_interval
         self._max_wait = max_wait
         self._cfg_scale = cfg_scale
+        self._client = http_client or httpx.Client(
+            timeout=DEFAULT_TIMEOUT_SECONDS,
+            follow_redirects=False,
+            limits=httpx.Limits(max_connections=KLING_MAX_CONNECTIONS),
+        )
+        self._token_lock = threading.Lock()
+        self._token: tuple[str, float] | None = None  # (jwt, refresh-after epoch)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._limiter = _KlingRateLimiter(rate_per_second, KLING_RATE_BURST)
+        self._tracker = _KlingTaskTracker(self._list_tasks, poll_interval)
 
     @classmethod
     def from_env(cls) -> "KlingProvider | None":
@@ -1311,15 +1503,15 @@ class KlingProvider:
         token was stuffed into the positive prompt, which is a diffusion-model
         anti-pattern (negative tokens in positive prompt inject the very
         concept they try to forbid into the model's attention).
+
+        Thread-safe; blocks while `max_concurrency` generations are in flight.
         """
-        token = _make_kling_jwt(self._ak, self._sk)
-        with httpx.Client(timeout=DEFAULT_TIMEOUT_SECONDS, follow_redirects=False) as client:
-            task_id = self._submit(client, token, prompt, seed, width, height, negative_prompt=negative_prompt)
-            img_url = self._poll(client, token, task_id)
-        if not _is_safe_download_host(img_url):
-            raise RuntimeError(f"kling: rejected unsafe download URL: {img_url}")
-        with httpx.Client(timeout=DEFAULT_TIMEOUT_SECONDS, follow_redirects=True) as client:
-            with client.stream("GET", img_url) as resp:
+        with self._slots:
+            task_id = self._submit(self._client, self._auth_token(), prompt, seed, width, height, negative_prompt=negative_prompt)
+            img_url = self._tracker.wait(task_id, self._max_wait)
+            if not _is_safe_download_host(img_url):
+                raise RuntimeError(f"kling: rejected unsafe download URL: {img_url}")
+            with self._client.stream("GET", img_url, follow_redirects=True) as resp:
                 resp.raise_for_status()
                 buf = bytearray()
                 for chunk in resp.iter_bytes():
@@ -1330,6 +1522,16 @@ class KlingProvider:
                         )
                 return bytes(buf)
 
+    def _auth_token(self) -> str:
+        with self._token_lock:
+            now = time.time()
+            if self._token is None or now >= self._token[1]:
+                self._token = (
+                    _make_kling_jwt(self._ak, self._sk),
+                    now + KLING_JWT_EXP_SECONDS - KLING_JWT_REFRESH_MARGIN_SECONDS,
+                )
+            return self._token[0]
+
     def _submit(
         self,
         client: httpx.Client,
@@ -1362,7 +1564,7 @@ class KlingProvider:
             resp.raise_for_status()
             return resp
 
-        resp = _kling_call_with_retry(_do_post)
+        resp = _kling_call_with_retry(_do_post, self._limiter)
         payload = resp.json()
         if payload.get("code") != 0:
             raise RuntimeError(
@@ -1374,46 +1576,19 @@ class KlingProvider:
             raise RuntimeError(f"kling submit: missing task_id in {payload!r}")
         return task_id
 
-    def _poll(self, client: httpx.Client, token: str, task_id: str) -> str:
-        start = time.time()
-        headers = {"Authorization": f"Bearer {token}"}
-        while True:
-            if time.time() - start > self._max_wait:
-                raise TimeoutError(
-                    f"kling: task {task_id} not done in {self._max_wait:.0f}s"
-                )
-            def _do_get() -> httpx.Response:
-                resp = client.get(
-                    f"{self._base}/images/generations",
-                    params={"pageSize": 500},
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                return resp
+    def _list_tasks(self) -> list[dict[str, object]]:
+        """One page of the account's latest tasks (the tracker's poll)."""
+        def _do_get() -> httpx.Response:
+            resp = self._client.get(
+                f"{self._base}/images/generations",
+                params={"pageSize": 500},
+                headers={"Authorization": f"Bearer {self._auth_token()}"},
+            )
+            resp.raise_for_status()
+            return resp
 
-            resp = _kling_call_with_retry(_do_get)
-            tasks = (resp.json() or {}).get("data") or []
-            for task in tasks:
-                if task.get("task_id") != task_id:
-                    continue
-                status = task.get("task_status")
-                if status == "succeed":
-                    images = (task.get("task_result") or {}).get("images") or []
-                    if not images:
-                        raise RuntimeError(
-                            f"kling: task {task_id} succeeded with no images"
-                        )
-                    url = images[0].get("url")
-                    if not isinstance(url, str) or not url:
-                        raise RuntimeError(
-                            f"kling: task {task_id} missing image url"
-                        )
-                    return url
-                if status == "failed":
-                    msg = task.get("task_status_msg") or task
-                    raise RuntimeError(f"kling: task {task_id} failed: {msg!r}")
-                break
-            time.sleep(self._poll_interval)
+        resp = _kling_call_with_retry(_do_get, self._limiter)
+        return (resp.json() or {}).get("data") or []
 
 
 class ActorPool:
@@ -1422,9 +1597,14 @@ class ActorPool:
         exposed: ExposedTree,
         resolver: SafeResolver,
         provider: KlingProvider | None = None,
+        watcher: FsWatcher | None = None,
     ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        # Parsed sidecars + id numbers of `_actors/`, kept fresh by `watcher`.
+        self._catalog: LibraryCatalog[ActorInfo] = LibraryCatalog(
+            self.actors_dir, number=_actor_number, load=self._load_actor, watcher=watcher
+        )
         if provider is not None:
             self._provider = provider
         else:
@@ -1638,13 +1818,16 @@ class ActorPool:
         base_seed = int(time.time() * 1000)
         target_px = _RESOLUTION_PRESETS[resolution]
         self._reap_incomplete_folders(actors_dir)
-        for i in range(count):
+
+        def _slot(i: int) -> tuple[dict[str, object] | None, list[dict[str, str]]]:
+            """One actor: allocate its folder, render face + body shots
+            concurrently, write them + the sidecar. (generated row, errors)."""
+            errors: list[dict[str, str]] = []
             seed = seeds[i] if seeds is not None else base_seed + i
             try:
                 actor_id, actor_folder = self._allocate_actor_id(actors_dir)
             except ActorGenerationDirMissingError as exc:
-                result.errors.append({"requested_id": f"slot_{i}", "message": f"alloc_failed: {exc}"})
-                continue
+                return None, [{"requested_id": f"slot_{i}", "message": f"alloc_failed: {exc}"}]
             # Per follow-up 082: batch-coordinated prompts when frontend
             # passes batch_seed/batch_size/slot_index (worker-pool fires N
             # parallel count=1 calls; each call's slot_index pins its row
@@ -1656,37 +1839,40 @@ class ActorPool:
                 batch_size=batch_size,
                 slot_index=effective_slot,
             )
-            # --- Face shot (1:1) — primary identity image ---
-            try:
-                face_bytes = self._provider.generate(face_prompt, seed, IMAGE_WIDTH, IMAGE_HEIGHT, negative_prompt=neg_prompt)
-            except Exception as exc:
-                result.errors.append({"requested_id": actor_id, "message": f"http_failed: {exc}"})
+            # Face (primary identity image) and body (supplementary casting
+            # reference, follow-up 052; same seed → identity coherence) are
+            # submitted together. A failed face still discards the body shot.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="kling-body") as side:
+                body_future = side.submit(
+                    self._provider.generate,
+                    body_prompt, seed, IMAGE_WIDTH_BODY, IMAGE_HEIGHT_BODY, negative_prompt=neg_prompt,
+                )
+                try:
+                    face_bytes = self._provider.generate(face_prompt, seed, IMAGE_WIDTH, IMAGE_HEIGHT, negative_prompt=neg_prompt)
+                    face_error = None
+                except Exception as exc:
+                    face_bytes, face_error = b"", exc
+                body_error: str | None = None
+                try:
+                    body_bytes = body_future.result()
+                except Exception as exc:
+                    body_bytes = b""
+                    body_error = f"body_http_failed: {exc}"
+            if face_error is not None:
                 self._cleanup_empty_folder(actor_folder)
-                continue
+                return None, [{"requested_id": actor_id, "message": f"http_failed: {face_error}"}]
             if not face_bytes:
-                result.errors.append({"requested_id": actor_id, "message": "empty_response"})
                 self._cleanup_empty_folder(actor_folder)
-                continue
+                return None, [{"requested_id": actor_id, "message": "empty_response"}]
             if target_px is not None:
                 try:
                     face_bytes = self._resize_jpeg(face_bytes, target_px)
                 except Exception as exc:
-                    result.errors.append({"requested_id": actor_id, "message": f"resize_failed: {exc}"})
                     self._cleanup_empty_folder(actor_folder)
-                    continue
+                    return None, [{"requested_id": actor_id, "message": f"resize_failed: {exc}"}]
             face_path = actor_folder / _attrs_to_filename(attrs)
             md_path = actor_folder / f"{actor_id}.md"
-            # --- Body shot (9:16) — supplementary casting reference (follow-up 052) ---
-            # Same seed → identity coherence with face. Failure isolated: face is still saved.
             body_path: Path | None = None
-            body_error: str | None = None
-            try:
-                body_bytes = self._provider.generate(
-                    body_prompt, seed, IMAGE_WIDTH_BODY, IMAGE_HEIGHT_BODY, negative_prompt=neg_prompt,
-                )
-            except Exception as exc:
-                body_bytes = b""
-                body_error = f"body_http_failed: {exc}"
             if not body_bytes and body_error is None:
                 body_error = "body_empty_response"
             if body_bytes:
@@ -1713,23 +1899,28 @@ class ActorPool:
                     encoding="utf-8",
                 )
             except OSError as exc:
-                result.errors.append({"requested_id": actor_id, "message": f"write_failed: {exc}"})
                 self._cleanup_empty_folder(actor_folder)
-                continue
+                return None, [{"requested_id": actor_id, "message": f"write_failed: {exc}"}]
             if body_error is not None:
-                result.errors.append({"requested_id": actor_id, "message": body_error})
-            rel_image = self._rel(face_path)
-            result.generated.append(
-                {
-                    "id": actor_id,
-                    "image_path": rel_image,
-                    "body_path": self._rel(body_path) if body_path is not None else None,
-                    "attrs": asdict(attrs),
-                    "seed": seed,
-                    "resolution": resolution,
-                    "archetype": archetype,
-                }
-            )
+                errors.append({"requested_id": actor_id, "message": body_error})
+            return {
+                "id": actor_id,
+                "image_path": self._rel(face_path),
+                "body_path": self._rel(body_path) if body_path is not None else None,
+                "attrs": asdict(attrs),
+                "seed": seed,
+                "resolution": resolution,
+                "archetype": archetype,
+            }, errors
+
+        # Slots run concurrently (two generations each); the provider caps
+        # what is actually in flight, so this only sets how far ahead folders
+        # are allocated — never so far that the reaper's age guard is at risk.
+        workers = max(1, KLING_MAX_CONCURRENCY // 2)
+        for generated, errors in parallel_steps(range(count), _slot, workers=workers):
+            if generated is not None:
+                result.generated.append(generated)
+            result.errors.extend(errors)
         return result
 
     def create_prompts_batch(
@@ -2081,47 +2272,42 @@ class ActorPool:
         """List image-bearing actors. When `include_pending=True`, also include
         prompt-only actors (sidecar .md present but no rendered jpg yet) so the
         UI can surface + bulk-delete them; those rows carry `pending_import=True`
-        and `image_path=""`. Default stays image-only (backward compatible)."""
-        actors_dir = self.actors_dir()
-        if not actors_dir.is_dir():
-            return []
-        out: list[ActorInfo] = []
-        for child in sorted(actors_dir.iterdir(), key=lambda p: p.name):
-            if not child.is_dir() or child.is_symlink():
-                continue
-            match = _ACTOR_DIR_RE.match(child.name)
-            if not match:
-                continue
-            actor_id = child.name
-            md_path = child / f"{actor_id}.md"
-            if not md_path.is_file():
-                continue
-            parsed = self._parse_sidecar_full(md_path)
-            if parsed is None:
-                continue
-            attrs, archetype = parsed
-            jpg_path = _find_actor_jpg(child)
-            if jpg_path is None:
-                if not include_pending:
-                    continue
-                try:
-                    mtime = md_path.stat().st_mtime
-                except OSError:
-                    continue
-                out.append(ActorInfo(
-                    id=actor_id, attrs=attrs, image_path="",
-                    mtime=mtime, archetype=archetype, pending_import=True,
-                ))
-                continue
+        and `image_path=""`. Default stays image-only (backward compatible).
+        Served from the `LibraryCatalog`: a sidecar is parsed once per edit."""
+        return [
+            info for _folder, info in self._catalog.entries()
+            if include_pending or not info.pending_import
+        ]
+
+    def _load_actor(self, folder: Path) -> ActorInfo | None:
+        """One catalog entry: the parsed sidecar + face jpg (None when the
+        folder has no parseable sidecar yet)."""
+        actor_id = folder.name
+        md_path = folder / f"{actor_id}.md"
+        if not md_path.is_file():
+            return None
+        parsed = self._parse_sidecar_full(md_path)
+        if parsed is None:
+            return None
+        attrs, archetype = parsed
+        jpg_path = _find_actor_jpg(folder)
+        if jpg_path is None:
             try:
-                mtime = jpg_path.stat().st_mtime
+                mtime = md_path.stat().st_mtime
             except OSError:
-                continue
-            out.append(ActorInfo(
-                id=actor_id, attrs=attrs, image_path=self._rel(jpg_path),
-                mtime=mtime, archetype=archetype,
-            ))
-        return out
+                return None
+            return ActorInfo(
+                id=actor_id, attrs=attrs, image_path="",
+                mtime=mtime, archetype=archetype, pending_import=True,
+            )
+        try:
+            mtime = jpg_path.stat().st_mtime
+        except OSError:
+            return None
+        return ActorInfo(
+            id=actor_id, attrs=attrs, image_path=self._rel(jpg_path),
+            mtime=mtime, archetype=archetype,
+        )
 
     def actor_exists(self, actor_id: str) -> bool:
         if not _ACTOR_ID_RE.match(actor_id):
@@ -2217,8 +2403,8 @@ class ActorPool:
         before this rename so dangling references never persist).
 
         Trash-collision handling: actor ids are reused after a delete →
-        regenerate cycle (`_next_actor_id_num` scans only the live `_actors/`
-        dir, not the trash), so a previously-deleted `actor_NNNN` may already
+        regenerate cycle (the allocator counts only the live `_actors/` dir,
+        not the trash), so a previously-deleted `actor_NNNN` may already
         occupy the recycle-bin slot. A recycle bin must never refuse a delete
         because it already holds a same-named entry — when the slot is taken we
         disambiguate the target with a `__N` suffix instead of raising. The old
@@ -2372,9 +2558,11 @@ class ActorPool:
         all saw the same starting id and raced on the same mkdir. Now each
         allocation walks forward through ids using mkdir as the atomic
         primitive — first thread to win mkdir on actor_K owns it, others
-        try actor_K+1, K+2, ... up to _MAX_ID_ALLOC_SCAN attempts.
+        try actor_K+1, K+2, ... up to _MAX_ID_ALLOC_SCAN attempts. The
+        starting id is the catalog's max + 1 (every actor_NNNN folder counts
+        as occupied, jpg or not).
         """
-        start = self._next_actor_id_num(actors_dir)
+        start = self._catalog.max_number() + 1
         candidate = start
         attempts = 0
         while attempts < _MAX_ID_ALLOC_SCAN:
@@ -2445,31 +2633,6 @@ class ActorPool:
             except OSError:
                 pass
 
-    @staticmethod
-    def _next_actor_id_num(actors_dir: Path) -> int:
-        """Return max+1 across every actor_NNNN folder under actors_dir.
-
-        Pure scan with no side effects (per follow-up 027: reaping moved
-        to `_reap_incomplete_folders` so the allocator's mkdir is the
-        sole atomic primitive). A folder counts as occupied regardless of
-        jpg presence — if a folder exists, its id is taken.
-        """
-        max_num = 0
-        try:
-            entries = list(actors_dir.iterdir())
-        except OSError:
-            return 1
-        for entry in entries:
-            if not entry.is_dir():
-                continue
-            m = _ACTOR_DIR_RE.match(entry.name)
-            if not m:
-                continue
-            n = int(m.group(1))
-            if n > max_num:
-                max_num = n
-        return max_num + 1
-
     @staticmethod
     def _build_sidecar(
         actor_id: str,
@@ -31,6 +31,8 @@ from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.library_catalog import LibraryCatalog
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.bgm__error import (
     BgmDeleteFailedError,
@@ -136,13 +138,34 @@ def _find_mp3(folder: Path) -> Path | None:
     return None
 
 
+def _bgm_number(folder: Path) -> int | None:
+    m = _BGM_DIR_RE.match(folder.name)
+    return int(m.group(1)) if m else None
+
+
+def _is_category_dir(folder: Path) -> bool:
+    return folder.name in CATEGORY_OPTIONS
+
+
 class BgmPool:
     """Implements `BgmRepository`. Generation shells out to a self-hosted
     Stable Audio tool; the webapp process never imports torch."""
 
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver, watcher: FsWatcher | None = None
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        # Parsed sidecars + id numbers of `_bgm/{category}/`, and the id numbers
+        # retired into the recycle bin, kept fresh by `watcher`.
+        self._catalog: LibraryCatalog[BgmInfo] = LibraryCatalog(
+            self.bgm_dir, number=_bgm_number, load=self._load_bgm,
+            depth=2, shelf=_is_category_dir, watcher=watcher,
+        )
+        self._retired: LibraryCatalog[object] = LibraryCatalog(
+            self._deleted_bgm_dir, number=_bgm_number, load=lambda _folder: None,
+            depth=2, shelf=_is_category_dir, watcher=watcher,
+        )
 
     # ------------------------------------------------------------------ paths
     def bgm_dir(self) -> Path:
@@ -199,46 +222,31 @@ class BgmPool:
         return _find_mp3(folder)
 
     def list_bgms(self) -> list[BgmInfo]:
-        root = self.bgm_dir()
-        if not root.is_dir():
-            return []
-        out: list[BgmInfo] = []
-        for cat_dir in sorted(root.iterdir(), key=lambda p: p.name):
-            if not cat_dir.is_dir() or cat_dir.is_symlink():
-                continue
-            category = cat_dir.name
-            if category not in CATEGORY_OPTIONS:
-                continue
-            for child in sorted(cat_dir.iterdir(), key=lambda p: p.name):
-                if not child.is_dir() or child.is_symlink():
-                    continue
-                if not _BGM_DIR_RE.match(child.name):
-                    continue
-                bgm_id = child.name
-                md_path = child / f"{bgm_id}.md"
-                if not md_path.is_file():
-                    continue
-                parsed = self._parse_sidecar(md_path)
-                if parsed is None:
-                    continue
-                attrs, seed = parsed
-                try:
-                    mtime = md_path.stat().st_mtime
-                except OSError:
-                    continue
-                mp3 = _find_mp3(child)
-                out.append(
-                    BgmInfo(
-                        id=bgm_id,
-                        category=category,
-                        attrs=attrs,
-                        sidecar_path=self._rel(md_path),
-                        audio_path=self._rel(mp3) if mp3 is not None else None,
-                        seed=seed,
-                        mtime=mtime,
-                    )
-                )
-        return out
+        return [info for _folder, info in self._catalog.entries()]
+
+    def _load_bgm(self, folder: Path) -> BgmInfo | None:
+        bgm_id = folder.name
+        md_path = folder / f"{bgm_id}.md"
+        if not md_path.is_file():
+            return None
+        parsed = self._parse_sidecar(md_path)
+        if parsed is None:
+            return None
+        attrs, seed = parsed
+        try:
+            mtime = md_path.stat().st_mtime
+        except OSError:
+            return None
+        mp3 = _find_mp3(folder)
+        return BgmInfo(
+            id=bgm_id,
+            category=folder.parent.name,
+            attrs=attrs,
+            sidecar_path=self._rel(md_path),
+            audio_path=self._rel(mp3) if mp3 is not None else None,
+            seed=seed,
+            mtime=mtime,
+        )
 
     # ------------------------------------------------------------------ delete
     def delete_bgm(self, bgm_id: str) -> dict[str, str]:
@@ -549,43 +557,12 @@ class BgmPool:
     def _deleted_bgm_dir(self) -> Path:
         return self._resolver.root / "ai_videos" / "_deleted" / BGM_DIR_NAME
 
-    @staticmethod
-    def _max_bgm_num_under(root: Path) -> int:
-        """Highest `bgm_NNNN` number under any category folder of `root` (0 if
-        none). A folder counts as occupied regardless of mp3 presence."""
-        max_num = 0
-        try:
-            cat_dirs = list(root.iterdir())
-        except OSError:
-            return 0
-        for cat_dir in cat_dirs:
-            if not cat_dir.is_dir() or cat_dir.is_symlink():
-                continue
-            if cat_dir.name not in CATEGORY_OPTIONS:
-                continue
-            try:
-                entries = list(cat_dir.iterdir())
-            except OSError:
-                continue
-            for entry in entries:
-                if not entry.is_dir():
-                    continue
-                m = _BGM_DIR_RE.match(entry.name)
-                if not m:
-                    continue
-                n = int(m.group(1))
-                if n > max_num:
-                    max_num = n
-        return max_num
-
     def _next_bgm_id_num(self) -> int:
         """max+1 across every `bgm_NNNN` folder in EVERY category — counting both
         the LIVE library AND the `_deleted/_bgm` recycle bin, so a soft-deleted
         track's number is never reused. Reuse would silently rebind any drama's
         `bgm.md` cue that still references the retired id to a different track."""
-        live = self._max_bgm_num_under(self.bgm_dir())
-        retired = self._max_bgm_num_under(self._deleted_bgm_dir())
-        return max(live, retired) + 1
+        return max(self._catalog.max_number(), self._retired.max_number()) + 1
 
     @staticmethod
     def _reap_incomplete_folders(bgm_root: Path) -> None:
@@ -4,6 +4,10 @@ Per follow-up 014: each drama owns one `casting.md` with a single markdown
 table mapping each role to one actor in the pool. The file is rewritten
 atomically on every assign / unassign — no surgical line edits inside
 markdown tables (boundary cases are too easy to get wrong).
+
+"Where is this actor / voice cast?" is answered from a `ReferenceIndex` over
+every drama's casting.md (id -> drama, role, notes), which every rewrite here
+updates in place.
 """
 from __future__ import annotations
 
@@ -16,6 +20,8 @@ from pathlib import Path
 
 from libs.common import drama_layout
 from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.reference_index import ReferenceIndex, Row
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.actor__error import InvalidActorIdError
 from libs.domain.errors.casting__error import (
@@ -70,6 +76,7 @@ class Casting:
         renamer: MediaRenamer,
         actor_pool: ActorPool,
         voice_pool: VoicePool | None = None,
+        watcher: FsWatcher | None = None,
     ) -> None:
         self._exposed = exposed
         self._resolver = resolver
@@ -80,6 +87,13 @@ class Casting:
         # without it still pass. The voice-side endpoints inject the real
         # pool via the DI container.
         self._voice_pool = voice_pool
+        self._references = ReferenceIndex(
+            lambda: self._resolver.root / "ai_videos",
+            kind="casting",
+            sources=_casting_sources,
+            extract=lambda _drama, path: _casting_rows(self._parse(path)),
+            watcher=watcher,
+        )
 
     def read(self, rel_drama_path: str) -> CastingResult:
         drama_dir = self._renamer.validate_drama(rel_drama_path)
@@ -223,55 +237,13 @@ class Casting:
         """Mirror of find_assignments_for_actor for voice bindings."""
         if not _VOICE_ID_SHAPE_RE.match(voice_id):
             raise InvalidVoiceIdError(f"voice_id={voice_id!r} does not match shape")
-        ai_videos = self._resolver.root / "ai_videos"
-        if not ai_videos.is_dir():
-            return []
-        out: list[dict[str, object]] = []
-        for drama_dir in sorted(ai_videos.iterdir(), key=lambda p: p.name):
-            if not drama_dir.is_dir() or drama_dir.is_symlink():
-                continue
-            if drama_dir.name.startswith("_"):
-                continue
-            casting_path = drama_layout.casting_md(drama_dir)
-            if not casting_path.is_file():
-                continue
-            entries = self._parse(casting_path)
-            for e in entries:
-                if e.voice_id != voice_id:
-                    continue
-                character_folder = drama_layout.characters_dir(drama_dir) / e.role
-                out.append(
-                    {
-                        "drama": drama_dir.name,
-                        "role": e.role,
-                        "notes": e.notes,
-                        "character_folder": self._rel(character_folder),
-                        "character_folder_exists": character_folder.is_dir(),
-                    }
-                )
-        out.sort(key=lambda r: (str(r["drama"]), str(r["role"])))
-        return out
+        return self._assignment_rows(voice_id)
 
     def assigned_voice_ids(self) -> set[str]:
-        ai_videos = self._resolver.root / "ai_videos"
-        if not ai_videos.is_dir():
-            return set()
-        ids: set[str] = set()
-        for drama_dir in ai_videos.iterdir():
-            if not drama_dir.is_dir() or drama_dir.is_symlink():
-                continue
-            if drama_dir.name.startswith("_"):
-                continue
-            casting_path = drama_layout.casting_md(drama_dir)
-            if not casting_path.is_file():
-                continue
-            for entry in self._parse(casting_path):
-                if entry.voice_id:
-                    ids.add(entry.voice_id)
-        return ids
+        return {i for i in self._references.ids() if _VOICE_ID_SHAPE_RE.match(i)}
 
     def find_assignments_for_actor(self, actor_id: str) -> list[dict[str, object]]:
-        """Scan every drama's casting.md, return rows where actor_id matches.
+        """Every drama row whose actor_id matches, from the reference index.
 
         Per follow-up 043: backs `GET /api/actors/assignments` and the
         delete/archive refusal in `POST /api/actors/delete`,
@@ -281,77 +253,31 @@ class Casting:
         """
         if not _ACTOR_ID_SHAPE_RE.match(actor_id):
             raise InvalidActorIdError(f"actor_id={actor_id!r} does not match shape")
-        ai_videos = self._resolver.root / "ai_videos"
-        if not ai_videos.is_dir():
-            return []
-        out: list[dict[str, object]] = []
-        for drama_dir in sorted(ai_videos.iterdir(), key=lambda p: p.name):
-            if not drama_dir.is_dir() or drama_dir.is_symlink():
-                continue
-            if drama_dir.name.startswith("_"):
-                continue
-            casting_path = drama_layout.casting_md(drama_dir)
-            if not casting_path.is_file():
-                continue
-            entries = self._parse(casting_path)
-            for e in entries:
-                if e.actor_id != actor_id:
-                    continue
-                character_folder = drama_layout.characters_dir(drama_dir) / e.role
-                out.append(
-                    {
-                        "drama": drama_dir.name,
-                        "role": e.role,
-                        "notes": e.notes,
-                        "character_folder": self._rel(character_folder),
-                        "character_folder_exists": character_folder.is_dir(),
-                    }
-                )
-        out.sort(key=lambda r: (str(r["drama"]), str(r["role"])))
-        return out
+        return self._assignment_rows(actor_id)
 
     def assigned_actor_ids(self) -> set[str]:
-        """Per follow-up 086: single-pass scan over every drama's casting.md
-        returning the union of actor_ids appearing in any row. Used by
-        `ActorQuery.list()` to compute each actor's `is_assigned` flag for
-        the grid filter without N × `find_assignments_for_actor` round
-        trips. O(drama_count × rows_per_casting) total."""
-        ai_videos = self._resolver.root / "ai_videos"
-        if not ai_videos.is_dir():
-            return set()
-        ids: set[str] = set()
-        for drama_dir in ai_videos.iterdir():
-            if not drama_dir.is_dir() or drama_dir.is_symlink():
-                continue
-            if drama_dir.name.startswith("_"):
-                continue
-            casting_path = drama_layout.casting_md(drama_dir)
-            if not casting_path.is_file():
-                continue
-            for entry in self._parse(casting_path):
-                if entry.actor_id:
-                    ids.add(entry.actor_id)
-        return ids
+        """Per follow-up 086: the union of actor_ids appearing in any drama's
+        casting row. Used by `ActorQuery.list()` to compute each actor's
+        `is_assigned` flag for the grid filter without N ×
+        `find_assignments_for_actor` round trips. Answered from the reference
+        index — no casting.md is read unless it changed."""
+        return {i for i in self._references.ids() if _ACTOR_ID_SHAPE_RE.match(i)}
 
     def unassign_actor_everywhere(self, actor_id: str) -> list[dict[str, str]]:
-        """Sweep every drama's casting.md, remove rows where actor_id matches.
+        """Remove the actor from every casting.md that references it.
 
         Per follow-up 026 cascade requirement: called by `POST /api/actors/delete`
         before the actor folder is moved so casting.md never references a deleted
-        actor. Best-effort over the drama set: missing casting.md → skip;
+        actor. Only the dramas the reference index names are rewritten;
         OS error on read / write → propagates (endpoint maps to 500).
         Returns a list of `{drama, role}` removed entries for the endpoint's
         response so the UI can report how many casting references were cleared.
         """
         ai_videos = self._resolver.root / "ai_videos"
-        if not ai_videos.is_dir():
-            return []
+        dramas = sorted({str(r["drama"]) for r in self._references.refs(actor_id)})
         removed: list[dict[str, str]] = []
-        for drama_dir in sorted(ai_videos.iterdir(), key=lambda p: p.name):
-            if not drama_dir.is_dir() or drama_dir.is_symlink():
-                continue
-            if drama_dir.name.startswith("_"):
-                continue
+        for drama in dramas:
+            drama_dir = ai_videos / drama
             casting_path = drama_layout.casting_md(drama_dir)
             if not casting_path.is_file():
                 continue
@@ -377,6 +303,24 @@ class Casting:
             self._write(casting_path, drama_dir.name, kept)
         return removed
 
+    def _assignment_rows(self, ref_id: str) -> list[dict[str, object]]:
+        ai_videos = self._resolver.root / "ai_videos"
+        out: list[dict[str, object]] = []
+        for ref in self._references.refs(ref_id):
+            drama_dir = ai_videos / str(ref["drama"])
+            character_folder = drama_layout.characters_dir(drama_dir) / str(ref["role"])
+            out.append(
+                {
+                    "drama": ref["drama"],
+                    "role": ref["role"],
+                    "notes": ref["notes"],
+                    "character_folder": self._rel(character_folder),
+                    "character_folder_exists": character_folder.is_dir(),
+                }
+            )
+        out.sort(key=lambda r: (str(r["drama"]), str(r["role"])))
+        return out
+
     def _write_character_link(
         self,
         drama_dir: Path,
@@ -608,8 +552,7 @@ class Casting:
             out.append(CastEntry(role=role, actor_id=actor_id, notes=notes, voice_id=voice_id))
         return out
 
-    @staticmethod
-    def _write(casting_path: Path, drama_name: str, entries: list[CastEntry]) -> None:
+    def _write(self, casting_path: Path, drama_name: str, entries: list[CastEntry]) -> None:
         lines: list[str] = [
             f"# Casting — {drama_name}",
             "",
@@ -639,6 +582,7 @@ class Casting:
             except OSError:
                 pass
             raise
+        self._references.note_written(casting_path)
 
     def _rel(self, p: Path) -> str:
         try:
@@ -647,6 +591,21 @@ class Casting:
             return p.as_posix()
 
 
+def _casting_sources(drama_dir: Path) -> list[Path]:
+    casting_path = drama_layout.casting_md(drama_dir)
+    return [casting_path] if casting_path.is_file() else []
+
+
+def _casting_rows(entries: list[CastEntry]) -> list[tuple[str, Row]]:
+    """Index rows of one casting table: each bound actor_id / voice_id -> its role."""
+    rows: list[tuple[str, Row]] = []
+    for e in entries:
+        for ref_id in (e.actor_id, e.voice_id):
+            if ref_id:
+                rows.append((ref_id, {"role": e.role, "notes": e.notes}))
+    return rows
+
+
 __all__ = [
     "CASTING_FILE_NAME",
     "CAST_LINK_FILE_NAME",
@@ -21,6 +21,7 @@ from pathlib import Path
 import imageio_ffmpeg
 
 from libs.common.exposed_tree import ExposedTree
+from libs.common.job_progress import default_workers, job_step, parallel_steps, run_ffmpeg
 from libs.common.safe_resolve import SafeResolver
 
 
@@ -49,6 +50,8 @@ from libs.domain.errors.character_video__error import (
     TruncateFailedError,
     ViewExtractFailedError,
 )
+from libs.infrastructure.readers.media_probe__reader import MediaProbeReader
+from libs.infrastructure.writers.frame__writer import grab_frames
 # --- Shared exceptions ------------------------------------------------------
 
 
@@ -262,9 +265,13 @@ class ConcatResult:
 
 
 class ShotConcatBuilder:
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver,
+        probe: MediaProbeReader | None = None,
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._probe = probe or MediaProbeReader()
 
     def build(self, rel: str) -> ConcatResult:
         shot_md, shot_slug, drama = self._validate_shot_md(rel)
@@ -686,29 +693,13 @@ class ShotConcatBuilder:
             err = completed.stderr.decode("utf-8", errors="replace").strip()[:400]
             raise ConcatFailedError(err or "ffmpeg_failed")
 
-    @staticmethod
-    def _probe_has_audio(ffmpeg: str, src: Path) -> bool:
+    def _probe_has_audio(self, ffmpeg: str, src: Path) -> bool:
         """Return True iff `src` carries at least one Audio stream.
 
-        `imageio_ffmpeg` doesn't bundle ffprobe, so probe via `ffmpeg -i`
-        with no output target — ffmpeg dumps stream metadata to stderr and
-        exits non-zero (no output), which is fine for our purpose.
+        `imageio_ffmpeg` doesn't bundle ffprobe; the shared MediaProbeReader
+        reads stream metadata from `ffmpeg -i` stderr once per file version.
         """
-        try:
-            result = subprocess.run(
-                [ffmpeg, "-i", str(src), "-hide_banner"],
-                capture_output=True,
-                timeout=15,
-                check=False,
-            )
-        except subprocess.TimeoutExpired:
-            return False
-        stderr = result.stderr.decode("utf-8", errors="replace")
-        for line in stderr.splitlines():
-            stripped = line.strip()
-            if stripped.startswith("Stream #") and "Audio:" in stripped:
-                return True
-        return False
+        return self._probe.probe(src, ffmpeg).has_audio
 
     def _rel(self, p: Path) -> str:
         try:
@@ -741,6 +732,8 @@ _AUDIO_FFMPEG_TIMEOUT_S: int = 60
 _TRIM_FFMPEG_TIMEOUT_S: int = 60
 _VIEWS_SUBDIR: str = "views"
 _AUDIO_MP3_QUALITY: str = "4"  # libmp3lame VBR ~165 kbps — small, transparent for speech
+# Encoder threads per character in an extract-all run; the default pool is cores ÷ this.
+_BATCH_FFMPEG_THREADS: int = 2
 
 
 @dataclass(frozen=True)
@@ -836,11 +829,23 @@ class CharacterViewExtractor:
     button yields all 5 reference files. The 3 timestamps live in
     `libs/domain/value_objects/character_video__valueobject.py` and are
     pinned to rule #12.5 v10.2's camera path.
+
+    `extract_all` runs `workers` characters at once, each capped at
+    `ffmpeg_threads` encoder threads (default pool: cores ÷ threads);
+    `workers=1` is the strictly-serial walk.
     """
 
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self,
+        exposed: ExposedTree,
+        resolver: SafeResolver,
+        workers: int | None = None,
+        ffmpeg_threads: int = _BATCH_FFMPEG_THREADS,
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._ffmpeg_threads = max(1, ffmpeg_threads)
+        self._workers = workers if workers is not None else default_workers(self._ffmpeg_threads)
 
     def _latest_video_in(self, folder: Path) -> Path | None:
         """Newest original turntable mp4 directly in `folder` by mtime, or None.
@@ -876,7 +881,7 @@ class CharacterViewExtractor:
         src = self._resolve_latest_source(self._validate_character_video_source(rel))
         return self._extract_source(src)
 
-    def _extract_source(self, src: Path) -> ViewExtractResult:
+    def _extract_source(self, src: Path, threads: int | None = None) -> ViewExtractResult:
         try:
             ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
         except Exception as exc:
@@ -890,9 +895,14 @@ class CharacterViewExtractor:
         self._sweep_outputs(out_dir)
         views: list[ViewResult] = []
         failures: list[tuple[str, str]] = []
-        for spec in CANONICAL_VIEWS:
-            out_path = out_dir / view_output_filename(prefix, spec)
-            ok, err = self._run_view(ffmpeg, src, spec.timestamp, out_path)
+        view_paths = [out_dir / view_output_filename(prefix, spec) for spec in CANONICAL_VIEWS]
+        grabbed = grab_frames(
+            ffmpeg,
+            src,
+            [(spec.timestamp, out) for spec, out in zip(CANONICAL_VIEWS, view_paths)],
+            timeout=_VIEW_FFMPEG_TIMEOUT_S,
+        )
+        for spec, out_path, (ok, err) in zip(CANONICAL_VIEWS, view_paths, grabbed):
             if ok:
                 views.append(
                     ViewResult(
@@ -905,7 +915,7 @@ class CharacterViewExtractor:
                 failures.append((spec.role, err))
         audio_path = out_dir / audio_output_filename(prefix)
         audio: AudioResult | None
-        ok, err = self._run_audio(ffmpeg, src, audio_path)
+        ok, err = self._run_audio(ffmpeg, src, audio_path, threads)
         if ok:
             audio = AudioResult(out_rel=self._rel(audio_path))
         else:
@@ -913,7 +923,7 @@ class CharacterViewExtractor:
             failures.append(("audio", err))
         trim_path = out_dir / trim_output_filename(prefix)
         trim: TrimResult | None
-        ok, err = self._run_trim(ffmpeg, src, trim_path)
+        ok, err = self._run_trim(ffmpeg, src, trim_path, threads)
         if ok:
             trim = TrimResult(out_rel=self._rel(trim_path), duration_seconds=TRIM_DURATION_S)
         else:
@@ -930,42 +940,12 @@ class CharacterViewExtractor:
             failures=tuple(failures),
         )
 
-    def _run_view(
-        self,
-        ffmpeg: str,
-        src: Path,
-        timestamp: float,
-        out_path: Path,
-    ) -> tuple[bool, str]:
-        cmd = [
-            ffmpeg,
-            "-y",
-            "-ss", f"{timestamp}",
-            "-i", str(src),
-            "-frames:v", "1",
-            "-q:v", "1",
-            "-loglevel", "error",
-            str(out_path),
-        ]
-        try:
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=_VIEW_FFMPEG_TIMEOUT_S,
-                check=False,
-            )
-        except subprocess.TimeoutExpired:
-            return False, "ffmpeg_timeout"
-        if completed.returncode != 0 or not out_path.is_file():
-            err = completed.stderr.decode("utf-8", errors="replace").strip()[:200]
-            return False, err or "ffmpeg_failed"
-        return True, ""
-
     def _run_audio(
         self,
         ffmpeg: str,
         src: Path,
         out_path: Path,
+        threads: int | None = None,
     ) -> tuple[bool, str]:
         cmd = [
             ffmpeg,
@@ -977,13 +957,10 @@ class CharacterViewExtractor:
             "-loglevel", "error",
             str(out_path),
         ]
+        if threads is not None:
+            cmd[-1:-1] = ["-threads", str(threads)]
         try:
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=_AUDIO_FFMPEG_TIMEOUT_S,
-                check=False,
-            )
+            completed = run_ffmpeg(cmd, timeout=_AUDIO_FFMPEG_TIMEOUT_S)
         except subprocess.TimeoutExpired:
             return False, "ffmpeg_timeout"
         if completed.returncode != 0 or not out_path.is_file():
@@ -996,6 +973,7 @@ class CharacterViewExtractor:
         ffmpeg: str,
         src: Path,
         out_path: Path,
+        threads: int | None = None,
     ) -> tuple[bool, str]:
         cmd = [
             ffmpeg,
@@ -1010,12 +988,11 @@ class CharacterViewExtractor:
             "-loglevel", "error",
             str(out_path),
         ]
+        if threads is not None:
+            cmd[-1:-1] = ["-threads", str(threads)]
         try:
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=_TRIM_FFMPEG_TIMEOUT_S,
-                check=False,
+            completed = run_ffmpeg(
+                cmd, timeout=_TRIM_FFMPEG_TIMEOUT_S, duration_s=TRIM_DURATION_S
             )
         except subprocess.TimeoutExpired:
             return False, "ffmpeg_timeout"
@@ -1077,30 +1054,40 @@ class CharacterViewExtractor:
         ffmpeg/validation failures are reported `error` (the run never aborts
         on one bad folder). Per 2026-06-27 follow-up: a single click on the
         character gallery regenerates every character's 3 views + audio + trim.
+        Folders run concurrently (see the class doc); items keep folder order.
         """
         chars_dir = self._validate_characters_dir(characters_rel)
-        items: list[BatchViewItem] = []
-        for sub in sorted(chars_dir.iterdir(), key=lambda p: p.name):
-            if not sub.is_dir() or sub.is_symlink():
-                continue
-            if not _CHARACTER_DIR_RE.match(sub.name):
-                continue
-            src = self._latest_video_in(sub)
-            if src is None:
-                items.append(BatchViewItem(sub.name, "skipped", None, "no turntable video"))
-                continue
-            try:
-                result = self._extract_source(src)
-                items.append(BatchViewItem(sub.name, "ok", result, ""))
-            except CharacterVideoDomainError as exc:
-                items.append(
-                    BatchViewItem(sub.name, "error", None, str(exc) or type(exc).__name__)
-                )
+        subs = [
+            sub for sub in sorted(chars_dir.iterdir(), key=lambda p: p.name)
+            if sub.is_dir() and not sub.is_symlink() and _CHARACTER_DIR_RE.match(sub.name)
+        ]
+        if self._workers <= 1:
+            items: list[BatchViewItem] = []
+            for i, sub in enumerate(subs):
+                with job_step(i, len(subs), sub.name):
+                    items.append(self._extract_folder(sub, None))
+        else:
+            items = parallel_steps(
+                subs,
+                lambda sub: self._extract_folder(sub, self._ffmpeg_threads),
+                workers=self._workers,
+                stage=lambda sub: sub.name,
+            )
         return BatchViewExtractResult(
             characters_rel=self._rel(chars_dir),
             items=tuple(items),
         )
 
+    def _extract_folder(self, sub: Path, threads: int | None) -> BatchViewItem:
+        src = self._latest_video_in(sub)
+        if src is None:
+            return BatchViewItem(sub.name, "skipped", None, "no turntable video")
+        try:
+            result = self._extract_source(src, threads)
+        except CharacterVideoDomainError as exc:
+            return BatchViewItem(sub.name, "error", None, str(exc) or type(exc).__name__)
+        return BatchViewItem(sub.name, "ok", result, "")
+
     def _validate_characters_dir(self, rel: str) -> Path:
         if not isinstance(rel, str) or rel == "":
             raise InvalidCharactersDirError("path is empty")
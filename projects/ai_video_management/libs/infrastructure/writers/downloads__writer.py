@@ -25,21 +25,31 @@ This module is the first place the backend reads from a path OUTSIDE
 EXPOSED_TREE. Source-side hardening: basename validation, symlink refusal,
 and shutil.move (never copy + delete in two steps that could leave orphans).
 Destination is always inside the drama folder validated by MediaRenamer.
+
+Routing runs against a per-drama `_RoutingIndex`: every candidate token (and
+every plate 方位 token) compiled into one Aho–Corasick `TokenMatcher`, so each
+download name is scanned once instead of once per candidate token. The index
+is cached on the importer and rebuilt when any folder it was built from
+changes (directory mtimes — adding/removing/renaming a character, scene,
+plate, episode or shot folder bumps one of them).
 """
 from __future__ import annotations
 
 import os
 import re
 import shutil
+import threading
 import time
 from dataclasses import dataclass, field
 from io import BytesIO
 from libs.common import drama_layout
 from pathlib import Path
+from typing import Iterable
 
 from PIL import Image
 
 from libs.common.exposed_tree import MEDIA_EXTENSIONS, ExposedTree
+from libs.common.token_matcher import TokenMatcher
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.casting__error import DramaNotFoundError, InvalidDramaPathError
 from libs.domain.errors.downloads__error import DownloadsDirMissingError
@@ -99,6 +109,9 @@ _INTRO_CARD_MARKER = re.compile(r"名牌|出场卡|intro[ _]?card")
 # scene description (`小神庙内部` → spurious `庙内` plate match).
 _SCENE_ROOT_MARKER = re.compile(r"场景立绘|全局|建场|底图|巡游|环视|walk")
 _IMAGE_EXTS_LC = frozenset({".png", ".webp", ".jpg", ".jpeg"})
+# The compact shot tag `{NN}集{NN}镜` (see `_RoutingIndex.classify`).
+_SHOT_TAG = re.compile(r"(\d+)集(\d+)镜")
+_KIND_PRIORITY: dict[str, int] = {"shot": 4, "prop": 3, "scene": 2, "character": 1}
 
 
 @dataclass(frozen=True)
@@ -108,6 +121,162 @@ class _Candidate:
     tokens: tuple[str, ...]  # already lowercased
 
 
+@dataclass(frozen=True)
+class _Plate:
+    folder: Path
+    token: str  # 方位 routing token, lowercased
+
+
+class _RoutingIndex:
+    """Everything `import_drama` routes a download against, for one drama:
+    the candidates, each scene's orientation plates, and one compiled matcher
+    over all their tokens. `route()` gives the same winner as the former
+    per-candidate substring scan — (score, kind priority, folder order), ties
+    kept by the earlier candidate — with a single pass over the filename.
+    `layout` is the drama's chosen characters/scenes/episodes dirs and
+    `stamps` the mtimes of every folder it was built from."""
+
+    def __init__(
+        self,
+        drama_dir: Path,
+        candidates: list[_Candidate],
+        plates: dict[Path, list[_Plate]],
+        stamps: dict[Path, int | None],
+    ) -> None:
+        self._drama_dir = drama_dir
+        self.layout = _layout_dirs(drama_dir)
+        self.candidates = candidates
+        self._plates = plates
+        self.stamps = stamps
+        self._owners: dict[str, list[int]] = {}
+        self._by_tag: dict[str, _Candidate] = {}
+        for i, cand in enumerate(candidates):
+            for token in cand.tokens:
+                self._owners.setdefault(token, []).append(i)
+                if cand.kind == "shot":
+                    self._by_tag.setdefault(token, cand)
+        plate_tokens = [p.token for folder in plates.values() for p in folder]
+        self._matcher = TokenMatcher([*self._owners, *plate_tokens])
+
+    def is_current(self) -> bool:
+        return (
+            _layout_dirs(self._drama_dir) == self.layout
+            and _dir_stamps(self.stamps) == self.stamps
+        )
+
+    def route(self, filename: str) -> tuple[Path, str] | None:
+        """(destination folder, kind) for a download, or None (unmatched)."""
+        present = self._matcher.present(filename.lower())
+        chosen = self.classify(filename, present)
+        if chosen is None:
+            # Fallback: a scene background-plate download often carries only
+            # the 方位 token (`bg1_朝北_…`) with NO pinyin scene-name token —
+            # the out-of-image tool (kling/jimeng) truncates the filename to
+            # the prompt's first ~10 chars, where the early 方位 survives but
+            # the scene handle does not. Route by 方位 to the unique matching
+            # plate folder across the drama's scenes.
+            plate = self.plate_any_scene(present)
+            return (plate, "scene_plate") if plate is not None else None
+        if chosen.kind == "scene":
+            plate = self.scene_plate(filename, chosen.folder, present)
+            if plate is not None:
+                return plate, "scene_plate"
+        return chosen.folder, chosen.kind
+
+    def classify(self, filename: str, present: set[str]) -> _Candidate | None:
+        # The compact shot tag `{NN}集{NN}镜` is the AUTHORITATIVE routing key for
+        # a shot render: Kling/jimeng name the download from the shot block's
+        # first line `{NN}集{NN}镜{视|始|末}` (ai_video rule 12.4 / 2026-05-30), so
+        # its presence unambiguously identifies the owning shot. It MUST win
+        # outright over length-based scoring — a shot's `参考:` line now embeds
+        # the scene-plate handle it references (e.g. `s4_回忆庭院·bg1_…`), so the
+        # scene name appears in the render filename and, being a longer token,
+        # would otherwise out-score the shot tag and misroute the render into the
+        # scene folder (follow-up wushen_juexing/026).
+        tag_m = _SHOT_TAG.search(filename)
+        if tag_m is not None:
+            cand = self._by_tag.get(f"{tag_m.group(1)}集{tag_m.group(2)}镜")
+            if cand is not None:
+                return cand
+        scores: dict[int, int] = {}
+        for token in present:
+            for i in self._owners.get(token, ()):
+                if len(token) > scores.get(i, 0):
+                    scores[i] = len(token)
+        best: tuple[int, int, int, _Candidate] | None = None  # (score, kind_rank, -folder_name_lex, candidate)
+        for i in sorted(scores):
+            cand = self.candidates[i]
+            key = (scores[i], _KIND_PRIORITY[cand.kind], -ord_seq(cand.folder.name))
+            if best is None or key > best[:3]:
+                best = (*key, cand)
+        return best[3] if best is not None else None
+
+    def scene_plate(self, filename: str, scene_folder: Path, present: set[str]) -> Path | None:
+        """When a file matched a scene, route it deeper into the orientation
+        plate sub-folder whose 方位 token appears in the filename. Files with
+        no 方位 token (e.g. the scene walk-through `.mp4`) — or whole-scene assets
+        (场景立绘 / 全局建场底图), whose description can spuriously contain a 方位
+        substring — stay at the scene root."""
+        if _SCENE_ROOT_MARKER.search(filename):
+            return None
+        best: tuple[int, str, Path] | None = None
+        for plate in self._plates.get(scene_folder, ()):
+            if plate.token not in present:
+                continue
+            key = (len(plate.token), plate.folder.name)
+            if best is None or key > best[:2]:
+                best = (*key, plate.folder)
+        return best[2] if best is not None else None
+
+    def plate_any_scene(self, present: set[str]) -> Path | None:
+        """Route a scene background-plate download by its 方位 token alone, when
+        `classify` found no scene-name match.
+
+        Out-of-image tools truncate the download filename to the prompt's first
+        ~10 chars; for a plate prompt whose first line is the plate_id
+        (`bg{N}_{方位}_…`) the EARLY 方位 token survives but the pinyin scene
+        handle does not — so the file never matches a scene by name. This
+        considers every plate folder under `scenes/*/bg{N}_{方位}_…/` whose 方位
+        token appears in the filename. Disambiguation when more than one scene
+        owns the same 方位: keep only plates whose SCENE name token also appears
+        in the filename; route iff that leaves exactly one plate folder (else
+        None → not_matched, never a silent misroute).
+        """
+        all_hits: list[Path] = []
+        scene_scoped_hits: list[Path] = []
+        for cand in self.candidates:
+            if cand.kind != "scene":
+                continue
+            scene_present = not present.isdisjoint(cand.tokens)
+            for plate in self._plates.get(cand.folder, ()):
+                if plate.token not in present:
+                    continue
+                all_hits.append(plate.folder)
+                if scene_present:
+                    scene_scoped_hits.append(plate.folder)
+        pool = scene_scoped_hits or all_hits
+        unique = {p.resolve() for p in pool}
+        return pool[0] if len(unique) == 1 else None
+
+
+def _layout_dirs(drama_dir: Path) -> tuple[Path, Path, Path]:
+    return (
+        drama_layout.characters_dir(drama_dir),
+        drama_layout.scenes_dir(drama_dir),
+        drama_layout.episodes_dir(drama_dir),
+    )
+
+
+def _dir_stamps(dirs: Iterable[Path]) -> dict[Path, int | None]:
+    stamps: dict[Path, int | None] = {}
+    for d in dirs:
+        try:
+            stamps[d] = d.stat().st_mtime_ns
+        except OSError:
+            stamps[d] = None
+    return stamps
+
+
 @dataclass
 class ImportResult:
     moved: list[dict[str, str]] = field(default_factory=list)
@@ -138,6 +307,8 @@ class DownloadsImporter:
         self._renamer = renamer
         self._downloads_dir = (downloads_dir or self._resolve_default_downloads_dir()).resolve()
         self._window = time_window_seconds
+        self._index_lock = threading.Lock()
+        self._indexes: dict[Path, _RoutingIndex] = {}
 
     @staticmethod
     def _resolve_default_downloads_dir() -> Path:
@@ -150,34 +321,20 @@ class DownloadsImporter:
         drama_dir = self._renamer.validate_drama(rel_drama_path)
         if not self._downloads_dir.is_dir():
             raise DownloadsDirMissingError(str(self._downloads_dir))
-        candidates = self._collect_candidates(drama_dir)
+        index = self._routing_index(drama_dir)
         cutoff = time.time() - self._window
         result = ImportResult()
         for src in self._iter_downloads(cutoff):
             if not self._is_safe_basename(src.name):
                 result.errors.append({"path": self._display_src(src), "message": "invalid_basename"})
                 continue
-            chosen = self._classify(src.name, candidates)
-            if chosen is None:
-                # Fallback: a scene background-plate download often carries only
-                # the 方位 token (`bg1_朝北_…`) with NO pinyin scene-name token —
-                # the out-of-image tool (kling/jimeng) truncates the filename to
-                # the prompt's first ~10 chars, where the early 方位 survives but
-                # the scene handle does not. Route by 方位 to the unique matching
-                # plate folder across the drama's scenes.
-                plate = self._match_plate_any_scene(src.name, drama_dir)
-                if plate is None:
-                    # Truly unmatched → NOT imported: leave the file in Downloads
-                    # untouched, only report it back (no not_matched/ folder).
-                    result.unmatched.append({"from": self._display_src(src), "kind": "unmatched"})
-                    continue
-                dst_folder, kind = plate, "scene_plate"
-            else:
-                dst_folder, kind = chosen.folder, chosen.kind
-                if chosen.kind == "scene":
-                    plate = self._match_scene_plate(src.name, chosen.folder)
-                    if plate is not None:
-                        dst_folder, kind = plate, "scene_plate"
+            routed = index.route(src.name)
+            if routed is None:
+                # Truly unmatched → NOT imported: leave the file in Downloads
+                # untouched, only report it back (no not_matched/ folder).
+                result.unmatched.append({"from": self._display_src(src), "kind": "unmatched"})
+                continue
+            dst_folder, kind = routed
             # Canonical-named destinations (one image per folder): an intro-card
             # nameplate matched to a character → `{char}/intro_card.{ext}`; a prop
             # download → `props/{道具}/{道具}.{ext}`. Everything else keeps its
@@ -478,30 +635,70 @@ class DownloadsImporter:
                     folders[m.group(1)] = perf_dir
         return folders
 
-    def _collect_candidates(self, drama_dir: Path) -> list[_Candidate]:
+    def _routing_index(self, drama_dir: Path) -> _RoutingIndex:
+        """The drama's cached `_RoutingIndex`, rebuilt when stale."""
+        with self._index_lock:
+            index = self._indexes.get(drama_dir)
+        if index is not None and index.is_current():
+            return index
+        watched: list[Path] = []
+        candidates = self._collect_candidates(drama_dir, watched)
+        plates: dict[Path, list[_Plate]] = {}
+        for cand in candidates:
+            if cand.kind == "scene":
+                plates[cand.folder] = self._collect_plates(cand.folder)
+        index = _RoutingIndex(drama_dir, candidates, plates, _dir_stamps(watched))
+        with self._index_lock:
+            self._indexes[drama_dir] = index
+        return index
+
+    @classmethod
+    def _collect_plates(cls, scene_folder: Path) -> list[_Plate]:
+        try:
+            children = sorted(scene_folder.iterdir(), key=lambda p: p.name)
+        except OSError:
+            return []
+        plates: list[_Plate] = []
+        for child in children:
+            if not child.is_dir() or child.is_symlink() or child.name in _PLATE_NON_DEST:
+                continue
+            token = cls._plate_orientation_token(child.name)
+            if token is not None:
+                plates.append(_Plate(folder=child, token=token))
+        return plates
+
+    def _collect_candidates(
+        self, drama_dir: Path, watched: list[Path] | None = None
+    ) -> list[_Candidate]:
+        """Routing candidates in priority-tiebreak order. `watched` collects
+        every folder whose listing the result (or a scene's plates) depends on."""
         out: list[_Candidate] = []
+        seen_dirs: list[Path] = watched if watched is not None else []
         characters_dir = drama_layout.characters_dir(drama_dir)
+        props_dir = characters_dir.parent / PROPS_DIR_NAME
+        scenes_dir = drama_layout.scenes_dir(drama_dir)
+        episodes_dir = drama_layout.episodes_dir(drama_dir)
+        seen_dirs.extend([characters_dir, props_dir.parent, props_dir, scenes_dir, episodes_dir])
         if characters_dir.is_dir():
             for child in sorted(characters_dir.iterdir()):
                 if child.is_dir() and not child.is_symlink():
                     out.append(_Candidate(folder=child, kind="character", tokens=self._tokens(child.name)))
-        scenes_dir = drama_layout.scenes_dir(drama_dir)
         if scenes_dir.is_dir():
             for child in sorted(scenes_dir.iterdir()):
                 if child.is_dir() and not child.is_symlink():
+                    seen_dirs.append(child)
                     out.append(_Candidate(folder=child, kind="scene", tokens=self._tokens(child.name)))
         # Props (`2_世界观人设/props/{道具名}/`) — a sibling of characters/scenes;
         # one canonical image per prop folder (e.g. `props/玉佩/玉佩.png`).
-        props_dir = drama_layout.characters_dir(drama_dir).parent / PROPS_DIR_NAME
         if props_dir.is_dir():
             for child in sorted(props_dir.iterdir()):
                 if child.is_dir() and not child.is_symlink():
                     out.append(_Candidate(folder=child, kind="prop", tokens=self._tokens(child.name)))
-        episodes_dir = drama_layout.episodes_dir(drama_dir)
         if episodes_dir.is_dir():
             for ep in sorted(episodes_dir.iterdir()):
                 if not ep.is_dir() or ep.is_symlink():
                     continue
+                seen_dirs.append(ep)
                 # Shot folders live under episodes/{ep}/shots/ (renamed from
                 # the legacy prompts/ per ai_video rule 2 v3). Accept either.
                 shots_dir = ep / "shots"
@@ -509,6 +706,7 @@ class DownloadsImporter:
                     shots_dir = ep / "prompts"
                 if not shots_dir.is_dir():
                     continue
+                seen_dirs.append(shots_dir)
                 for shot in sorted(shots_dir.iterdir()):
                     if not shot.is_dir() or shot.is_symlink():
                         continue
@@ -551,39 +749,6 @@ class DownloadsImporter:
                 seen[t] = None
         return tuple(seen)
 
-    @staticmethod
-    def _classify(filename: str, candidates: list[_Candidate]) -> _Candidate | None:
-        name = filename.lower()
-        # The compact shot tag `{NN}集{NN}镜` is the AUTHORITATIVE routing key for
-        # a shot render: Kling/jimeng name the download from the shot block's
-        # first line `{NN}集{NN}镜{视|始|末}` (ai_video rule 12.4 / 2026-05-30), so
-        # its presence unambiguously identifies the owning shot. It MUST win
-        # outright over length-based scoring — a shot's `参考:` line now embeds
-        # the scene-plate handle it references (e.g. `s4_回忆庭院·bg1_…`), so the
-        # scene name appears in the render filename and, being a longer token,
-        # would otherwise out-score the shot tag and misroute the render into the
-        # scene folder (follow-up wushen_juexing/026).
-        tag_m = re.search(r"(\d+)集(\d+)镜", filename)
-        if tag_m is not None:
-            tag = f"{tag_m.group(1)}集{tag_m.group(2)}镜"
-            for cand in candidates:
-                if cand.kind == "shot" and tag in cand.tokens:
-                    return cand
-        kind_priority = {"shot": 4, "prop": 3, "scene": 2, "character": 1}
-        best: tuple[int, int, str, _Candidate] | None = None  # (score, kind_rank, folder_name_lex, candidate)
-        for cand in candidates:
-            score = 0
-            for token in cand.tokens:
-                if token and token in name:
-                    if len(token) > score:
-                        score = len(token)
-            if score == 0:
-                continue
-            key = (score, kind_priority[cand.kind], -ord_seq(cand.folder.name))
-            if best is None or key > best[:3]:
-                best = (*key, cand)
-        return best[3] if best is not None else None
-
     @staticmethod
     def _clear_folder_media(folder: Path) -> None:
         """Delete top-level media files in a folder (overwrite support for
@@ -627,77 +792,6 @@ class DownloadsImporter:
         token = folder_name[m.end():].split("_", 1)[0].strip().lower()
         return token or None
 
-    @classmethod
-    def _match_scene_plate(cls, filename: str, scene_folder: Path) -> Path | None:
-        """When a file matched a scene, route it deeper into the orientation
-        plate sub-folder whose 方位 token appears in the filename. Files with
-        no 方位 token (e.g. the scene walk-through `.mp4`) — or whole-scene assets
-        (场景立绘 / 全局建场底图), whose description can spuriously contain a 方位
-        substring — stay at the scene root."""
-        if _SCENE_ROOT_MARKER.search(filename):
-            return None
-        name = filename.lower()
-        best: tuple[int, str, Path] | None = None
-        try:
-            children = sorted(scene_folder.iterdir(), key=lambda p: p.name)
-        except OSError:
-            return None
-        for child in children:
-            if not child.is_dir() or child.is_symlink() or child.name in _PLATE_NON_DEST:
-                continue
-            token = cls._plate_orientation_token(child.name)
-            if token is None or token not in name:
-                continue
-            key = (len(token), child.name)
-            if best is None or key > best[:2]:
-                best = (len(token), child.name, child)
-        return best[2] if best is not None else None
-
-    def _match_plate_any_scene(self, filename: str, drama_dir: Path) -> Path | None:
-        """Route a scene background-plate download by its 方位 token alone, when
-        `_classify` found no scene-name match.
-
-        Out-of-image tools truncate the download filename to the prompt's first
-        ~10 chars; for a plate prompt whose first line is the plate_id
-        (`bg{N}_{方位}_…`) the EARLY 方位 token survives but the pinyin scene
-        handle does not — so the file never matches a scene by name. This scans
-        every plate folder under `scenes/*/bg{N}_{方位}_…/` and routes the file
-        to the one whose 方位 token appears in the filename. Disambiguation when
-        more than one scene owns the same 方位: keep only plates whose SCENE name
-        token also appears in the filename; route iff that leaves exactly one
-        plate folder (else None → not_matched, never a silent misroute).
-        """
-        name = filename.lower()
-        scenes_dir = drama_layout.scenes_dir(drama_dir)
-        if not scenes_dir.is_dir():
-            return None
-        all_hits: list[Path] = []
-        scene_scoped_hits: list[Path] = []
-        try:
-            scenes = sorted(scenes_dir.iterdir(), key=lambda p: p.name)
-        except OSError:
-            return None
-        for scene in scenes:
-            if not scene.is_dir() or scene.is_symlink():
-                continue
-            scene_present = any(tok in name for tok in self._tokens(scene.name))
-            try:
-                children = sorted(scene.iterdir(), key=lambda p: p.name)
-            except OSError:
-                continue
-            for child in children:
-                if not child.is_dir() or child.is_symlink() or child.name in _PLATE_NON_DEST:
-                    continue
-                token = self._plate_orientation_token(child.name)
-                if token is None or token not in name:
-                    continue
-                all_hits.append(child)
-                if scene_present:
-                    scene_scoped_hits.append(child)
-        pool = scene_scoped_hits or all_hits
-        unique = {p.resolve() for p in pool}
-        return pool[0] if len(unique) == 1 else None
-
     def _iter_downloads(self, cutoff: float) -> list[Path]:
         out: list[Path] = []
         try:
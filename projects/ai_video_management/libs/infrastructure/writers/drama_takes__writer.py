@@ -55,13 +55,13 @@ class DramaTakesSelector:
         self._resolver = resolver
         self._episode_selector = episode_selector
 
-    def select_all(self, rel: str) -> DramaTakesResult:
+    def select_all(self, rel: str, force: bool = False) -> DramaTakesResult:
         drama_root = self._drama_root(rel)
         outcomes: list[EpisodeTakesOutcome] = []
         for ep_dir in self._episode_dirs(drama_root):
             ep_rel = self._rel(ep_dir)
             try:
-                result: SelectTakesResult = self._episode_selector.select(ep_rel)
+                result: SelectTakesResult = self._episode_selector.select(ep_rel, force)
             except EpisodeDomainError as exc:
                 outcomes.append(
                     EpisodeTakesOutcome(ep_dir.name, ep_rel, False, 0, 0, type(exc).__name__)
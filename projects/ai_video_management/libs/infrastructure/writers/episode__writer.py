@@ -12,6 +12,9 @@ output. The prior `ep{NN}.mp4` (and its `.segments.json` sidecar) is DELETED fir
 — right after shot validation, before the slow seam-probe + stitch — so its absence
 signals "generating…" and a stale reel is never mistaken for a freshly-built one;
 a validation failure (no shots) raises before that delete, preserving the old reel.
+Neither happens when the reel is up to date (`BuildManifest`: same selected clips,
+same shot `衔接:` notes, same rife/plan/incremental choice, same ffmpeg) — the
+recorded result is returned with `up_to_date=True`; `force=True` re-stitches.
 
 Implementation mirrors ShotConcatBuilder's concat *filter* approach
 (`trim`-free here, so each shot plays at full length): every input is
@@ -35,12 +38,14 @@ ffmpeg binary supplied by `imageio-ffmpeg` — no system install required.
 from __future__ import annotations
 
 import base64
+import hashlib
 import importlib.util
 import json
 import os
 import re
 import subprocess
 import tempfile
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -48,7 +53,10 @@ from types import ModuleType
 
 import imageio_ffmpeg
 
+from libs.common.build_manifest import BuildManifest, build_key, ffmpeg_version
+from libs.common.drama_layout import cache_dir
 from libs.common.exposed_tree import ExposedTree
+from libs.common.job_progress import JobSubmitter, default_workers, job_step, run_ffmpeg
 from libs.common.render_select import newest_render
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.episode__error import (
@@ -60,6 +68,7 @@ from libs.domain.errors.episode__error import (
     NoShotVideosError,
     NotEpisodePathError,
 )
+from libs.infrastructure.readers.media_probe__reader import MediaProbeReader
 
 _EP_DIR_RE = re.compile(r"^ep\d+$", re.IGNORECASE)
 _SHOT_DIR_RE = re.compile(r"^shot\d+$", re.IGNORECASE)
@@ -79,6 +88,21 @@ VALID_EPISODE_LANGS: tuple[str, ...] = ("original",)
 _SEGMENTS_SUFFIX: str = ".segments.json"
 
 _EPISODE_FFMPEG_TIMEOUT_S: int = 600
+# Incremental concat (opt-in): each shot's normalised, trimmed segment is cached
+# under `ai_videos/{drama}/.cache/episode_segments/{episode rel}/`, keyed by the
+# source (path, size, mtime) and the exact trim / normalise filters it is cut with
+# — then the cached segments are stream-copied together. Swapping one take
+# re-encodes ONE shot instead of the whole episode. The filters are the full
+# build's own: `_ffmpeg_concat`'s per-clip normalisation on the auto path,
+# `seam_concat`'s body rule (native size, first-clip fps, kept audio tail) on the
+# plan path. Bump the recipe version whenever the per-segment encode below changes
+# so stale segments are never reused.
+_SEGMENT_CACHE_SUBDIR: str = "episode_segments"
+_SEGMENT_RECIPE_VERSION: int = 2
+# Whole-reel counterpart for the build manifest: bump when the stitch itself
+# (filter graph, seam trims, encoder settings) changes.
+_CONCAT_RECIPE_VERSION: int = 2
+_SEGMENT_FADE_S: float = 0.010   # ~10ms boundary micro-fade: no click at stream-copy joins
 _CONCAT_TARGET_W: int = 720      # 9:16 reel — 720x1280 is fast to encode + plenty for review
 _CONCAT_TARGET_H: int = 1280
 # Output framerate is matched to the SOURCE cadence, not hardcoded. The shot
@@ -138,9 +162,6 @@ _SEAM_PLAN_FILE: str = "seam_plan.json"
 _SEAM_THUMB_W: int = 200          # px width of the per-seam preview frames (base64 JPEG)
 _FREEZE_START_RE = re.compile(r"freeze_start:\s*([0-9.]+)")
 _FREEZE_END_RE = re.compile(r"freeze_end:\s*([0-9.]+)")
-_CLIP_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
-_PROGRESS_TIME_RE = re.compile(r"time=\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
-_FPS_RE = re.compile(r"(\d+(?:\.\d+)?)\s*fps")
 # A de-freeze pass (mpdecimate, follow-up 139/140) once lived here to collapse the
 # i2v renders' long mid-shot stalls, but it was REVERTED (follow-up 141): the
 # stalls overlap speech, so removing them either sped the dialogue (atempo) or
@@ -177,6 +198,8 @@ class EpisodeConcatResult:
     rife_used: bool = False     # RIFE motion-bridge stitch applied at 承接 seams
     rife_bridges: int = 0       # number of seams actually bridged
     segments_rel: str | None = None   # sidecar ep{NN}.segments.json (final timeline)
+    reused_segments: int = 0    # incremental mode: cached shot segments not re-encoded
+    up_to_date: bool = False    # reel already built from these inputs; nothing stitched
 
     def to_payload(self) -> dict[str, object]:
         return {
@@ -188,6 +211,8 @@ class EpisodeConcatResult:
             "rife_used": self.rife_used,
             "rife_bridges": self.rife_bridges,
             "segments": self.segments_rel,
+            "reused_segments": self.reused_segments,
+            "up_to_date": self.up_to_date,
         }
 
 
@@ -230,13 +255,22 @@ class SeamAnalysis:
 
 
 class EpisodeConcatBuilder:
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver,
+        probe: MediaProbeReader | None = None,
+        jobs: JobSubmitter | None = None,
+        manifest: BuildManifest | None = None,
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._probe = probe or MediaProbeReader()
+        self._jobs = jobs
+        self._manifest = manifest or BuildManifest()
 
     def build(
         self, rel: str, lang: str = "original", rife: bool = False,
-        plan: list[dict] | None = None,
+        plan: list[dict] | None = None, incremental: bool = False,
+        force: bool = False,
     ) -> EpisodeConcatResult:
         if lang not in VALID_EPISODE_LANGS:
             raise InvalidEpisodePathError(f"unknown episode lang: {lang!r}")
@@ -268,6 +302,11 @@ class EpisodeConcatBuilder:
         # confirmed there ARE shots to stitch (so a no-shots failure preserves the old
         # reel). seam_plan.json is the user's saved input, not output — never removed.
         out_path = episode_dir / f"{episode_slug}{_MP4_EXT}"
+        key = self._build_key(used, used_dirs, rife, plan, incremental)
+        if not force:
+            cached = self._cached_build(episode_dir, out_path, key, skipped)
+            if cached is not None:
+                return cached
         self._remove_stale_output(out_path)
 
         ffmpeg = self._ffmpeg_exe()
@@ -304,16 +343,37 @@ class EpisodeConcatBuilder:
 
         rife_used = False
         rife_bridges = 0
+        reused = 0
         approx_eff = True
         eff: list[float] = []
         all_resolved = all(p is not None for p in inputs)
-        if plan is not None and all_resolved:
+        tool_plan = (
+            self._plan_for_used(plan, used) if plan is not None and all_resolved else None
+        )
+        if (
+            incremental and tool_plan is not None
+            and not any(e.get("rife") and e["bridge"] for e in tool_plan)
+        ):
+            # A plan with no RIFE seam is pure trim-butt / hard-cut: every edit is a
+            # per-shot trim, so it stitches from the segment cache like the auto path.
+            self._save_plan(episode_dir, plan)  # type: ignore[arg-type]
+            head_trims, tail_trims = self._plan_trims(tool_plan, len(used))
+            used = [
+                ShotClip(c.shot, c.video_rel, head_trims[i] + tail_trims[i])
+                for i, c in enumerate(used)
+            ]
+            eff, reused = self._incremental_concat(
+                ffmpeg, episode_dir, inputs, out_path, head_trims, tail_trims,  # type: ignore[arg-type]
+                [c.shot for c in used], tool_plan,
+            )
+            approx_eff = False
+        elif plan is not None and all_resolved:
             # Explicit per-seam plan from the UI planner: honor each choice (RIFE
             # gate off). Persist the plan FIRST — it is the user's intent and must
             # survive even if the (long) render is interrupted, so reopening the
             # planner always reloads their last choices.
             self._save_plan(episode_dir, plan)
-            tool_plan = self._plan_for_used(plan, used)
+            assert tool_plan is not None
             rife_bridges = self._stitch_with_plan(inputs, out_path, tool_plan)  # type: ignore[arg-type]
             rife_used = any(e.get("rife") and e["bridge"] for e in tool_plan)
             eff = self._approx_eff(ffmpeg, inputs, head_trims, tail_trims)  # type: ignore[arg-type]
@@ -326,6 +386,12 @@ class EpisodeConcatBuilder:
             rife_bridges = self._rife_stitch(inputs, out_path, seams, None)  # type: ignore[arg-type]
             rife_used = True
             eff = self._approx_eff(ffmpeg, inputs, head_trims, tail_trims)  # type: ignore[arg-type]
+        elif incremental and all_resolved:
+            eff, reused = self._incremental_concat(
+                ffmpeg, episode_dir, inputs, out_path, head_trims, tail_trims,  # type: ignore[arg-type]
+                [c.shot for c in used], None,
+            )
+            approx_eff = False
         else:
             ret = self._ffmpeg_concat(
                 ffmpeg=ffmpeg,
@@ -341,6 +407,14 @@ class EpisodeConcatBuilder:
                 eff = list(ret)
                 approx_eff = False
         segments_rel = self._write_segments(out_path, used, eff, approx_eff)
+        self._manifest.record(out_path, key, {
+            "used": [[c.shot, c.video_rel, c.trimmed_s] for c in used],
+            "rife_used": rife_used,
+            "rife_bridges": rife_bridges,
+            "segments": segments_rel is not None,
+        })
+        if segments_rel is not None:
+            self._manifest.record(out_path.with_suffix(_SEGMENTS_SUFFIX), key)
         # Persist the seam scorecard for THIS build so the dashboard shows the last
         # generation's score with no recompute when the page opens (best-effort).
         self._write_seam_scores(episode_dir, lang)
@@ -353,6 +427,50 @@ class EpisodeConcatBuilder:
             rife_used=rife_used,
             rife_bridges=rife_bridges,
             segments_rel=segments_rel,
+            reused_segments=reused,
+        )
+
+    def _build_key(
+        self, used: list[ShotClip], used_dirs: list[Path], rife: bool,
+        plan: list[dict] | None, incremental: bool,
+    ) -> str:
+        """Manifest key of one reel: the selected clips, each shot's `shotNN.md`
+        (its `衔接:` line decides the seam trims), the stitch options and — when
+        the external tool stitches — `tools/seam_concat.py` + the RIFE exe."""
+        inputs: list[Path] = []
+        for clip, shot_dir in zip(used, used_dirs):
+            inputs.append(self._resolver.root / clip.video_rel)
+            inputs.append(shot_dir / f"{shot_dir.name}.md")
+        params: dict[str, object] = {
+            "op": "concat", "v": _CONCAT_RECIPE_VERSION, "ffmpeg": ffmpeg_version(),
+            "rife": rife, "plan": plan, "incremental": incremental,
+        }
+        if rife or plan is not None:
+            inputs.append(self._resolver.root / "tools" / "seam_concat.py")
+            params["rife_exe"] = self._resolve_rife_exe()
+        return build_key(inputs, params)
+
+    def _cached_build(
+        self, episode_dir: Path, out_path: Path, key: str, skipped: list[ShotSkip],
+    ) -> EpisodeConcatResult | None:
+        """The recorded result when `ep{NN}.mp4` (and its segments sidecar) are
+        still exactly what a build from `key` produced, else None."""
+        meta = self._manifest.lookup(out_path, key)
+        if meta is None or "used" not in meta:
+            return None
+        seg_path = out_path.with_suffix(_SEGMENTS_SUFFIX)
+        if meta.get("segments") and self._manifest.lookup(seg_path, key) is None:
+            return None
+        return EpisodeConcatResult(
+            episode_rel=self._rel(episode_dir),
+            out_rel=self._rel(out_path),
+            used=tuple(ShotClip(s, v, float(t)) for s, v, t in meta["used"]),
+            skipped=tuple(skipped),
+            lang="original",
+            rife_used=bool(meta.get("rife_used")),
+            rife_bridges=int(meta.get("rife_bridges") or 0),
+            segments_rel=self._rel(seg_path) if meta.get("segments") else None,
+            up_to_date=True,
         )
 
     def _rife_stitch(
@@ -373,7 +491,8 @@ class EpisodeConcatBuilder:
         try:
             return int(
                 seam_mod.seam_concat(
-                    list(inputs), out_path, _RIFE_SEAM_TRIM_S, rife_exe, 0, seams, plan
+                    list(inputs), out_path, _RIFE_SEAM_TRIM_S, rife_exe, 0, seams, plan,
+                    jobs=default_workers(seam_mod.SEGMENT_THREADS),
                 )
             )
         except Exception as exc:  # tool raises RuntimeError on any ffmpeg/RIFE failure
@@ -397,7 +516,8 @@ class EpisodeConcatBuilder:
         try:
             return int(
                 seam_mod.seam_concat(
-                    list(inputs), out_path, _RIFE_SEAM_TRIM_S, rife_exe, 0, None, tool_plan
+                    list(inputs), out_path, _RIFE_SEAM_TRIM_S, rife_exe, 0, None, tool_plan,
+                    jobs=default_workers(seam_mod.SEGMENT_THREADS),
                 )
             )
         except Exception as exc:  # tool raises RuntimeError on any ffmpeg/RIFE failure
@@ -432,6 +552,21 @@ class EpisodeConcatBuilder:
             })
         return tool_plan
 
+    @staticmethod
+    def _plan_trims(
+        tool_plan: list[dict], n: int
+    ) -> tuple[list[float], list[float]]:
+        """Per-clip (head, tail) trims a RIFE-free tool plan implies — the same rule
+        `seam_concat` applies: a side is trimmed only when the seam touching it is a
+        承接 (trim-butt) join, by that seam's bite."""
+        head = [0.0] * n
+        tail = [0.0] * n
+        for j, e in enumerate(tool_plan[: max(0, n - 1)]):
+            if e.get("bridge"):
+                tail[j] = float(e["trim"])
+                head[j + 1] = float(e["trim"])
+        return head, tail
+
     @staticmethod
     def _remove_stale_output(out_path: Path) -> None:
         """Delete a prior `ep{NN}.mp4` + its derived `.segments.json` sidecar before a
@@ -596,15 +731,15 @@ class EpisodeConcatBuilder:
 
     def _write_seam_scores(self, episode_dir: Path, lang: str) -> None:
         """Score the just-built episode's 首尾帧承接 seams and persist the sidecar so the
-        dashboard renders the last generation instantly — but do it on a BACKGROUND
-        thread so it never adds to the concat's response time. Scoring rebuilds isolated
-        seam pairs + runs optical flow (~tens of seconds); running it inline would make
-        每次「拼接成片」感觉卡住/超时. The reel (ep{NN}.mp4) is already written by the time
-        this is spawned; the score sidecar simply appears a little later."""
+        dashboard renders the last generation instantly — but queue it as a
+        `seam-scores` BACKGROUND job so it never adds to the concat's response time.
+        Scoring rebuilds isolated seam pairs + runs optical flow (~tens of seconds);
+        running it inline would make 每次「拼接成片」感觉卡住/超时. The reel (ep{NN}.mp4)
+        is already written by the time this is queued; the score sidecar simply
+        appears a little later. With no job queue wired (CLI / tests) it runs on a
+        plain (non-daemon, so it still finishes before exit) background thread."""
         if not (episode_dir / _SEAM_PLAN_FILE).is_file():
             return
-        import threading
-
         root = self._resolver.root
         rife_exe = self._resolve_rife_exe()
 
@@ -620,7 +755,10 @@ class EpisodeConcatBuilder:
             except Exception:  # scoring is a nicety; never let it surface anywhere
                 return
 
-        threading.Thread(target=_job, name="seam-score", daemon=True).start()
+        if self._jobs is None:
+            threading.Thread(target=_job, name="seam-scores").start()
+        else:
+            self._jobs.submit("seam-scores", self._rel(episode_dir), _job)
 
     @staticmethod
     def _ffmpeg_exe() -> str:
@@ -857,11 +995,8 @@ class EpisodeConcatBuilder:
         ])
 
         try:
-            completed = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=_EPISODE_FFMPEG_TIMEOUT_S,
-                check=False,
+            completed = run_ffmpeg(
+                cmd, timeout=_EPISODE_FFMPEG_TIMEOUT_S, duration_s=sum(eff)
             )
         except subprocess.TimeoutExpired as exc:
             raise EpisodeConcatFailedError("ffmpeg_timeout") from exc
@@ -870,34 +1005,199 @@ class EpisodeConcatBuilder:
             raise EpisodeConcatFailedError(err or "ffmpeg_failed")
         return eff
 
+    def _incremental_concat(
+        self,
+        ffmpeg: str,
+        episode_dir: Path,
+        inputs: list[Path],
+        out_path: Path,
+        head_trims: list[float],
+        tail_trims: list[float],
+        shots: list[str],
+        tool_plan: list[dict] | None,
+    ) -> tuple[list[float], int]:
+        """Stitch from per-shot cached segments: encode only the shots whose key
+        changed, then stream-copy concat. Each segment is cut with the filters the
+        matching full build uses (`_segment_recipes`), to a whole number of frames
+        with its audio padded to exactly that length so the copy-concat never
+        drifts. Returns (per-shot kept durations, segments reused)."""
+        n = len(inputs)
+        fps, recipes = self._segment_recipes(ffmpeg, inputs, head_trims, tail_trims, tool_plan)
+        cache = self._segment_cache_dir(episode_dir)
+        cache.mkdir(parents=True, exist_ok=True)
+        eff: list[float] = []
+        segs: list[Path] = []
+        reused = 0
+        for i, (src, (vf, af, kept)) in enumerate(zip(inputs, recipes)):
+            frames = max(1, round(kept * fps))
+            seg = cache / f"{shots[i]}.{self._segment_key(src, vf, af, frames, fps)}{_MP4_EXT}"
+            if seg.is_file():
+                reused += 1
+            else:
+                # one progress slice per shot + one for the final stitch
+                with job_step(i, n + 1, shots[i]):
+                    self._render_segment(ffmpeg, src, vf, af, frames, fps, seg)
+            segs.append(seg)
+            eff.append(frames / fps)
+        with job_step(n, n + 1, "concat"):
+            self._copy_concat(ffmpeg, segs, out_path)
+        self._prune_segments(cache, segs)
+        return eff, reused
+
+    def _segment_recipes(
+        self,
+        ffmpeg: str,
+        inputs: list[Path],
+        head_trims: list[float],
+        tail_trims: list[float],
+        tool_plan: list[dict] | None,
+    ) -> tuple[int, list[tuple[str, str | None, float]]]:
+        """(fps, per-shot (video filter, audio filter or None when mute, kept
+        seconds)) — the full build's own segment parameters, never re-derived: a
+        plan stitches through `seam_concat`, so its bodies come from the tool's
+        `_body_filters` (native size, first-clip fps, audio tail kept past the
+        last frame on a butt tail); the auto path mirrors `_ffmpeg_concat`."""
+        n = len(inputs)
+        h = [head_trims[i] if i < len(head_trims) else 0.0 for i in range(n)]
+        tl = [tail_trims[i] if i < len(tail_trims) else 0.0 for i in range(n)]
+        if tool_plan is not None:
+            seam_mod = self._load_seam_concat(self._resolver.root)
+            probes = [seam_mod._probe(ffmpeg, src) for src in inputs]
+            fps, w, ht = seam_mod._reel_format(probes)
+            return fps, [
+                seam_mod._body_filters(ffmpeg, src, h[i], tl[i], probes[i][0], fps, w, ht)
+                for i, src in enumerate(inputs)
+            ]
+        fps = self._target_fps(ffmpeg, inputs)
+        recipes: list[tuple[str, str | None, float]] = []
+        for i, src in enumerate(inputs):
+            end = max(h[i] + 0.1, self._probe_duration(ffmpeg, src) - tl[i])
+            trimmed = h[i] > 0 or tl[i] > 0
+            vf = (
+                (f"trim=start={h[i]:.3f}:end={end:.3f}," if trimmed else "")
+                + "setpts=PTS-STARTPTS,"
+                f"scale={_CONCAT_TARGET_W}:{_CONCAT_TARGET_H}:force_original_aspect_ratio=decrease,"
+                f"pad={_CONCAT_TARGET_W}:{_CONCAT_TARGET_H}:(ow-iw)/2:(oh-ih)/2:black,"
+                f"setsar=1,fps={fps}"
+            )
+            af = None
+            if self._probe_has_audio(ffmpeg, src):
+                af = (
+                    (f"atrim=start={h[i]:.3f}:end={end:.3f}," if trimmed else "")
+                    + "asetpts=PTS-STARTPTS,aresample=44100"
+                )
+            recipes.append((vf, af, end - h[i]))
+        return fps, recipes
+
+    def _segment_cache_dir(self, episode_dir: Path) -> Path:
+        """`ai_videos/{drama}/.cache/episode_segments/{episode path under drama}/`."""
+        parts = episode_dir.relative_to(self._resolver.root).parts
+        drama_dir = self._resolver.root.joinpath(*parts[:2])
+        return cache_dir(drama_dir).joinpath(_SEGMENT_CACHE_SUBDIR, *parts[2:])
+
     @staticmethod
-    def _probe_duration(ffmpeg: str, src: Path) -> float:
+    def _segment_key(src: Path, vf: str, af: str | None, frames: int, fps: int) -> str:
+        st = src.stat()
+        payload = json.dumps(
+            {
+                "v": _SEGMENT_RECIPE_VERSION, "src": str(src), "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns, "vf": vf, "af": af,
+                "frames": frames, "fps": fps,
+            },
+            sort_keys=True, ensure_ascii=False,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _render_segment(
+        self, ffmpeg: str, src: Path, vf: str, af: str | None, frames: int, fps: int,
+        seg: Path,
+    ) -> None:
+        """Encode one shot's segment to `seg` (via a `.part` sibling, so an
+        interrupted encode never leaves a cache entry that looks valid): `vf` /
+        `af` cut and normalise it, then the video is held / cut to exactly
+        `frames` and the audio (silence for a mute source) padded / cut to match."""
+        dur = frames / fps
+        fo = max(0.0, dur - _SEGMENT_FADE_S)
+        graph = (
+            f"[0:v]{vf},tpad=stop_mode=clone:stop={frames},"
+            f"trim=end_frame={frames},setpts=PTS-STARTPTS[v];"
+            + (f"[0:a]{af}," if af is not None
+               else "anullsrc=channel_layout=stereo:sample_rate=44100,")
+            + f"aformat=sample_fmts=fltp:channel_layouts=stereo,apad,atrim=0:{dur:.6f},"
+            f"asetpts=PTS-STARTPTS,afade=t=in:st=0:d={_SEGMENT_FADE_S},"
+            f"afade=t=out:st={fo:.6f}:d={_SEGMENT_FADE_S}[a]"
+        )
+        part = seg.with_name(seg.name + ".part")
+        cmd = [
+            ffmpeg, "-y", "-i", str(src),
+            "-filter_complex", graph,
+            "-map", "[v]", "-map", "[a]",
+            "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p", "-r", str(fps),
+            "-c:a", "aac", "-b:a", "128k", "-ar", "44100", "-ac", "2",
+            "-f", "mp4", "-loglevel", "error", str(part),
+        ]
+        try:
+            completed = run_ffmpeg(cmd, timeout=_EPISODE_FFMPEG_TIMEOUT_S, duration_s=dur)
+        except subprocess.TimeoutExpired as exc:
+            part.unlink(missing_ok=True)
+            raise EpisodeConcatFailedError("ffmpeg_timeout") from exc
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+        if completed.returncode != 0 or not part.is_file():
+            part.unlink(missing_ok=True)
+            err = completed.stderr.decode("utf-8", errors="replace").strip()[:400]
+            raise EpisodeConcatFailedError(err or "ffmpeg_failed")
+        part.replace(seg)
+
+    @staticmethod
+    def _copy_concat(ffmpeg: str, segs: list[Path], out_path: Path) -> None:
+        """Stream-copy the uniform segments into `out_path` (concat demuxer — no
+        re-encode, so the stitch costs one disk pass)."""
+        listing = out_path.with_name(out_path.name + ".concat.txt")
+        listing.write_text(
+            "".join(
+                "file '" + s.as_posix().replace("'", "'\\''") + "'\n" for s in segs
+            ),
+            encoding="utf-8",
+        )
+        try:
+            completed = run_ffmpeg(
+                [ffmpeg, "-y", "-f", "concat", "-safe", "0", "-i", str(listing),
+                 "-c", "copy", "-movflags", "+faststart", "-loglevel", "error",
+                 str(out_path)],
+                timeout=_EPISODE_FFMPEG_TIMEOUT_S,
+            )
+        except subprocess.TimeoutExpired as exc:
+            raise EpisodeConcatFailedError("ffmpeg_timeout") from exc
+        finally:
+            listing.unlink(missing_ok=True)
+        if completed.returncode != 0 or not out_path.is_file():
+            err = completed.stderr.decode("utf-8", errors="replace").strip()[:400]
+            raise EpisodeConcatFailedError(err or "ffmpeg_failed")
+
+    @staticmethod
+    def _prune_segments(cache: Path, keep: list[Path]) -> None:
+        """Drop cached segments this build no longer references (superseded takes,
+        old trims) so the cache holds one version per shot. Best-effort."""
+        live = {p.name for p in keep}
+        for p in cache.glob(f"*{_MP4_EXT}"):
+            if p.name not in live:
+                try:
+                    p.unlink()
+                except OSError:
+                    pass
+
+    def _probe_duration(self, ffmpeg: str, src: Path) -> float:
         """The VIDEO-STREAM duration in seconds — NOT the container Duration,
         which can be the longer audio track. xfade operates on the video
         timeline, so an over-long container value pushes the xfade offset past
         the real end of the accumulated video and drops everything after the
-        seam. `-map 0:v:0 -c copy -f null -` demuxes (no decode → fast) and the
-        final progress `time=` is the video stream's true length. 5.0 on failure.
+        seam. Served by the shared MediaProbeReader (one `-map 0:v:0 -c copy`
+        demux pass per file version, persisted). 5.0 on failure.
         """
-        try:
-            result = subprocess.run(
-                [ffmpeg, "-i", str(src), "-map", "0:v:0", "-c", "copy",
-                 "-f", "null", "-"],
-                capture_output=True, timeout=30, check=False,
-            )
-        except subprocess.TimeoutExpired:
-            return 5.0
-        err = result.stderr.decode("utf-8", errors="replace")
-        times = _PROGRESS_TIME_RE.findall(err)
-        if times:
-            h, m, s = times[-1]
-            return max(0.1, int(h) * 3600 + int(m) * 60 + float(s))
-        m2 = _CLIP_DURATION_RE.search(err)  # fallback: container Duration
-        if m2:
-            return max(
-                0.1, int(m2.group(1)) * 3600 + int(m2.group(2)) * 60 + float(m2.group(3))
-            )
-        return 5.0
+        dur = self._probe.probe(src, ffmpeg).duration
+        return max(0.1, dur) if dur else 5.0
 
     def _target_fps(self, ffmpeg: str, inputs: list[Path]) -> int:
         """The output framerate, matched to the source cadence: the median of the
@@ -911,23 +1211,9 @@ class EpisodeConcatBuilder:
         median = probed[len(probed) // 2]
         return self._snap_fps(median)
 
-    @staticmethod
-    def _probe_fps(ffmpeg: str, src: Path) -> float | None:
-        """The clip's nominal frame rate from `ffmpeg -i` stderr, or None."""
-        try:
-            result = subprocess.run(
-                [ffmpeg, "-i", str(src), "-hide_banner"],
-                capture_output=True, timeout=15, check=False,
-            )
-        except subprocess.TimeoutExpired:
-            return None
-        m = _FPS_RE.search(result.stderr.decode("utf-8", errors="replace"))
-        if not m:
-            return None
-        try:
-            return float(m.group(1))
-        except ValueError:
-            return None
+    def _probe_fps(self, ffmpeg: str, src: Path) -> float | None:
+        """The clip's nominal frame rate from the cached probe, or None."""
+        return self._probe.probe(src, ffmpeg).fps
 
     @staticmethod
     def _snap_fps(fps: float) -> int:
@@ -939,22 +1225,10 @@ class EpisodeConcatBuilder:
             return nearest
         return max(1, round(fps))
 
-    @staticmethod
-    def _probe_has_audio(ffmpeg: str, src: Path) -> bool:
-        """True iff `src` carries at least one Audio stream (probed via `ffmpeg -i`
-        stderr — imageio_ffmpeg bundles no ffprobe)."""
-        try:
-            result = subprocess.run(
-                [ffmpeg, "-i", str(src), "-hide_banner"],
-                capture_output=True, timeout=15, check=False,
-            )
-        except subprocess.TimeoutExpired:
-            return False
-        for line in result.stderr.decode("utf-8", errors="replace").splitlines():
-            stripped = line.strip()
-            if stripped.startswith("Stream #") and "Audio:" in stripped:
-                return True
-        return False
+    def _probe_has_audio(self, ffmpeg: str, src: Path) -> bool:
+        """True iff `src` carries at least one Audio stream (from the cached
+        probe's `ffmpeg -i` header — imageio_ffmpeg bundles no ffprobe)."""
+        return self._probe.probe(src, ffmpeg).has_audio
 
     def _rel(self, p: Path) -> str:
         try:
@@ -11,6 +11,9 @@ master `ep{NN}_zh.mp4` (preserved, never touched) → `ep{NN}_zh_bgm.mp4`
 Assignment is a surgical line replace in `bgm.md` (line-oriented timeline, not a
 markdown table — safe). The burn is one ffmpeg invocation with a filter graph
 built from the assigned cues; the video stream is stream-copied (`-c:v copy`).
+The mix is skipped when `ep{NN}_zh_bgm.mp4` is up to date (`BuildManifest`:
+same subtitled master, same `bgm.md`, same library mp3s, same ffmpeg) unless
+`force=True`.
 
 ffmpeg binary supplied by `imageio-ffmpeg` — no system install.
 """
@@ -25,7 +28,9 @@ from pathlib import Path
 
 import imageio_ffmpeg
 
+from libs.common.build_manifest import BuildManifest, build_key, ffmpeg_version
 from libs.common.exposed_tree import ExposedTree
+from libs.common.job_progress import run_ffmpeg
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.episode_bgm__error import (
     BgmCueNotFoundError,
@@ -45,6 +50,8 @@ from libs.domain.value_objects.episode_bgm__valueobject import (
     parse_cue_line,
     serialize_cue,
 )
+from libs.infrastructure.readers.bgm_reference__reader import BgmReferenceReader
+from libs.infrastructure.readers.media_probe__reader import MediaProbeReader
 from libs.infrastructure.writers.bgm__writer import BgmPool
 
 _EP_DIR_RE = re.compile(r"^ep\d+$", re.IGNORECASE)
@@ -58,6 +65,8 @@ _AUDIO_BITRATE: str = "192k"
 _FADE_SECONDS: float = 1.0
 # sidechaincompress duck params — mirror tools/mux_av.py defaults.
 _DUCK = {"threshold": 0.03, "ratio": 8.0, "attack": 40.0, "release": 400.0}
+# Bump when the mix graph / encoder settings change (build-manifest key).
+_MUX_RECIPE_VERSION: int = 1
 
 
 @dataclass(frozen=True)
@@ -90,6 +99,7 @@ class BurnEpisodeBgmResult:
     out_rel: str
     used: tuple[dict[str, object], ...]
     skipped: tuple[dict[str, object], ...]
+    up_to_date: bool = False   # existing mix reused, nothing encoded
 
     def to_payload(self) -> dict[str, object]:
         return {
@@ -97,16 +107,23 @@ class BurnEpisodeBgmResult:
             "out": self.out_rel,
             "used": list(self.used),
             "skipped": list(self.skipped),
+            "up_to_date": self.up_to_date,
         }
 
 
 class EpisodeBgmManager:
     def __init__(
-        self, exposed: ExposedTree, resolver: SafeResolver, bgm_pool: BgmPool
+        self, exposed: ExposedTree, resolver: SafeResolver, bgm_pool: BgmPool,
+        probe: MediaProbeReader | None = None,
+        manifest: BuildManifest | None = None,
+        references: BgmReferenceReader | None = None,
     ) -> None:
         self._exposed = exposed
         self._resolver = resolver
         self._bgm_pool = bgm_pool
+        self._probe = probe or MediaProbeReader()
+        self._manifest = manifest or BuildManifest()
+        self._references = references or BgmReferenceReader(exposed, resolver)
 
     # ------------------------------------------------------------------ read
     def read(self, rel: str) -> EpisodeBgmReadResult:
@@ -177,9 +194,10 @@ class EpisodeBgmManager:
         if not matched:
             raise BgmCueNotFoundError(f"no cue at window {start}-{end}")
         self._atomic_write(cue_file, "\n".join(out) + "\n")
+        self._references.note_written(cue_file)
 
     # ------------------------------------------------------------------ burn
-    def burn(self, rel: str) -> BurnEpisodeBgmResult:
+    def burn(self, rel: str, force: bool = False) -> BurnEpisodeBgmResult:
         episode_dir, slug = self._validate_episode(rel)
         cue_file = episode_dir / BGM_CUE_DIR_NAME / BGM_CUE_FILE_NAME
         if not cue_file.is_file():
@@ -203,7 +221,14 @@ class EpisodeBgmManager:
             raise NoAssignedBgmCuesError("no assigned cue to mux")
 
         out_path = episode_dir / f"{slug}{_OUTPUT_SUFFIX}{_MP4_EXT}"
-        self._mux(source, resolved, out_path)
+        key = build_key(
+            [source, cue_file, *(mp3 for _cue, mp3 in resolved)],
+            {"op": "bgm_mux", "v": _MUX_RECIPE_VERSION, "ffmpeg": ffmpeg_version()},
+        )
+        fresh = not force and self._manifest.lookup(out_path, key) is not None
+        if not fresh:
+            self._mux(source, resolved, out_path)
+            self._manifest.record(out_path, key)
         return BurnEpisodeBgmResult(
             episode_rel=self._rel(episode_dir),
             out_rel=self._rel(out_path),
@@ -212,6 +237,7 @@ class EpisodeBgmManager:
                 for c, _ in resolved
             ),
             skipped=tuple(skipped),
+            up_to_date=fresh,
         )
 
     def _mux(
@@ -236,8 +262,9 @@ class EpisodeBgmManager:
             str(out_path),
         ])
         try:
-            completed = subprocess.run(
-                cmd, capture_output=True, timeout=_MUX_TIMEOUT_S, check=False
+            completed = run_ffmpeg(
+                cmd, timeout=_MUX_TIMEOUT_S,
+                duration_s=self._probe.probe(source, ffmpeg).duration,
             )
         except subprocess.TimeoutExpired as exc:
             raise EpisodeBgmMuxFailedError("ffmpeg_timeout") from exc
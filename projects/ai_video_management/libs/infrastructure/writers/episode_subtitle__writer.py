@@ -7,25 +7,25 @@ in the final reel, read from `ep{NN}.segments.json` (written by concat): a
 segment's cues are generated on a 0..dur_s axis (SubtitleBurner.segment_cues,
 re-timed to the segment's real post-trim length) then shifted by its start_s.
 
-Output `ep{NN}_{zh|en|zhen}.mp4` next to the episode markdown. ffmpeg binary
-from imageio-ffmpeg.
+Output `ep{NN}_{zh|en|zhen}.mp4` next to the episode markdown. `burn_whole_langs`
+writes several of them from one decode of the reel (`burn_ass_outputs`).
+A language whose output is up to date (`BuildManifest`: same reel, same
+segments.json, same per-shot subtitles.md / shot{NN}.md, same ffmpeg) is not
+re-burned unless `force=True`.
+ffmpeg binary from imageio-ffmpeg.
 """
 from __future__ import annotations
 
 import json
 import re
-import subprocess
-import tempfile
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Sequence
 
-import imageio_ffmpeg
-
+from libs.common.build_manifest import BuildManifest, build_key, ffmpeg_version
 from libs.common.exposed_tree import ExposedTree
 from libs.common.safe_resolve import SafeResolver
-from libs.domain.errors.frame__error import FfmpegMissingError
 from libs.domain.errors.subtitle__error import (
-    BurnFailedError,
     EmptySubtitlesError,
     EpisodeNotConcatenatedError,
     InvalidBatchScopeError,
@@ -38,7 +38,13 @@ from libs.domain.value_objects.subtitle__valueobject import (
     cues_to_ass,
     has_text_for,
 )
-from libs.infrastructure.writers.subtitle__writer import SubtitleBurner
+from libs.infrastructure.writers.subtitle__writer import (
+    BURN_RECIPE_VERSION,
+    SUBTITLE_FILE_NAME,
+    SubtitleBurner,
+    burn_ass_outputs,
+    normalize_langs,
+)
 
 _EP_DIR_RE = re.compile(r"^ep\d+$", re.IGNORECASE)
 _LANG_SUFFIX: dict[str, str] = {"zh": "zh", "en": "en", "both": "zhen"}
@@ -52,6 +58,7 @@ class EpisodeWholeBurnResult:
     lang: str
     cue_count: int
     shot_count: int
+    up_to_date: bool = False   # existing burn reused, nothing encoded
 
     def to_payload(self) -> dict[str, object]:
         return {
@@ -60,20 +67,32 @@ class EpisodeWholeBurnResult:
             "lang": self.lang,
             "cues": self.cue_count,
             "shots": self.shot_count,
+            "up_to_date": self.up_to_date,
         }
 
 
 class EpisodeSubtitleBurner:
     def __init__(
-        self, exposed: ExposedTree, resolver: SafeResolver, burner: SubtitleBurner
+        self, exposed: ExposedTree, resolver: SafeResolver, burner: SubtitleBurner,
+        manifest: BuildManifest | None = None,
     ) -> None:
         self._exposed = exposed
         self._resolver = resolver
         self._burner = burner
+        self._manifest = manifest or BuildManifest()
 
-    def burn_whole(self, rel: str, lang: str = "zh") -> EpisodeWholeBurnResult:
+    def burn_whole(
+        self, rel: str, lang: str = "zh", force: bool = False
+    ) -> EpisodeWholeBurnResult:
         if lang not in VALID_LANGS:
             raise InvalidSubtitleLangError(lang)
+        return self.burn_whole_langs(rel, (lang,), force)[0]
+
+    def burn_whole_langs(
+        self, rel: str, langs: Sequence[str], force: bool = False
+    ) -> tuple[EpisodeWholeBurnResult, ...]:
+        """One `ep{NN}_{lang}.mp4` per language, all from a single decode."""
+        langs = normalize_langs(langs)
         episode_dir, slug = self._episode_dir(rel)
         ep_mp4 = episode_dir / f"{slug}.mp4"
         if not ep_mp4.is_file():
@@ -83,16 +102,46 @@ class EpisodeSubtitleBurner:
             raise EpisodeNotConcatenatedError(self._rel(seg_json))
         segments = self._read_segments(seg_json)
         cue_tuple, shots_with_cues = self.assemble_cues(episode_dir / "shots", segments)
-        if not cue_tuple or not has_text_for(cue_tuple, lang):
+        if not cue_tuple or not all(has_text_for(cue_tuple, lang) for lang in langs):
             raise EmptySubtitlesError(self._rel(seg_json))
-        out_path = episode_dir / f"{slug}_{_LANG_SUFFIX[lang]}.mp4"
-        self._burn(ep_mp4, cue_tuple, lang, out_path)
-        return EpisodeWholeBurnResult(
-            episode_rel=self._rel(episode_dir),
-            out_rel=self._rel(out_path),
-            lang=lang,
-            cue_count=len(cue_tuple),
-            shot_count=shots_with_cues,
+        outs = [episode_dir / f"{slug}_{_LANG_SUFFIX[lang]}.mp4" for lang in langs]
+        shots_dir = episode_dir / "shots"
+        inputs = [ep_mp4, seg_json]
+        for seg in segments:
+            shot_dir = shots_dir / str(seg["shot"])
+            inputs += [shot_dir / SUBTITLE_FILE_NAME, shot_dir / f"{shot_dir.name}.md"]
+        keys = [
+            build_key(inputs, {
+                "op": "burn_whole", "lang": lang,
+                "v": BURN_RECIPE_VERSION, "ffmpeg": ffmpeg_version(),
+            })
+            for lang in langs
+        ]
+        fresh = [
+            not force and self._manifest.lookup(out, key) is not None
+            for out, key in zip(outs, keys)
+        ]
+        stale = [i for i, ok in enumerate(fresh) if not ok]
+        if stale:
+            reel_s = max(float(s["start_s"]) + float(s["dur_s"]) for s in segments)
+            burn_ass_outputs(
+                ep_mp4,
+                [(cues_to_ass(cue_tuple, langs[i]), outs[i]) for i in stale],
+                timeout=_FFMPEG_TIMEOUT_S,
+                duration_s=reel_s,
+            )
+            for i in stale:
+                self._manifest.record(outs[i], keys[i])
+        return tuple(
+            EpisodeWholeBurnResult(
+                episode_rel=self._rel(episode_dir),
+                out_rel=self._rel(out),
+                lang=lang,
+                cue_count=len(cue_tuple),
+                shot_count=shots_with_cues,
+                up_to_date=ok,
+            )
+            for lang, out, ok in zip(langs, outs, fresh)
         )
 
     def assemble_cues(
@@ -118,32 +167,6 @@ class EpisodeSubtitleBurner:
             )
         return tuple(cues), shots_with_cues
 
-    def _burn(
-        self, src: Path, cues: tuple[SubtitleCue, ...], lang: str, out_path: Path
-    ) -> None:
-        try:
-            ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
-        except Exception as exc:  # imageio_ffmpeg raises various on failure
-            raise FfmpegMissingError(str(exc)) from exc
-        with tempfile.TemporaryDirectory() as tmp:
-            (Path(tmp) / "sub.ass").write_text(cues_to_ass(cues, lang), encoding="utf-8")
-            cmd = [
-                ffmpeg, "-y", "-i", str(src),
-                "-vf", "subtitles=sub.ass",  # bare name; cwd=tmp avoids Win path escaping
-                "-c:a", "copy", "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
-                "-loglevel", "error", str(out_path),
-            ]
-            try:
-                completed = subprocess.run(
-                    cmd, cwd=tmp, capture_output=True,
-                    timeout=_FFMPEG_TIMEOUT_S, check=False,
-                )
-            except subprocess.TimeoutExpired as exc:
-                raise BurnFailedError("ffmpeg_timeout") from exc
-        if completed.returncode != 0 or not out_path.is_file():
-            err = completed.stderr.decode("utf-8", errors="replace").strip()[:300]
-            raise BurnFailedError(err or "ffmpeg_failed")
-
     @staticmethod
     def _read_segments(seg_json: Path) -> list[dict]:
         try:
@@ -3,22 +3,29 @@
 
 `renders/` keeps every raw take untouched; `shot{NN}.mp4` is the chosen one the
 episode concat then stitches (`EpisodeConcatBuilder._select_clip` prefers it).
-Re-running re-copies the current newest (overwrites). Shots with no render are
+Re-running re-locks the current newest (replaces). Shots with no render are
 skipped (reported), not fatal — unless NO shot has one.
 
 Selection reuses the shared `newest_render` (the SAME "newest take wins" rule
 episode concat + batch subtitle use), so the locked take never drifts from what
-those would have picked. A plain `shutil.copy2` (not symlink) per the decision —
-robust + cross-platform, renders/ left intact.
+those would have picked. A real file (not symlink) per the decision — robust +
+cross-platform, renders/ left intact — placed by `fast_copy.place_copy`: a
+reflink where the volume allows (instant, no second copy of the take), else
+`shutil.copy2`. Never a hardlink: `shot{NN}.mp4` is a working file (the intro
+card burn, hand edits) and a shared inode would carry any in-place rewrite back
+into the raw take under renders/. A shot whose
+`shot{NN}.mp4` is already its current newest take (`BuildManifest`, or same
+inode / size + mtime) is not re-copied unless `force=True`.
 """
 from __future__ import annotations
 
 import re
-import shutil
 from dataclasses import dataclass
 from pathlib import Path
 
+from libs.common.build_manifest import BuildManifest, build_key
 from libs.common.exposed_tree import ExposedTree
+from libs.common.fast_copy import CopyMode, place_copy
 from libs.common.render_select import newest_render
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.episode__error import (
@@ -39,6 +46,7 @@ class TakeSelection:
     shot: str
     src_rel: str   # the newest renders/ take that was copied
     out_rel: str   # the locked shot{NN}.mp4
+    up_to_date: bool = False   # already locked to this take; not re-copied
 
 
 @dataclass(frozen=True)
@@ -57,7 +65,8 @@ class SelectTakesResult:
         return {
             "episode": self.episode_rel,
             "selected": [
-                {"shot": s.shot, "src": s.src_rel, "out": s.out_rel}
+                {"shot": s.shot, "src": s.src_rel, "out": s.out_rel,
+                 "up_to_date": s.up_to_date}
                 for s in self.selected
             ],
             "skipped": [{"shot": s.shot, "reason": s.reason} for s in self.skipped],
@@ -65,11 +74,17 @@ class SelectTakesResult:
 
 
 class EpisodeTakesSelector:
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver,
+        manifest: BuildManifest | None = None,
+        copy_mode: CopyMode = "reflink",
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._manifest = manifest or BuildManifest()
+        self._copy_mode = copy_mode
 
-    def select(self, rel: str) -> SelectTakesResult:
+    def select(self, rel: str, force: bool = False) -> SelectTakesResult:
         episode_dir = self._validate_episode(rel)
         shots_dir = episode_dir / "shots"
         if not shots_dir.is_dir():
@@ -85,9 +100,14 @@ class EpisodeTakesSelector:
                 skipped.append(TakeSkip(shot_dir.name, "no_render_mp4"))
                 continue
             dst = shot_dir / f"{shot_dir.name}{_MP4_EXT}"
-            shutil.copy2(take, dst)
+            key = build_key([take], {"op": "select_take"})
+            fresh = not force and self._manifest.lookup(dst, key) is not None
+            if not fresh:
+                method = place_copy(take, dst, mode=self._copy_mode, overwrite=force)
+                fresh = method == "unchanged"
+                self._manifest.record(dst, key)
             selected.append(
-                TakeSelection(shot_dir.name, self._rel(take), self._rel(dst))
+                TakeSelection(shot_dir.name, self._rel(take), self._rel(dst), fresh)
             )
         if not selected:
             raise NoShotVideosError("no shot has a renders/ mp4 to select")
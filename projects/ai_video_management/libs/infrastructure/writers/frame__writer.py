@@ -25,6 +25,11 @@ On every extract, the `frames/` subfolder is swept of all `*.png` files
 and any `MediaRenamer`-mangled `frames{N}.png` residue from before
 follow-up 041 are cleaned up automatically.
 
+All 8 frames come out of ONE ffmpeg process (`grab_frames`): the source is
+decoded once and a `split` filter fans it out to one `trim` per timestamp,
+instead of 8 processes each seeking into the same mp4. The scene-plate and
+character-view extractors use the same helper.
+
 ffmpeg binary is supplied by the `imageio-ffmpeg` wheel — no system install.
 """
 from __future__ import annotations
@@ -52,8 +57,8 @@ VIDEO_EXTENSIONS: frozenset[str] = frozenset(
 )
 
 # (timestamp_seconds, role, shot_size, rank)
-# Order is by timestamp (sequential ffmpeg seek = fast); the rank field
-# is the upload-priority order, not the iteration order.
+# Order is by timestamp; the rank field is the upload-priority order, not the
+# iteration order.
 CANONICAL_FRAMES: tuple[tuple[float, str, str, int], ...] = (
     (0.5,  "hero",         "wide",      2),
     (2.5,  "side",         "wide",      6),
@@ -73,6 +78,43 @@ _SHOT_DIR_RE = re.compile(r"^shot\d+$", re.IGNORECASE)
 _LASTFRAME_TAIL_S: int = 3
 
 
+def grab_frames(
+    ffmpeg: str,
+    src: Path,
+    picks: list[tuple[float, Path]],
+    *,
+    timeout: float = _FFMPEG_TIMEOUT_S,
+) -> list[tuple[bool, str]]:
+    """Write the first frame at-or-after each `(timestamp, out_png)` pick, all
+    from a single decode of `src`. Returns one `(ok, error)` per pick, in order.
+
+    Same frame an `-ss t` input seek would give: timestamps are rebased to the
+    first frame, then each branch of the split keeps frames from `t` on and
+    closes after one — a closed branch no longer buffers, and decoding stops
+    once the last branch closed. Picks are judged per PNG — a timestamp past
+    the end fails alone while the others still land — so any stale target is
+    removed up front."""
+    if not picks:
+        return []
+    for _t, out in picks:
+        try:
+            out.unlink(missing_ok=True)
+        except OSError:
+            pass
+    n = len(picks)
+    graph = [f"[0:v]setpts=PTS-STARTPTS,split={n}" + "".join(f"[s{i}]" for i in range(n))]
+    graph += [f"[s{i}]trim=start={t},trim=end_frame=1[v{i}]" for i, (t, _out) in enumerate(picks)]
+    cmd = [ffmpeg, "-y", "-loglevel", "error", "-i", str(src), "-filter_complex", ";".join(graph)]
+    for i, (_t, out) in enumerate(picks):
+        cmd += ["-map", f"[v{i}]", "-frames:v", "1", "-q:v", "1", str(out)]
+    try:
+        completed = subprocess.run(cmd, capture_output=True, timeout=timeout, check=False)
+        err = completed.stderr.decode("utf-8", errors="replace").strip()[:200] or "ffmpeg_failed"
+    except subprocess.TimeoutExpired:
+        err = "ffmpeg_timeout"
+    return [(True, "") if out.is_file() else (False, err) for _t, out in picks]
+
+
 @dataclass(frozen=True)
 class FrameResult:
     timestamp: float
@@ -241,31 +283,18 @@ class FrameExtractor:
         self._sweep_pngs(out_dir)
         frames: list[FrameResult] = []
         failures: list[tuple[float, str, str]] = []
-        for t, role, shot_size, rank in CANONICAL_FRAMES:
-            out_path = out_dir / f"{prefix}_r{rank}_{role}_{shot_size}.png"
-            cmd = [
-                ffmpeg,
-                "-y",                  # overwrite output
-                "-ss", f"{t}",         # seek before -i for fast seek
-                "-i", str(src),
-                "-frames:v", "1",
-                "-q:v", "1",           # PNG: q is ignored but harmless
-                "-loglevel", "error",
-                str(out_path),
-            ]
-            try:
-                completed = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    timeout=_FFMPEG_TIMEOUT_S,
-                    check=False,
-                )
-            except subprocess.TimeoutExpired:
-                failures.append((t, role, "ffmpeg_timeout"))
-                continue
-            if completed.returncode != 0 or not out_path.is_file():
-                err = completed.stderr.decode("utf-8", errors="replace").strip()[:200]
-                failures.append((t, role, err or "ffmpeg_failed"))
+        out_paths = [
+            out_dir / f"{prefix}_r{rank}_{role}_{shot_size}.png"
+            for _t, role, shot_size, rank in CANONICAL_FRAMES
+        ]
+        grabbed = grab_frames(
+            ffmpeg, src, [(f[0], out) for f, out in zip(CANONICAL_FRAMES, out_paths)]
+        )
+        for (t, role, shot_size, rank), out_path, (ok, err) in zip(
+            CANONICAL_FRAMES, out_paths, grabbed
+        ):
+            if not ok:
+                failures.append((t, role, err))
                 continue
             frames.append(
                 FrameResult(
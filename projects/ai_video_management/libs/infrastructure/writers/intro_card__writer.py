@@ -5,7 +5,9 @@ from the global library `ai_videos/_intro_cards/`. The burn composites that PNG
 onto the shot's top corner (right/left) with a fade in/out over the MOVING
 footage — the video is not frozen, nothing is drawn programmatically. Output is
 the shot's finished video `shot{NN}.mp4` in the shot-folder ROOT (never under
-`renders/`, which keeps the originals); a re-burn overwrites it.
+`renders/`, which keeps the originals); a re-burn replaces it (encoded to a
+temp sibling, then `os.replace`d — never written through, so a copy sharing
+its inode keeps its bytes).
 
 Layout: a shot lives at `…/episodes/ep{NN}/shots/shot{NN}/`; the card spec is
 the episode-level `…/episodes/ep{NN}/intro_cards.md`. ffmpeg comes from the
@@ -13,10 +15,10 @@ the episode-level `…/episodes/ep{NN}/intro_cards.md`. ffmpeg comes from the
 """
 from __future__ import annotations
 
+import os
 import re
-import shutil
 import subprocess
-import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -41,6 +43,7 @@ from libs.domain.value_objects.intro_card__valueobject import (
     cards_for_shot,
     parse_intro_cards,
 )
+from libs.infrastructure.readers.media_probe__reader import MediaProbeReader
 
 VIDEO_EXTENSIONS: frozenset[str] = frozenset(
     {".mp4", ".mov", ".webm", ".mkv", ".avi", ".m4v"}
@@ -58,8 +61,6 @@ _MARGIN_FRAC: float = 0.035       # corner gap as a fraction of video width
 # then key near-black to transparent, so the card composites as a clean
 # transparent nameplate rather than a black box.
 _BLACK_KEY: str = "colorkey=0x000000:0.18:0.12"
-_STREAM_RE = re.compile(r"Stream #.*Video:.* (\d{2,5})x(\d{2,5})")
-_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
 _CROP_RE = re.compile(r"crop=(\d+:\d+:\d+:\d+)")
 
 
@@ -72,9 +73,13 @@ class IntroCardBurnResult:
 
 
 class IntroCardBurner:
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver,
+        probe: MediaProbeReader | None = None,
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._probe = probe or MediaProbeReader()
 
     def burn(self, rel: str) -> IntroCardBurnResult:
         src = self._validate_video_source(rel)
@@ -97,29 +102,29 @@ class IntroCardBurner:
         width, duration = self._probe_dims(ffmpeg, src)
         crops = [self._detect_crop(ffmpeg, img) for img in images]
         out_path = shot_folder / f"{shot_folder.name}.mp4"
-        with tempfile.TemporaryDirectory() as tmp:
-            cmd = [ffmpeg, "-y", "-i", str(src)]
-            for img in images:
-                # `-t` bounds the looped image to the clip so ffmpeg terminates.
-                cmd += ["-loop", "1", "-t", f"{duration:.3f}", "-i", str(img)]
-            cmd += ["-filter_complex", self._build_filter(cards, width, crops),
-                    "-map", "[v]", "-map", "0:a?", "-c:a", "copy",
-                    "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
-                    "-pix_fmt", "yuv420p", "-movflags", "+faststart",
-                    # looped image inputs are infinite — bound output to the video.
-                    "-shortest", "-loglevel", "error", "out.mp4"]
-            try:
-                completed = subprocess.run(
-                    cmd, cwd=tmp, capture_output=True,
-                    timeout=_FFMPEG_TIMEOUT_S, check=False,
-                )
-            except subprocess.TimeoutExpired as exc:
-                raise IntroCardBurnFailedError("ffmpeg_timeout") from exc
-            tmp_out = Path(tmp) / "out.mp4"
-            if completed.returncode != 0 or not tmp_out.is_file():
-                err = completed.stderr.decode("utf-8", errors="replace").strip()[:300]
-                raise IntroCardBurnFailedError(err or "ffmpeg_failed")
-            shutil.move(str(tmp_out), str(out_path))
+        part = out_path.with_name(f".{out_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+        cmd = [ffmpeg, "-y", "-i", str(src)]
+        for img in images:
+            # `-t` bounds the looped image to the clip so ffmpeg terminates.
+            cmd += ["-loop", "1", "-t", f"{duration:.3f}", "-i", str(img)]
+        cmd += ["-filter_complex", self._build_filter(cards, width, crops),
+                "-map", "[v]", "-map", "0:a?", "-c:a", "copy",
+                "-c:v", "libx264", "-preset", "veryfast", "-crf", "18",
+                "-pix_fmt", "yuv420p", "-movflags", "+faststart",
+                # looped image inputs are infinite — bound output to the video.
+                "-shortest", "-loglevel", "error", "-f", "mp4", str(part)]
+        try:
+            completed = subprocess.run(
+                cmd, capture_output=True, timeout=_FFMPEG_TIMEOUT_S, check=False,
+            )
+        except subprocess.TimeoutExpired as exc:
+            part.unlink(missing_ok=True)
+            raise IntroCardBurnFailedError("ffmpeg_timeout") from exc
+        if completed.returncode != 0 or not part.is_file():
+            part.unlink(missing_ok=True)
+            err = completed.stderr.decode("utf-8", errors="replace").strip()[:300]
+            raise IntroCardBurnFailedError(err or "ffmpeg_failed")
+        os.replace(part, out_path)
         return IntroCardBurnResult(
             src_rel=self._rel(src),
             out_rel=self._rel(out_path),
@@ -224,24 +229,12 @@ class IntroCardBurner:
         matches = _CROP_RE.findall(result.stderr.decode("utf-8", errors="replace"))
         return matches[-1] if matches else None
 
-    @staticmethod
-    def _probe_dims(ffmpeg: str, src: Path) -> tuple[int, float]:
-        """(video width px, duration seconds) — defaults 1080 / 10s on failure."""
-        try:
-            result = subprocess.run(
-                [ffmpeg, "-i", str(src), "-hide_banner"],
-                capture_output=True, timeout=15, check=False,
-            )
-        except subprocess.TimeoutExpired:
-            return 1080, 10.0
-        out = result.stderr.decode("utf-8", errors="replace")
-        wm = _STREAM_RE.search(out)
-        width = int(wm.group(1)) if wm else 1080
-        dm = _DURATION_RE.search(out)
-        if dm:
-            dur = int(dm.group(1)) * 3600 + int(dm.group(2)) * 60 + float(dm.group(3))
-        else:
-            dur = 10.0
+    def _probe_dims(self, ffmpeg: str, src: Path) -> tuple[int, float]:
+        """(video width px, container duration seconds) from the shared probe
+        cache — defaults 1080 / 10s on failure."""
+        info = self._probe.probe(src, ffmpeg)
+        width = info.width or 1080
+        dur = info.container_duration if info.container_duration else 10.0
         return width, max(0.1, dur)
 
     def _shot_folder(self, src: Path) -> Path:
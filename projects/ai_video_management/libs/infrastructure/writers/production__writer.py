@@ -4,10 +4,16 @@
 `episodes/ep{NN}` dirs (legacy root layout AND staged `…/5_6_…/episodes/`), and
 for each finds the burned subtitle masters `ep{NN}_{zh|en|zhen}.mp4`, copying
 each into `ai_videos/{drama}/production/{中文|英文|中英}/ep{NN}.mp4` — the language
-is implied by the sub-folder, so the suffix is stripped. `shutil.copy2`,
-overwrites, never a symlink; existing production files are left in place and only
-overwritten when re-exported. Nothing-to-export is a valid EMPTY result (not an
-error) — the user simply hasn't burned any episode subtitles yet.
+is implied by the sub-folder, so the suffix is stripped. Placed by
+`fast_copy.place_copy` — a reflink or hardlink where the volume allows (no
+second copy of every master), else `shutil.copy2`; replaces, never a symlink;
+existing production files are left in place and only replaced when re-exported.
+Masters are written temp + rename (`burn_ass_outputs`), so a re-burn never
+writes through a hardlinked production copy. Nothing-to-export is a valid EMPTY result (not an
+error) — the user simply hasn't burned any episode subtitles yet. A production
+copy that is still the copy of its current master (`BuildManifest`, or same
+inode / size + mtime) is reported
+`up_to_date` and not re-copied unless `force=True`.
 
 The drama-root resolution + episode tree-walk mirror
 `subtitle_batch__writer.SubtitleBatchBurner` (defined once there, copied here to
@@ -17,12 +23,13 @@ no `episodes/` dir so it is never re-walked.
 from __future__ import annotations
 
 import re
-import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from libs.common.build_manifest import BuildManifest, build_key
 from libs.common.exposed_tree import ExposedTree
+from libs.common.fast_copy import CopyMode, place_copy
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.subtitle__error import InvalidBatchScopeError
 
@@ -40,6 +47,7 @@ class ExportedEpisode:
     episode: str    # ep01
     src_rel: str
     out_rel: str
+    up_to_date: bool = False   # production copy already current; not re-copied
 
     def to_payload(self) -> dict[str, Any]:
         return {
@@ -48,6 +56,7 @@ class ExportedEpisode:
             "episode": self.episode,
             "src": self.src_rel,
             "out": self.out_rel,
+            "up_to_date": self.up_to_date,
         }
 
 
@@ -73,11 +82,17 @@ class ExportProductionResult:
 
 
 class ProductionExporter:
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver,
+        manifest: BuildManifest | None = None,
+        copy_mode: CopyMode = "auto",
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._manifest = manifest or BuildManifest()
+        self._copy_mode = copy_mode
 
-    def export(self, rel: str) -> ExportProductionResult:
+    def export(self, rel: str, force: bool = False) -> ExportProductionResult:
         drama_root = self._drama_root(rel)
         production_root = drama_root / _PRODUCTION_DIR_NAME
         exported: list[ExportedEpisode] = []
@@ -90,10 +105,15 @@ class ProductionExporter:
                 dst_dir = production_root / folder
                 dst_dir.mkdir(parents=True, exist_ok=True)
                 dst = dst_dir / f"{slug}.mp4"
-                shutil.copy2(src, dst)
-                exported.append(
-                    ExportedEpisode(suffix, folder, slug, self._rel(src), self._rel(dst))
-                )
+                key = build_key([src], {"op": "export_production"})
+                fresh = not force and self._manifest.lookup(dst, key) is not None
+                if not fresh:
+                    method = place_copy(src, dst, mode=self._copy_mode, overwrite=force)
+                    fresh = method == "unchanged"
+                    self._manifest.record(dst, key)
+                exported.append(ExportedEpisode(
+                    suffix, folder, slug, self._rel(src), self._rel(dst), fresh
+                ))
         return ExportProductionResult(
             self._rel(drama_root), self._rel(production_root), tuple(exported)
         )
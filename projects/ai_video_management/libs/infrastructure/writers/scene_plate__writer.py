@@ -17,12 +17,13 @@ two halves of one contract: if the video's per-second orientation changes, this
 map must change with it (and vice-versa), else the grabbed frame won't be
 on-direction.
 
+Every plate of a scene comes out of one decode of the video (`grab_frames`).
+
 ffmpeg binary is supplied by the `imageio-ffmpeg` wheel — no system install.
 """
 from __future__ import annotations
 
 import re
-import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -37,7 +38,7 @@ from libs.domain.errors.frame__error import (
     NotVideoError,
     VideoNotFoundError,
 )
-from libs.infrastructure.writers.frame__writer import VIDEO_EXTENSIONS
+from libs.infrastructure.writers.frame__writer import VIDEO_EXTENSIONS, grab_frames
 
 # Direction → (matching tokens, dwell-midpoint seconds). A bg folder is routed
 # to a direction if its name contains any of that direction's tokens. Order is
@@ -51,7 +52,6 @@ DIRECTION_TIMEPOINTS: tuple[tuple[str, tuple[str, ...], float], ...] = (
 )
 
 _BG_DIR_RE = re.compile(r"^bg\d+_")
-_FFMPEG_TIMEOUT_S: int = 30
 
 # A full plate-folder token inside the scene md index table, e.g.
 # `bg1_朝北_高座主位`. Requires at least one `_{描述}` segment after the number
@@ -130,6 +130,7 @@ class ScenePlateExtractor:
         plates: list[PlateResult] = []
         skipped: list[str] = []
         failures: list[tuple[str, str]] = []
+        picks: list[tuple[str, str, float, Path]] = []  # (folder, direction, t, png)
         for d in bg_dirs:
             routed = self._route_direction(d.name)
             table_t = scene_timepoints.get(d.name)
@@ -147,29 +148,14 @@ class ScenePlateExtractor:
             else:
                 skipped.append(d.name)
                 continue
-            out_path = d / f"{d.name}.png"
-            cmd = [
-                ffmpeg, "-y",
-                "-ss", f"{t}",
-                "-i", str(src),
-                "-frames:v", "1",
-                "-q:v", "1",
-                "-loglevel", "error",
-                str(out_path),
-            ]
-            try:
-                completed = subprocess.run(
-                    cmd, capture_output=True, timeout=_FFMPEG_TIMEOUT_S, check=False,
-                )
-            except subprocess.TimeoutExpired:
-                failures.append((d.name, "ffmpeg_timeout"))
-                continue
-            if completed.returncode != 0 or not out_path.is_file():
-                err = completed.stderr.decode("utf-8", errors="replace").strip()[:200]
-                failures.append((d.name, err or "ffmpeg_failed"))
+            picks.append((d.name, direction, t, d / f"{d.name}.png"))
+        grabbed = grab_frames(ffmpeg, src, [(t, out) for _f, _d, t, out in picks])
+        for (folder, direction, t, out_path), (ok, err) in zip(picks, grabbed):
+            if not ok:
+                failures.append((folder, err))
                 continue
             plates.append(PlateResult(
-                folder=d.name, direction=direction, timestamp=t, out_rel=self._rel(out_path),
+                folder=folder, direction=direction, timestamp=t, out_rel=self._rel(out_path),
             ))
         if not plates:
             joined = "; ".join(f"{f}: {e}" for (f, e) in failures) or "no plates produced"
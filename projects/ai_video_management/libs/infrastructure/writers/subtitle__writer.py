@@ -13,6 +13,15 @@ its bilingual cues, renders an ASS script in the requested language mode
 imported take can be burned; the language master name is fixed so a re-burn
 overwrites it, and episode concat selects masters by language.
 
+`burn_langs(rel, langs)` writes several language masters (e.g. zh + en +
+zhen) from ONE ffmpeg process: the source is decoded once and `split` into one
+`subtitles=` filter + libx264 encode per language (`burn_ass_outputs`), instead
+of one full decode + process per language.
+
+Burns are skipped when the master is up to date (`BuildManifest`): same render,
+same `subtitles.md`, same language, same ffmpeg → the existing file is reported
+with `up_to_date=True`. `force=True` re-burns regardless.
+
 `scaffold(rel)` writes a starter bilingual `subtitles.md` from the shot's
 `shot{NN}.md`. Each spoken `台词:` line is segmented into short phrases (split
 on Chinese/Latin punctuation, long punctuation-free runs hard-capped) and the
@@ -26,15 +35,20 @@ ffmpeg binary is supplied by the `imageio-ffmpeg` wheel — no system install.
 """
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Sequence
 
 import imageio_ffmpeg
 
+from libs.common.build_manifest import BuildManifest, build_key, ffmpeg_version
 from libs.common.exposed_tree import ExposedTree
+from libs.common.job_progress import run_ffmpeg
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.frame__error import (
     FfmpegMissingError,
@@ -66,6 +80,9 @@ RENDERS_DIR_NAME: str = "renders"
 _SHOT_DIR_RE = re.compile(r"^shot\d+$", re.IGNORECASE)
 SUBTITLE_FILE_NAME: str = "subtitles.md"
 _FFMPEG_TIMEOUT_S: int = 300
+# Bump when the burn recipe (ASS styling, encoder settings) changes, so every
+# master recorded by the build manifest is rebuilt once.
+BURN_RECIPE_VERSION: int = 1
 
 _QUOTE_RE = re.compile(r"[\"“]([^\"”]+)[\"”]")
 _DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)")
@@ -78,6 +95,86 @@ _PHRASE_SPLIT_RE = re.compile(r"[，。！？；：、,.!?;:…—\-\s]+")
 _MAX_PHRASE_CHARS: int = 18
 
 
+def normalize_langs(langs: Sequence[str]) -> tuple[str, ...]:
+    """Validated, de-duplicated burn languages in request order."""
+    out = tuple(dict.fromkeys(langs))
+    if not out:
+        raise InvalidSubtitleLangError("")
+    for lang in out:
+        if lang not in VALID_LANGS:
+            raise InvalidSubtitleLangError(lang)
+    return out
+
+
+def burn_ass_outputs(
+    src: Path,
+    tracks: Sequence[tuple[str, Path]],
+    *,
+    timeout: float,
+    duration_s: float | None = None,
+    threads: int | None = None,
+) -> None:
+    """Burn each (ASS script, output path) track onto `src` in ONE ffmpeg run:
+    decode once, `split` the video into a `subtitles=` filter per track, and
+    encode every output with the same x264 settings (audio stream-copied).
+    `threads` caps each encoder (batch burns running several ffmpegs at once);
+    None lets x264 use every core. Each output is encoded to a temp sibling and
+    renamed over its path only once ffmpeg succeeds, so an existing master —
+    possibly hardlinked into `production/` (`fast_copy`) — is replaced, never
+    rewritten in place. Raises FfmpegMissingError / BurnFailedError."""
+    try:
+        ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception as exc:  # imageio_ffmpeg raises various on failure
+        raise FfmpegMissingError(str(exc)) from exc
+    n = len(tracks)
+    parts = [out.with_name(f".{out.name}.{os.getpid()}.{threading.get_ident()}.part") for _ass, out in tracks]
+    with tempfile.TemporaryDirectory() as tmp:
+        # bare script names; cwd=tmp avoids Win path escaping in the filter
+        for i, (ass, _out) in enumerate(tracks):
+            (Path(tmp) / f"sub{i}.ass").write_text(ass, encoding="utf-8")
+        if n == 1:
+            graph = "[0:v]subtitles=sub0.ass[o0]"
+        else:
+            graph = ";".join(
+                [f"[0:v]split={n}" + "".join(f"[v{i}]" for i in range(n))]
+                + [f"[v{i}]subtitles=sub{i}.ass[o{i}]" for i in range(n)]
+            )
+        cmd = [ffmpeg, "-y", "-loglevel", "error"]
+        if threads is not None:
+            cmd += ["-filter_threads", str(threads)]
+        cmd += ["-i", str(src), "-filter_complex", graph]
+        for i, part in enumerate(parts):
+            if threads is not None:
+                cmd += ["-threads", str(threads)]
+            cmd += [
+                "-map", f"[o{i}]", "-map", "0:a:0?",  # ONE audio track, like -vf's default selection
+                "-c:a", "copy",
+                "-c:v", "libx264",
+                "-preset", "veryfast",
+                "-crf", "18",
+                "-f", "mp4", str(part),
+            ]
+        try:
+            completed = run_ffmpeg(cmd, cwd=tmp, timeout=timeout * n, duration_s=duration_s)
+        except subprocess.TimeoutExpired as exc:
+            _discard(parts)
+            raise BurnFailedError("ffmpeg_timeout") from exc
+    if completed.returncode != 0 or not all(part.is_file() for part in parts):
+        _discard(parts)
+        err = completed.stderr.decode("utf-8", errors="replace").strip()[:300]
+        raise BurnFailedError(err or "ffmpeg_failed")
+    for part, (_ass, out) in zip(parts, tracks):
+        os.replace(part, out)
+
+
+def _discard(paths: Sequence[Path]) -> None:
+    for p in paths:
+        try:
+            p.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
 def _split_phrases(text: str) -> list[str]:
     phrases: list[str] = []
     for seg in _PHRASE_SPLIT_RE.split(text):
@@ -103,6 +200,7 @@ class BurnResult:
     out_rel: str
     cue_count: int
     lang: str
+    up_to_date: bool = False   # existing master reused, nothing burned
 
 
 @dataclass(frozen=True)
@@ -113,64 +211,73 @@ class ScaffoldResult:
 
 
 class SubtitleBurner:
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver,
+        manifest: BuildManifest | None = None,
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        self._manifest = manifest or BuildManifest()
 
-    def burn(self, rel: str, lang: str = "zh") -> BurnResult:
+    def burn(
+        self, rel: str, lang: str = "zh", threads: int | None = None, force: bool = False
+    ) -> BurnResult:
         if lang not in VALID_LANGS:
             raise InvalidSubtitleLangError(lang)
+        return self.burn_langs(rel, (lang,), threads=threads, force=force)[0]
+
+    def burn_langs(
+        self, rel: str, langs: Sequence[str], threads: int | None = None,
+        force: bool = False,
+    ) -> tuple[BurnResult, ...]:
+        """Burn one master per language from a single decode of the render;
+        languages whose master is already up to date are not re-burned."""
+        langs = normalize_langs(langs)
         src = self._validate_video_source(rel)
         shot_folder = self._shot_folder(src)
         sub_md = shot_folder / SUBTITLE_FILE_NAME
         if not sub_md.is_file():
             raise SubtitleFileMissingError(self._rel(sub_md))
         cues = parse_subtitles(sub_md.read_text(encoding="utf-8"))
-        if not cues or not has_text_for(cues, lang):
+        if not cues or not all(has_text_for(cues, lang) for lang in langs):
             raise EmptySubtitlesError(self._rel(sub_md))
-        try:
-            ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
-        except Exception as exc:  # imageio_ffmpeg raises various on failure
-            raise FfmpegMissingError(str(exc)) from exc
         # Canonical per-shot, per-language master in the shot-folder ROOT
         # (not next to the chosen raw take): `shot{NN}_{zh|en|zhen}.mp4`. Any of
         # the shot's imported takes can be burned; the output name is stable, so
         # re-burning overwrites the same language master. Episode concat then
         # picks these by language.
-        out_path = shot_folder / f"{shot_folder.name}_{_LANG_SUFFIX[lang]}.mp4"
-        with tempfile.TemporaryDirectory() as tmp:
-            ass_path = Path(tmp) / "sub.ass"
-            ass_path.write_text(cues_to_ass(cues, lang), encoding="utf-8")
-            cmd = [
-                ffmpeg,
-                "-y",
-                "-i", str(src),
-                "-vf", "subtitles=sub.ass",  # bare name; cwd=tmp avoids Win path escaping
-                "-c:a", "copy",
-                "-c:v", "libx264",
-                "-preset", "veryfast",
-                "-crf", "18",
-                "-loglevel", "error",
-                str(out_path),
-            ]
-            try:
-                completed = subprocess.run(
-                    cmd,
-                    cwd=tmp,
-                    capture_output=True,
-                    timeout=_FFMPEG_TIMEOUT_S,
-                    check=False,
-                )
-            except subprocess.TimeoutExpired as exc:
-                raise BurnFailedError("ffmpeg_timeout") from exc
-        if completed.returncode != 0 or not out_path.is_file():
-            err = completed.stderr.decode("utf-8", errors="replace").strip()[:300]
-            raise BurnFailedError(err or "ffmpeg_failed")
-        return BurnResult(
-            src_rel=self._rel(src),
-            out_rel=self._rel(out_path),
-            cue_count=len(cues),
-            lang=lang,
+        outs = [shot_folder / f"{shot_folder.name}_{_LANG_SUFFIX[lang]}.mp4" for lang in langs]
+        keys = [self._burn_key(src, sub_md, lang) for lang in langs]
+        fresh = [
+            not force and self._manifest.lookup(out, key) is not None
+            for out, key in zip(outs, keys)
+        ]
+        stale = [i for i, ok in enumerate(fresh) if not ok]
+        if stale:
+            burn_ass_outputs(
+                src,
+                [(cues_to_ass(cues, langs[i]), outs[i]) for i in stale],
+                timeout=_FFMPEG_TIMEOUT_S,
+                threads=threads,
+            )
+            for i in stale:
+                self._manifest.record(outs[i], keys[i])
+        return tuple(
+            BurnResult(
+                src_rel=self._rel(src),
+                out_rel=self._rel(out),
+                cue_count=len(cues),
+                lang=lang,
+                up_to_date=ok,
+            )
+            for lang, out, ok in zip(langs, outs, fresh)
+        )
+
+    @staticmethod
+    def _burn_key(src: Path, sub_md: Path, lang: str) -> str:
+        return build_key(
+            [src, sub_md],
+            {"op": "burn", "lang": lang, "v": BURN_RECIPE_VERSION, "ffmpeg": ffmpeg_version()},
         )
 
     def scaffold(self, rel: str) -> ScaffoldResult:
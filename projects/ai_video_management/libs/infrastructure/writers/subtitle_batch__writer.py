@@ -9,6 +9,13 @@
   burned with its sibling `subtitles.md`. Shots lacking a render or a non-empty
   `subtitles.md` are skipped (reported), not failed.
 
+Burns run on `workers` concurrent ffmpegs (`parallel_steps`), each capped at
+`ffmpeg_threads` encoder threads; the default worker count is
+cores ÷ `ffmpeg_threads`, so the machine is filled without oversubscribing it.
+`workers=1` is the old strictly-serial walk. Outcomes keep the walk order.
+Shots whose master is already up to date (see `SubtitleBurner`) are reported
+`ok` + `up_to_date` without an encode unless `force=True`.
+
 This writer owns only the episode/drama tree-walk; the per-shot work delegates
 to `SubtitleBurner`, and newest-render selection to the shared
 `libs.common.render_select.newest_render` (the SAME helper episode concat uses,
@@ -20,11 +27,13 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from libs.common.exposed_tree import ExposedTree
+from libs.common.job_progress import default_workers, job_step, parallel_steps
 from libs.common.render_select import newest_render
 from libs.common.safe_resolve import SafeResolver
+from libs.domain.errors.job__error import JobCancelledError
 from libs.domain.errors.subtitle__error import (
     EmptySubtitlesError,
     InvalidBatchScopeError,
@@ -39,6 +48,8 @@ _EP_DIR_RE = re.compile(r"^ep\d+$", re.IGNORECASE)
 _SHOT_DIR_RE = re.compile(r"^shot\d+$", re.IGNORECASE)
 _EPISODES_DIR_NAME = "episodes"
 _SHOTS_DIR_NAME = "shots"
+# x264 threads per concurrent burn; the default pool is cores ÷ this.
+DEFAULT_FFMPEG_THREADS: int = 2
 
 
 @dataclass(frozen=True)
@@ -49,6 +60,7 @@ class BatchShotOutcome:
     out_rel: str | None   # subtitles.md path (scaffold) or burned mp4 (burn)
     cue_count: int | None
     reason: str | None    # skip / failure reason when not ok
+    up_to_date: bool = False  # burn: existing master reused, nothing encoded
 
     def to_payload(self) -> dict[str, Any]:
         return {
@@ -58,6 +70,7 @@ class BatchShotOutcome:
             "out": self.out_rel,
             "cues": self.cue_count,
             "reason": self.reason,
+            "up_to_date": self.up_to_date,
         }
 
 
@@ -103,11 +116,18 @@ class DramaBurnResult:
 
 class SubtitleBatchBurner:
     def __init__(
-        self, exposed: ExposedTree, resolver: SafeResolver, burner: SubtitleBurner
+        self,
+        exposed: ExposedTree,
+        resolver: SafeResolver,
+        burner: SubtitleBurner,
+        workers: int | None = None,
+        ffmpeg_threads: int = DEFAULT_FFMPEG_THREADS,
     ) -> None:
         self._exposed = exposed
         self._resolver = resolver
         self._burner = burner
+        self._ffmpeg_threads = max(1, ffmpeg_threads)
+        self._workers = workers if workers is not None else default_workers(self._ffmpeg_threads)
 
     def scaffold_episode(self, rel: str) -> EpisodeScaffoldResult:
         episode_dir = self._episode_dir(rel)
@@ -129,47 +149,90 @@ class SubtitleBatchBurner:
             )
         return EpisodeScaffoldResult(self._rel(episode_dir), tuple(outcomes))
 
-    def burn_episode(self, rel: str, lang: str = "zh") -> EpisodeBurnResult:
+    def burn_episode(
+        self, rel: str, lang: str = "zh", workers: int | None = None,
+        force: bool = False,
+    ) -> EpisodeBurnResult:
         if lang not in VALID_LANGS:
             raise InvalidSubtitleLangError(lang)
         episode_dir = self._episode_dir(rel)
         shot_dirs = self._shot_dirs(episode_dir / _SHOTS_DIR_NAME)
         if not shot_dirs:
             raise NoBatchShotsError("episode has no shot folders")
-        outcomes = [
-            self._burn_one(episode_dir.name, shot_dir, lang)
-            for shot_dir in shot_dirs
-        ]
+        outcomes = self._burn_all(
+            [(episode_dir, shot_dir) for shot_dir in shot_dirs], lang, workers, force,
+            stage=lambda unit: unit[1].name,
+        )
         return EpisodeBurnResult(self._rel(episode_dir), lang, tuple(outcomes))
 
-    def burn_drama(self, rel: str, lang: str = "zh") -> DramaBurnResult:
+    def burn_drama(
+        self, rel: str, lang: str = "zh", workers: int | None = None,
+        force: bool = False,
+    ) -> DramaBurnResult:
         if lang not in VALID_LANGS:
             raise InvalidSubtitleLangError(lang)
         drama_root = self._drama_root(rel)
         episode_dirs = self._episode_dirs(drama_root)
         if not episode_dirs:
             raise NoBatchShotsError("drama has no episodes with shots")
-        outcomes: list[BatchShotOutcome] = []
-        for episode_dir in episode_dirs:
-            for shot_dir in self._shot_dirs(episode_dir / _SHOTS_DIR_NAME):
-                outcomes.append(self._burn_one(episode_dir.name, shot_dir, lang))
-        if not outcomes:
+        work = [
+            (episode_dir, shot_dir)
+            for episode_dir in episode_dirs
+            for shot_dir in self._shot_dirs(episode_dir / _SHOTS_DIR_NAME)
+        ]
+        if not work:
             raise NoBatchShotsError("drama has no shot folders")
+        outcomes = self._burn_all(
+            work, lang, workers, force,
+            stage=lambda unit: f"{unit[0].name}/{unit[1].name}",
+        )
         return DramaBurnResult(self._rel(drama_root), lang, tuple(outcomes))
 
-    def _burn_one(self, ep_slug: str, shot_dir: Path, lang: str) -> BatchShotOutcome:
+    def _burn_all(
+        self,
+        work: list[tuple[Path, Path]],
+        lang: str,
+        workers: int | None,
+        force: bool,
+        stage: Callable[[tuple[Path, Path]], str],
+    ) -> list[BatchShotOutcome]:
+        """Burn every (episode_dir, shot_dir) unit; outcomes in `work` order."""
+        n = max(1, workers if workers is not None else self._workers)
+        if n == 1:
+            outcomes: list[BatchShotOutcome] = []
+            for i, unit in enumerate(work):
+                with job_step(i, len(work), stage(unit)):
+                    outcomes.append(self._burn_one(unit[0].name, unit[1], lang, None, force))
+            return outcomes
+        return parallel_steps(
+            work,
+            lambda unit: self._burn_one(
+                unit[0].name, unit[1], lang, self._ffmpeg_threads, force
+            ),
+            workers=n,
+            stage=stage,
+        )
+
+    def _burn_one(
+        self, ep_slug: str, shot_dir: Path, lang: str, threads: int | None,
+        force: bool = False,
+    ) -> BatchShotOutcome:
         render = newest_render(shot_dir)
         if render is None:
             return self._skip(ep_slug, shot_dir.name, "no_render_mp4")
         try:
-            r = self._burner.burn(self._rel(render), lang)
+            r = self._burner.burn(self._rel(render), lang, threads=threads, force=force)
         except SubtitleFileMissingError:
             return self._skip(ep_slug, shot_dir.name, "no_subtitles_md")
         except EmptySubtitlesError:
             return self._skip(ep_slug, shot_dir.name, "empty_subtitles")
+        except JobCancelledError:
+            raise
         except Exception as exc:
             return self._fail(ep_slug, shot_dir.name, _kind(exc))
-        return BatchShotOutcome(ep_slug, shot_dir.name, True, r.out_rel, r.cue_count, None)
+        return BatchShotOutcome(
+            ep_slug, shot_dir.name, True, r.out_rel, r.cue_count, None, r.up_to_date
+        )
 
     @staticmethod
     def _skip(ep: str, shot: str, reason: str) -> BatchShotOutcome:
@@ -31,6 +31,8 @@ from pathlib import Path
 import imageio_ffmpeg
 
 from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.library_catalog import LibraryCatalog
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.voice__error import (
     InvalidVoiceAttributeError,
@@ -121,12 +123,23 @@ def _find_audio_file(folder: Path) -> Path | None:
     return None
 
 
+def _voice_number(folder: Path) -> int | None:
+    m = _VOICE_DIR_RE.match(folder.name)
+    return int(m.group(1)) if m else None
+
+
 class VoicePool:
     """Implements `VoiceRepository`. Pure-local: no HTTP, no provider env vars."""
 
-    def __init__(self, exposed: ExposedTree, resolver: SafeResolver) -> None:
+    def __init__(
+        self, exposed: ExposedTree, resolver: SafeResolver, watcher: FsWatcher | None = None
+    ) -> None:
         self._exposed = exposed
         self._resolver = resolver
+        # Parsed sidecars + id numbers of `_voices/`, kept fresh by `watcher`.
+        self._catalog: LibraryCatalog[VoiceInfo] = LibraryCatalog(
+            self.voices_dir, number=_voice_number, load=self._load_voice, watcher=watcher
+        )
 
     # ------------------------------------------------------------------ paths
     def voices_dir(self) -> Path:
@@ -158,37 +171,28 @@ class VoicePool:
         return audio.name if audio is not None else None
 
     def list_voices(self) -> list[VoiceInfo]:
-        voices_dir = self.voices_dir()
-        if not voices_dir.is_dir():
-            return []
-        out: list[VoiceInfo] = []
-        for child in sorted(voices_dir.iterdir(), key=lambda p: p.name):
-            if not child.is_dir() or child.is_symlink():
-                continue
-            if not _VOICE_DIR_RE.match(child.name):
-                continue
-            voice_id = child.name
-            md_path = child / f"{voice_id}.md"
-            if not md_path.is_file():
-                continue
-            attrs = self._parse_sidecar(md_path)
-            if attrs is None:
-                continue
-            try:
-                mtime = md_path.stat().st_mtime
-            except OSError:
-                continue
-            audio = _find_audio_file(child)
-            out.append(
-                VoiceInfo(
-                    id=voice_id,
-                    attrs=attrs,
-                    sidecar_path=self._rel(md_path),
-                    audio_path=self._rel(audio) if audio is not None else None,
-                    mtime=mtime,
-                )
-            )
-        return out
+        return [info for _folder, info in self._catalog.entries()]
+
+    def _load_voice(self, folder: Path) -> VoiceInfo | None:
+        voice_id = folder.name
+        md_path = folder / f"{voice_id}.md"
+        if not md_path.is_file():
+            return None
+        attrs = self._parse_sidecar(md_path)
+        if attrs is None:
+            return None
+        try:
+            mtime = md_path.stat().st_mtime
+        except OSError:
+            return None
+        audio = _find_audio_file(folder)
+        return VoiceInfo(
+            id=voice_id,
+            attrs=attrs,
+            sidecar_path=self._rel(md_path),
+            audio_path=self._rel(audio) if audio is not None else None,
+            mtime=mtime,
+        )
 
     # ------------------------------------------------------------------ delete
     def delete_voice(self, voice_id: str) -> dict[str, str]:
@@ -489,7 +493,7 @@ class VoicePool:
     # ------------------------------------------------------------------ helpers
     def _allocate_voice_id(self, voices_dir: Path) -> tuple[str, Path]:
         """Race-safe id allocation via mkdir(exist_ok=False)."""
-        start = self._next_voice_id_num(voices_dir)
+        start = self._catalog.max_number() + 1
         candidate = start
         attempts = 0
         while attempts < _MAX_ID_ALLOC_SCAN:
@@ -508,24 +512,6 @@ class VoicePool:
             f"exhausted {_MAX_ID_ALLOC_SCAN} id-allocation attempts starting from voice_{start:04d}"
         )
 
-    @staticmethod
-    def _next_voice_id_num(voices_dir: Path) -> int:
-        max_num = 0
-        try:
-            entries = list(voices_dir.iterdir())
-        except OSError:
-            return 1
-        for entry in entries:
-            if not entry.is_dir():
-                continue
-            m = _VOICE_DIR_RE.match(entry.name)
-            if not m:
-                continue
-            n = int(m.group(1))
-            if n > max_num:
-                max_num = n
-        return max_num + 1
-
     @staticmethod
     def _reap_incomplete_folders(voices_dir: Path) -> None:
         """Drop voice_NNNN folders left behind by killed batches (no md sidecar)."""
@@ -0,0 +1,144 @@
+"""Skip-if-up-to-date build manifest (libs/common/build_manifest) + the writers
+that consult it.
+
+Contract:
+- an output is up to date only for the key it was recorded with AND while it
+  still has the size/mtime it had then; touching an input changes the key;
+- entries persist in `ai_videos/{drama}/.cache/build_manifest.json` and are
+  honoured by a fresh manifest instance; outputs outside a drama never are;
+- a batch of records writes the file once (on flush), and entries whose output
+  is gone are dropped when the manifest is next loaded;
+- a second burn / take lock with unchanged inputs does no work and says so
+  (`up_to_date`), `force=True` redoes it, and an edited input rebuilds.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import imageio_ffmpeg
+import pytest
+
+from libs.common.build_manifest import MANIFEST_FILE_NAME, BuildManifest, build_key
+from libs.common.exposed_tree import ExposedTree
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.writers.episode_takes__writer import EpisodeTakesSelector
+from libs.infrastructure.writers.subtitle__writer import SubtitleBurner
+
+
+def _bump(p: Path, seconds: int = 10) -> None:
+    later = p.stat().st_mtime + seconds
+    os.utime(p, (later, later))
+
+
+def test_lookup_tracks_inputs_output_and_persists(tmp_path: Path) -> None:
+    drama = tmp_path / "ai_videos" / "td"
+    drama.mkdir(parents=True)
+    src = drama / "in.txt"
+    src.write_text("a", encoding="utf-8")
+    out = drama / "out.txt"
+    out.write_text("built", encoding="utf-8")
+
+    manifest = BuildManifest()
+    key = build_key([src], {"lang": "zh"})
+    assert manifest.lookup(out, key) is None
+    manifest.record(out, key, {"n": 1})
+    assert manifest.lookup(out, key) == {"n": 1}
+    manifest.flush()
+    assert (drama / ".cache" / MANIFEST_FILE_NAME).is_file()
+    assert BuildManifest().lookup(out, key) == {"n": 1}
+
+    assert build_key([src], {"lang": "en"}) != key
+    _bump(src)
+    assert build_key([src], {"lang": "zh"}) != key
+
+    out.write_text("hand-edited", encoding="utf-8")
+    assert manifest.lookup(out, key) is None
+
+    loose = tmp_path / "loose.txt"
+    loose.write_text("x", encoding="utf-8")
+    manifest.record(loose, key)
+    assert manifest.lookup(loose, key) is None
+
+
+def test_batch_records_write_once_and_prune_on_load(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    drama = tmp_path / "ai_videos" / "td"
+    drama.mkdir(parents=True)
+    outs = [drama / f"out{i}.txt" for i in range(20)]
+    for out in outs:
+        out.write_text("built", encoding="utf-8")
+    writes: list[Path] = []
+    real_replace = os.replace
+
+    def counting_replace(src: str | Path, dst: str | Path) -> None:
+        writes.append(Path(dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", counting_replace)
+    manifest = BuildManifest()
+    for out in outs:
+        manifest.record(out, "k")
+    assert writes == []
+    manifest.flush()
+    manifest.flush()
+    assert writes == [drama / ".cache" / MANIFEST_FILE_NAME]
+
+    outs[0].unlink()
+    fresh = BuildManifest()
+    assert fresh.lookup(outs[1], "k") == {}
+    fresh.flush()
+    data = json.loads((drama / ".cache" / MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+    assert sorted(data["entries"]) == sorted(o.name for o in outs[1:])
+
+
+def _shot_with_render(root: Path) -> Path:
+    shot = root / "ai_videos" / "td" / "episodes" / "ep01" / "shots" / "shot01"
+    (shot / "renders").mkdir(parents=True)
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-f", "lavfi", "-i",
+         "testsrc=duration=1:size=160x120:rate=10", "-pix_fmt", "yuv420p",
+         "-loglevel", "error", str(shot / "renders" / "take.mp4")],
+        check=True, capture_output=True, timeout=60,
+    )
+    (shot / "subtitles.md").write_text("```text\n0-1 等着 || wait\n```\n", encoding="utf-8")
+    return shot
+
+
+def test_burn_skips_unchanged_and_rebuilds_on_edit_or_force(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    shot = _shot_with_render(root)
+    burner = SubtitleBurner(ExposedTree(root), SafeResolver(root))
+    rel = "ai_videos/td/episodes/ep01/shots/shot01/renders/take.mp4"
+    out = shot / "shot01_zh.mp4"
+
+    assert not burner.burn(rel, "zh").up_to_date
+    stamp = out.stat().st_mtime_ns
+    assert burner.burn(rel, "zh").up_to_date
+    assert out.stat().st_mtime_ns == stamp
+
+    # only the missing language is encoded
+    zh, en = burner.burn_langs(rel, ["zh", "en"])
+    assert zh.up_to_date and not en.up_to_date
+
+    assert not burner.burn(rel, "zh", force=True).up_to_date
+    _bump(shot / "subtitles.md")
+    assert not burner.burn(rel, "zh").up_to_date
+
+
+def test_take_lock_skips_unchanged_shots(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    shot = _shot_with_render(root)
+    selector = EpisodeTakesSelector(ExposedTree(root), SafeResolver(root))
+    rel = "ai_videos/td/episodes/ep01/shots/shot01/shot01.md"
+
+    assert not selector.select(rel).selected[0].up_to_date
+    assert selector.select(rel).selected[0].up_to_date
+    assert not selector.select(rel, force=True).selected[0].up_to_date
+
+    (shot / "shot01.mp4").unlink()
+    assert not selector.select(rel).selected[0].up_to_date
+    assert (shot / "shot01.mp4").is_file()
@@ -0,0 +1,55 @@
+"""`CharacterViewExtractor.extract_all`: every character folder of a drama, run
+on a bounded worker pool.
+
+Contract:
+- a concurrent run reports the same per-folder outcomes, in folder order, as
+  the strictly-serial walk (`workers=1`);
+- a folder without a turntable mp4 is `skipped`, the others land all 5 outputs.
+"""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import imageio_ffmpeg
+import pytest
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.writers.character_video__writer import CharacterViewExtractor
+
+
+def _turntable(dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y",
+         "-f", "lavfi", "-i", "testsrc=size=64x96:rate=24:duration=4",
+         "-f", "lavfi", "-i", "sine=frequency=440:duration=4",
+         "-pix_fmt", "yuv420p", "-c:v", "libx264", "-preset", "veryfast",
+         "-c:a", "aac", "-shortest", "-loglevel", "error", str(dst)],
+        capture_output=True, check=True,
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_extract_all_outcomes_in_folder_order(tmp_path: Path, workers: int) -> None:
+    chars = tmp_path / "ai_videos" / "d" / "characters"
+    _turntable(chars / "c1_甲" / "take.mp4")
+    (chars / "c2_乙").mkdir(parents=True)
+    _turntable(chars / "c3_丙" / "take.mp4")
+    _turntable(chars / "c10_丁" / "take.mp4")
+    extractor = CharacterViewExtractor(
+        ExposedTree(tmp_path), SafeResolver(tmp_path), workers=workers
+    )
+
+    result = extractor.extract_all("ai_videos/d/characters")
+
+    assert [(i.folder, i.status) for i in result.items] == [
+        ("c10_丁", "ok"), ("c1_甲", "ok"), ("c2_乙", "skipped"), ("c3_丙", "ok"),
+    ]
+    for item in result.items:
+        if item.result is None:
+            continue
+        assert item.result.failures == ()
+        assert [v.role for v in item.result.views] == ["front", "side", "back"]
+        assert len(list((chars / item.folder / "views").iterdir())) == 5
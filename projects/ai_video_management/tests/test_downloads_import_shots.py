@@ -327,3 +327,22 @@ def test_unrelated_file_is_not_imported(tmp_path: Path) -> None:
     # File left in place; never moved into the drama tree.
     assert (downloads / "totally_unrelated.png").is_file()
     assert not (root / "ai_videos" / "td" / "not_matched").exists()
+
+
+def test_routing_index_is_reused_and_rebuilt_on_new_shot(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    shots = root / "ai_videos" / "td" / "episodes" / "ep01" / "shots"
+    (shots / "shot01").mkdir(parents=True)
+    downloads = tmp_path / "Downloads"
+    downloads.mkdir()
+    importer = _make_importer(root, downloads)
+    drama_dir = (root / "ai_videos" / "td").resolve()
+
+    first = importer._routing_index(drama_dir)
+    assert importer._routing_index(drama_dir) is first  # unchanged tree → cached
+
+    (shots / "shot02").mkdir()
+    _touch(downloads / "01集02镜视.mp4")
+    result = importer.import_drama("ai_videos/td")
+    assert [e["kind"] for e in result.moved] == ["shot"]
+    assert (shots / "shot02" / "renders" / "01集02镜视.mp4").is_file()
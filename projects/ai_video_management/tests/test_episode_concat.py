@@ -14,6 +14,7 @@ The real ffmpeg concat is stubbed here — these assert the orchestration
 """
 from __future__ import annotations
 
+import json
 import os
 import subprocess
 from pathlib import Path
@@ -27,6 +28,7 @@ from libs.domain.errors.episode__error import (
     NoShotVideosError,
     NotEpisodePathError,
 )
+from libs.infrastructure.readers.media_probe__reader import MediaProbeReader
 from libs.infrastructure.writers.episode__writer import (
     _SEAM_MIN_EDGE_TRIM_S,
     EpisodeConcatBuilder,
@@ -493,3 +495,124 @@ def test_real_concat_preserves_length_when_audio_longer_than_video(tmp_path: Pat
     result = builder.build("ai_videos/td/episodes/ep01/shotlist.md")
     dur = builder._probe_duration(imageio_ffmpeg.get_ffmpeg_exe(), root / result.out_rel)
     assert dur > 2.0  # all three clips present, not truncated to the first
+
+
+# --- incremental build (per-shot segment cache + stream-copy concat) -----------
+
+def _voiced_clip(path: Path, dur: float, size: str = "320x240") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ff = imageio_ffmpeg.get_ffmpeg_exe()
+    subprocess.run(
+        [ff, "-y",
+         "-f", "lavfi", "-i", f"testsrc=duration={dur}:size={size}:rate=24",
+         "-f", "lavfi", "-i", f"sine=frequency=440:duration={dur}",
+         "-map", "0:v", "-map", "1:a", "-pix_fmt", "yuv420p", str(path)],
+        capture_output=True, check=True,
+    )
+
+
+_TOOLS_DIR = Path(__file__).resolve().parents[3] / "tools"
+
+
+def _incremental_episode(root: Path) -> Path:
+    ep = root / "ai_videos" / "td" / "episodes" / "ep01"
+    # plan builds load tools/seam_concat.py off the sandbox root
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "tools").symlink_to(_TOOLS_DIR)
+    _voiced_clip(ep / "shots" / "shot01" / "renders" / "a.mp4", 1.0)
+    _silent_clip(ep / "shots" / "shot02" / "renders" / "b.mp4", 1.0)
+    _voiced_clip(ep / "shots" / "shot03" / "renders" / "c.mp4", 1.0)
+    (ep / "shots" / "shot02" / "shot02.md").write_text(
+        "- **衔接**：承接 shot01 末帧\n", encoding="utf-8"
+    )
+    (ep / "shotlist.md").write_text("x", encoding="utf-8")
+    return ep
+
+
+def test_incremental_reencodes_only_the_changed_shot(tmp_path: Path) -> None:
+    """First incremental build encodes every shot; after one take is replaced the
+    rebuild reuses the other two cached segments and still yields a full reel whose
+    segments.json is exact (not approximate)."""
+    root = tmp_path / "repo"
+    ep = _incremental_episode(root)
+    builder = _bare(root)
+    rel = "ai_videos/td/episodes/ep01/shotlist.md"
+
+    first = builder.build(rel, incremental=True)
+    assert first.reused_segments == 0
+    cache = root / "ai_videos" / "td" / ".cache" / "episode_segments" / "episodes" / "ep01"
+    assert len(list(cache.glob("*.mp4"))) == 3
+
+    newer = ep / "shots" / "shot03" / "renders" / "d.mp4"
+    _voiced_clip(newer, 1.0, size="240x320")
+    later = newer.stat().st_mtime + 10
+    os.utime(newer, (later, later))
+    second = builder.build(rel, incremental=True)
+    assert second.reused_segments == 2
+    assert len(list(cache.glob("*.mp4"))) == 3  # superseded shot03 segment pruned
+
+    out = root / second.out_rel
+    dur = builder._probe_duration(imageio_ffmpeg.get_ffmpeg_exe(), out)
+    assert 2.2 < dur < 3.0  # 3×1s minus the 承接 trims on both sides of seam 1
+    assert builder._probe_has_audio(imageio_ffmpeg.get_ffmpeg_exe(), out)
+    seg = json.loads((root / second.segments_rel).read_text(encoding="utf-8"))
+    assert seg["approx"] is False
+    assert abs(seg["total_s"] - dur) < 0.15  # probe reads the last packet's pts
+
+
+def test_incremental_plan_change_invalidates_touched_shots(tmp_path: Path) -> None:
+    """A RIFE-free plan stitches from the cache; changing one seam's trim only
+    re-encodes the two shots that seam touches."""
+    root = tmp_path / "repo"
+    _incremental_episode(root)
+    builder = _bare(root)
+    rel = "ai_videos/td/episodes/ep01/shotlist.md"
+    plan = [
+        {"from": "shot01", "to": "shot02", "method": "trim", "trim": 0.1},
+        {"from": "shot02", "to": "shot03", "method": "butt"},
+    ]
+    assert builder.build(rel, plan=plan, incremental=True).reused_segments == 0
+    # unchanged inputs: skipped outright; a forced re-stitch reuses every segment
+    assert builder.build(rel, plan=plan, incremental=True).up_to_date
+    assert builder.build(rel, plan=plan, incremental=True, force=True).reused_segments == 3
+    plan[1] = {"from": "shot02", "to": "shot03", "method": "trim", "trim": 0.1}
+    result = builder.build(rel, plan=plan, incremental=True)
+    assert result.reused_segments == 1  # only shot01 untouched
+    tm = {u.shot: u.trimmed_s for u in result.used}
+    assert tm == {"shot01": 0.1, "shot02": 0.2, "shot03": 0.1}
+
+
+def _reel_streams(out: Path) -> tuple:
+    probes = MediaProbeReader(imageio_ffmpeg.get_ffmpeg_exe())
+    info = probes.probe(out)
+    return info.width, info.height, info.fps, info.has_audio, info.duration, probes.audio_duration(out)
+
+
+@pytest.mark.parametrize("plan", [
+    None,
+    [
+        {"from": "shot01", "to": "shot02", "method": "trim", "trim": 0.1},
+        {"from": "shot02", "to": "shot03", "method": "butt"},
+    ],
+])
+def test_incremental_output_matches_full_build(tmp_path: Path, plan: list[dict] | None) -> None:
+    """Cached segments are cut with the full build's own parameters: same size,
+    fps and audio, and the same length — audio outlasting a clip's video (a TTS
+    tail) is kept exactly as the full stitch keeps it, not cut at the video end."""
+    reels = {}
+    for incremental in (False, True):
+        root = tmp_path / f"repo_{incremental}"
+        ep = _incremental_episode(root)
+        for s, (vdur, adur) in zip(("shot01", "shot02", "shot03"), [(1.0, 1.4), (0.9, 1.5), (1.0, 1.2)]):
+            for old in (ep / "shots" / s / "renders").glob("*.mp4"):
+                old.unlink()
+            _clip_audio_longer(ep / "shots" / s / "renders" / "x.mp4", vdur, adur)
+        result = _bare(root).build(
+            "ai_videos/td/episodes/ep01/shotlist.md", plan=plan, incremental=incremental
+        )
+        reels[incremental] = _reel_streams(root / result.out_rel)
+
+    full, inc = reels[False], reels[True]
+    assert inc[:4] == full[:4]
+    assert abs(inc[4] - full[4]) < 0.1
+    assert abs(inc[5] - full[5]) < 0.1
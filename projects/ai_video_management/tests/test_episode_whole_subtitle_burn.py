@@ -97,6 +97,11 @@ def test_burn_whole_end_to_end_produces_ep_zh_mp4(tmp_path: Path) -> None:
     assert burned.name == "ep01_zh.mp4"
     assert burned.is_file() and burned.stat().st_size > 1000
 
+    # Several languages from one decode of the reel.
+    both = _burner(root).burn_whole_langs("ai_videos/td/episodes/ep01/shotlist.md", ["zh", "both"])
+    assert [Path(r.out_rel).name for r in both] == ["ep01_zh.mp4", "ep01_zhen.mp4"]
+    assert all((root / r.out_rel).stat().st_size > 1000 for r in both)
+
 
 def test_burn_whole_requires_concat_first(tmp_path: Path) -> None:
     root = tmp_path / "repo"
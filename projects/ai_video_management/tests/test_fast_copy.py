@@ -0,0 +1,88 @@
+"""Link-or-copy placement (libs/common/fast_copy) for locked takes + exports.
+
+Contract:
+- `auto` shares the source's bytes when the volume allows (reflink or
+  hardlink) and otherwise copies; `copy` always makes an independent file;
+- a destination already matching the source (same inode, or size + mtime) is
+  left alone unless `overwrite=True`;
+- placing over an existing destination replaces it — a hardlinked old copy's
+  other name keeps its bytes — and no temp sibling is left behind;
+- the production export of a master re-burned since is refreshed, and the
+  earlier export is not written through.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.fast_copy import place_copy
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.writers.production__writer import ProductionExporter
+
+
+def _leftovers(d: Path) -> list[str]:
+    return [p.name for p in d.iterdir() if p.name.endswith(".part")]
+
+
+def test_auto_shares_bytes_and_skips_unchanged(tmp_path: Path) -> None:
+    src = tmp_path / "take.mp4"
+    src.write_bytes(b"x" * 4096)
+    dst = tmp_path / "shot01.mp4"
+
+    method = place_copy(src, dst)
+    assert method in {"reflink", "hardlink", "copy"}
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+    if method == "hardlink":
+        assert os.path.samefile(src, dst)
+
+    assert place_copy(src, dst) == "unchanged"
+    assert place_copy(src, dst, overwrite=True) != "unchanged"
+    assert _leftovers(tmp_path) == []
+
+
+def test_copy_mode_is_independent_and_replace_never_writes_through(tmp_path: Path) -> None:
+    src = tmp_path / "a.mp4"
+    src.write_bytes(b"old")
+    linked = tmp_path / "linked.mp4"
+    try:
+        os.link(src, linked)
+    except OSError:
+        pytest.skip("volume has no hardlinks")
+
+    newer = tmp_path / "b.mp4"
+    newer.write_bytes(b"newer bytes")
+    assert place_copy(newer, linked, mode="copy") == "copy"
+    assert not os.path.samefile(newer, linked)
+    assert linked.read_bytes() == b"newer bytes"
+    assert src.read_bytes() == b"old"
+
+    with pytest.raises(ValueError):
+        place_copy(src, linked, mode="symlink")  # type: ignore[arg-type]
+
+
+def test_export_refreshes_after_reburn(tmp_path: Path) -> None:
+    ep = tmp_path / "ai_videos" / "td" / "episodes" / "ep01"
+    ep.mkdir(parents=True)
+    master = ep / "ep01_zh.mp4"
+    master.write_bytes(b"first burn")
+    exporter = ProductionExporter(ExposedTree(tmp_path), SafeResolver(tmp_path))
+
+    first = exporter.export("ai_videos/td").exported[0]
+    out = tmp_path / first.out_rel
+    assert out.read_bytes() == b"first burn"
+    assert exporter.export("ai_videos/td").exported[0].up_to_date
+
+    kept = tmp_path / "kept.mp4"
+    os.link(out, kept)  # an earlier export someone kept around
+    tmp = master.with_name(".ep01_zh.mp4.part")
+    tmp.write_bytes(b"second burn!")
+    os.replace(tmp, master)  # how burn_ass_outputs lands a re-burn
+
+    again = exporter.export("ai_videos/td").exported[0]
+    assert not again.up_to_date
+    assert out.read_bytes() == b"second burn!"
+    assert kept.read_bytes() == b"first burn"
@@ -0,0 +1,77 @@
+"""`grab_frames` (libs/infrastructure/writers/frame__writer): every requested
+timestamp of a video comes out of ONE ffmpeg decode.
+
+Contract:
+- each PNG is the very frame a per-timestamp `-ss t` grab yields;
+- a timestamp past the end fails alone, the others still land;
+- `FrameExtractor.extract` writes all 8 canonical frames with one ffmpeg launch.
+"""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import imageio_ffmpeg
+import pytest
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.writers.frame__writer import CANONICAL_FRAMES, FrameExtractor, grab_frames
+
+
+def _video(dst: Path) -> Path:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-f", "lavfi", "-i",
+         "testsrc=size=96x64:rate=24:duration=15", "-pix_fmt", "yuv420p",
+         "-c:v", "libx264", "-preset", "veryfast", "-loglevel", "error", str(dst)],
+        capture_output=True, check=True,
+    )
+    return dst
+
+
+def _pixels(png: Path) -> bytes:
+    return subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-i", str(png), "-f", "rawvideo", "-pix_fmt", "rgb24", "-"],
+        capture_output=True, check=True,
+    ).stdout
+
+
+def test_grabs_match_per_timestamp_seeks(tmp_path: Path) -> None:
+    ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    src = _video(tmp_path / "s.mp4")
+    times = [0.0, 2.5, 7.9, 7.9, 14.6, 20.0]
+    picks = [(t, tmp_path / f"g{i}.png") for i, t in enumerate(times)]
+    (tmp_path / "g5.png").write_bytes(b"stale")
+
+    result = grab_frames(ffmpeg, src, picks)
+
+    assert [ok for ok, _err in result] == [True] * 5 + [False]
+    assert not (tmp_path / "g5.png").exists()
+    for t, out in picks[:5]:
+        ref = tmp_path / f"ref_{t}.png"
+        subprocess.run(
+            [ffmpeg, "-y", "-ss", f"{t}", "-i", str(src), "-frames:v", "1",
+             "-loglevel", "error", str(ref)],
+            capture_output=True, check=True,
+        )
+        assert _pixels(out) == _pixels(ref)
+
+
+def test_extract_decodes_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    src = _video(tmp_path / "ai_videos" / "d" / "scenes" / "s1" / "walk.mp4")
+    launches: list[list[str]] = []
+    real_run = subprocess.run
+
+    def counting_run(cmd: list[str], *args: object, **kwargs: object) -> subprocess.CompletedProcess[bytes]:
+        launches.append(cmd)
+        return real_run(cmd, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(subprocess, "run", counting_run)
+    result = FrameExtractor(ExposedTree(tmp_path), SafeResolver(tmp_path)).extract(
+        "ai_videos/d/scenes/s1/walk.mp4"
+    )
+
+    assert len(launches) == 1
+    assert len(result.frames) == len(CANONICAL_FRAMES) and result.failures == ()
+    assert len(list((src.parent / "frames").glob("s1_r*.png"))) == len(CANONICAL_FRAMES)
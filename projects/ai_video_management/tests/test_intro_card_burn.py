@@ -7,6 +7,7 @@ output exists with the same duration (smooth overlay, no freeze).
 """
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 from pathlib import Path
@@ -25,6 +26,7 @@ from libs.domain.value_objects.intro_card__valueobject import (
     cards_for_shot,
     parse_intro_cards,
 )
+from libs.infrastructure.writers.episode_takes__writer import EpisodeTakesSelector
 from libs.infrastructure.writers.intro_card__writer import IntroCardBurner
 
 _CARDS = (
@@ -150,3 +152,26 @@ def test_burn_two_cards_one_shot(tmp_path: Path) -> None:
     result = _burner(root).burn(rel)
     assert result.card_count == 2 and result.names == ("裴昭", "沈婉")
     assert (mp4.parent.parent / "shot03.mp4").is_file()
+
+
+def test_burn_after_take_lock_leaves_the_raw_take_intact(tmp_path: Path) -> None:
+    """Locking a take places `shot{NN}.mp4` as an independent file (never a
+    hardlink), and the card burn replaces it — so the raw take under renders/
+    is byte-identical afterwards."""
+    root = tmp_path / "repo"
+    mp4, rel = _shot_render(root, "shot01")
+    original = mp4.read_bytes()
+    (root / "ai_videos/td/episodes/ep01/shotlist.md").write_text("x", encoding="utf-8")
+    EpisodeTakesSelector(ExposedTree(root), SafeResolver(root)).select(
+        "ai_videos/td/episodes/ep01/shotlist.md"
+    )
+    locked = mp4.parent.parent / "shot01.mp4"
+    assert not os.path.samefile(mp4, locked)
+    _make_card_png(root, "裴知秋")
+    _cards_md(root, "裴知秋 | shot01 | 0.2 | 裴知秋 | 右上 | 0.6 | 0.3")
+
+    _burner(root).burn("ai_videos/td/episodes/ep01/shots/shot01/shot01.mp4")
+
+    assert locked.read_bytes() != original
+    assert mp4.read_bytes() == original
+    assert [p.name for p in locked.parent.iterdir() if p.name.endswith(".part")] == []
@@ -0,0 +1,168 @@
+"""Background job queue — JobManager + the ffmpeg progress/cancel plumbing.
+
+Contract:
+- a job runs on the bounded pool; its return value's `to_payload()` becomes the
+  job `result`, a domain error becomes the same `{kind, …}` the sync route
+  answers;
+- under a job `run_ffmpeg` feeds `-progress` into a 0..1 fraction, `job_step`
+  maps each unit of a batch onto its slice of the bar;
+- `parallel_steps` keeps input order, fills the bar one unit per finished item
+  and re-raises the first failure;
+- cancel drops a queued job and kills a running ffmpeg (state `cancelled`);
+- `background: true` on a long route answers 202 {job}; `/api/jobs/{id}/events`
+  streams it to its terminal state.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import imageio_ffmpeg
+from fastapi.testclient import TestClient
+
+from apps.api.jobs import JobManager
+from libs.common.job_progress import (
+    job_step,
+    parallel_steps,
+    parse_progress_line,
+    run_ffmpeg,
+)
+from libs.common.origin import BoundOrigin
+from libs.common.repo_root import RepoRoot
+from tests.conftest import make_app, repo_root
+
+_FF = imageio_ffmpeg.get_ffmpeg_exe()
+_HDRS = {"Origin": "http://127.0.0.1:8766", "Host": "127.0.0.1:8766"}
+
+
+def _wait(jobs: JobManager, job_id: str, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        snap = jobs.get(job_id)
+        if snap["state"] in ("succeeded", "failed", "cancelled"):
+            return snap
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish: {jobs.get(job_id)}")
+
+
+class _Payload:
+    def to_payload(self) -> dict:
+        return {"ok": True}
+
+
+def test_result_and_error_are_recorded() -> None:
+    jobs = JobManager(max_workers=1)
+    jobs.bind_error_describer(lambda exc: {"kind": "boom", "message": str(exc)})
+    ok = jobs.submit("t", "a", _Payload)
+    bad = jobs.submit("t", "b", lambda: (_ for _ in ()).throw(ValueError("nope")))
+    assert _wait(jobs, ok["id"])["result"] == {"ok": True}
+    failed = _wait(jobs, bad["id"])
+    assert failed["state"] == "failed"
+    assert failed["error"] == {"kind": "boom", "message": "nope"}
+    assert [j["id"] for j in jobs.snapshots()] == [bad["id"], ok["id"]]
+
+
+def test_queued_job_cancels_without_running() -> None:
+    jobs = JobManager(max_workers=1)
+    gate = threading.Event()
+    ran: list[str] = []
+    blocker = jobs.submit("t", "a", gate.wait)
+    queued = jobs.submit("t", "b", lambda: ran.append("b"))
+    assert jobs.cancel(queued["id"])["state"] == "cancelled"
+    gate.set()
+    _wait(jobs, blocker["id"])
+    assert ran == []
+
+
+def test_ffmpeg_progress_and_steps(tmp_path: Path) -> None:
+    jobs = JobManager(max_workers=1)
+    seen: list[float] = []
+
+    def work() -> None:
+        for i in range(2):
+            with job_step(i, 2, f"part{i}"):
+                out = tmp_path / f"{i}.mp4"
+                done = run_ffmpeg(
+                    [_FF, "-y", "-f", "lavfi", "-i", "testsrc=size=64x64:rate=24:duration=2",
+                     "-c:v", "libx264", "-preset", "veryfast", "-loglevel", "error", str(out)],
+                    timeout=60, duration_s=2.0,
+                )
+                assert done.returncode == 0 and out.is_file()
+                seen.append(jobs.snapshots()[0]["progress"])
+
+    job = jobs.submit("t", "a", work)
+    snap = _wait(jobs, job["id"])
+    assert snap["state"] == "succeeded", snap
+    assert snap["stage"] == "part1"
+    # each encode fills exactly its half of the bar
+    assert seen == [0.5, 1.0]
+
+
+def test_parallel_steps_order_progress_and_error() -> None:
+    jobs = JobManager(max_workers=1)
+
+    def work() -> list[int]:
+        def slow_square(n: int) -> int:
+            time.sleep(0.01 * (5 - n))  # later items finish first
+            return n * n
+        return parallel_steps(list(range(5)), slow_square, workers=3, stage=str)
+
+    snap = _wait(jobs, jobs.submit("t", "a", work)["id"])
+    assert snap["state"] == "succeeded" and snap["progress"] == 1.0
+
+    def boom(n: int) -> int:
+        if n == 2:
+            raise ValueError("two")
+        return n
+
+    try:
+        parallel_steps(list(range(5)), boom, workers=2)
+    except ValueError as exc:
+        assert str(exc) == "two"
+    else:
+        raise AssertionError("expected ValueError")
+    assert parallel_steps([3, 1, 2], lambda n: -n, workers=2) == [-3, -1, -2]
+
+
+def test_cancel_kills_running_ffmpeg(tmp_path: Path) -> None:
+    jobs = JobManager(max_workers=1)
+    cmd = [_FF, "-y", "-re", "-f", "lavfi", "-i", "testsrc=size=64x64:rate=24:duration=60",
+           "-c:v", "libx264", "-preset", "veryfast", "-loglevel", "error",
+           str(tmp_path / "long.mp4")]
+    job = jobs.submit("t", "a", lambda: run_ffmpeg(cmd, timeout=120, duration_s=60.0))
+    deadline = time.monotonic() + 20
+    while jobs.get(job["id"])["progress"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert 0 < jobs.get(job["id"])["progress"] < 0.5
+    started = time.monotonic()
+    jobs.cancel(job["id"])
+    assert _wait(jobs, job["id"])["state"] == "cancelled"
+    assert time.monotonic() - started < 5
+
+
+def test_parse_progress_line() -> None:
+    assert parse_progress_line("out_time_us=1500000\n", 3.0) == 0.5
+    assert parse_progress_line("out_time_ms=3000000", 3.0) == 1.0
+    assert parse_progress_line("out_time_us=N/A", 3.0) is None
+    assert parse_progress_line("out_time_us=1000000", None) is None
+    assert parse_progress_line("progress=end", None) == 1.0
+
+
+def test_background_route_answers_202_and_streams_failure() -> None:
+    rr = RepoRoot(path=repo_root())
+    bound = BoundOrigin(host="127.0.0.1", port=8766)
+    client = TestClient(make_app(rr, bound, serve_static=False))
+    r = client.post(
+        "/api/burn-drama-subtitles",
+        json={"path": "not/a/drama", "lang": "zh", "background": True},
+        headers=_HDRS,
+    )
+    assert r.status_code == 202
+    job_id = r.json()["job"]["id"]
+    events = client.get(f"/api/jobs/{job_id}/events").text
+    assert events.startswith("event: job\n")
+    final = client.get(f"/api/jobs/{job_id}").json()
+    assert final["state"] == "failed"
+    assert final["error"]["kind"] == "invalid_batch_scope"
+    assert client.get("/api/jobs/nope").json()["detail"]["kind"] == "job_not_found"
@@ -0,0 +1,159 @@
+"""KlingProvider's shared task tracker (actor__writer).
+
+Contract:
+- N concurrent generate calls share ONE list poll per interval — outbound
+  poll traffic is O(1) per tick, not O(N);
+- each waiter gets its own task's image url; a failed task raises for that
+  waiter only;
+- the submits, the poller and the JWT ride one pooled client / token;
+- a 429 holds the shared rate limiter, pausing every caller for its backoff;
+- `ActorPool.generate_batch` renders all slots (face + body) concurrently and
+  still reports them in slot order.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+
+import httpx
+import pytest
+from PIL import Image
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.writers import actor__writer
+from libs.infrastructure.writers.actor__writer import (
+    ActorAttrs,
+    ActorPool,
+    KlingProvider,
+    _kling_call_with_retry,
+    _KlingRateLimiter,
+)
+
+_N = 6
+_READY_ON_POLL = 3
+
+
+def _provider(handler) -> KlingProvider:
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return KlingProvider("ak", "sk", poll_interval=0.02, max_wait=10, http_client=client)
+
+
+def test_concurrent_tasks_share_one_poll_per_tick() -> None:
+    lock = threading.Lock()
+    polls = 0
+    tokens: set[str] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal polls
+        with lock:
+            tokens.add(request.headers["authorization"])
+            if request.method == "POST":
+                prompt = json.loads(request.content)["prompt"]
+                return httpx.Response(200, json={"code": 0, "data": {"task_id": prompt}})
+            polls += 1
+            done = polls >= _READY_ON_POLL
+        tasks = []
+        for i in range(_N):
+            task: dict[str, object] = {"task_id": f"t{i}", "task_status": "processing"}
+            if done and i == 0:
+                task.update(task_status="failed", task_status_msg="nsfw")
+            elif done:
+                task.update(
+                    task_status="succeed",
+                    task_result={"images": [{"url": f"https://cdn.example/t{i}.png"}]},
+                )
+            tasks.append(task)
+        return httpx.Response(200, json={"code": 0, "data": tasks})
+
+    provider = _provider(handler)
+    results: dict[str, str] = {}
+    errors: dict[str, str] = {}
+
+    def one(i: int) -> None:
+        task_id = provider._submit(provider._client, provider._auth_token(), f"t{i}", i, 1, 1)
+        try:
+            results[task_id] = provider._tracker.wait(task_id, 10)
+        except RuntimeError as exc:
+            errors[task_id] = str(exc)
+
+    threads = [threading.Thread(target=one, args=(i,)) for i in range(_N)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(15)
+
+    assert results == {f"t{i}": f"https://cdn.example/t{i}.png" for i in range(1, _N)}
+    assert list(errors) == ["t0"] and "nsfw" in errors["t0"]
+    # one list call per tick for all six waiters (separate pollers: 6 × 3)
+    assert polls <= _READY_ON_POLL + 1
+    assert len(tokens) == 1
+
+
+def test_list_failure_reaches_every_waiter() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(403, json={"code": 1})
+
+    provider = _provider(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        provider._tracker.wait("t0", 5)
+
+
+def test_429_holds_the_limiter_for_every_caller(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(actor__writer, "_KLING_RETRY_BACKOFFS", (0.2,))
+    limiter = _KlingRateLimiter(rate=1000.0, burst=10)
+    calls = 0
+
+    def throttled_once() -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        request = httpx.Request("POST", "https://api.example/x")
+        resp = httpx.Response(429 if calls == 1 else 200, request=request)
+        resp.raise_for_status()
+        return resp
+
+    assert _kling_call_with_retry(throttled_once, limiter).status_code == 200
+    assert calls == 2
+    limiter.hold(0.2)
+    start = time.monotonic()
+    limiter.acquire()  # a peer arriving during the hold waits it out
+    assert time.monotonic() - start >= 0.15
+
+
+class _SlowProvider:
+    """Each image takes 0.2 s; records the peak number in flight."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def generate(self, prompt, seed, width, height, negative_prompt=None) -> bytes:  # noqa: ANN001
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.2)
+        with self._lock:
+            self.in_flight -= 1
+        buf = BytesIO()
+        Image.new("RGB", (8, 8), (seed % 255, 0, 0)).save(buf, format="JPEG")
+        return buf.getvalue()
+
+
+def test_generate_batch_runs_slots_concurrently(tmp_path: Path) -> None:
+    provider = _SlowProvider()
+    pool = ActorPool(ExposedTree(tmp_path), SafeResolver(tmp_path), provider=provider)
+    attrs = ActorAttrs(ethnicity="asian", gender="female", age_range="26-35", look="beautiful")
+
+    start = time.monotonic()
+    result = pool.generate_batch(attrs, count=4, resolution="normal", seeds=[11, 12, 13, 14])
+    elapsed = time.monotonic() - start
+
+    assert result.errors == []
+    assert [g["seed"] for g in result.generated] == [11, 12, 13, 14]
+    assert all(g["body_path"] for g in result.generated)
+    assert provider.peak >= 4  # face + body of several slots at once
+    assert elapsed < 1.0  # 8 images × 0.2 s serially would be 1.6 s
@@ -0,0 +1,90 @@
+"""Library catalog (libs/common/library_catalog) behind the actor / voice / BGM pools.
+
+Contract:
+- each entry's sidecar is loaded once and re-loaded only after it (or its
+  folder) changed; added / removed folders show up on the next read;
+- folders that are not listable entries still count for `max_number()`;
+- with a live watcher the same holds, driven by change events;
+- BgmPool keeps never reusing a number retired into the recycle bin.
+"""
+from __future__ import annotations
+
+import re
+import shutil
+from pathlib import Path
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.library_catalog import LibraryCatalog
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.writers.bgm__writer import BgmPool
+
+_ENTRY_RE = re.compile(r"^item_(\d{4})$")
+
+
+def _catalog(root: Path, loads: list[str], watcher: FsWatcher | None = None) -> LibraryCatalog[str]:
+    def load(folder: Path) -> str | None:
+        loads.append(folder.name)
+        md = folder / f"{folder.name}.md"
+        return md.read_text(encoding="utf-8") if md.is_file() else None
+
+    def number(folder: Path) -> int | None:
+        m = _ENTRY_RE.match(folder.name)
+        return int(m.group(1)) if m else None
+
+    return LibraryCatalog(lambda: root, number=number, load=load, watcher=watcher)
+
+
+def _entry(root: Path, n: int, text: str | None = "v1") -> Path:
+    folder = root / f"item_{n:04d}"
+    folder.mkdir(parents=True)
+    if text is not None:
+        (folder / f"{folder.name}.md").write_text(text, encoding="utf-8")
+    return folder
+
+
+def _exercise(root: Path, catalog: LibraryCatalog[str], loads: list[str]) -> None:
+    assert [v for _f, v in catalog.entries()] == ["v1", "v1"]
+    assert catalog.max_number() == 7
+    loads.clear()
+    assert len(catalog.entries()) == 2
+    assert loads == []
+
+    (root / "item_0002" / "item_0002.md").write_text("v2 edited", encoding="utf-8")
+    _entry(root, 9)
+    shutil.rmtree(root / "item_0001")
+    assert [v for _f, v in catalog.entries()] == ["v2 edited", "v1"]
+    assert sorted(set(loads)) == ["item_0002", "item_0009"]
+    assert catalog.max_number() == 9
+
+
+def test_catalog_without_watcher(tmp_path: Path) -> None:
+    _entry(tmp_path, 1)
+    _entry(tmp_path, 2)
+    _entry(tmp_path, 7, text=None)  # no sidecar yet: not listed, id still taken
+    (tmp_path / "notes").mkdir()
+    loads: list[str] = []
+    _exercise(tmp_path, _catalog(tmp_path, loads), loads)
+
+
+def test_catalog_with_live_watcher(tmp_path: Path) -> None:
+    root = tmp_path / "lib"
+    _entry(root, 1)
+    _entry(root, 2)
+    _entry(root, 7, text=None)
+    watcher = FsWatcher([tmp_path])
+    try:
+        loads: list[str] = []
+        catalog = _catalog(root, loads, watcher)
+        _exercise(root, catalog, loads)
+        assert watcher.running
+    finally:
+        watcher.stop()
+
+
+def test_bgm_ids_skip_retired_numbers(tmp_path: Path) -> None:
+    pool = BgmPool(ExposedTree(tmp_path), SafeResolver(tmp_path))
+    (tmp_path / "ai_videos" / "_bgm" / "tension" / "bgm_0003").mkdir(parents=True)
+    (tmp_path / "ai_videos" / "_deleted" / "_bgm" / "tension" / "bgm_0005").mkdir(parents=True)
+    assert pool._next_bgm_id_num() == 6
+    assert pool.list_bgms() == []
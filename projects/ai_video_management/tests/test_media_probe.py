@@ -0,0 +1,159 @@
+"""MediaProbeReader — the shared, persistent probe behind every ffmpeg writer.
+
+Contract:
+- one probe reports the VIDEO-stream duration (not the longer container/audio
+  length), fps, WxH, video codec and audio presence;
+- results for files under `ai_videos/{drama}/` persist in
+  `ai_videos/{drama}/.cache/media_index.json`, so a fresh reader (another
+  process) answers without spawning ffmpeg; a batch of probes is written once
+  per drama, and entries for deleted files are pruned when the index loads;
+- a rewrite of the file (size / mtime change) invalidates the entry;
+- `.cache/` never shows up in the tree or the sandbox.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+import imageio_ffmpeg
+import pytest
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.readers.media_probe__reader import (
+    MediaProbeReader,
+    parse_probe_output,
+)
+
+_FF = imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def _clip(dst: Path, *, size: str = "64x96", rate: int = 24, dur: float = 1.0,
+          audio_dur: float | None = None) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [_FF, "-y", "-f", "lavfi", "-i", f"testsrc=size={size}:rate={rate}:duration={dur}"]
+    if audio_dur is not None:
+        cmd += ["-f", "lavfi", "-i", f"sine=frequency=440:duration={audio_dur}"]
+    cmd += ["-pix_fmt", "yuv420p", "-c:v", "libx264", "-preset", "veryfast"]
+    if audio_dur is not None:
+        cmd += ["-c:a", "aac"]
+    cmd += ["-loglevel", "error", str(dst)]
+    subprocess.run(cmd, capture_output=True, check=True)
+
+
+def test_probe_reports_video_stream_fields(tmp_path: Path) -> None:
+    src = tmp_path / "ai_videos" / "d" / "a.mp4"
+    _clip(src, audio_dur=2.0)
+    info = MediaProbeReader(_FF).probe(src)
+    assert info.width == 64 and info.height == 96
+    assert info.fps == 24.0
+    assert info.vcodec == "h264"
+    assert info.has_audio is True
+    # the 2s audio track stretches the container; duration stays on the video
+    assert 0.9 <= (info.duration or 0) <= 1.1
+    assert (info.container_duration or 0) > 1.5
+
+
+def test_probe_persists_index_under_drama_cache(tmp_path: Path) -> None:
+    src = tmp_path / "ai_videos" / "d" / "ep01" / "a.mp4"
+    _clip(src)
+    probe = MediaProbeReader(_FF)
+    first = probe.probe(src)
+    probe.flush()
+    index = tmp_path / "ai_videos" / "d" / ".cache" / "media_index.json"
+    data = json.loads(index.read_text(encoding="utf-8"))
+    assert "ep01/a.mp4" in data["entries"]
+    # a fresh reader with a bogus ffmpeg can only answer from the index
+    again = MediaProbeReader("/nonexistent/ffmpeg").probe(src)
+    assert again == first
+
+
+def test_batch_writes_index_once_and_prunes_on_load(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    drama = tmp_path / "ai_videos" / "d"
+    clips = [drama / f"c{i}.mp4" for i in range(3)]
+    for c in clips:
+        _clip(c)
+    writes: list[Path] = []
+    real_replace = os.replace
+
+    def counting_replace(src: str | Path, dst: str | Path) -> None:
+        writes.append(Path(dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", counting_replace)
+    probe = MediaProbeReader(_FF)
+    for c in clips:
+        probe.probe(c)
+    assert writes == []
+    probe.flush()
+    probe.flush()
+    index = drama / ".cache" / "media_index.json"
+    assert writes == [index]
+
+    clips[0].unlink()
+    fresh = MediaProbeReader("/nonexistent/ffmpeg")
+    assert fresh.probe(clips[1]).vcodec == "h264"
+    fresh.flush()  # the entry pruned on load is written back
+    data = json.loads(index.read_text(encoding="utf-8"))
+    assert sorted(data["entries"]) == ["c1.mp4", "c2.mp4"]
+
+
+def test_rewrite_invalidates_cached_entry(tmp_path: Path) -> None:
+    src = tmp_path / "ai_videos" / "d" / "a.mp4"
+    _clip(src, size="64x96")
+    probe = MediaProbeReader(_FF)
+    assert probe.probe(src).width == 64
+    _clip(src, size="128x96")
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert probe.probe(src).width == 128
+
+
+def test_audio_duration_is_lazy_and_zero_when_mute(tmp_path: Path) -> None:
+    mute = tmp_path / "ai_videos" / "d" / "mute.mp4"
+    voiced = tmp_path / "ai_videos" / "d" / "voiced.mp4"
+    _clip(mute)
+    _clip(voiced, audio_dur=1.5)
+    probe = MediaProbeReader(_FF)
+    assert probe.audio_duration(mute) == 0.0
+    assert 1.4 <= probe.audio_duration(voiced) <= 1.6
+    probe.flush()
+    assert 1.4 <= (MediaProbeReader("/nonexistent/ffmpeg").probe(voiced).audio_duration or 0) <= 1.6
+
+
+def test_missing_or_junk_file_is_all_none(tmp_path: Path) -> None:
+    probe = MediaProbeReader(_FF)
+    assert probe.probe(tmp_path / "nope.mp4").duration is None
+    junk = tmp_path / "junk.mp4"
+    junk.write_bytes(b"not-a-video")
+    info = probe.probe(junk)
+    assert info.vcodec is None and info.fps is None and info.has_audio is False
+
+
+def test_parse_ignores_output_side_stream_lines() -> None:
+    err = (
+        "Input #0, mov,mp4, from 'a.mp4':\n"
+        "  Duration: 00:00:05.04, start: 0.000000, bitrate: 900 kb/s\n"
+        "  Stream #0:0[0x1](und): Video: h264 (High) (avc1 / 0x31637661), yuv420p(progressive), "
+        "720x1280 [SAR 1:1 DAR 9:16], 800 kb/s, 24 fps, 24 tbr, 12288 tbn (default)\n"
+        "Stream mapping:\n"
+        "  Stream #0:0 -> #0:0 (copy)\n"
+        "Output #0, null, to 'pipe:':\n"
+        "  Stream #0:0: Audio: pcm_s16le\n"
+        "frame=  100 fps=0.0 q=-1.0 size=N/A time=00:00:04.00 bitrate=N/A\n"
+        "frame=  120 fps=0.0 q=-1.0 Lsize=N/A time=00:00:04.96 bitrate=N/A\n"
+    )
+    info = parse_probe_output(err)
+    assert (info.width, info.height, info.fps) == (720, 1280, 24.0)
+    assert info.has_audio is False
+    assert info.duration == 4.96 and info.container_duration == 5.04
+
+
+def test_cache_dir_hidden_from_tree_and_sandbox(tmp_path: Path) -> None:
+    (tmp_path / "ai_videos" / "d" / ".cache").mkdir(parents=True)
+    assert ".cache" in ExposedTree(tmp_path).excluded_dirs()
+    assert SafeResolver(tmp_path).resolve("ai_videos/d/.cache/media_index.json") is None
@@ -0,0 +1,84 @@
+"""GET /api/media: range-aware, cache-validated streaming.
+
+Contract:
+- the whole file comes back 200 with a strong ETag, Last-Modified and
+  `Accept-Ranges: bytes`; a `v` in the URL makes it `immutable`, without one
+  the browser must revalidate (`no-cache`);
+- `If-None-Match` with the current tag is an empty 304; the tag moves when
+  the file's size / mtime does;
+- `Range: bytes=a-b` / `a-` / `-n` -> 206 with exactly those bytes and a
+  `Content-Range`; past the end -> 416; a stale `If-Range` -> the whole file.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from libs.common.origin import BoundOrigin
+from libs.common.repo_root import RepoRoot
+from tests.conftest import make_app
+
+_REL = "ai_videos/td/episodes/ep01/ep01.mp4"
+_BYTES = bytes(range(256)) * 40  # 10240
+
+
+def _client(root: Path) -> TestClient:
+    target = root / _REL
+    target.parent.mkdir(parents=True)
+    target.write_bytes(_BYTES)
+    bound = BoundOrigin(host="127.0.0.1", port=8766)
+    return TestClient(make_app(RepoRoot(path=root), bound, serve_static=False))
+
+
+def test_full_body_validators_and_304(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    r = client.get("/api/media", params={"path": _REL})
+    assert r.status_code == 200
+    assert r.content == _BYTES
+    assert r.headers["accept-ranges"] == "bytes"
+    assert r.headers["cache-control"] == "no-cache"
+    assert r.headers["last-modified"]
+    etag = r.headers["etag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    versioned = client.get("/api/media", params={"path": _REL, "v": "1"})
+    assert "immutable" in versioned.headers["cache-control"]
+
+    again = client.get("/api/media", params={"path": _REL}, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    later = (tmp_path / _REL).stat().st_mtime + 10
+    os.utime(tmp_path / _REL, (later, later))
+    moved = client.get("/api/media", params={"path": _REL}, headers={"If-None-Match": etag})
+    assert moved.status_code == 200
+    assert moved.headers["etag"] != etag
+
+
+def test_byte_ranges(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+
+    def get(range_: str, **extra: str):
+        return client.get("/api/media", params={"path": _REL}, headers={"Range": range_, **extra})
+
+    r = get("bytes=100-199")
+    assert r.status_code == 206
+    assert r.content == _BYTES[100:200]
+    assert r.headers["content-range"] == f"bytes 100-199/{len(_BYTES)}"
+    assert r.headers["content-length"] == "100"
+
+    assert get("bytes=10000-").content == _BYTES[10000:]
+    assert get("bytes=-16").content == _BYTES[-16:]
+    assert get("bytes=10000-99999").headers["content-range"] == f"bytes 10000-10239/{len(_BYTES)}"
+
+    past = get("bytes=20000-")
+    assert past.status_code == 416
+    assert past.headers["content-range"] == f"bytes */{len(_BYTES)}"
+
+    etag = get("bytes=0-0").headers["etag"]
+    assert get("bytes=0-9", **{"If-Range": etag}).status_code == 206
+    stale = get("bytes=0-9", **{"If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == _BYTES
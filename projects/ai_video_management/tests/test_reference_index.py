@@ -0,0 +1,125 @@
+"""Reverse-reference index (libs/common/reference_index) behind casting / BGM usage.
+
+Contract:
+- each source file is parsed once and re-parsed only after it changed; new and
+  removed dramas show up on the next read, `_`-prefixed folders never count;
+- the per-drama snapshot persists in `.cache/`, so a fresh index re-parses
+  nothing that is unchanged;
+- with a live watcher the same holds, driven by change events;
+- Casting answers actor / voice usage from it and `unassign_actor_everywhere`
+  keeps it current; BGM references carry each cue's window.
+"""
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.reference_index import ReferenceIndex, Row
+from libs.common.safe_resolve import SafeResolver
+from libs.infrastructure.readers.bgm_reference__reader import BgmReferenceReader
+from libs.infrastructure.writers.actor__writer import ActorPool
+from libs.infrastructure.writers.casting__writer import Casting
+from libs.infrastructure.writers.media__writer import MediaRenamer
+
+
+def _index(ai_videos: Path, parsed: list[str], watcher: FsWatcher | None = None) -> ReferenceIndex:
+    def extract(drama_dir: Path, path: Path) -> list[tuple[str, Row]]:
+        parsed.append(drama_dir.name)
+        return [(tok, {"at": i}) for i, tok in enumerate(path.read_text(encoding="utf-8").split())]
+
+    def sources(drama_dir: Path) -> list[Path]:
+        refs = drama_dir / "refs.txt"
+        return [refs] if refs.is_file() else []
+
+    return ReferenceIndex(lambda: ai_videos, kind="test", sources=sources, extract=extract, watcher=watcher)
+
+
+def _drama(ai_videos: Path, name: str, text: str) -> None:
+    (ai_videos / name).mkdir(parents=True, exist_ok=True)
+    (ai_videos / name / "refs.txt").write_text(text, encoding="utf-8")
+
+
+def _exercise(ai_videos: Path, index: ReferenceIndex, parsed: list[str]) -> None:
+    assert index.ids() == {"a", "b"}
+    assert index.refs("a") == [
+        {"at": 0, "drama": "d1", "source": "refs.txt"},
+        {"at": 1, "drama": "d2", "source": "refs.txt"},
+    ]
+    parsed.clear()
+    assert index.refs("b")[0]["drama"] == "d2"
+    assert parsed == []
+
+    _drama(ai_videos, "d1", "c a c")
+    _drama(ai_videos, "d3", "b")
+    shutil.rmtree(ai_videos / "d2")
+    assert index.ids() == {"a", "b", "c"}
+    assert [r["drama"] for r in index.refs("b")] == ["d3"]
+    assert sorted(parsed) == ["d1", "d3"]
+
+
+def test_index_without_watcher_and_persisted(tmp_path: Path) -> None:
+    ai_videos = tmp_path / "ai_videos"
+    _drama(ai_videos, "d1", "a")
+    _drama(ai_videos, "d2", "b a")
+    _drama(ai_videos, "_actors", "z")
+    parsed: list[str] = []
+    _exercise(ai_videos, _index(ai_videos, parsed), parsed)
+    assert (ai_videos / "d1" / ".cache" / "references_test.json").is_file()
+
+    parsed.clear()
+    fresh = _index(ai_videos, parsed)
+    assert fresh.ids() == {"a", "b", "c"}
+    assert parsed == []
+
+
+def test_index_with_live_watcher(tmp_path: Path) -> None:
+    ai_videos = tmp_path / "ai_videos"
+    _drama(ai_videos, "d1", "a")
+    _drama(ai_videos, "d2", "b a")
+    watcher = FsWatcher([tmp_path], excluded=frozenset({".cache"}))
+    try:
+        parsed: list[str] = []
+        _exercise(ai_videos, _index(ai_videos, parsed, watcher), parsed)
+        assert watcher.running
+    finally:
+        watcher.stop()
+
+
+def test_casting_usage_from_index(tmp_path: Path) -> None:
+    exposed, resolver = ExposedTree(tmp_path), SafeResolver(tmp_path)
+    casting = Casting(exposed, resolver, MediaRenamer(exposed, resolver), ActorPool(exposed, resolver))
+    drama = tmp_path / "ai_videos" / "td"
+    drama.mkdir(parents=True)
+    (drama / "casting.md").write_text(
+        "| role | actor_id | voice_id | notes |\n|---|---|---|---|\n"
+        "| hero | actor_0001 | voice_0002 | lead |\n| villain | actor_0001 | — | — |\n",
+        encoding="utf-8",
+    )
+    assert casting.assigned_actor_ids() == {"actor_0001"}
+    assert casting.assigned_voice_ids() == {"voice_0002"}
+    rows = casting.find_assignments_for_actor("actor_0001")
+    assert [(r["drama"], r["role"], r["notes"]) for r in rows] == [
+        ("td", "hero", "lead"), ("td", "villain", ""),
+    ]
+
+    assert casting.unassign_actor_everywhere("actor_0001") == [{"drama": "td", "role": "villain"}]
+    assert casting.assigned_actor_ids() == set()
+    assert [r["role"] for r in casting.find_voice_assignments_for_voice("voice_0002")] == ["hero"]
+
+
+def test_bgm_references_carry_cue_windows(tmp_path: Path) -> None:
+    ep = tmp_path / "ai_videos" / "td" / "episodes" / "ep01" / "bgm"
+    ep.mkdir(parents=True)
+    (ep / "bgm.md").write_text(
+        "# cues\n0-5 bgm_0001 | vol=0.6\n12.5-20 bgm_0001 | duck=off\n20-30 bgm_0002\n",
+        encoding="utf-8",
+    )
+    refs = BgmReferenceReader(ExposedTree(tmp_path), SafeResolver(tmp_path))
+    assert refs.referenced_bgm_ids() == {"bgm_0001", "bgm_0002"}
+    [row] = refs.find_references_for_bgm("bgm_0001")
+    assert row["location"] == "episodes/ep01"
+    assert row["cue_file"] == "ai_videos/td/episodes/ep01/bgm/bgm.md"
+    assert row["cue_windows"] == [[0.0, 5.0], [12.5, 20.0]]
+    assert len(row["cue_lines"]) == 2
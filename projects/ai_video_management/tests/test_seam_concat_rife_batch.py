@@ -0,0 +1,144 @@
+"""`tools/seam_concat.py` RIFE bridging: one batched interpolator run per seam.
+
+Driven by a stand-in `rife-ncnn-vulkan` (a PIL cross-blend honouring both CLI
+shapes, placing directory-mode output k at timestep k*inputs/n like the real
+tool) that logs each launch:
+- a build with directory mode produces all 2**depth-1 bridge frames of a seam in
+  ONE launch;
+- a build that refuses a custom `-n` (non-v4 models) falls back to bisecting with
+  single-pair launches — 2**depth-1 of them — and still bridges the seam;
+- either way the bridge frames sit at k/2**depth between the seam frames;
+- a parallel stitch (`jobs` > 1) still runs one interpolator at a time.
+"""
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import imageio_ffmpeg
+import pytest
+from PIL import Image
+
+_FAKE_RIFE = '''\
+import os, sys, time
+from pathlib import Path
+from PIL import Image
+
+args = sys.argv[1:]
+opt = dict(zip(args[::2], args[1::2]))
+with open(os.environ["FAKE_RIFE_LOG"], "a") as log:
+    log.write(" ".join(args[::2]) + "\\n")
+if os.environ.get("FAKE_RIFE_SPAN"):
+    with open(os.environ["FAKE_RIFE_SPAN"], "a") as span:
+        span.write("start\\n")
+    time.sleep(0.3)
+if "-i" in opt:
+    if os.environ.get("FAKE_RIFE_NO_DIR"):
+        sys.exit(255)
+    ins = [Image.open(p).convert("RGB") for p in sorted(Path(opt["-i"]).glob("*.png"))]
+    n = int(opt["-n"])
+    for k in range(n):  # rife-ncnn-vulkan: output k at timestep k*len(inputs)/n
+        t = k * len(ins) / n
+        lo = min(int(t), len(ins) - 1)
+        hi = min(lo + 1, len(ins) - 1)
+        Image.blend(ins[lo], ins[hi], t - lo if hi > lo else 0.0).save(
+            Path(opt["-o"]) / f"{k + 1:08d}.png"
+        )
+else:
+    a, b = (Image.open(opt[k]).convert("RGB") for k in ("-0", "-1"))
+    Image.blend(a, b, 0.5).save(opt["-o"])
+if os.environ.get("FAKE_RIFE_SPAN"):
+    with open(os.environ["FAKE_RIFE_SPAN"], "a") as span:
+        span.write("end\\n")
+'''
+
+
+def _load_seam_concat() -> ModuleType:
+    root = Path(__file__).resolve().parents[3]
+    spec = importlib.util.spec_from_file_location("seam_concat_tool", root / "tools" / "seam_concat.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _clip(dst: Path, pattern: str) -> None:
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-f", "lavfi", "-i",
+         f"{pattern}=size=64x64:rate=24:duration=1", "-pix_fmt", "yuv420p",
+         "-c:v", "libx264", "-preset", "veryfast", "-loglevel", "error", str(dst)],
+        capture_output=True, check=True,
+    )
+
+
+def _fake_rife(tmp_path: Path) -> Path:
+    exe = tmp_path / "rife-ncnn-vulkan"
+    exe.write_text(f"#!{sys.executable}\n{_FAKE_RIFE}", encoding="utf-8")
+    exe.chmod(0o755)
+    return exe
+
+
+@pytest.mark.parametrize("dir_mode", [True, False])
+def test_bridge_frames_from_one_launch_per_seam(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dir_mode: bool
+) -> None:
+    seam = _load_seam_concat()
+    log = tmp_path / "rife.log"
+    monkeypatch.setenv("FAKE_RIFE_LOG", str(log))
+    if not dir_mode:
+        monkeypatch.setenv("FAKE_RIFE_NO_DIR", "1")
+    clips = [tmp_path / "a.mp4", tmp_path / "b.mp4"]
+    _clip(clips[0], "testsrc")
+    _clip(clips[1], "smptebars")
+    plan = [{"bridge": True, "rife": True, "depth": 2, "trim": 0.1}]
+
+    out = tmp_path / "ep.mp4"
+    assert seam.seam_concat(clips, out, 0.1, str(_fake_rife(tmp_path)), 0, plan=plan) == 1
+
+    launches = log.read_text(encoding="utf-8").splitlines()
+    if dir_mode:
+        assert launches == ["-i -o -n"]
+    else:
+        assert launches == ["-i -o -n"] + ["-0 -1 -o"] * 3
+    assert seam._PROBES.probe(out, seam._ffmpeg_exe()).vcodec is not None
+
+
+@pytest.mark.parametrize("dir_mode", [True, False])
+def test_bridge_frames_evenly_timed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dir_mode: bool
+) -> None:
+    seam = _load_seam_concat()
+    monkeypatch.setenv("FAKE_RIFE_LOG", str(tmp_path / "rife.log"))
+    if not dir_mode:
+        monkeypatch.setenv("FAKE_RIFE_NO_DIR", "1")
+    a, b = tmp_path / "a.png", tmp_path / "b.png"
+    Image.new("RGB", (8, 8), (0, 0, 0)).save(a)
+    Image.new("RGB", (8, 8), (200, 200, 200)).save(b)
+    rife, sd = str(_fake_rife(tmp_path)), tmp_path / "sd"
+    sd.mkdir()
+
+    frames = seam._rife_batch(rife, a, b, 2, sd) or seam._rife_chain(rife, a, b, 2, sd, "r")
+
+    assert [Image.open(f).getpixel((0, 0))[0] for f in frames] == [50, 100, 150]
+
+
+def test_parallel_stitch_runs_one_rife_at_a_time(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    seam = _load_seam_concat()
+    span = tmp_path / "span.log"
+    monkeypatch.setenv("FAKE_RIFE_LOG", str(tmp_path / "rife.log"))
+    monkeypatch.setenv("FAKE_RIFE_SPAN", str(span))
+    clips = [tmp_path / f"{i}.mp4" for i in range(3)]
+    for clip, pattern in zip(clips, ("testsrc", "smptebars", "testsrc2")):
+        _clip(clip, pattern)
+    plan = [{"bridge": True, "rife": True, "depth": 1, "trim": 0.1}] * 2
+
+    out = tmp_path / "ep.mp4"
+    bridged = seam.seam_concat(clips, out, 0.1, str(_fake_rife(tmp_path)), 0, plan=plan, jobs=2)
+
+    assert bridged == 2
+    assert span.read_text(encoding="utf-8").split() == ["start", "end"] * 2
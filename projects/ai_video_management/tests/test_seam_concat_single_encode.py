@@ -0,0 +1,88 @@
+"""`tools/seam_concat.py` encodes the reel exactly once, from bodies rendered in
+parallel.
+
+Bodies (and RIFE bridges) are lossless intermediates; only the final concat runs
+a lossy encode. Asserted by recording the ffmpeg commands of a real 3-clip
+trim+butt stitch: every segment render uses `_SEGMENT_CODEC`, exactly one command
+writes AAC / lossy H.264, and the reel still carries video + audio of the
+expected length. A parallel build (`jobs` > 1) decodes to the same frames as a
+serial one.
+"""
+from __future__ import annotations
+
+import importlib.util
+import subprocess
+from pathlib import Path
+from types import ModuleType
+
+import imageio_ffmpeg
+
+
+def _load_seam_concat() -> ModuleType:
+    root = Path(__file__).resolve().parents[3]
+    spec = importlib.util.spec_from_file_location("seam_concat_tool", root / "tools" / "seam_concat.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _clip(dst: Path, freq: int) -> None:
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y",
+         "-f", "lavfi", "-i", "testsrc=size=64x64:rate=24:duration=1",
+         "-f", "lavfi", "-i", f"sine=frequency={freq}:duration=1",
+         "-pix_fmt", "yuv420p", "-c:v", "libx264", "-preset", "veryfast",
+         "-c:a", "aac", "-shortest", "-loglevel", "error", str(dst)],
+        capture_output=True, check=True,
+    )
+
+
+def test_reel_is_encoded_once(tmp_path: Path) -> None:
+    seam = _load_seam_concat()
+    clips = [tmp_path / f"c{i}.mp4" for i in range(3)]
+    for i, c in enumerate(clips):
+        _clip(c, 300 + 100 * i)
+    ran: list[list[str]] = []
+    real_run = seam._run
+
+    def recording_run(cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
+        ran.append(cmd)
+        return real_run(cmd)
+
+    seam._run = recording_run
+    out = tmp_path / "ep.mp4"
+    assert seam.seam_concat(clips, out, 0.1, None, 0, jobs=1) == 0
+
+    encodes = [c for c in ran if "-c:v" in c]
+    lossy = [c for c in encodes if "aac" in c]
+    assert len(encodes) == 4
+    assert len(lossy) == 1 and lossy[0][-1].endswith(".part")
+    for c in encodes:
+        if c is not lossy[0]:
+            assert c[-1].endswith(seam._SEGMENT_EXT) and "-qp" in c
+
+    ffmpeg = seam._ffmpeg_exe()
+    info = seam._PROBES.probe(out, ffmpeg)
+    assert info.vcodec is not None and info.has_audio
+    expected = sum(seam._probe(ffmpeg, c)[0] for c in clips) - 4 * 0.1  # two seams, both sides
+    assert abs((info.duration or 0) - expected) < 0.1
+
+
+def _frame_md5s(path: Path) -> list[str]:
+    res = subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-i", str(path), "-map", "0:v", "-f", "framemd5", "-"],
+        capture_output=True, check=True, text=True,
+    )
+    return [line.rsplit(",", 1)[-1].strip() for line in res.stdout.splitlines() if not line.startswith("#")]
+
+
+def test_parallel_build_matches_serial(tmp_path: Path) -> None:
+    seam = _load_seam_concat()
+    clips = [tmp_path / f"c{i}.mp4" for i in range(4)]
+    for i, c in enumerate(clips):
+        _clip(c, 300 + 100 * i)
+    serial, parallel = tmp_path / "serial.mp4", tmp_path / "parallel.mp4"
+    seam.seam_concat(clips, serial, 0.1, None, 0, [True, False, True], jobs=1)
+    seam.seam_concat(clips, parallel, 0.1, None, 0, [True, False, True], jobs=4)
+    assert _frame_md5s(parallel) == _frame_md5s(serial)
@@ -0,0 +1,92 @@
+"""`tools/seam_metrics.py` persistent seam-result cache
+(`ai_videos/{drama}/.cache/seam_results/`).
+
+Contract:
+- a RIFE candidate's key tracks the interpolator itself (resolved path, size,
+  mtime), not just its file name — a rebuilt exe re-scores;
+- the folder is an LRU bounded by file count: a hit refreshes an entry, a write
+  evicts the least-recently-used ones beyond the cap.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+
+def _load_seam_metrics() -> ModuleType:
+    root = Path(__file__).resolve().parents[3]
+    spec = importlib.util.spec_from_file_location("seam_metrics_tool", root / "tools" / "seam_metrics.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Concat:
+    JOIN_VERSION = 1
+
+
+def _clips(tmp_path: Path) -> tuple[Path, Path]:
+    shots = tmp_path / "ai_videos" / "d" / "episodes" / "ep01" / "shots"
+    shots.mkdir(parents=True)
+    a, b = shots / "a.mp4", shots / "b.mp4"
+    a.write_bytes(b"a")
+    b.write_bytes(b"b")
+    return a, b
+
+
+def test_rife_key_tracks_the_exe_not_its_name(tmp_path: Path) -> None:
+    metrics = _load_seam_metrics()
+    a, b = _clips(tmp_path)
+    exe = tmp_path / "bin" / "rife-ncnn-vulkan"
+    exe.parent.mkdir()
+    exe.write_bytes(b"v1")
+    before = metrics._result_cache_file(a, b, "rife", 0.1, 2, str(exe), 1)
+
+    exe.write_bytes(b"v2-rebuilt")
+    assert metrics._result_cache_file(a, b, "rife", 0.1, 2, str(exe), 1) != before
+    other = tmp_path / "other" / "rife-ncnn-vulkan"
+    other.parent.mkdir()
+    other.write_bytes(b"v2-rebuilt")
+    assert metrics._result_cache_file(a, b, "rife", 0.1, 2, str(other), 1) != (
+        metrics._result_cache_file(a, b, "rife", 0.1, 2, str(exe), 1)
+    )
+
+
+def test_result_cache_evicts_least_recently_used(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    metrics = _load_seam_metrics()
+    monkeypatch.setattr(metrics, "_RESULT_CACHE_MAX_FILES", 3)
+    builds: list[float] = []
+
+    def fake_build(seam_concat, a, b, method, trim, depth, rife, tmp, tag):  # type: ignore[no-untyped-def]
+        builds.append(trim)
+        return {"score": trim}
+
+    monkeypatch.setattr(metrics, "_build_and_measure_uncached", fake_build)
+    a, b = _clips(tmp_path)
+
+    def measure(trim: float) -> dict:
+        return metrics._build_and_measure(_Concat, a, b, "trim", trim, None, None, tmp_path, "t")
+
+    def age(trim: float, seconds: int) -> None:
+        f = metrics._result_cache_file(a, b, "trim", trim, None, None, 1)
+        os.utime(f, (f.stat().st_mtime - seconds,) * 2)
+
+    for i, trim in enumerate((0.1, 0.2, 0.3)):
+        measure(trim)
+        age(trim, 100 - 10 * i)  # 0.1 oldest
+    assert measure(0.1) == {"score": 0.1}  # hit: now the most recently used
+    measure(0.4)  # over the cap: 0.2 (least recently used) goes
+
+    folder = a.parents[3] / ".cache" / "seam_results"
+    assert len(list(folder.glob("*.json"))) == 3
+    builds.clear()
+    for trim in (0.1, 0.3, 0.4, 0.2):
+        measure(trim)
+    assert builds == [0.2]
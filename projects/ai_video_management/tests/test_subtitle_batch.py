@@ -4,11 +4,13 @@ across a whole drama. The burn test does a real (tiny) ffmpeg encode per shot.
 from __future__ import annotations
 
 import subprocess
+import time
 from pathlib import Path
 
 import imageio_ffmpeg
 import pytest
 
+from apps.api.jobs import JobManager
 from libs.common.exposed_tree import ExposedTree
 from libs.common.safe_resolve import SafeResolver
 from libs.domain.errors.subtitle__error import (
@@ -107,6 +109,34 @@ def test_burn_drama_burns_every_shot_across_episodes(tmp_path: Path) -> None:
     assert by_key[("ep02", "shot02")].reason == "no_render_mp4"
 
 
+def test_burn_drama_parallel_matches_serial_and_reports_progress(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    for ep, shot in [("ep01", "shot01"), ("ep01", "shot02"), ("ep02", "shot01")]:
+        s = _shot(root, ep, shot, talk="等着。")
+        _make_render(s)
+        (s / "subtitles.md").write_text("```text\n0-1 等着 || wait\n```\n", encoding="utf-8")
+    _shot(root, "ep02", "shot02", talk="等着。")  # no render → skipped
+
+    batch = _batch(root)
+    serial = batch.burn_drama("ai_videos/td/README.md", "zh", workers=1)
+    jobs = JobManager(max_workers=1)
+    job = jobs.submit(
+        "t", "td", lambda: batch.burn_drama(
+            "ai_videos/td/README.md", "zh", workers=3, force=True
+        )
+    )
+    deadline = time.monotonic() + 60
+    while jobs.get(job["id"])["state"] not in ("succeeded", "failed"):
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+    snap = jobs.get(job["id"])
+    assert snap["state"] == "succeeded", snap
+    assert snap["progress"] == 1.0
+    # same outcomes, same walk order, whatever order the burns finished in
+    assert snap["result"] == serial.to_payload()
+    assert [o.ok for o in serial.outcomes] == [True, True, True, False]
+
+
 # --- burn_episode -------------------------------------------------------------
 
 def test_burn_episode_burns_only_named_episode(tmp_path: Path) -> None:
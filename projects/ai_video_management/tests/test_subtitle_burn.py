@@ -184,6 +184,61 @@ def test_burn_produces_subtitled_mp4_per_lang(tmp_path: Path) -> None:
         assert result.out_rel.endswith(f"shots/shot01/shot01_{suffix}.mp4")
 
 
+def test_burn_langs_writes_every_master_from_one_process(tmp_path: Path, monkeypatch) -> None:
+    from libs.infrastructure.writers import subtitle__writer
+
+    root = tmp_path / "repo"
+    mp4, rel = _shot_render(root)
+    shot_folder = mp4.parent.parent
+    (shot_folder / "subtitles.md").write_text(
+        "0-0.5 重活一回 || Lived again\n0.5-1 你们等着 || Just wait\n", encoding="utf-8"
+    )
+    calls: list[list[str]] = []
+    real = subtitle__writer.run_ffmpeg
+
+    def counting(cmd, **kw):  # type: ignore[no-untyped-def]
+        calls.append(cmd)
+        return real(cmd, **kw)
+
+    monkeypatch.setattr(subtitle__writer, "run_ffmpeg", counting)
+    results = _burner(root).burn_langs(rel, ["zh", "en", "both", "zh"])
+    assert len(calls) == 1
+    assert [r.lang for r in results] == ["zh", "en", "both"]
+    sizes = set()
+    for suffix in ("zh", "en", "zhen"):
+        out = shot_folder / f"shot01_{suffix}.mp4"
+        assert out.is_file() and out.stat().st_size > 0
+        sizes.add(out.stat().st_size)
+    assert len(sizes) == 3  # each master carries its own subtitle track
+    with pytest.raises(InvalidSubtitleLangError):
+        _burner(root).burn_langs(rel, [])
+
+
+def test_burn_langs_keeps_a_single_audio_track(tmp_path: Path) -> None:
+    root = tmp_path / "repo"
+    mp4, rel = _shot_render(root)
+    ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    subprocess.run(  # the take with a second (e.g. commentary) audio track
+        [ffmpeg, "-y", "-i", str(mp4),
+         "-f", "lavfi", "-i", "sine=frequency=440:duration=1",
+         "-f", "lavfi", "-i", "sine=frequency=880:duration=1",
+         "-map", "0:v", "-map", "1:a", "-map", "2:a", "-c:v", "copy",
+         "-loglevel", "error", str(mp4.with_name("two.mp4"))],
+        check=True, capture_output=True, timeout=60,
+    )
+    mp4.with_name("two.mp4").replace(mp4)
+    shot_folder = mp4.parent.parent
+    (shot_folder / "subtitles.md").write_text("0-1 重活一回 || Lived again\n", encoding="utf-8")
+
+    _burner(root).burn_langs(rel, ["zh", "en"])
+
+    for suffix in ("zh", "en"):
+        info = subprocess.run(
+            [ffmpeg, "-i", str(shot_folder / f"shot01_{suffix}.mp4")], capture_output=True
+        ).stderr.decode("utf-8", errors="replace")
+        assert info.count("Audio:") == 1
+
+
 def test_scaffold_from_shot_md_bilingual_and_overwrites(tmp_path: Path) -> None:
     root = tmp_path / "repo"
     mp4, rel = _shot_render(root)
@@ -0,0 +1,95 @@
+"""Gallery thumbnails + poster frames (thumbnail__reader, GET /api/thumbnail).
+
+Contract:
+- an image thumb is shrunk to the snapped width (never enlarged) and cached
+  under the drama's `.cache/thumbs/`; asking again reuses the file;
+- editing the source yields a fresh thumb and prunes the superseded one;
+- a video gets a poster frame of the requested width;
+- the route serves it with the same validators as /api/media; audio is a 400.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import imageio_ffmpeg
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from libs.common.origin import BoundOrigin
+from libs.common.repo_root import RepoRoot
+from libs.infrastructure.readers.thumbnail__reader import ThumbnailReader, snap_width
+from tests.conftest import make_app
+
+
+def _face(root: Path) -> Path:
+    face = root / "ai_videos" / "_actors" / "actor_0001" / "actor_0001.jpg"
+    face.parent.mkdir(parents=True)
+    Image.new("RGB", (1200, 1600), (200, 120, 80)).save(face, quality=95)
+    return face
+
+
+def test_snap_width() -> None:
+    assert snap_width(None) == 256
+    assert snap_width(100) == 128
+    assert snap_width(300) == 512
+    assert snap_width(4000) == 512
+
+
+def test_image_thumb_cached_and_refreshed(tmp_path: Path) -> None:
+    face = _face(tmp_path)
+    reader = ThumbnailReader()
+
+    thumb = reader.thumbnail(face, 256)
+    assert thumb.parent == tmp_path / "ai_videos" / "_actors" / ".cache" / "thumbs"
+    with Image.open(thumb) as im:
+        assert im.size == (256, 341)
+    assert thumb.stat().st_size < face.stat().st_size
+    stamp = thumb.stat().st_mtime_ns
+    assert reader.thumbnail(face, 200) == thumb
+    assert thumb.stat().st_mtime_ns == stamp
+
+    Image.new("RGB", (64, 64), (0, 0, 0)).save(face)
+    later = face.stat().st_mtime + 10
+    os.utime(face, (later, later))
+    fresh = reader.thumbnail(face, 256)
+    assert fresh != thumb and not thumb.exists()
+    with Image.open(fresh) as im:
+        assert im.size == (64, 64)
+
+
+def test_video_poster_frame(tmp_path: Path) -> None:
+    clip = tmp_path / "ai_videos" / "td" / "episodes" / "ep01" / "ep01.mp4"
+    clip.parent.mkdir(parents=True)
+    subprocess.run(
+        [imageio_ffmpeg.get_ffmpeg_exe(), "-y", "-f", "lavfi", "-i",
+         "testsrc=duration=2:size=640x360:rate=10", "-pix_fmt", "yuv420p",
+         "-loglevel", "error", str(clip)],
+        check=True, capture_output=True, timeout=60,
+    )
+    poster = ThumbnailReader().thumbnail(clip, 128)
+    assert poster.parent == tmp_path / "ai_videos" / "td" / ".cache" / "thumbs"
+    with Image.open(poster) as im:
+        assert im.size == (128, 72)
+
+
+def test_thumbnail_route(tmp_path: Path) -> None:
+    _face(tmp_path)
+    (tmp_path / "ai_videos" / "_actors" / "actor_0001" / "take.mp3").write_bytes(b"\x00")
+    bound = BoundOrigin(host="127.0.0.1", port=8766)
+    client = TestClient(make_app(RepoRoot(path=tmp_path), bound, serve_static=False))
+
+    rel = "ai_videos/_actors/actor_0001/actor_0001.jpg"
+    r = client.get("/api/thumbnail", params={"path": rel, "w": 128, "v": "1"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] in {"image/webp", "image/jpeg"}
+    assert "immutable" in r.headers["cache-control"]
+    again = client.get(
+        "/api/thumbnail", params={"path": rel, "w": 128},
+        headers={"If-None-Match": r.headers["etag"]},
+    )
+    assert again.status_code == 304
+
+    audio = client.get("/api/thumbnail", params={"path": "ai_videos/_actors/actor_0001/take.mp3"})
+    assert audio.status_code == 400
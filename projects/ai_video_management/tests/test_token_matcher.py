@@ -0,0 +1,22 @@
+"""TokenMatcher (Aho–Corasick) ≡ the naive `token in text` scan it replaces."""
+from __future__ import annotations
+
+import random
+
+from libs.common.token_matcher import TokenMatcher
+
+
+def test_present_matches_naive_substring_scan() -> None:
+    rng = random.Random(7)
+    alphabet = "ab_集镜01"
+    for _ in range(300):
+        tokens = ["".join(rng.choices(alphabet, k=rng.randint(1, 5))) for _ in range(12)]
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 40)))
+        assert TokenMatcher(tokens).present(text) == {t for t in tokens if t in text}
+
+
+def test_overlapping_and_nested_tokens() -> None:
+    m = TokenMatcher(["he", "she", "his", "hers", "", "she"])
+    assert m.tokens == ("he", "she", "his", "hers")
+    assert m.present("ushers") == {"he", "she", "hers"}
+    assert m.present("") == set()
@@ -0,0 +1,126 @@
+"""Watcher-backed `/api/tree` cache (tree__reader + fs_watcher).
+
+Contract:
+- with a live watcher a rebuild reuses the memoized subtrees, and a write made
+  before the request is visible in it (the `sync()` fence);
+- the ETag is stable while nothing changes and moves after an edit;
+- without a watcher every build is a full walk (old behaviour);
+- GET /api/tree answers 304 on a matching `If-None-Match`;
+- `depth` / `path` / `offset`+`limit` return a projected slice whose cut
+  child lists carry `child_count` + `truncated`; an unknown path is a 404.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from libs.common.exposed_tree import ExposedTree
+from libs.common.fs_watcher import FsWatcher
+from libs.common.origin import BoundOrigin
+from libs.common.repo_root import RepoRoot
+from libs.domain.errors.tree__error import TreeNodeNotFoundError
+from libs.infrastructure.readers.tree__reader import TreeReader
+from tests.conftest import make_app, repo_root
+
+
+def _drama(tree: dict, name: str) -> dict | None:
+    ai_videos = next(c for c in tree["children"] if c["name"] == "AI Videos")
+    return next((c for c in ai_videos.get("children", []) if c["name"] == name), None)
+
+
+def test_watched_reader_sees_edits_and_etag_moves(tmp_path: Path) -> None:
+    proj = tmp_path / "ai_videos" / "foo"
+    proj.mkdir(parents=True)
+    (proj / "README.md").write_text("# 《旧名》\n", encoding="utf-8")
+    exposed = ExposedTree(tmp_path)
+    watcher = FsWatcher(exposed.top_level_dirs(), exposed.excluded_dirs())
+    reader = TreeReader(exposed, watcher=watcher)
+    try:
+        tree, etag = reader.snapshot()
+        assert watcher.running
+        assert _drama(tree, "foo")["display_name"] == "旧名"
+        assert reader.snapshot()[1] == etag
+
+        (proj / "README.md").write_text("# 《新名》\n", encoding="utf-8")
+        (tmp_path / "ai_videos" / "bar").mkdir()
+        tree, moved = reader.snapshot()
+        assert _drama(tree, "foo")["display_name"] == "新名"
+        assert _drama(tree, "bar") is not None
+        assert moved != etag
+        assert tree == TreeReader(exposed).build()
+    finally:
+        watcher.stop()
+
+
+def test_unwatched_reader_walks_every_time(tmp_path: Path) -> None:
+    (tmp_path / "ai_videos" / "foo").mkdir(parents=True)
+    reader = TreeReader(ExposedTree(tmp_path))
+    _, etag = reader.snapshot()
+    (tmp_path / "ai_videos" / "bar").mkdir()
+    tree, moved = reader.snapshot()
+    assert _drama(tree, "bar") is not None
+    assert moved != etag
+
+
+def test_tree_route_revalidates_with_etag() -> None:
+    rr = RepoRoot(path=repo_root())
+    bound = BoundOrigin(host="127.0.0.1", port=8766)
+    with TestClient(make_app(rr, bound, serve_static=False)) as client:
+        first = client.get("/api/tree")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        again = client.get("/api/tree", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+
+
+def _novel_tree(root: Path, chapters: int) -> None:
+    novel = root / "my_novel" / "book"
+    (novel / "chapters").mkdir(parents=True)
+    for i in range(chapters):
+        (novel / "chapters" / f"{i:03d}.md").write_text("x", encoding="utf-8")
+
+
+def test_view_depth_subtree_and_pages(tmp_path: Path) -> None:
+    _novel_tree(tmp_path, 5)
+    reader = TreeReader(ExposedTree(tmp_path))
+
+    shallow, _ = reader.view(depth=1)
+    sections = {c["name"]: c for c in shallow["children"]}
+    assert sections["My Novel"] == {
+        "type": "section", "name": "My Novel", "path": "",
+        "children": [], "child_count": 1, "truncated": True,
+    }
+
+    book, _ = reader.view(path="my_novel/book", depth=1)
+    assert book["children"][0]["path"] == "my_novel/book/chapters"
+    assert book["children"][0]["child_count"] == 5
+
+    page, etag = reader.view(path="my_novel/book/chapters", offset=2, limit=2)
+    assert [c["name"] for c in page["children"]] == ["002.md", "003.md"]
+    assert (page["child_count"], page["offset"], page["truncated"]) == (5, 2, True)
+    assert reader.view(path="my_novel/book/chapters", offset=2, limit=2)[1] == etag
+
+    whole, _ = reader.view(path="my_novel")
+    assert "truncated" not in whole
+    assert whole["children"] == reader.build()["children"][2]["children"]
+
+
+def test_view_unknown_path_is_404(tmp_path: Path) -> None:
+    _novel_tree(tmp_path, 1)
+    reader = TreeReader(ExposedTree(tmp_path))
+    try:
+        reader.view(path="my_novel/nope")
+    except TreeNodeNotFoundError:
+        pass
+    else:
+        raise AssertionError("expected TreeNodeNotFoundError")
+    rr = RepoRoot(path=repo_root())
+    client = TestClient(make_app(rr, BoundOrigin(host="127.0.0.1", port=8766)))
+    r = client.get("/api/tree", params={"path": "ai_videos/__nope__"})
+    assert r.status_code == 404
+    assert r.json()["detail"]["kind"] == "tree_node_not_found"
+    r = client.get("/api/tree", params={"depth": 1})
+    assert r.status_code == 200
+    assert all(s["children"] == [] for s in r.json()["children"])
@@ -0,0 +1,36 @@
+"""The webapp's shared media probe, loaded once for every seam tool.
+
+`media_probe__reader.py` is stdlib-only (it loads its one webapp dependency,
+`drama_layout.py`, by path too), so the CLIs load it by path instead of
+importing the webapp package: one demux pass per file version, persisted in
+`ai_videos/{drama}/.cache/media_index.json`, so the tools and the webapp never
+re-probe the same clip. `seam_concat`, `seam_metrics` and `seam_tune` all import
+`media_probe` from here, so they share one module (and one reader per tool).
+"""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+_MEDIA_PROBE_PY = (
+    Path(__file__).resolve().parent.parent / "projects" / "ai_video_management" / "libs"
+    / "infrastructure" / "readers" / "media_probe__reader.py"
+)
+_MODULE_NAME = "media_probe__reader"
+
+
+def _load() -> ModuleType:
+    loaded = sys.modules.get(_MODULE_NAME)
+    if loaded is not None:
+        return loaded
+    spec = importlib.util.spec_from_file_location(_MODULE_NAME, _MEDIA_PROBE_PY)
+    assert spec and spec.loader
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[_MODULE_NAME] = mod  # dataclasses resolve their module by name
+    spec.loader.exec_module(mod)
+    return mod
+
+
+media_probe = _load()
@@ -32,12 +32,14 @@ fine and trimming/bridging a cut only damages it.
 
 Usage:
   python tools/seam_concat.py --out ep.mp4 A.mp4 B.mp4 [C.mp4 ...] \
-      [--trim 0.10] [--rife /path/to/rife-ncnn-vulkan] [--fps 0]
+      [--trim 0.10] [--rife /path/to/rife-ncnn-vulkan] [--fps 0] [--jobs 0]
 
   --trim   seconds cut from EACH side of every seam (the dead ease motion +
            duplicate frame). 0.10 ≈ 3 frames @30fps. Raise if a freeze remains.
   --rife   optional RIFE executable; when given, each seam is motion-bridged.
   --fps    output framerate; 0 = follow the first clip.
+  --jobs   bodies / bridges rendered in parallel; 0 = cores ÷ the encoder threads
+           each parallel segment gets (`default_jobs`), 1 = serial.
 
 ffmpeg is located via the bundled imageio_ffmpeg when present, else `ffmpeg` on
 PATH.
@@ -46,15 +48,24 @@ from __future__ import annotations
 
 import argparse
 import math
+import os
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Sequence, TypeVar
 
-_TIME_RE = re.compile(r"time=\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
-_FPS_RE = re.compile(r"(\d+(?:\.\d+)?)\s*fps")
-_SIZE_RE = re.compile(r",\s*(\d+)x(\d+)[,\s]")
+_HERE = Path(__file__).resolve().parent
+if str(_HERE) not in sys.path:  # sibling helpers, also when loaded by path
+    sys.path.insert(0, str(_HERE))
+from _media_probe import media_probe  # noqa: E402
+
+# The webapp's shared probe (see tools/_media_probe.py).
+_PROBES = media_probe.MediaProbeReader()
 
 
 def _ffmpeg_exe() -> str:
@@ -66,6 +77,20 @@ def _ffmpeg_exe() -> str:
         return "ffmpeg"
 
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _pmap(fn: Callable[[_T], _R], items: Sequence[_T], jobs: int) -> list[_R]:
+    """`[fn(x) for x in items]` on up to `jobs` threads, results in input order
+    (the first failure re-raises, as serially). Threads suffice: every unit spends
+    its time waiting on its own ffmpeg / RIFE subprocess."""
+    if jobs <= 1 or len(items) <= 1:
+        return [fn(x) for x in items]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
 def _run(cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
     try:
         return subprocess.run(cmd, capture_output=True, check=False)
@@ -75,33 +100,13 @@ def _run(cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
 
 def _probe(ffmpeg: str, src: Path) -> tuple[float, float, int, int]:
     """Return (video-stream duration, fps, width, height) for `src`."""
-    info = _run([ffmpeg, "-i", str(src)]).stderr.decode("utf-8", "replace")
-    dur_probe = _run(
-        [ffmpeg, "-i", str(src), "-map", "0:v:0", "-c", "copy", "-f", "null", "-"]
-    ).stderr.decode("utf-8", "replace")
-    times = _TIME_RE.findall(dur_probe)
-    dur = (
-        int(times[-1][0]) * 3600 + int(times[-1][1]) * 60 + float(times[-1][2])
-        if times
-        else 5.0
-    )
-    fps_m = _FPS_RE.search(info)
-    fps = float(fps_m.group(1)) if fps_m else 30.0
-    size_m = _SIZE_RE.search(info)
-    w, h = (int(size_m.group(1)), int(size_m.group(2))) if size_m else (0, 0)
-    return max(0.1, dur), fps, w, h
+    info = _PROBES.probe(src, ffmpeg)
+    return max(0.1, info.duration or 5.0), info.fps or 30.0, info.width or 0, info.height or 0
 
 
 def _audio_dur(ffmpeg: str, src: Path) -> float:
     """Audio-stream duration in seconds (0.0 when the source is mute)."""
-    out = _run(
-        [ffmpeg, "-i", str(src), "-map", "0:a:0", "-c", "copy", "-f", "null", "-"]
-    ).stderr.decode("utf-8", "replace")
-    times = _TIME_RE.findall(out)
-    if not times:
-        return 0.0
-    t = times[-1]
-    return int(t[0]) * 3600 + int(t[1]) * 60 + float(t[2])
+    return _PROBES.audio_duration(src, ffmpeg)
 
 
 def _norm(w: int, h: int, fps: int) -> str:
@@ -113,7 +118,40 @@ def _norm(w: int, h: int, fps: int) -> str:
     )
 
 
+# Version of the joined OUTPUT. seam_metrics keys its persisted seam scores on it,
+# so bump it on ANY change to what a join renders (trims, bodies, bridges, RIFE
+# frame timing, audio) — otherwise stale scores of the old join are served.
+JOIN_VERSION: int = 2
+
 _AR: int = 44100   # uniform audio rate/layout across every segment (concat needs identical)
+# Bodies and bridges are INTERMEDIATES — the final concat is the reel's only lossy
+# encode. Lossless x264 (qp 0, ultrafast) + PCM in Matroska: bit-exact frames and
+# samples (no generation loss at the concat) and several × cheaper than the
+# `veryfast` lossy pass the segments used to get, so the stitch time is dominated
+# by ONE encode instead of two.
+_SEGMENT_EXT: str = ".mkv"
+_SEGMENT_CODEC: list[str] = [
+    "-c:v", "libx264", "-preset", "ultrafast", "-qp", "0", "-pix_fmt", "yuv420p",
+    "-c:a", "pcm_s16le", "-ar", str(_AR), "-ac", "2",
+]
+# Parallel stitching (`jobs` > 1) caps every segment encoder at this many threads,
+# so `jobs` encoders share the cores instead of each spawning one thread per core.
+# A serial stitch leaves x264 uncapped. RIFE always runs ONE bridge at a time per
+# process, whatever `jobs` is: each run opens its own Vulkan context on the one
+# GPU, and concurrent ones only contend for (and can exhaust) its memory. A process
+# pool swaps `_RIFE_SLOT` for one shared lock (seam_tune's worker initializer).
+SEGMENT_THREADS: int = 2
+_RIFE_SLOT = threading.Lock()
+
+
+def default_jobs() -> int:
+    """`jobs` that fills the machine without oversubscribing it: cores ÷
+    `SEGMENT_THREADS` (the webapp's `job_progress.default_workers` rule)."""
+    return max(1, (os.cpu_count() or 1) // SEGMENT_THREADS)
+
+
+def _codec(threads: int | None) -> list[str]:
+    return _SEGMENT_CODEC + (["-threads", str(threads)] if threads else [])
 # Click-free joins. A short equal-power fade at each segment's audio boundaries
 # (NO overlap → duration preserved → no A/V drift, unlike a true crossfade which
 # would shrink the audio and desync it from the hard-cut video over many joins)
@@ -138,8 +176,7 @@ _AUDIO_TAIL_KEEP_S: float = 1.0
 def _has_audio(ffmpeg: str, src: Path) -> bool:
     """True iff `src` carries at least one Audio stream (parsed from `ffmpeg -i`
     stderr — imageio_ffmpeg ships no ffprobe)."""
-    info = _run([ffmpeg, "-i", str(src), "-hide_banner"]).stderr.decode("utf-8", "replace")
-    return "Audio:" in info
+    return _PROBES.probe(src, ffmpeg).has_audio
 
 
 def _segment_ok(ffmpeg: str, src: Path) -> bool:
@@ -151,18 +188,29 @@ def _segment_ok(ffmpeg: str, src: Path) -> bool:
     butt-join instead."""
     if not src.is_file():
         return False
-    info = _run([ffmpeg, "-i", str(src), "-hide_banner"]).stderr.decode("utf-8", "replace")
-    return "Video:" in info
+    return _PROBES.probe(src, ffmpeg).vcodec is not None
 
 
-def _render_body(
+def _reel_format(
+    probes: list[tuple[float, float, int, int]], fps_override: int = 0,
+) -> tuple[int, int, int]:
+    """(fps, width, height) every segment of the reel is normalised to: the first
+    clip's rate (unless overridden) and the largest probed frame, so no clip is
+    upscaled past its native resolution."""
+    fps = fps_override or max(1, round(probes[0][1]))
+    w = max((pr[2] for pr in probes), default=0) or 720
+    h = max((pr[3] for pr in probes), default=0) or 1280
+    return fps, w, h
+
+
+def _body_filters(
     ffmpeg: str, src: Path, head: float, tail: float, dur: float,
-    fps: int, w: int, h: int, out: Path,
-) -> None:
-    """Re-encode `src` minus its ease head/tail (the head trim also drops the
-    duplicated shared seam frame) to a uniform segment, carrying the matching
-    slice of audio (or silence when the source is mute) so the final concat keeps
-    sound and every segment has an identical a/v layout.
+    fps: int, w: int, h: int,
+) -> tuple[str, str | None, float]:
+    """(video filter, audio filter or None when `src` is mute, kept length) of
+    `src`'s body segment — the trim / normalise / audio-tail rule of
+    `_render_body`, shared with the webapp's cached per-shot segments so an
+    incremental episode build stitches the same bodies.
 
     On a butt tail (`tail`≈0) the audio is kept to its FULL length even when it
     runs past the last video frame (a TTS 末字 like 「了」 voiced after the picture
@@ -184,25 +232,35 @@ def _render_body(
         # silently no-ops in this ffmpeg build). Holds the last frame so the
         # video matches the kept audio tail (a/v stay in sync).
         vf += f",tpad=stop_mode=clone:stop_duration={vpad:.3f}"
-    if has_a:
-        af = (
-            f"atrim=start={head:.3f}:end={end_a:.3f},asetpts=PTS-STARTPTS,"
-            f"aresample={_AR}"
-        )
+    af = (
+        f"atrim=start={head:.3f}:end={end_a:.3f},asetpts=PTS-STARTPTS,aresample={_AR}"
+        if has_a else None
+    )
+    return vf, af, end_a - head
+
+
+def _render_body(
+    ffmpeg: str, src: Path, head: float, tail: float, dur: float,
+    fps: int, w: int, h: int, out: Path, threads: int | None = None,
+) -> None:
+    """Re-encode `src` minus its ease head/tail (the head trim also drops the
+    duplicated shared seam frame) to a uniform lossless intermediate segment
+    (`_SEGMENT_CODEC`; `out` should carry `_SEGMENT_EXT`), carrying the matching
+    slice of audio (or silence when the source is mute) so the final concat keeps
+    sound and every segment has an identical a/v layout. Filters and the
+    audio-tail rule: `_body_filters`."""
+    vf, af, _kept = _body_filters(ffmpeg, src, head, tail, dur, fps, w, h)
+    if af is not None:
         cmd = [
             ffmpeg, "-y", "-i", str(src), "-vf", vf, "-af", af,
-            "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p",
-            "-c:a", "aac", "-ar", str(_AR), "-ac", "2",
-            "-loglevel", "error", str(out),
+            *_codec(threads), "-loglevel", "error", str(out),
         ]
     else:
         cmd = [
             ffmpeg, "-y", "-i", str(src),
             "-f", "lavfi", "-i", f"anullsrc=r={_AR}:cl=stereo",
             "-vf", vf, "-map", "0:v:0", "-map", "1:a:0", "-shortest",
-            "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p",
-            "-c:a", "aac", "-ar", str(_AR), "-ac", "2",
-            "-loglevel", "error", str(out),
+            *_codec(threads), "-loglevel", "error", str(out),
         ]
     if _run(cmd).returncode != 0 or not out.is_file():
         raise RuntimeError(f"body render failed: {src.name}")
@@ -254,6 +312,29 @@ def _rife_mid(rife: str, a: Path, b: Path, dst: Path) -> bool:
     return _run([rife, "-0", str(a), "-1", str(b), "-o", str(dst)]).returncode == 0 and dst.is_file()
 
 
+def _rife_batch(rife: str, a: Path, b: Path, depth: int, sd: Path) -> list[Path]:
+    """All 2**depth - 1 in-between frames of [a, b] from ONE RIFE process — its
+    directory mode. That mode spaces `-n` output frames evenly over the INPUT
+    count (frame i sits at timestep i*inputs/n, clamped to the last input), so
+    for the pair we ask `-n 2*2**depth`: frames 1..2**depth-1 land on
+    k/2**depth, frame 0 is a and the rest are copies of b. One model load per
+    seam instead of one per midpoint. [] when this build can't (non-v4 models
+    only do t=0.5 and refuse a custom `-n`) or returned the wrong count — the
+    caller then bisects."""
+    pair, frames = sd / "pair", sd / "batch"
+    shutil.rmtree(frames, ignore_errors=True)
+    pair.mkdir(exist_ok=True)
+    frames.mkdir()
+    shutil.copyfile(a, pair / "0.png")
+    shutil.copyfile(b, pair / "1.png")
+    steps = 2 ** depth
+    want = 2 * steps
+    if _run([rife, "-i", str(pair), "-o", str(frames), "-n", str(want)]).returncode != 0:
+        return []
+    out = sorted(frames.glob("*.png"))
+    return out[1:steps] if len(out) == want else []
+
+
 def _rife_chain(rife: str, a: Path, b: Path, depth: int, sd: Path, tag: str) -> list[Path]:
     """Recursively bisect [a, b] `depth` times → up to 2**depth - 1 ORDERED
     in-between frames (a binary subdivision: mid, then mids of each half, ...).
@@ -272,11 +353,12 @@ def _rife_bridge(
     ffmpeg: str, rife: str, body_prev: Path, body_next: Path,
     src_prev: Path, src_next: Path, dur_prev: float,
     trim: float, fps: int, w: int, h: int, tmp: Path, idx: int, out: Path,
-    gate: bool = True, depth_override: int | None = None,
+    gate: bool = True, depth_override: int | None = None, threads: int | None = None,
 ) -> bool:
     """Bridge a seam with an external RIFE interpolator: extract the predecessor's
     last frame + successor's first frame, synthesise motion-compensated in-between
-    frames, encode them. The bridge's audio is the genuinely-removed seam content
+    frames, encode them (lossless intermediate, like the bodies). The bridge's
+    audio is the genuinely-removed seam content
     (predecessor's trimmed tail + successor's trimmed head, taken from the ORIGINAL
     clips — so it's continuous ambient, not dead silence, and not an echo of the
     body audio). Returns False (caller butt-joins) on any failure — never a silent
@@ -308,13 +390,15 @@ def _rife_bridge(
     # so the reconstructed motion ≈ the deleted motion and the seam timing stays
     # natural. Binary subdivision → 2**depth-1 frames; depth from the target, capped
     # at 4 (15 frames), or an explicit `depth_override` (补帧密度) from the plan.
-    # Single-pair `-0/-1/-o` only (dir-mode `-n` varies by build).
+    # One batched directory-mode run first; builds/models without custom `-n`
+    # support fall back to bisecting with the stable single-pair `-0/-1/-o`.
     if depth_override is not None:
         depth = max(1, min(4, int(depth_override)))
     else:
         target = max(1, round(2.0 * trim * fps))
         depth = max(1, min(4, math.ceil(math.log2(target + 1))))
-    inner = _rife_chain(rife, la, fb, depth, sd, "r")
+    with _RIFE_SLOT:
+        inner = _rife_batch(rife, la, fb, depth, sd) or _rife_chain(rife, la, fb, depth, sd, "r")
     if not inner:
         return False
     seq = sd / "seq"
@@ -360,9 +444,7 @@ def _rife_bridge(
         fc.append(f"[{ai}:a]atrim=0:{bridge_dur:.3f}[a]")
     cmd += [
         "-filter_complex", ";".join(fc), "-map", "[v]", "-map", "[a]", "-shortest",
-        "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p",
-        "-c:a", "aac", "-ar", str(_AR), "-ac", "2",
-        "-loglevel", "error", str(out),
+        *_codec(threads), "-loglevel", "error", str(out),
     ]
     return _run(cmd).returncode == 0 and out.is_file()
 
@@ -370,7 +452,7 @@ def _rife_bridge(
 def seam_concat(
     inputs: list[Path], out_path: Path, trim: float, rife: str | None,
     fps_override: int, seams: list[bool] | None = None,
-    plan: list[dict] | None = None,
+    plan: list[dict] | None = None, jobs: int = 1,
 ) -> int:
     """Stitch `inputs` into `out_path`, repairing 承接 seams. Returns the number
     of RIFE bridges actually inserted (0 when rife is None or all seams 硬切).
@@ -383,12 +465,16 @@ def seam_concat(
     WITHOUT a RIFE bridge — even when the global `rife` exe is supplied for OTHER
     seams. So one concat can mix RIFE seams ({bridge:True, rife:True, depth:N}),
     trim-butt seams ({bridge:True, rife:False}) and hard cuts ({bridge:False}).
-    `seams` (b/c) + the auto gate remain the default when no plan is supplied."""
+    `seams` (b/c) + the auto gate remain the default when no plan is supplied.
+
+    Bodies render `jobs` at a time (0 = `default_jobs()`; callers that already
+    run in parallel pass 1), then the seams' bridges do (each reads only its two
+    finished bodies, RIFE itself one at a time); results are slotted back by
+    index, so the segment order — and the reel — never depends on completion
+    order."""
     ffmpeg = _ffmpeg_exe()
     probes = [_probe(ffmpeg, p) for p in inputs]
-    fps = fps_override or max(1, round(probes[0][1]))
-    w = max((pr[2] for pr in probes), default=0) or 720
-    h = max((pr[3] for pr in probes), default=0) or 1280
+    fps, w, h = _reel_format(probes, fps_override)
     n = len(inputs)
 
     # Per-seam config arrays (length n-1): whether to bridge, the trim bite, an
@@ -414,45 +500,61 @@ def seam_concat(
             raise RuntimeError(f"--seams needs {n - 1} entries, got {len(seams)}")
         bridge_seam = list(seams)
 
+    jobs = jobs if jobs > 0 else default_jobs()
+    threads = SEGMENT_THREADS if jobs > 1 else None
+
     with tempfile.TemporaryDirectory() as td:
         tmp = Path(td)
-        bodies: list[Path] = []
-        for i, src in enumerate(inputs):
+        bodies = [tmp / f"body_{i:03d}{_SEGMENT_EXT}" for i in range(n)]
+
+        def _body(i: int) -> None:
             # trim a side only when the seam touching it is a 承接 bridge.
             head = trims[i - 1] if i > 0 and bridge_seam[i - 1] else 0.0
             tail = trims[i] if i < n - 1 and bridge_seam[i] else 0.0
-            body = tmp / f"body_{i:03d}.mp4"
-            _render_body(ffmpeg, src, head, tail, probes[i][0], fps, w, h, body)
-            bodies.append(body)
+            _render_body(ffmpeg, inputs[i], head, tail, probes[i][0], fps, w, h, bodies[i], threads)
+
+        _pmap(_body, range(n), jobs)
+
+        def _bridge(i: int) -> tuple[bool, bool]:
+            """(encoded, usable) for the RIFE bridge of seam i."""
+            br = tmp / f"bridge_{i:03d}{_SEGMENT_EXT}"
+            ok = _rife_bridge(ffmpeg, rife, bodies[i], bodies[i + 1],
+                              inputs[i], inputs[i + 1], probes[i][0],
+                              trims[i], fps, w, h, tmp, i, br,
+                              gate=gated[i], depth_override=depths[i], threads=threads)
+            return ok, ok and _segment_ok(ffmpeg, br)
+
+        bridge_at = [
+            i for i in range(n - 1) if rife and bridge_seam[i] and do_rife[i]
+        ]
+        built = dict(zip(bridge_at, _pmap(_bridge, bridge_at, jobs)))
 
         segments: list[Path] = []
         bridged = 0
         for i in range(n):
             segments.append(bodies[i])
-            if rife and i < n - 1 and bridge_seam[i] and do_rife[i]:
-                br = tmp / f"bridge_{i:03d}.mp4"
-                ok = _rife_bridge(ffmpeg, rife, bodies[i], bodies[i + 1],
-                                  inputs[i], inputs[i + 1], probes[i][0],
-                                  trims[i], fps, w, h, tmp, i, br,
-                                  gate=gated[i], depth_override=depths[i])
-                if ok and _segment_ok(ffmpeg, br):
-                    segments.append(br)
-                    bridged += 1
-                elif ok:
-                    # The bridge encoded but is degenerate (no decodable video stream
-                    # — e.g. a forced bridge over a big scale/scene jump): adding it
-                    # would make the final filtergraph fail ("matches no streams") and
-                    # break the WHOLE episode. Drop it → clean butt-join for this seam.
-                    print(f"  seam {i}->{i+1}: bridge unusable (no video stream), "
-                          f"butt-joining", file=sys.stderr)
-                else:
-                    # gated out of band (reason already printed) or RIFE failed —
-                    # either way the seam is a clean trim+butt-join.
-                    print(f"  seam {i}->{i+1}: no bridge, butt-joining",
-                          file=sys.stderr)
-
-        # Concat via the filter (one re-encode) — reliable for short/heterogeneous
-        # segments where the stream-copy muxer silently drops frames. Write to a
+            if i not in built:
+                continue
+            ok, usable = built[i]
+            if usable:
+                segments.append(tmp / f"bridge_{i:03d}{_SEGMENT_EXT}")
+                bridged += 1
+            elif ok:
+                # The bridge encoded but is degenerate (no decodable video stream
+                # — e.g. a forced bridge over a big scale/scene jump): adding it
+                # would make the final filtergraph fail ("matches no streams") and
+                # break the WHOLE episode. Drop it → clean butt-join for this seam.
+                print(f"  seam {i}->{i+1}: bridge unusable (no video stream), "
+                      f"butt-joining", file=sys.stderr)
+            else:
+                # gated out of band (reason already printed) or RIFE failed —
+                # either way the seam is a clean trim+butt-join.
+                print(f"  seam {i}->{i+1}: no bridge, butt-joining",
+                      file=sys.stderr)
+
+        # Concat via the filter — the reel's one lossy encode (the segments are
+        # lossless intermediates) and reliable for short/heterogeneous segments
+        # where the stream-copy muxer silently drops frames. Write to a
         # `.part` sibling and atomically rename only on success: a build killed
         # mid-encode (e.g. the HTTP client disconnects and Starlette cancels the
         # handler) then never leaves a 0-byte/partial file at the real path — the
@@ -521,6 +623,8 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--trim", type=float, default=0.10)
     ap.add_argument("--rife", type=str, default=None)
     ap.add_argument("--fps", type=int, default=0)
+    ap.add_argument("--jobs", type=int, default=0,
+                    help="bodies / bridges rendered in parallel; 0 = cores ÷ encoder threads")
     ap.add_argument(
         "--seams", type=str, default=None,
         help="per-seam continuity, one char per seam (len = #clips-1): "
@@ -535,8 +639,6 @@ def main(argv: list[str] | None = None) -> int:
         if not c.is_file():
             ap.error(f"not found: {c}")
     if args.rife is not None:
-        import shutil
-
         if shutil.which(args.rife) is None and not Path(args.rife).is_file():
             ap.error(f"--rife executable not found: {args.rife}")
 
@@ -548,7 +650,7 @@ def main(argv: list[str] | None = None) -> int:
                 f"--seams must be {len(args.clips) - 1} chars of b/c, got {args.seams!r}")
         seams = [ch == "b" for ch in spec]
 
-    seam_concat(args.clips, args.out, args.trim, args.rife, args.fps, seams)
+    seam_concat(args.clips, args.out, args.trim, args.rife, args.fps, seams, jobs=args.jobs)
     return 0
 
 
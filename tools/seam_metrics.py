@@ -56,18 +56,23 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import importlib.util
 import json
 import os
 import subprocess
 import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 import cv2
 import numpy as np
 
 _HERE = Path(__file__).resolve().parent
+if str(_HERE) not in sys.path:  # sibling helpers, also when loaded by path
+    sys.path.insert(0, str(_HERE))
+from _media_probe import media_probe  # noqa: E402
 _RIFE_DEFAULT = r"C:\tools\rife\rife-ncnn-vulkan-20221029-windows\rife-ncnn-vulkan.exe"
 
 # Perceptual scales (720x1280 @ ~24fps, measured at a 360px-wide analysis frame).
@@ -103,10 +108,6 @@ def _ffmpeg() -> str:
 
 
 FF = _ffmpeg()
-import re
-
-_TIME = re.compile(r"time=\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
-_FPS = re.compile(r"(\d+(?:\.\d+)?)\s*fps")
 
 
 def _run(cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
@@ -128,28 +129,65 @@ def _load_seam_concat():
     return mod
 
 
+# The webapp's shared probe cache — clips already probed by the webapp or
+# seam_concat are free.
+_PROBES = media_probe.MediaProbeReader(FF)
+
+
 def _probe(src: Path) -> tuple[float, int]:
-    info = _run([FF, "-i", str(src)]).stderr.decode("utf-8", "replace")
-    d = _run([FF, "-i", str(src), "-map", "0:v:0", "-c", "copy", "-f", "null", "-"]).stderr.decode("utf-8", "replace")
-    t = _TIME.findall(d)
-    dur = int(t[-1][0]) * 3600 + int(t[-1][1]) * 60 + float(t[-1][2]) if t else 5.0
-    fm = _FPS.search(info)
-    return max(0.1, dur), max(1, round(float(fm.group(1)) if fm else 24.0))
-
-
-def _extract_window(src: Path, start: float, end: float, tmp: Path) -> list[np.ndarray]:
-    """Decode [start,end] of `src` to grayscale frames downscaled to _ANALYSIS_W wide."""
-    pat = str(tmp / "f_%04d.png")
-    for f in tmp.glob("f_*.png"):
-        f.unlink()
-    _run([FF, "-ss", f"{max(0.0, start):.3f}", "-to", f"{end:.3f}", "-i", str(src),
-          "-vf", f"scale={_ANALYSIS_W}:-2", "-vsync", "0", pat])
-    out = []
-    for p in sorted(tmp.glob("f_*.png")):
-        img = cv2.imread(str(p), cv2.IMREAD_GRAYSCALE)
-        if img is not None:
-            out.append(img)
-    return out
+    info = _PROBES.probe(src)
+    return max(0.1, info.duration or 5.0), max(1, round(info.fps or 24.0))
+
+
+def _analysis_h(w: int | None, h: int | None) -> int:
+    """Even analysis height for a source of w×h scaled to _ANALYSIS_W wide (9:16 when
+    the source size is unknown). Both dims are fixed up front so the raw decode has an
+    exact, known frame size."""
+    if not w or not h:
+        w, h = 9, 16
+    return max(2, int(round(_ANALYSIS_W * h / w / 2.0)) * 2)
+
+
+def _read_exact(stream, view: memoryview) -> int:
+    """Fill `view` from `stream` (looping over short pipe reads); bytes read (< len at EOF)."""
+    got = 0
+    while got < len(view):
+        k = stream.readinto(view[got:])
+        if not k:
+            break
+        got += k
+    return got
+
+
+def _extract_window(src: Path, start: float, end: float) -> np.ndarray:
+    """Decode [start,end] of `src` to grayscale frames downscaled to _ANALYSIS_W wide, as
+    ONE contiguous (N, H, W) uint8 array. ffmpeg writes raw `gray` frames to stdout and
+    they are read straight into a buffer preallocated from the window length × fps —
+    no PNG encode/decode and no temp files. `frames[i]` is a 2-D view into that buffer.
+    `out_range=full` keeps luma on the 0–255 scale the PNG→imread path produced, so the
+    absolute thresholds (luma 12, SSIM constants) keep their meaning."""
+    info = _PROBES.probe(src)
+    w, h = _ANALYSIS_W, _analysis_h(info.width, info.height)
+    start = max(0.0, start)
+    cap = int(np.ceil(max(0.0, end - start) * (info.fps or 30.0))) + 4
+    buf = np.empty((cap, h, w), dtype=np.uint8)
+    cmd = [FF, "-nostdin", "-ss", f"{start:.3f}", "-to", f"{end:.3f}", "-i", str(src),
+           "-vf", f"scale={w}:{h}:out_range=full", "-vsync", "0",
+           "-f", "rawvideo", "-pix_fmt", "gray", "-loglevel", "error", "pipe:1"]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return buf[:0]
+    n = 0
+    with proc.stdout:
+        while True:
+            if n == len(buf):  # VFR overshoot of the estimate — grow once, rarely
+                buf = np.concatenate([buf, np.empty_like(buf)])
+            if _read_exact(proc.stdout, memoryview(buf[n]).cast("B")) < w * h:
+                break
+            n += 1
+    proc.wait()
+    return buf[:n]
 
 
 def _flow_field(a: np.ndarray, b: np.ndarray) -> np.ndarray:
@@ -157,10 +195,23 @@ def _flow_field(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     return cv2.calcOpticalFlowFarneback(a, b, None, 0.5, 3, 15, 3, 5, 1.2, 0)
 
 
+def _field_mag(F: np.ndarray) -> float:
+    return float(cv2.magnitude(F[..., 0], F[..., 1]).mean())
+
+
 def _flow_mag(a: np.ndarray, b: np.ndarray) -> float:
     """Mean dense optical-flow magnitude (px/frame) from a→b."""
-    F = _flow_field(a, b)
-    return float(np.mean(np.sqrt(F[..., 0] ** 2 + F[..., 1] ** 2)))
+    return _field_mag(_flow_field(a, b))
+
+
+@lru_cache(maxsize=8)
+def _pixel_grid(h: int, w: int) -> tuple[np.ndarray, np.ndarray]:
+    """The (x, y) pixel-coordinate grids `_mc_residual` offsets by the flow — built once
+    per analysis frame size instead of per frame pair. Read-only: never mutate."""
+    gx, gy = np.meshgrid(np.arange(w, dtype=np.float32), np.arange(h, dtype=np.float32))
+    gx.flags.writeable = False
+    gy.flags.writeable = False
+    return gx, gy
 
 
 def _mc_residual(a: np.ndarray, b: np.ndarray, F: np.ndarray) -> float:
@@ -170,32 +221,72 @@ def _mc_residual(a: np.ndarray, b: np.ndarray, F: np.ndarray) -> float:
     matching unrelated content → the warp can't reconstruct `b` → high residual. This is
     the signal that tells a real motion step from a content swap even when the two raw
     frames look similar (same scene/framing) and SSIM/magnitude alone are fooled."""
-    h, w = a.shape
-    gx, gy = np.meshgrid(np.arange(w, dtype=np.float32), np.arange(h, dtype=np.float32))
-    mapx = gx + F[..., 0]
-    mapy = gy + F[..., 1]
-    warped = cv2.remap(a, mapx, mapy, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
-    return float(np.mean(np.abs(warped.astype(np.int16) - b.astype(np.int16))))
+    gx, gy = _pixel_grid(*a.shape)
+    warped = cv2.remap(a, gx + F[..., 0], gy + F[..., 1], cv2.INTER_LINEAR,
+                       borderMode=cv2.BORDER_REPLICATE)
+    return float(cv2.absdiff(warped, b).mean())
+
+
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+
+
+def _ssim_stats(a: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-frame SSIM terms (float frame, local mean, local variance) on the cropped
+    11×11 σ=1.5 Gaussian window. Computed ONCE per frame; each adjacent pair then only
+    needs its cross term, instead of re-filtering both frames for every pair."""
+    f = a.astype(np.float64)
+    mu = cv2.GaussianBlur(f, (11, 11), 1.5)[5:-5, 5:-5]
+    var = cv2.GaussianBlur(f * f, (11, 11), 1.5)[5:-5, 5:-5] - mu * mu
+    return f, mu, var
+
+
+def _ssim_from_stats(sa: tuple[np.ndarray, np.ndarray, np.ndarray],
+                     sb: tuple[np.ndarray, np.ndarray, np.ndarray]) -> float:
+    fa, mu_a, a2 = sa
+    fb, mu_b, b2 = sb
+    ab = cv2.GaussianBlur(fa * fb, (11, 11), 1.5)[5:-5, 5:-5] - mu_a * mu_b
+    s = ((2 * mu_a * mu_b + _SSIM_C1) * (2 * ab + _SSIM_C2)) / (
+        (mu_a ** 2 + mu_b ** 2 + _SSIM_C1) * (a2 + b2 + _SSIM_C2))
+    return float(np.clip(s.mean(), -1, 1))
 
 
 def _ssim(a: np.ndarray, b: np.ndarray) -> float:
     """Global SSIM between two grayscale frames (Wang et al. constants)."""
-    a = a.astype(np.float64); b = b.astype(np.float64)
-    C1, C2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
-    ka = cv2.getGaussianKernel(11, 1.5)
-    win = ka @ ka.T
-    mu_a = cv2.filter2D(a, -1, win)[5:-5, 5:-5]
-    mu_b = cv2.filter2D(b, -1, win)[5:-5, 5:-5]
-    a2 = cv2.filter2D(a * a, -1, win)[5:-5, 5:-5] - mu_a ** 2
-    b2 = cv2.filter2D(b * b, -1, win)[5:-5, 5:-5] - mu_b ** 2
-    ab = cv2.filter2D(a * b, -1, win)[5:-5, 5:-5] - mu_a * mu_b
-    s = ((2 * mu_a * mu_b + C1) * (2 * ab + C2)) / (
-        (mu_a ** 2 + mu_b ** 2 + C1) * (a2 + b2 + C2))
-    return float(np.clip(s.mean(), -1, 1))
+    return _ssim_from_stats(_ssim_stats(a), _ssim_stats(b))
 
 
 def _luma_diff(a: np.ndarray, b: np.ndarray) -> float:
-    return float(np.mean(np.abs(a.astype(np.int16) - b.astype(np.int16))))
+    return float(cv2.absdiff(a, b).mean())
+
+
+def _window_pair_stats(
+    frames: np.ndarray | list[np.ndarray],
+) -> tuple[list[float], list[float], list[float], list[float]]:
+    """(flow magnitude, luma diff, SSIM, MC residual) for every adjacent pair of the
+    window, each computed once and shared by M1–M4. Luma diffs are one batched NumPy op
+    over the whole window; SSIM terms are per frame; the flow field of a pair feeds both
+    its magnitude and its residual."""
+    arr = np.asarray(frames)
+    n = len(arr)
+    luma = (
+        np.abs(np.diff(arr.astype(np.int16), axis=0)).mean(axis=(1, 2)).tolist()
+        if n > 1 else []
+    )
+    stats: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    flow: list[float] = []
+    ssim: list[float] = []
+    mcr: list[float] = []
+    for i in range(n - 1):
+        F = _flow_field(arr[i], arr[i + 1])
+        for j in (i, i + 1):
+            if j not in stats:
+                stats[j] = _ssim_stats(arr[j])
+        flow.append(_field_mag(F))
+        ssim.append(_ssim_from_stats(stats[i], stats[i + 1]))
+        mcr.append(_mc_residual(arr[i], arr[i + 1], F))
+        stats.pop(i - 1, None)  # only the current pair's frames are needed from here on
+    return flow, luma, ssim, mcr
 
 
 def _score_curve(val: float, good: float, bad: float) -> float:
@@ -206,8 +297,9 @@ def _score_curve(val: float, good: float, bad: float) -> float:
     return float(np.clip(t, 0.0, 1.0) * 100.0)
 
 
-def measure_seam(frames: list[np.ndarray], seam_idx: int, n_bridge: int) -> dict:
-    """Compute the four metrics from the extracted seam-window frames. `seam_idx` =
+def measure_seam(frames: np.ndarray | list[np.ndarray], seam_idx: int, n_bridge: int) -> dict:
+    """Compute the four metrics from the extracted seam-window frames (an (N, H, W) gray
+    array from `_extract_window`, or any sequence of 2-D frames). `seam_idx` =
     the EXPECTED index of the last frame before the join (derived from durations, which
     can be off by a frame or two after dedup/trim); `n_bridge` synth frames follow.
 
@@ -222,11 +314,7 @@ def measure_seam(frames: list[np.ndarray], seam_idx: int, n_bridge: int) -> dict
     n = len(frames)
     if n < 8:
         return {"error": "too-few-frames", "frames": n}
-    fields = [_flow_field(frames[i], frames[i + 1]) for i in range(n - 1)]
-    flow = [float(np.mean(np.sqrt(F[..., 0] ** 2 + F[..., 1] ** 2))) for F in fields]
-    luma = [_luma_diff(frames[i], frames[i + 1]) for i in range(n - 1)]
-    ssim_pair = [_ssim(frames[i], frames[i + 1]) for i in range(n - 1)]
-    mcr = [_mc_residual(frames[i], frames[i + 1], fields[i]) for i in range(n - 1)]
+    flow, luma, ssim_pair, mcr = _window_pair_stats(frames)
     nf = len(flow)
     # Empirically locate the transition ONSET by local prominence — how much a step's MC-
     # residual spikes above its own neighbours — NOT by absolute residual (which is high
@@ -339,8 +427,114 @@ def rank_key(r: dict) -> tuple:
             method_pref, -float(r.get("trim") or 0.0))
 
 
+# Persistent candidate-result cache. Building + scoring one candidate join (stitch the
+# isolated A|B pair, decode the window, run flow) costs seconds to tens of seconds, and
+# the dashboard, seam_tune and the post-build scorer keep asking for the SAME (clips,
+# method, trim, depth) again. A result is a pure function of its inputs, so it is stored
+# content-addressed under `ai_videos/{drama}/.cache/seam_results/{key}.json` — one file
+# per result, so concurrent seam_tune workers never contend on a shared index. The key
+# covers both clips' (path, size, mtime), the join method/trim/depth, the RIFE exe (it
+# synthesises the bridge — keyed on its resolved path + size + mtime, so swapping the
+# binary or upgrading it in place re-scores), seam_concat's JOIN_VERSION (how the join
+# is built) and METRIC_VERSION (how it is scored). Errors are never cached (a missing
+# RIFE exe or a transient ffmpeg failure must not stick). The built pair mp4 itself is
+# still a temp file: only its measurement is worth keeping. The directory is an LRU
+# bounded by file count and bytes: a hit refreshes the file's mtime, and every write
+# evicts the least-recently-used results beyond either cap.
+METRIC_VERSION = 1   # bump on ANY change to the decode or measure_seam
+_RESULT_CACHE_SUBDIR = "seam_results"
+_RESULT_CACHE_MAX_FILES = 4000
+_RESULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _rife_ident(rife: str) -> list | None:
+    """(resolved path, size, mtime_ns) of the RIFE exe; None when it can't be found
+    (the build then fails and nothing is cached anyway)."""
+    import shutil
+
+    exe = Path(shutil.which(rife) or rife).resolve()
+    try:
+        st = exe.stat()
+    except OSError:
+        return None
+    return [str(exe), st.st_size, st.st_mtime_ns]
+
+
+def _result_cache_file(a: Path, b: Path, method: str, trim: float, depth: int | None,
+                       rife: str | None, join_version: int) -> Path | None:
+    drama = media_probe.drama_dir_of(a.resolve())
+    if drama is None:
+        return None
+    try:
+        sa, sb = a.stat(), b.stat()
+    except OSError:
+        return None
+    ident = json.dumps({
+        "v": METRIC_VERSION, "join": join_version,
+        "a": [str(a.resolve()), sa.st_size, sa.st_mtime_ns],
+        "b": [str(b.resolve()), sb.st_size, sb.st_mtime_ns],
+        "method": method, "trim": round(float(trim), 4),
+        "depth": depth if method == "rife" else None,
+        "rife": _rife_ident(rife) if (rife and method == "rife") else None,
+    }, sort_keys=True, ensure_ascii=False)
+    key = hashlib.sha1(ident.encode("utf-8")).hexdigest()
+    return media_probe.cache_dir(drama) / _RESULT_CACHE_SUBDIR / f"{key}.json"
+
+
 def _build_and_measure(seam_concat, a: Path, b: Path, method: str, trim: float,
                        depth: int | None, rife: str | None, tmp: Path, tag: str) -> dict:
+    """Build the isolated A|B join for one candidate and score it — served from the
+    persistent result cache when neither clip nor the candidate changed."""
+    cache = _result_cache_file(a, b, method, trim, depth, rife, seam_concat.JOIN_VERSION)
+    if cache is not None:
+        try:
+            hit = json.loads(cache.read_text(encoding="utf-8"))
+            os.utime(cache)  # most recently used: last to be evicted
+            return hit
+        except (OSError, ValueError):
+            pass
+    res = _build_and_measure_uncached(seam_concat, a, b, method, trim, depth, rife, tmp, tag)
+    if cache is not None and "error" not in res:
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            part = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+            part.write_text(json.dumps(res, ensure_ascii=False), encoding="utf-8")
+            os.replace(part, cache)
+        except OSError:
+            pass  # a read-only tree just means no persistence
+        else:
+            _evict_results(cache.parent)
+    return res
+
+
+def _evict_results(folder: Path) -> None:
+    """Drop the least-recently-used results until the folder is within both caps.
+    Races with other writers are harmless: a vanished file is simply skipped."""
+    entries = []
+    for e in os.scandir(folder):
+        if not e.name.endswith(".json"):
+            continue
+        try:
+            st = e.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, e.path))
+    total = sum(size for _, size, _ in entries)
+    count = len(entries)
+    for _, size, path in sorted(entries):
+        if count <= _RESULT_CACHE_MAX_FILES and total <= _RESULT_CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        count -= 1
+        total -= size
+
+
+def _build_and_measure_uncached(seam_concat, a: Path, b: Path, method: str, trim: float,
+                                depth: int | None, rife: str | None, tmp: Path,
+                                tag: str) -> dict:
     out = tmp / f"pair_{tag}.mp4"
     if method == "butt":
         plan = [{"bridge": False, "rife": False, "trim": trim, "depth": None}]
@@ -352,7 +546,7 @@ def _build_and_measure(seam_concat, a: Path, b: Path, method: str, trim: float,
         plan = [{"bridge": True, "rife": True, "trim": trim, "depth": depth}]
         use_rife = rife
     try:
-        bridged = seam_concat.seam_concat([a, b], out, trim, use_rife, 0, None, plan)
+        bridged = seam_concat.seam_concat([a, b], out, trim, use_rife, 0, None, plan, jobs=1)
     except Exception as exc:
         return {"error": f"build-failed: {exc}"}
     durA, fps = _probe(a)
@@ -361,7 +555,7 @@ def _build_and_measure(seam_concat, a: Path, b: Path, method: str, trim: float,
     seam_t = durA - (trim if method in ("trim", "rife") else 0.0)
     win_lo = seam_t - 0.5
     win_hi = seam_t + n_bridge / fps + 0.5
-    frames = _extract_window(out, win_lo, win_hi, tmp)
+    frames = _extract_window(out, win_lo, win_hi)
     seam_idx = int(round((seam_t - win_lo) * fps))
     seam_idx = max(1, min(len(frames) - 2, seam_idx))
     res = measure_seam(frames, seam_idx, n_bridge)
@@ -42,6 +42,10 @@ Usage:
   python tools/seam_tune.py "<epdir>" --trims 0.08,0.10,0.12,0.14,0.16,0.20 \
       --depths 2,3,4 --build --out "<epdir>/ep01_rife.mp4"
 
+  # fan the candidate builds out over a process pool (0 = one worker per core); each
+  # candidate runs in its own temp dir, results stream as they finish:
+  python tools/seam_tune.py "<epdir>" --apply --jobs 0
+
 ffmpeg is located via the bundled imageio_ffmpeg when present, else `ffmpeg` on PATH.
 RIFE is taken from --rife, else $RIFE_NCNN_VULKAN_EXE, else the default install path.
 """
@@ -50,6 +54,7 @@ from __future__ import annotations
 import argparse
 import importlib.util
 import json
+import multiprocessing
 import os
 import re
 import subprocess
@@ -58,6 +63,9 @@ import tempfile
 from pathlib import Path
 
 _HERE = Path(__file__).resolve().parent
+if str(_HERE) not in sys.path:  # sibling helpers, also when loaded by path
+    sys.path.insert(0, str(_HERE))
+from _media_probe import media_probe  # noqa: E402
 _RIFE_DEFAULT = r"C:\tools\rife\rife-ncnn-vulkan-20221029-windows\rife-ncnn-vulkan.exe"
 # Out-of-band gate (mirrors seam_concat's auto gate). Above MAX the seam frames are a
 # composition/scale change RIFE morphs → a prompt problem, not a tuning problem. Below
@@ -104,9 +112,10 @@ def _load_seam_metrics():
 
 
 FF = _ffmpeg()
+# The webapp's shared probe cache — clips already probed by the webapp or
+# seam_concat are free.
+_PROBES = media_probe.MediaProbeReader(FF)
 _YAVG = re.compile(r"signalstats\.YAVG=([0-9.]+)")
-_TIME = re.compile(r"time=\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
-_FPS = re.compile(r"(\d+(?:\.\d+)?)\s*fps")
 
 
 def _run(cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
@@ -115,12 +124,8 @@ def _run(cmd: list[str]) -> subprocess.CompletedProcess[bytes]:
 
 def _probe(src: Path) -> tuple[float, float]:
     """(duration_s, fps)."""
-    info = _run([FF, "-i", str(src)]).stderr.decode("utf-8", "replace")
-    d = _run([FF, "-i", str(src), "-map", "0:v:0", "-c", "copy", "-f", "null", "-"]).stderr.decode("utf-8", "replace")
-    t = _TIME.findall(d)
-    dur = int(t[-1][0]) * 3600 + int(t[-1][1]) * 60 + float(t[-1][2]) if t else 5.0
-    fm = _FPS.search(info)
-    return max(0.1, dur), (float(fm.group(1)) if fm else 30.0)
+    info = _PROBES.probe(src)
+    return max(0.1, info.duration or 5.0), info.fps or 30.0
 
 
 def _last_frame(src: Path, dst: Path) -> bool:
@@ -201,7 +206,7 @@ def _auto_lang(epdir: Path, seams: list[dict], tmp: Path) -> str:
 
 
 def tune(epdir: Path, lang: str, trims: list[float], depths: list[int],
-         rife: str, apply: bool, build: bool, out: Path | None) -> int:
+         rife: str, apply: bool, build: bool, out: Path | None, jobs: int = 1) -> int:
     seam_concat = _load_seam_concat()
     metrics = _load_seam_metrics()
     plan_path = epdir / "seam_plan.json"
@@ -231,6 +236,10 @@ def tune(epdir: Path, lang: str, trims: list[float], depths: list[int],
         if not tune_seams:
             print("no 首尾帧承接 seams to tune; nothing to do.")
         prompt_problems: list[str] = []
+        # With --jobs > 1 the candidates of EVERY seam are queued first and fanned out
+        # across one process pool together (so a seam with few candidates doesn't idle
+        # the pool); serially each seam is tuned as soon as its header is printed.
+        pending: list[tuple[dict, Path, Path, list[tuple[str, float, int | None]]]] = []
 
         for s in tune_seams:
             a = _clip_path(epdir, s["from"], lang)
@@ -270,34 +279,12 @@ def tune(epdir: Path, lang: str, trims: list[float], depths: list[int],
                 ("trim", t, None) for t in trims
             ]
             candidates += [("rife", t, d) for d in depths for t in trims]
-
-            results: list[dict] = []
-            for k, (m, t, d) in enumerate(candidates):
-                r = metrics._build_and_measure(
-                    seam_concat, a, b, m, t, d, rife, tmp, f"{s['from']}_{k}"
-                )
-                if "error" in r:
-                    print(f"   {m:4} trim={t:.2f} depth={d}  ERROR({r['error']})")
-                    continue
-                results.append(r)
-                tag = f"{m} trim={t:.2f}" + (f" d{d}(+{(2**d)-1}f)" if m == "rife" else "")
-                floor = "✓全≥80" if r.get("floor_pass") else f"✗最低{r.get('min_metric')}"
-                print(f"   {tag:22} 加权{r['score']:5.1f} [{floor}] "
-                      f"M1 {r['M1_velocity']['score']:.0f}·M2 {r['M2_no_freeze']['score']:.0f}·"
-                      f"M3 {r['M3_no_jump']['score']:.0f}·M4 {r['M4_junction_ssim']['score']:.0f}")
-            print()
-            if not results:
-                print("   !! all candidates errored; leaving seam unchanged\n")
-                continue
-            win = max(results, key=metrics.rank_key)
-            s["method"] = win["method"]
-            s["trim"] = round(float(win["trim"]), 3)
-            s["depth"] = win["depth"] if win["method"] == "rife" else None
-            tier = ("全指标≥80" if win.get("floor_pass")
-                    else f"无任何方案达标·leximin 选(最低指标{win.get('min_metric')})")
-            dd = f" depth={win['depth']}" if win["method"] == "rife" else ""
-            print(f"   >> WINNER {win['method']} trim={s['trim']}{dd} "
-                  f"加权 {win['score']:.1f} · {tier}\n")
+            pending.append((s, a, b, candidates))
+            if jobs <= 1:
+                _tune_seams(pending, rife, jobs, metrics)
+                pending.clear()
+        if pending:
+            _tune_seams(pending, rife, jobs, metrics)
 
         if prompt_problems:
             print("PROMPT PROBLEMS (not fixable by tuning):")
@@ -320,6 +307,121 @@ def tune(epdir: Path, lang: str, trims: list[float], depths: list[int],
     return 0
 
 
+# --- candidate execution (serial or process pool) -------------------------------------
+
+# Per-process module cache for pool workers: each worker loads seam_concat/seam_metrics
+# once, not once per candidate.
+_WORKER_MODS: dict[str, object] = {}
+
+
+def _init_worker(rife_slot) -> None:  # noqa: ANN001 — a multiprocessing.Lock
+    """Pool initializer: swap seam_concat's per-process RIFE slot for the lock shared
+    by the whole pool, so `jobs` workers still run ONE interpolator on the GPU."""
+    _WORKER_MODS["seam_concat"] = _load_seam_concat()
+    _WORKER_MODS["metrics"] = _load_seam_metrics()
+    _WORKER_MODS["seam_concat"]._RIFE_SLOT = rife_slot
+
+
+def _measure_candidate(a: Path, b: Path, method: str, trim: float, depth: int | None,
+                       rife: str, tag: str) -> dict:
+    """Build + score ONE candidate join in its own temp dir. Top-level (picklable) so
+    it can run in a pool worker; `_build_and_measure` writes fixed-name frames into its
+    tmp, so every candidate gets a private directory — concurrent candidates never share."""
+    if not _WORKER_MODS:
+        _WORKER_MODS["seam_concat"] = _load_seam_concat()
+        _WORKER_MODS["metrics"] = _load_seam_metrics()
+    with tempfile.TemporaryDirectory(prefix="seam_tune_") as td:
+        try:
+            return _WORKER_MODS["metrics"]._build_and_measure(
+                _WORKER_MODS["seam_concat"], a, b, method, trim, depth, rife, Path(td), tag
+            )
+        except Exception as exc:  # one bad candidate must not sink the sweep
+            return {"error": f"worker-failed: {exc}"}
+
+
+def _iter_candidates(work: list[tuple[int, int, Path, Path, str, float, int | None, str]],
+                     rife: str, jobs: int):
+    """Yield (seam_index, candidate_index, result) — in order when serial, as each one
+    finishes when `jobs` > 1 (a ProcessPoolExecutor of `jobs` workers)."""
+    if jobs <= 1:
+        for si, k, a, b, m, t, d, tag in work:
+            yield si, k, _measure_candidate(a, b, m, t, d, rife, tag)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(multiprocessing.Lock(),)
+    ) as pool:
+        futs = {
+            pool.submit(_measure_candidate, a, b, m, t, d, rife, tag): (si, k)
+            for si, k, a, b, m, t, d, tag in work
+        }
+        for fut in as_completed(futs):
+            si, k = futs[fut]
+            try:
+                r = fut.result()
+            except Exception as exc:  # a crashed worker (BrokenProcessPool, …)
+                r = {"error": f"worker-failed: {exc}"}
+            yield si, k, r
+
+
+def _tune_seams(pending: list[tuple[dict, Path, Path, list[tuple[str, float, int | None]]]],
+                rife: str, jobs: int, metrics) -> None:
+    """Score every pending seam's candidates and write each winner into its plan entry.
+    Candidate lines stream as they finish; a seam's ranked top-3 + winner print the moment
+    its last candidate lands, so long sweeps show progress instead of going silent."""
+    work = [
+        (si, k, a, b, m, t, d, f"{s['from']}_{k}")
+        for si, (s, a, b, cands) in enumerate(pending)
+        for k, (m, t, d) in enumerate(cands)
+    ]
+    results: list[list[tuple[int, dict]]] = [[] for _ in pending]  # (candidate index, result)
+    remaining = [len(c) for _, _, _, c in pending]
+    for si, k, r in _iter_candidates(work, rife, jobs):
+        s, _, _, cands = pending[si]
+        m, t, d = cands[k]
+        label = f"[{s['from']}->{s['to']}] " if jobs > 1 else ""
+        remaining[si] -= 1
+        if "error" in r:
+            print(f"   {label}{m:4} trim={t:.2f} depth={d}  ERROR({r['error']})")
+        else:
+            results[si].append((k, r))
+            tag = f"{m} trim={t:.2f}" + (f" d{d}(+{(2**d)-1}f)" if m == "rife" else "")
+            floor = "✓全≥80" if r.get("floor_pass") else f"✗最低{r.get('min_metric')}"
+            print(f"   {label}{tag:22} 加权{r['score']:5.1f} [{floor}] "
+                  f"M1 {r['M1_velocity']['score']:.0f}·M2 {r['M2_no_freeze']['score']:.0f}·"
+                  f"M3 {r['M3_no_jump']['score']:.0f}·M4 {r['M4_junction_ssim']['score']:.0f}",
+                  flush=True)
+        if remaining[si] == 0:
+            _pick_winner(s, results[si], metrics, label)
+
+
+def _pick_winner(s: dict, results: list[tuple[int, dict]], metrics, label: str) -> None:
+    print()
+    if not results:
+        print(f"   {label}!! all candidates errored; leaving seam unchanged\n")
+        return
+    # back into submission order first: the (stable) rank then breaks ties exactly as
+    # the serial sweep does, whatever order the pool finished them in
+    in_order = [r for _, r in sorted(results, key=lambda kr: kr[0])]
+    ranked = sorted(in_order, key=metrics.rank_key, reverse=True)
+    if label:
+        top = " > ".join(
+            f"{r['method']} {float(r['trim']):.2f}" + (f" d{r['depth']}" if r["method"] == "rife" else "")
+            for r in ranked[:3]
+        )
+        print(f"   {label}ranked: {top}")
+    win = ranked[0]
+    s["method"] = win["method"]
+    s["trim"] = round(float(win["trim"]), 3)
+    s["depth"] = win["depth"] if win["method"] == "rife" else None
+    tier = ("全指标≥80" if win.get("floor_pass")
+            else f"无任何方案达标·leximin 选(最低指标{win.get('min_metric')})")
+    dd = f" depth={win['depth']}" if win["method"] == "rife" else ""
+    print(f"   {label}>> WINNER {win['method']} trim={s['trim']}{dd} "
+          f"加权 {win['score']:.1f} · {tier}\n", flush=True)
+
+
 def _build_episode(seam_concat, epdir: Path, lang: str, seams: list[dict],
                    rife: str, out_path: Path) -> None:
     """Concat every shot in order with the (tuned) per-seam plan."""
@@ -339,7 +441,10 @@ def _build_episode(seam_concat, epdir: Path, lang: str, seams: list[dict],
         else:              # butt / hardcut: plain hard cut, no trim
             tool_plan.append({"bridge": False, "rife": False, "trim": trim, "depth": None})
     any_rife = any(e.get("rife") and e["bridge"] for e in tool_plan)
-    seam_concat.seam_concat(inputs, out_path, 0.10, rife if any_rife else None, 0, None, tool_plan)
+    seam_concat.seam_concat(
+        inputs, out_path, 0.10, rife if any_rife else None, 0, None, tool_plan,
+        jobs=seam_concat.default_jobs(),
+    )
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -355,6 +460,8 @@ def main(argv: list[str] | None = None) -> int:
     ap.add_argument("--apply", action="store_true", help="write winners into seam_plan.json")
     ap.add_argument("--build", action="store_true", help="build the episode video with tuned plan")
     ap.add_argument("--out", type=Path, default=None)
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="candidate builds to run in parallel (process pool); 0 = all cores")
     args = ap.parse_args(argv)
 
     if not args.epdir.is_dir():
@@ -364,7 +471,9 @@ def main(argv: list[str] | None = None) -> int:
         ap.error("RIFE executable not found — pass --rife or set $RIFE_NCNN_VULKAN_EXE")
     trims = [float(x) for x in args.trims.split(",") if x.strip()]
     depths = [int(x) for x in args.depths.split(",") if x.strip()]
-    return tune(args.epdir, args.lang, trims, depths, rife, args.apply, args.build, args.out)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    return tune(args.epdir, args.lang, trims, depths, rife, args.apply, args.build, args.out,
+                jobs)
 
 
 if __name__ == "__main__":